@@ -39,14 +39,21 @@ import json
 import time
 import asyncio
 import logging
+import threading
+import contextvars
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import AsyncIterator, Dict, Generator, Iterator, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache, wraps
+from dataclasses import dataclass, asdict, replace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial, wraps
 import hashlib
-import pickle
+
+from HeadyWriteBehind import WriteBehindQueue
+from HeadyTelemetry import StageTracer, traced_stage
+from HeadyMatcher import PatternMatcher
+from HeadyPrefetch import SpeculativePrefetcher
+from HeadyCodec import RecordCodec, CodecError, dumps
 
 try:
     import psutil
@@ -57,7 +64,7 @@ except ImportError:
     print("[WARN] HeadyBrain: psutil/requests not available, limited functionality")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingContext:
     """Context gathered before response generation."""
     request: str
@@ -85,34 +92,172 @@ class ProcessingContext:
     processing_time: float = 0.0
     cache_hit: bool = False
     confidence_score: float = 0.0
+    
+    def as_dict(self, extras: Optional[Dict[str, Any]] = None):
+        """Read-only dict view of the context's fields (no copying)."""
+        return CONTEXT_CODEC.view(self, extras)
+
+
+# Versioned binary codec for cached contexts; bump schema_version when fields change
+CONTEXT_CODEC = RecordCodec(ProcessingContext, schema_version=1)
+
+
+@dataclass
+class StreamEvent:
+    """
+    Partial result emitted by process_request_stream as a stage completes.
+    type is one of: system_state, memories, plan, concepts, analysis, context.
+    The final "context" event carries the complete ProcessingContext.
+    """
+    type: str
+    data: Any
+    elapsed_ms: float
+    cache_hit: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.data.as_dict() if isinstance(self.data, ProcessingContext) else self.data
+        return {"type": self.type, "data": data, "elapsed_ms": round(self.elapsed_ms, 3), "cache_hit": self.cache_hit}
+    
+    def to_json(self) -> str:
+        """Event encoded as JSON text (for SSE / WebSocket frames)."""
+        return dumps(self.to_dict()).decode("utf-8")
+
+
+def _record_call(self, name: str, start_time: float, processing_time: float, result: Any = None, error: Optional[BaseException] = None):
+    """Log a monitored call and record it as a span on the instance tracer."""
+    if hasattr(self, 'logger'):
+        if error is not None:
+            self.logger.error(f"{name} failed after {processing_time:.3f}s: {error}")
+        elif not getattr(self, 'quiet', False):
+            self.logger.info(f"{name} completed in {processing_time:.3f}s")
+    
+    tracer = getattr(self, 'tracer', None)
+    if tracer is not None:
+        tracer.record_span({
+            "stage": name,
+            "start": start_time,
+            "end": start_time + processing_time,
+            "duration_ms": processing_time * 1000.0,
+            "cache_hit": bool(getattr(result, 'cache_hit', False)),
+            "error": f"{type(error).__name__}: {error}" if error is not None else None
+        })
 
 
 def performance_monitor(func):
-    """Decorator to monitor function performance."""
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        start_time = time.time()
-        try:
-            result = func(self, *args, **kwargs)
+    """Decorator to monitor function performance (sync or async)."""
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            start_time = time.time()
+            try:
+                result = await func(self, *args, **kwargs)
+            except Exception as e:
+                _record_call(self, func.__name__, start_time, time.time() - start_time, error=e)
+                raise
             processing_time = time.time() - start_time
             
-            # Log performance if available
-            if hasattr(self, 'logger'):
-                self.logger.info(f"{func.__name__} completed in {processing_time:.3f}s")
-            
-            # Add timing to result if it's a ProcessingContext
             if hasattr(result, 'processing_time'):
                 result.processing_time = processing_time
             
+            _record_call(self, func.__name__, start_time, processing_time, result)
             return result
+        return async_wrapper
+    
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start_time = time.time()
+        try:
+            result = func(self, *args, **kwargs)
         except Exception as e:
-            processing_time = time.time() - start_time
-            if hasattr(self, 'logger'):
-                self.logger.error(f"{func.__name__} failed after {processing_time:.3f}s: {e}")
+            _record_call(self, func.__name__, start_time, time.time() - start_time, error=e)
             raise
+        processing_time = time.time() - start_time
+        
+        # Add timing to result if it's a ProcessingContext
+        if hasattr(result, 'processing_time'):
+            result.processing_time = processing_time
+        
+        # Log performance and record the end-to-end span
+        _record_call(self, func.__name__, start_time, processing_time, result)
+        return result
     return wrapper
 
 
+# Request vocabularies, compiled once into a shared multi-pattern matcher
+PATTERN_INDICATORS = {
+    "deployment_request": ["deploy", "deployment", "release", "publish"],
+    "security_request": ["security", "audit", "scan", "vulnerability"],
+    "monitoring_request": ["monitor", "check", "status", "health"],
+    "optimization_request": ["optimize", "improve", "enhance", "boost"],
+    "troubleshooting_request": ["fix", "error", "issue", "problem", "debug"],
+    "verification_request": ["verify", "validate", "smoke test"]
+}
+
+SYSTEM_CONCEPTS = [
+    "deployment", "monitoring", "security", "optimization", "documentation",
+    "workflow", "node", "service", "database", "api", "frontend",
+    "authentication", "encryption", "visualization", "testing"
+]
+
+REQUEST_MATCHER = PatternMatcher({**PATTERN_INDICATORS, "system_concept": SYSTEM_CONCEPTS})
+
+# Canonical follow-up request for each prediction, warmed by the speculative prefetcher
+FOLLOW_UP_REQUESTS = {
+    "post_deployment_verification_needed": "verify the deployment",
+    "security_findings_likely": "fix security vulnerabilities",
+    "monitoring_follow_up_likely": "monitor system health"
+}
+
+
+class RequestCoalescer:
+    """
+    Single-flight table for in-flight requests.
+    The first caller for a key computes; concurrent callers with the same key
+    wait on the same future and receive its result or exception. Uses
+    concurrent futures so sync and async callers can share one flight. A
+    leader that gives up (a stream whose consumer went away) abandons the
+    flight: waiters receive None and compute the request themselves.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+    
+    def join(self, key: str) -> Tuple[bool, Future]:
+        """Return (is_leader, future) for key, registering a new flight if none exists."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return False, future
+            future = Future()
+            self._inflight[key] = future
+            return True, future
+    
+    def complete(self, key: str, future: Future, result: Any = None, error: Optional[BaseException] = None):
+        """Finish a flight, releasing the key and waking every waiter."""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def abandon(self, key: str, future: Future):
+        """Release a flight without a result; waiters get None and take over."""
+        self.complete(key, future)
+    
+    def peek(self, key: str) -> Optional[Future]:
+        """The in-flight future for key, without joining it."""
+        with self._lock:
+            return self._inflight.get(key)
+    
+    def in_flight(self) -> int:
+        """Number of distinct requests currently being computed."""
+        with self._lock:
+            return len(self._inflight)
+
+
 class HeadyBrain:
     """
     BRAIN - The Central Intelligence
@@ -121,12 +266,20 @@ class HeadyBrain:
     Indexed in HeadyRegistry as a core system node.
     """
     
-    def __init__(self, registry=None, lens=None, memory=None, conductor=None):
+    def __init__(self, registry=None, lens=None, memory=None, conductor=None,
+                 write_behind: Optional[Dict[str, Any]] = None, quiet: bool = False,
+                 prefetch: Optional[Dict[str, Any]] = None):
         self.registry = registry
         self.lens = lens
         self.memory = memory
         self.conductor = conductor
         
+        # Quiet mode keeps console output off the request hot path
+        self.quiet = quiet
+        
+        # Per-stage spans and latency histograms
+        self.tracer = StageTracer(namespace="heady_brain")
+        
         # Performance optimization components
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.cache_dir = Path(".heady_cache")
@@ -153,7 +306,8 @@ class HeadyBrain:
             "enable_comparative_analysis": True,
             "enable_caching": True,
             "enable_parallel_processing": True,
-            "cache_ttl_minutes": 30
+            "cache_ttl_minutes": 30,
+            "stage_timeout_seconds": 10
         }
         
         # Performance metrics
@@ -161,8 +315,46 @@ class HeadyBrain:
             "requests_processed": 0,
             "cache_hits": 0,
             "average_processing_time": 0.0,
-            "total_processing_time": 0.0
+            "total_processing_time": 0.0,
+            "coalesced_requests": 0
+        }
+        
+        # Single-flight table shared by the sync and async APIs
+        self.coalescer = RequestCoalescer()
+        
+        # Write-behind persistence keeps MEMORY writes off the response path
+        self.write_behind_config = {
+            "enabled": True,
+            "max_queue": 1000,
+            "batch_size": 50,
+            "flush_interval": 1.0,
+            "overflow_policy": "drop_oldest",  # drop_oldest | block | spill
+            **(write_behind or {})
         }
+        self.persistence = None
+        if self.memory and self.write_behind_config["enabled"]:
+            self.persistence = WriteBehindQueue(
+                self.memory,
+                **{k: v for k, v in self.write_behind_config.items() if k != "enabled"}
+            )
+        
+        # Opt-in speculative prefetch of predicted follow-up requests
+        self.prefetch_config = {
+            "enabled": False,
+            "max_per_minute": 30,
+            "duty_cycle": 0.2,
+            "queue_size": 16,
+            "min_confidence": 0.5,
+            **(prefetch or {})
+        }
+        self.prefetcher = None
+        self._prefetch_local = threading.local()
+        if self.prefetch_config["enabled"]:
+            self.prefetcher = SpeculativePrefetcher(
+                self._warm_follow_up,
+                is_idle=lambda: self.coalescer.in_flight() == 0,
+                **{k: v for k, v in self.prefetch_config.items() if k != "enabled"}
+            )
         
         # Enhanced learning and intelligence configuration
         self.learning_metrics = {
@@ -177,10 +369,11 @@ class HeadyBrain:
         self.pattern_cache = {}
         self.knowledge_graph = {}
         
-        print("BRAIN: Initialized - The Central Intelligence is ready")
-        print(f"  * Performance optimizations enabled")
-        print(f"  * Cache directory: {self.cache_dir}")
-        print(f"  * Parallel processing: {self.executor._max_workers} workers")
+        if not self.quiet:
+            print("BRAIN: Initialized - The Central Intelligence is ready")
+            print(f"  * Performance optimizations enabled")
+            print(f"  * Cache directory: {self.cache_dir}")
+            print(f"  * Parallel processing: {self.executor._max_workers} workers")
     
     @performance_monitor
     def process_request(self, request: str, user_config: Optional[Dict[str, Any]] = None) -> ProcessingContext:
@@ -207,42 +400,541 @@ class HeadyBrain:
         
         timestamp = datetime.now().isoformat()
         
-        print(f"\n{'='*80}")
-        print("BRAIN - ENHANCED INTELLIGENCE PROCESSING PIPELINE")
-        print(f"{'='*80}")
-        print(f"Request: {request}")
-        print(f"Timestamp: {timestamp}")
-        print(f"Configuration: Enhanced learning mode active")
+        if not self.quiet:
+            print(f"\n{'='*80}")
+            print("BRAIN - ENHANCED INTELLIGENCE PROCESSING PIPELINE")
+            print(f"{'='*80}")
+            print(f"Request: {request}")
+            print(f"Timestamp: {timestamp}")
+            print(f"Configuration: Enhanced learning mode active")
         
         # Check cache first if enabled
-        cache_key = None
+        cache_key = self._get_cache_key(request, config)
         if config["enable_caching"]:
-            cache_key = self._get_cache_key(request, config)
-            cached_context = self._load_from_cache(cache_key, config["cache_ttl_minutes"])
+            with self.tracer.span("cache") as span:
+                cached_context = self._load_from_cache(cache_key, config["cache_ttl_minutes"])
+                span["cache_hit"] = cached_context is not None
             if cached_context:
                 self.metrics["cache_hits"] += 1
                 cached_context.cache_hit = True
-                print("  Cache hit - returning cached context")
+                if not self.quiet:
+                    print("  Cache hit - returning cached context")
+                self._after_request(request, config, cache_key)
                 return cached_context
         
-        # Parallel processing of stages
-        if config["enable_parallel_processing"]:
-            context = self._process_request_parallel(request, config, timestamp)
-        else:
-            context = self._process_request_sequential(request, config, timestamp)
+        # Join an identical in-flight request instead of recomputing it
+        is_leader, flight = self.coalescer.join(cache_key)
+        while not is_leader:
+            result = flight.result()
+            if result is not None:
+                self.metrics["coalesced_requests"] += 1
+                if not self.quiet:
+                    print("  Coalesced with identical in-flight request")
+                self._after_request(request, config, cache_key)
+                # Own copy: timing and cache flags are set per caller
+                return replace(result)
+            is_leader, flight = self.coalescer.join(cache_key)
         
-        # Cache the result if enabled
-        if config["enable_caching"] and cache_key:
-            self._save_to_cache(cache_key, context)
+        try:
+            # Parallel processing of stages
+            if config["enable_parallel_processing"]:
+                context = self._process_request_parallel(request, config, timestamp)
+            else:
+                context = self._process_request_sequential(request, config, timestamp)
+            
+            # Cache the result if enabled
+            if config["enable_caching"]:
+                self._save_to_cache(cache_key, context)
+        except BaseException as e:
+            self.coalescer.complete(cache_key, flight, error=e)
+            raise
+        self.coalescer.complete(cache_key, flight, result=context)
+        self._after_request(request, config, cache_key)
         
         # Update metrics
         self._update_metrics(context.processing_time)
-        print("BRAIN - ENHANCED INTELLIGENCE PROCESSING COMPLETE")
-        print(f"Learning metrics updated: {self.learning_metrics}")
-        print(f"{'='*80}\n")
+        if not self.quiet:
+            print("BRAIN - ENHANCED INTELLIGENCE PROCESSING COMPLETE")
+            print(f"Learning metrics updated: {self.learning_metrics}")
+            print(f"{'='*80}\n")
+        
+        return context
+    
+    @performance_monitor
+    async def process_request_async(self, request: str, user_config: Optional[Dict[str, Any]] = None) -> ProcessingContext:
+        """
+        Native asyncio processing pipeline for async callers (FastAPI worker).
+        
+        LENS, MEMORY and CONDUCTOR stages run concurrently via asyncio.gather,
+        each bounded by ``stage_timeout_seconds``. Blocking component calls run
+        on the shared executor, so many in-flight requests share a fixed pool of
+        threads. Cancelling the caller cancels queued stage work and signals
+        in-flight memory queries to stop. Shares the cache and the single-flight
+        table with process_request.
+        """
+        start_time = time.time()
+        self.learning_metrics["total_processed"] += 1
+        
+        config = {**self.default_config, **(user_config or {})}
+        timestamp = datetime.now().isoformat()
+        
+        cache_key = self._get_cache_key(request, config)
+        if config["enable_caching"]:
+            with self.tracer.span("cache") as span:
+                cached_context = await self._run_blocking(
+                    self._load_from_cache, cache_key, config["cache_ttl_minutes"]
+                )
+                span["cache_hit"] = cached_context is not None
+            if cached_context:
+                self.metrics["cache_hits"] += 1
+                cached_context.cache_hit = True
+                self._after_request(request, config, cache_key)
+                return cached_context
+        
+        # Join an identical in-flight request (sync or async) instead of recomputing it.
+        # The shield keeps a cancelled follower from cancelling the shared computation.
+        is_leader, flight = self.coalescer.join(cache_key)
+        while not is_leader:
+            result = await asyncio.shield(asyncio.wrap_future(flight))
+            if result is not None:
+                self.metrics["coalesced_requests"] += 1
+                self._after_request(request, config, cache_key)
+                return replace(result)
+            is_leader, flight = self.coalescer.join(cache_key)
+        
+        try:
+            context = await self._compute_request_async(request, config, timestamp)
+            if config["enable_caching"]:
+                await self._run_blocking(self._save_to_cache, cache_key, context)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; waiters compute the request themselves
+            self.coalescer.abandon(cache_key, flight)
+            raise
+        except BaseException as e:
+            self.coalescer.complete(cache_key, flight, error=e)
+            raise
+        self.coalescer.complete(cache_key, flight, result=context)
+        self._after_request(request, config, cache_key)
+        
+        self._update_metrics(time.time() - start_time)
+        return context
+    
+    async def _compute_request_async(self, request: str, config: Dict[str, Any], timestamp: str) -> ProcessingContext:
+        """Run the async stage graph for one request (no cache or coalescing)."""
+        cancel_event = threading.Event()
+        timeout = config["stage_timeout_seconds"]
+        try:
+            system_result, memory_result, execution_plan = await asyncio.gather(
+                self._run_stage_async("system", timeout, self._gather_system_awareness, config),
+                self._run_stage_async("memory", timeout, self._recall_knowledge, request, config,
+                                      cancel_event, cancel_event=cancel_event),
+                self._run_stage_async("plan", timeout, self._generate_execution_plan, request, config)
+            )
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+        
+        system_state, active_nodes, service_health = system_result
+        relevant_memories, user_preferences, external_sources = memory_result
+        
+        concepts_identified, tasks_assigned = self._analyze_and_assign(request, relevant_memories)
+        comparative_analysis = self._perform_comparative_analysis(request, external_sources, config)
+        
+        # Only drop_oldest never touches disk or waits; block waits for room and spill appends to a file
+        if self.persistence and self.persistence.overflow_policy == "drop_oldest":
+            self._store_processing_context(request, concepts_identified, tasks_assigned, execution_plan)
+        else:
+            await self._run_blocking(
+                self._store_processing_context, request, concepts_identified, tasks_assigned, execution_plan
+            )
+        
+        return self._create_context(
+            request, timestamp, system_state, active_nodes, service_health,
+            relevant_memories, user_preferences, external_sources,
+            execution_plan, concepts_identified, tasks_assigned, comparative_analysis
+        )
+    
+    @staticmethod
+    def _submit(executor, func, *args) -> Future:
+        """
+        Submit func in a copy of the caller's context: context-scoped state
+        such as the daemon's per-command stdout follows the stage to its worker.
+        """
+        return executor.submit(contextvars.copy_context().run, func, *args)
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call on the shared executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, contextvars.copy_context().run, partial(func, *args))
+    
+    async def _run_stage_async(self, stage: str, timeout: float, func, *args,
+                               cancel_event: Optional[threading.Event] = None) -> Any:
+        """
+        Run one pipeline stage with a timeout, falling back to defaults on failure.
+        The timeout starts when a worker picks the stage up: time spent queued
+        behind other requests' stages on the shared executor does not count.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(None) as deadline:
+                future = None
+                
+                def start_clock(when: float):
+                    if not future.done():
+                        deadline.reschedule(when)
+                
+                def run():
+                    loop.call_soon_threadsafe(start_clock, loop.time() + timeout)
+                    return func(*args)
+                
+                future = loop.run_in_executor(self.executor, contextvars.copy_context().run, run)
+                return await future
+        except TimeoutError:
+            if cancel_event:
+                cancel_event.set()
+            self.logger.warning(f"Async stage {stage} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            if cancel_event:
+                cancel_event.set()
+            raise
+        except Exception as e:
+            self.logger.warning(f"Async stage {stage} failed: {e}")
+        return self._get_default_result(stage)
+    
+    def process_request_stream(self, request: str, user_config: Optional[Dict[str, Any]] = None) -> Iterator[StreamEvent]:
+        """
+        Streaming variant of process_request.
+        
+        LENS, MEMORY and CONDUCTOR stages run concurrently on the shared
+        executor and each yields a StreamEvent as soon as it completes, so the
+        first useful partial arrives after the fastest stage. Concepts and
+        comparative analysis follow the memories; a final "context" event
+        carries the full ProcessingContext. Cache hits and identical in-flight
+        requests replay the finished context as events; otherwise the stream
+        leads the single-flight entry, so identical concurrent requests wait
+        for it instead of repeating the work.
+        """
+        start = time.perf_counter()
+        config = {**self.default_config, **(user_config or {})}
+        timestamp = datetime.now().isoformat()
+        cache_key = self._get_cache_key(request, config)
+        
+        context = None
+        if config["enable_caching"]:
+            with self.tracer.span("cache") as span:
+                context = self._load_from_cache(cache_key, config["cache_ttl_minutes"])
+                span["cache_hit"] = context is not None
+            if context:
+                self.metrics["cache_hits"] += 1
+                context.cache_hit = True
+        if context is None:
+            is_leader, flight = self.coalescer.join(cache_key)
+            while not is_leader:
+                context = flight.result()
+                if context is not None:
+                    self.metrics["coalesced_requests"] += 1
+                    context = replace(context)
+                    break
+                is_leader, flight = self.coalescer.join(cache_key)
+        if context is not None:
+            self._after_request(request, config, cache_key)
+            yield from self._context_events(context, start)
+            return
         
+        try:
+            context = yield from self._lead_stream(request, config, timestamp, cache_key, start)
+        except GeneratorExit:
+            # Consumer went away; waiters compute the request themselves
+            self.coalescer.abandon(cache_key, flight)
+            raise
+        except BaseException as e:
+            self.coalescer.complete(cache_key, flight, error=e)
+            raise
+        self.coalescer.complete(cache_key, flight, result=context)
+        self._update_metrics(context.processing_time)
+        self._after_request(request, config, cache_key)
+        yield StreamEvent("context", context, (time.perf_counter() - start) * 1000.0)
+    
+    def _lead_stream(self, request: str, config: Dict[str, Any], timestamp: str,
+                     cache_key: str, start: float) -> Generator[StreamEvent, None, ProcessingContext]:
+        """Compute a streamed request, yielding stage events; returns the context."""
+        self.learning_metrics["total_processed"] += 1
+        cancel_event = threading.Event()
+        futures = {
+            self._submit(self.executor, self._gather_system_awareness, config): "system",
+            self._submit(self.executor, self._recall_knowledge, request, config, cancel_event): "memory",
+            self._submit(self.executor, self._generate_execution_plan, request, config): "plan"
+        }
+        results = {}
+        try:
+            try:
+                for future in as_completed(futures, timeout=config["stage_timeout_seconds"]):
+                    stage = futures[future]
+                    try:
+                        results[stage] = future.result()
+                    except Exception as e:
+                        self.logger.warning(f"Streaming stage {stage} failed: {e}")
+                        results[stage] = self._get_default_result(stage)
+                    yield from self._stage_events(stage, request, config, results, start)
+            except TimeoutError:
+                cancel_event.set()
+                self.logger.warning(f"Streaming stages timed out after {config['stage_timeout_seconds']}s")
+                for stage in ("system", "memory", "plan"):
+                    if stage not in results:
+                        results[stage] = self._get_default_result(stage)
+                        yield from self._stage_events(stage, request, config, results, start)
+        finally:
+            # Consumer went away or a stage timed out: stop outstanding work
+            for future in futures:
+                future.cancel()
+            if not all(stage in results for stage in futures.values()):
+                cancel_event.set()
+        
+        context = self._finish_stream(request, config, timestamp, results)
+        context.processing_time = time.perf_counter() - start
+        if config["enable_caching"]:
+            self._save_to_cache(cache_key, context)
         return context
     
+    async def process_request_stream_async(self, request: str,
+                                           user_config: Optional[Dict[str, Any]] = None) -> AsyncIterator[StreamEvent]:
+        """
+        Async generator counterpart of process_request_stream for event-loop
+        callers (SSE / WebSocket endpoints). Stages are bounded by
+        ``stage_timeout_seconds`` and cancelled if the consumer disconnects.
+        """
+        start = time.perf_counter()
+        config = {**self.default_config, **(user_config or {})}
+        timestamp = datetime.now().isoformat()
+        cache_key = self._get_cache_key(request, config)
+        
+        context = None
+        if config["enable_caching"]:
+            with self.tracer.span("cache") as span:
+                context = await self._run_blocking(self._load_from_cache, cache_key, config["cache_ttl_minutes"])
+                span["cache_hit"] = context is not None
+            if context:
+                self.metrics["cache_hits"] += 1
+                context.cache_hit = True
+        if context is None:
+            is_leader, flight = self.coalescer.join(cache_key)
+            while not is_leader:
+                context = await asyncio.shield(asyncio.wrap_future(flight))
+                if context is not None:
+                    self.metrics["coalesced_requests"] += 1
+                    context = replace(context)
+                    break
+                is_leader, flight = self.coalescer.join(cache_key)
+        if context is not None:
+            self._after_request(request, config, cache_key)
+            for event in self._context_events(context, start):
+                yield event
+            return
+        
+        self.learning_metrics["total_processed"] += 1
+        cancel_event = threading.Event()
+        timeout = config["stage_timeout_seconds"]
+        tasks = {
+            asyncio.ensure_future(self._run_stage_async("system", timeout, self._gather_system_awareness, config)): "system",
+            asyncio.ensure_future(self._run_stage_async("memory", timeout, self._recall_knowledge, request, config,
+                                                        cancel_event, cancel_event=cancel_event)): "memory",
+            asyncio.ensure_future(self._run_stage_async("plan", timeout, self._generate_execution_plan, request, config)): "plan"
+        }
+        results = {}
+        try:
+            try:
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        stage = tasks[task]
+                        results[stage] = task.result()
+                        for event in self._stage_events(stage, request, config, results, start):
+                            yield event
+            finally:
+                for task in tasks:
+                    task.cancel()
+                if not all(stage in results for stage in tasks.values()):
+                    cancel_event.set()
+            
+            context = self._finish_stream(request, config, timestamp, results)
+            context.processing_time = time.perf_counter() - start
+            if config["enable_caching"]:
+                await self._run_blocking(self._save_to_cache, cache_key, context)
+        except (GeneratorExit, asyncio.CancelledError):
+            # Consumer went away; waiters compute the request themselves
+            self.coalescer.abandon(cache_key, flight)
+            raise
+        except BaseException as e:
+            self.coalescer.complete(cache_key, flight, error=e)
+            raise
+        self.coalescer.complete(cache_key, flight, result=context)
+        self._update_metrics(context.processing_time)
+        self._after_request(request, config, cache_key)
+        yield StreamEvent("context", context, (time.perf_counter() - start) * 1000.0)
+    
+    def _stage_events(self, stage: str, request: str, config: Dict[str, Any],
+                      results: Dict[str, Any], start: float) -> Iterator[StreamEvent]:
+        """Events for a finished stage; memories also unlock concepts and analysis."""
+        elapsed = lambda: (time.perf_counter() - start) * 1000.0
+        result = results[stage]
+        
+        if stage == "system":
+            system_state, active_nodes, service_health = result
+            yield StreamEvent("system_state", {
+                "system_state": system_state, "active_nodes": active_nodes, "service_health": service_health
+            }, elapsed())
+        elif stage == "plan":
+            yield StreamEvent("plan", result, elapsed())
+        elif stage == "memory":
+            relevant_memories, user_preferences, external_sources = result
+            yield StreamEvent("memories", {
+                "relevant_memories": relevant_memories, "user_preferences": user_preferences,
+                "external_sources": external_sources
+            }, elapsed())
+            
+            results["concepts"] = self._analyze_and_assign(request, relevant_memories)
+            concepts_identified, tasks_assigned = results["concepts"]
+            yield StreamEvent("concepts", {
+                "concepts_identified": concepts_identified, "tasks_assigned": tasks_assigned
+            }, elapsed())
+            
+            results["analysis"] = self._perform_comparative_analysis(request, external_sources, config)
+            yield StreamEvent("analysis", {"comparative_analysis": results["analysis"]}, elapsed())
+    
+    def _context_events(self, context: ProcessingContext, start: float) -> Iterator[StreamEvent]:
+        """Replay a finished context as the same sequence of typed events."""
+        elapsed = (time.perf_counter() - start) * 1000.0
+        cache_hit = context.cache_hit
+        yield StreamEvent("system_state", {
+            "system_state": context.system_state, "active_nodes": context.active_nodes,
+            "service_health": context.service_health
+        }, elapsed, cache_hit)
+        yield StreamEvent("memories", {
+            "relevant_memories": context.relevant_memories, "user_preferences": context.user_preferences,
+            "external_sources": context.external_sources
+        }, elapsed, cache_hit)
+        yield StreamEvent("plan", context.execution_plan, elapsed, cache_hit)
+        yield StreamEvent("concepts", {
+            "concepts_identified": context.concepts_identified, "tasks_assigned": context.tasks_assigned
+        }, elapsed, cache_hit)
+        yield StreamEvent("analysis", {"comparative_analysis": context.comparative_analysis}, elapsed, cache_hit)
+        yield StreamEvent("context", context, elapsed, cache_hit)
+    
+    def _finish_stream(self, request: str, config: Dict[str, Any], timestamp: str,
+                       results: Dict[str, Any]) -> ProcessingContext:
+        """Assemble and persist the full context once every streamed stage is in."""
+        system_state, active_nodes, service_health = results.get("system", self._get_default_result("system"))
+        relevant_memories, user_preferences, external_sources = results.get("memory", self._get_default_result("memory"))
+        execution_plan = results.get("plan", self._empty_execution_plan())
+        concepts_identified, tasks_assigned = results.get("concepts") or self._analyze_and_assign(request, relevant_memories)
+        comparative_analysis = results.get("analysis") or self._perform_comparative_analysis(request, external_sources, config)
+        
+        self._store_processing_context(request, concepts_identified, tasks_assigned, execution_plan)
+        
+        return self._create_context(
+            request, timestamp, system_state, active_nodes, service_health,
+            relevant_memories, user_preferences, external_sources,
+            execution_plan, concepts_identified, tasks_assigned, comparative_analysis
+        )
+    
+    def process_batch(self, requests: List[str], user_config: Optional[Dict[str, Any]] = None) -> List[ProcessingContext]:
+        """
+        Process many requests in one pass (log replay, cache pre-warming, pattern mining).
+        
+        Requests that are identical after normalization are computed once and
+        share a context. The batch takes one LENS snapshot and one preferences
+        read, looks up memories for the union of keywords in a single bulk
+        query, scores all requests against the registry in one CONDUCTOR pass
+        and hands every processing context to persistence in one call; the
+        write-behind queue then stores them in batches of its batch_size.
+        Returns one context per input request, in input order.
+        """
+        start_time = time.time()
+        self.learning_metrics["total_processed"] += len(requests)
+        
+        config = {**self.default_config, **(user_config or {})}
+        timestamp = datetime.now().isoformat()
+        
+        # Group request spellings by normalized form
+        variants_by_request: Dict[str, List[str]] = {}
+        for request in requests:
+            variants_by_request.setdefault(self._normalize_request(request), []).append(request)
+        
+        contexts: Dict[str, ProcessingContext] = {}
+        pending = []
+        for normalized, variants in variants_by_request.items():
+            if config["enable_caching"]:
+                cached_context = self._load_from_cache(
+                    self._get_cache_key(variants[0], config), config["cache_ttl_minutes"]
+                )
+                if cached_context:
+                    self.metrics["cache_hits"] += 1
+                    cached_context.cache_hit = True
+                    contexts[normalized] = cached_context
+                    continue
+            pending.append(normalized)
+        
+        if pending:
+            batch_requests = [variants_by_request[normalized][0] for normalized in pending]
+            
+            system_state, active_nodes, service_health = self._gather_system_awareness(config)
+            memories_per_request, user_preferences, external_sources = self._recall_knowledge_batch(batch_requests, config)
+            execution_plans = self._generate_execution_plans(batch_requests, config)
+            
+            records = []
+            for normalized, request, relevant_memories, execution_plan in zip(
+                pending, batch_requests, memories_per_request, execution_plans
+            ):
+                concepts_identified, tasks_assigned = self._analyze_and_assign(request, relevant_memories)
+                comparative_analysis = self._perform_comparative_analysis(request, external_sources, config)
+                records.append(self._processing_context_record(
+                    request, concepts_identified, tasks_assigned, execution_plan
+                ))
+                contexts[normalized] = self._create_context(
+                    request, timestamp, system_state, active_nodes, service_health,
+                    relevant_memories, user_preferences, external_sources,
+                    execution_plan, concepts_identified, tasks_assigned, comparative_analysis
+                )
+            
+            if records:
+                self._persist_many(records)
+            
+            per_request_time = (time.time() - start_time) / len(pending)
+            for normalized in pending:
+                context = contexts[normalized]
+                context.processing_time = per_request_time
+                if config["enable_caching"]:
+                    for variant in set(variants_by_request[normalized]):
+                        self._save_to_cache(self._get_cache_key(variant, config), context)
+                self._update_metrics(per_request_time)
+        
+        return [contexts[self._normalize_request(request)] for request in requests]
+    
+    def _normalize_request(self, request: str) -> str:
+        """Normalize request text for de-duplication (case and whitespace)."""
+        return " ".join(request.lower().split())
+    
+    def _recall_knowledge_batch(self, requests: List[str], config: Dict[str, Any]) -> Tuple[List[List], Dict, List]:
+        """Recall knowledge for many requests with one bulk MEMORY lookup."""
+        if not (config["use_memory"] and self.memory):
+            return [[] for _ in requests], {}, []
+        
+        # Same keywords, limit and ranking as _recall_knowledge's memory.search
+        keywords_per_request = [self._extract_keywords(request)[:5] for request in requests]
+        memories_per_request = self.memory.search_many(keywords_per_request, max_results=10)
+        
+        preferences = self.memory.get_all_preferences()
+        return memories_per_request, preferences, []
+    
+    def _generate_execution_plans(self, requests: List[str], config: Dict) -> List[Dict[str, Any]]:
+        """Generate execution plans for many requests in one CONDUCTOR pass."""
+        if config["use_conductor"] and self.conductor:
+            if hasattr(self.conductor, "analyze_requests"):
+                return self.conductor.analyze_requests(requests)
+            return [self.conductor.analyze_request(request) for request in requests]
+        return [self._empty_execution_plan() for _ in requests]
+    
     def _process_request_sequential(self, request: str, config: Dict[str, Any], timestamp: str) -> ProcessingContext:
         """Process request sequentially (original method)."""
         # Stage 1: Gather system awareness from LENS
@@ -277,16 +969,16 @@ class HeadyBrain:
         with ThreadPoolExecutor(max_workers=3) as executor:
             # System awareness can run in parallel with memory recall
             if config["use_lens"] and self.lens:
-                futures["system"] = executor.submit(self._gather_system_awareness, config)
+                futures["system"] = self._submit(executor, self._gather_system_awareness, config)
             
             if config["use_memory"] and self.memory:
-                futures["memory"] = executor.submit(self._recall_knowledge, request, config)
+                futures["memory"] = self._submit(executor, self._recall_knowledge, request, config)
             
             # Wait for parallel tasks
             results = {}
             for key, future in futures.items():
                 try:
-                    results[key] = future.result(timeout=10)
+                    results[key] = future.result(timeout=config["stage_timeout_seconds"])
                 except Exception as e:
                     self.logger.warning(f"Parallel task {key} failed: {e}")
                     results[key] = self._get_default_result(key)
@@ -308,46 +1000,6 @@ class HeadyBrain:
             relevant_memories, user_preferences, external_sources,
             execution_plan, concepts_identified, tasks_assigned, comparative_analysis
         )
-        """
-        Process request with full context gathering.
-        Returns comprehensive context for conductor to use.
-        """
-        
-        # Process request to gather context
-        context = self.process_request(request, user_config)
-        
-        # Record execution in LENS (without calling conductor to avoid recursion)
-        if self.lens:
-            for node_info in context.execution_plan.get("nodes_to_invoke", []):
-                self.lens.record_node_activity(node_info["name"])
-            
-            for workflow_info in context.execution_plan.get("workflows_to_execute", []):
-                self.lens.record_workflow_execution(workflow_info["name"])
-        
-        # Return comprehensive context (converted to dict manually)
-        return {
-            "request": request,
-            "context": {
-                "request": context.request,
-                "timestamp": context.timestamp,
-                "system_state": context.system_state,
-                "active_nodes": context.active_nodes,
-                "service_health": context.service_health,
-                "relevant_memories": context.relevant_memories,
-                "user_preferences": context.user_preferences,
-                "external_sources": context.external_sources,
-                "execution_plan": context.execution_plan,
-                "concepts_identified": context.concepts_identified,
-                "tasks_assigned": context.tasks_assigned,
-                "comparative_analysis": context.comparative_analysis,
-                "patterns_identified": getattr(context, 'patterns_identified', []),
-                "synthesized_knowledge": getattr(context, 'synthesized_knowledge', {}),
-                "predictions": getattr(context, 'predictions', []),
-                "learning_metrics": getattr(context, 'learning_metrics', {})
-            },
-            "timestamp": datetime.now().isoformat(),
-            "learning_enabled": True
-        }
     
     def _get_cache_key(self, request: str, config: Dict[str, Any]) -> str:
         """Generate cache key for request."""
@@ -356,28 +1008,26 @@ class HeadyBrain:
     
     def _load_from_cache(self, cache_key: str, ttl_minutes: int) -> Optional[ProcessingContext]:
         """Load cached context if available and not expired."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        cache_file = self.cache_dir / f"{cache_key}.hcx"
         if cache_file.exists():
             try:
-                with open(cache_file, 'rb') as f:
-                    cached_data = pickle.load(f)
+                context, envelope = CONTEXT_CODEC.decode(cache_file.read_bytes())
                 
-                cached_time = datetime.fromisoformat(cached_data['timestamp'])
+                cached_time = datetime.fromisoformat(envelope['timestamp'])
                 if datetime.now() - cached_time < timedelta(minutes=ttl_minutes):
-                    return cached_data['context']
+                    return context
+            except CodecError as e:
+                # Written under another schema version or truncated: treat as a miss
+                self.logger.debug(f"Cache entry {cache_key} ignored: {e}")
             except Exception as e:
                 self.logger.warning(f"Cache load failed: {e}")
         return None
     
     def _save_to_cache(self, cache_key: str, context: ProcessingContext):
         """Save context to cache."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        cache_file = self.cache_dir / f"{cache_key}.hcx"
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'context': context
-                }, f)
+            cache_file.write_bytes(CONTEXT_CODEC.encode(context, timestamp=datetime.now().isoformat()))
         except Exception as e:
             self.logger.warning(f"Cache save failed: {e}")
     
@@ -395,8 +1045,11 @@ class HeadyBrain:
             return {}, [], {}
         elif key == "memory":
             return [], {}, []
+        elif key == "plan":
+            return self._empty_execution_plan()
         return None
     
+    @traced_stage("lens")
     def _gather_system_awareness(self, config: Dict[str, Any]) -> Tuple[Dict, List, Dict]:
         """Gather system awareness from LENS."""
         if config["use_lens"] and self.lens:
@@ -404,43 +1057,88 @@ class HeadyBrain:
             return state, state.get("nodes_active", []), state.get("services", {})
         return {}, [], {}
     
-    def _recall_knowledge(self, request: str, config: Dict[str, Any]) -> Tuple[List, Dict, List]:
+    @traced_stage("memory")
+    def _recall_knowledge(self, request: str, config: Dict[str, Any],
+                          cancel_event: Optional[threading.Event] = None) -> Tuple[List, Dict, List]:
         """Recall knowledge from MEMORY."""
         if config["use_memory"] and self.memory:
-            keywords = self._extract_keywords(request)
-            memories = self.memory.search(keywords[:5], max_results=10)
+            keywords = self._extract_keywords(request)[:5]
+            memories = self.prefetcher.cached_memories(keywords) if self.prefetcher else None
+            if memories is None:
+                memories = self.memory.search(keywords, max_results=10, cancel_event=cancel_event)
+                if self._is_prefetching():
+                    self.prefetcher.cache_memories(keywords, memories)
             preferences = self.memory.get_all_preferences()
             external = []
             return memories, preferences, external
         return [], {}, []
     
+    @traced_stage("analysis")
     def _analyze_and_assign(self, request: str, memories: List[Dict]) -> Tuple[List, List]:
         """Analyze request and assign tasks."""
         concepts = self._identify_concepts(request, memories)
         tasks = self._assign_tasks(request, concepts)
         return concepts, tasks
     
+    @traced_stage("comparative")
     def _perform_comparative_analysis(self, request: str, sources: List[Dict], config: Dict) -> str:
         """Perform comparative analysis."""
         if config["enable_comparative_analysis"]:
             return self._comparative_analysis(request, sources)
         return "Comparative analysis disabled"
     
+    @traced_stage("plan")
     def _generate_execution_plan(self, request: str, config: Dict) -> Dict[str, Any]:
         """Generate execution plan."""
         if config["use_conductor"] and self.conductor:
             return self.conductor.analyze_request(request)
+        return self._empty_execution_plan()
+    
+    def _empty_execution_plan(self) -> Dict[str, Any]:
+        """Execution plan used when CONDUCTOR is unavailable or its stage fails."""
         return {"confidence": 0.0, "nodes_to_invoke": [], "workflows_to_execute": [], "tools_to_use": [], "services_required": []}
     
+    @traced_stage("persist")
     def _store_processing_context(self, request: str, concepts: List[str], tasks: List[Dict], plan: Dict):
         """Store processing context in memory."""
-        if self.memory:
-            self.memory.store(
-                category="processing_context",
-                content={"request": request, "concepts": concepts, "tasks": tasks, "plan": plan},
-                tags=concepts[:5],
-                source="brain"
-            )
+        # Speculative work must not leave traces of requests nobody made
+        if self.memory and not self._is_prefetching():
+            self._persist_many([self._processing_context_record(request, concepts, tasks, plan)])
+    
+    def _persist_many(self, records: List[Dict[str, Any]]):
+        """Queue memory records for write-behind, or write them directly when it is disabled."""
+        if not self.memory:
+            return
+        if self.persistence:
+            self.persistence.put_many(records)
+        elif hasattr(self.memory, "store_many"):
+            self.memory.store_many(records)
+        else:
+            for record in records:
+                self.memory.store(**record)
+    
+    def flush_persistence(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all deferred memory writes have been committed."""
+        if self.persistence:
+            return self.persistence.flush(timeout)
+        return True
+    
+    def shutdown(self):
+        """Flush deferred memory writes and stop background workers."""
+        if self.prefetcher:
+            self.prefetcher.close()
+        if self.persistence:
+            self.persistence.close()
+        self.executor.shutdown(wait=False)
+    
+    def _processing_context_record(self, request: str, concepts: List[str], tasks: List[Dict], plan: Dict) -> Dict[str, Any]:
+        """Build the memory record for a processing context."""
+        return {
+            "category": "processing_context",
+            "content": {"request": request, "concepts": concepts, "tasks": tasks, "plan": plan},
+            "tags": concepts[:5],
+            "source": "brain"
+        }
     
     def _create_context(self, request, timestamp, system_state, active_nodes, service_health,
                        relevant_memories, user_preferences, external_sources,
@@ -490,27 +1188,15 @@ class HeadyBrain:
             for workflow_info in context.execution_plan.get("workflows_to_execute", []):
                 self.lens.record_workflow_execution(workflow_info["name"])
         
-        # Return comprehensive context (converted to dict manually)
+        # Return comprehensive context as a zero-copy view over the context fields
         return {
             "request": request,
-            "context": {
-                "request": context.request,
-                "timestamp": context.timestamp,
-                "system_state": context.system_state,
-                "active_nodes": context.active_nodes,
-                "service_health": context.service_health,
-                "relevant_memories": context.relevant_memories,
-                "user_preferences": context.user_preferences,
-                "external_sources": context.external_sources,
-                "execution_plan": context.execution_plan,
-                "concepts_identified": context.concepts_identified,
-                "tasks_assigned": context.tasks_assigned,
-                "comparative_analysis": context.comparative_analysis,
-                "patterns_identified": getattr(context, 'patterns_identified', []),
-                "synthesized_knowledge": getattr(context, 'synthesized_knowledge', {}),
-                "predictions": getattr(context, 'predictions', []),
-                "learning_metrics": getattr(context, 'learning_metrics', {})
-            },
+            "context": context.as_dict(extras={
+                "patterns_identified": [],
+                "synthesized_knowledge": {},
+                "predictions": [],
+                "learning_metrics": {}
+            }),
             "timestamp": datetime.now().isoformat(),
             "learning_enabled": True,
             "success": True
@@ -519,23 +1205,15 @@ class HeadyBrain:
     def _recognize_patterns(self, request: str, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Recognize patterns in request and historical data."""
         patterns = []
-        request_lower = request.lower()
-        
-        # Check for common request patterns
-        pattern_indicators = {
-            "deployment_request": ["deploy", "deployment", "release", "publish"],
-            "security_request": ["security", "audit", "scan", "vulnerability"],
-            "monitoring_request": ["monitor", "check", "status", "health"],
-            "optimization_request": ["optimize", "improve", "enhance", "boost"],
-            "troubleshooting_request": ["fix", "error", "issue", "problem", "debug"]
-        }
         
-        for pattern_type, indicators in pattern_indicators.items():
-            if any(indicator in request_lower for indicator in indicators):
+        # Check for common request patterns (single pass over the request)
+        hits = REQUEST_MATCHER.match_categories(request)
+        for pattern_type in PATTERN_INDICATORS:
+            if pattern_type in hits:
                 patterns.append({
                     "type": pattern_type,
                     "confidence": 0.8,
-                    "indicators": [i for i in indicators if i in request_lower],
+                    "indicators": hits[pattern_type],
                     "timestamp": datetime.now().isoformat()
                 })
         
@@ -639,9 +1317,66 @@ class HeadyBrain:
                     "confidence": 0.7,
                     "reasoning": "Security audits often reveal issues"
                 })
+            elif pattern["type"] == "verification_request":
+                predictions.append({
+                    "prediction": "monitoring_follow_up_likely",
+                    "confidence": 0.7,
+                    "reasoning": "Verified changes are usually watched afterwards"
+                })
+        
+        for prediction in predictions:
+            prediction["follow_up"] = FOLLOW_UP_REQUESTS.get(prediction["prediction"])
+            # Predictions whose prefetches go unused lose confidence
+            if self.prefetcher:
+                prediction["confidence"] = self.prefetcher.adjusted_confidence(
+                    prediction["prediction"], prediction["confidence"]
+                )
         
         return predictions
     
+    def _after_request(self, request: str, config: Dict[str, Any], cache_key: str):
+        """Credit a prefetch hit and queue warming of the predicted follow-ups."""
+        if not self.prefetcher or self._is_prefetching():
+            return
+        self.prefetcher.record_access(cache_key)
+        if not config["enable_caching"]:
+            return
+        
+        patterns = self._recognize_patterns(request, [])
+        for prediction in self._predictive_analysis(request, [], patterns):
+            follow_up = prediction.get("follow_up")
+            if follow_up and follow_up != request:
+                self.prefetcher.schedule(
+                    prediction["prediction"], follow_up, config,
+                    self._get_cache_key(follow_up, config), prediction["confidence"]
+                )
+    
+    def _warm_follow_up(self, request: str, config: Dict[str, Any]):
+        """Prefetcher job: compute a predicted request into the Brain and memory caches."""
+        cache_key = self._get_cache_key(request, config)
+        if self._load_from_cache(cache_key, config["cache_ttl_minutes"]):
+            return
+        
+        # A foreground request arriving meanwhile joins this flight instead of recomputing
+        is_leader, flight = self.coalescer.join(cache_key)
+        if not is_leader:
+            return
+        
+        self._prefetch_local.active = True
+        try:
+            context = self._process_request_sequential(request, config, datetime.now().isoformat())
+            self._save_to_cache(cache_key, context)
+        except BaseException as e:
+            self.coalescer.complete(cache_key, flight, error=e)
+            raise
+        finally:
+            self._prefetch_local.active = False
+        self.coalescer.complete(cache_key, flight, result=context)
+    
+    def _is_prefetching(self) -> bool:
+        """True on the prefetch worker while it computes a speculative request."""
+        return getattr(self._prefetch_local, "active", False)
+    
     def _enhance_execution_plan_with_learning(self, execution_plan: Dict[str, Any], patterns: List[Dict[str, Any]], predictions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Enhance execution plan with learning insights."""
         # Add learning-based confidence boost
@@ -661,9 +1396,9 @@ class HeadyBrain:
     def _store_learning_insights(self, request: str, concepts: List[str], patterns: List[Dict[str, Any]], predictions: List[Dict[str, Any]], execution_plan: Dict[str, Any]):
         """Store learning insights in memory for future reference."""
         if self.memory:
-            self.memory.store(
-                category="learning_insights",
-                content={
+            self._persist_many([{
+                "category": "learning_insights",
+                "content": {
                     "request": request,
                     "concepts": concepts,
                     "patterns": patterns,
@@ -671,9 +1406,9 @@ class HeadyBrain:
                     "execution_confidence": execution_plan.get("confidence", 0),
                     "learning_timestamp": datetime.now().isoformat()
                 },
-                tags=["learning", "insights"] + concepts[:3],
-                source="brain_learning"
-            )
+                "tags": ["learning", "insights"] + concepts[:3],
+                "source": "brain_learning"
+            }])
     
     def get_learning_metrics(self) -> Dict[str, Any]:
         """Get current learning metrics."""
@@ -687,22 +1422,36 @@ class HeadyBrain:
             )
         }
     
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        """Get request counters plus per-stage latency percentiles (p50/p95/p99)."""
+        return {
+            **self.metrics,
+            "cache_hit_rate": (
+                self.metrics["cache_hits"] / max(self.metrics["requests_processed"] + self.metrics["cache_hits"], 1)
+            ),
+            "stages": self.tracer.get_stage_metrics(),
+            "prefetch": self.prefetcher.get_stats() if self.prefetcher else None,
+            "plan_memo": self._plan_memo_stats()
+        }
+    
+    def _plan_memo_stats(self) -> Optional[Dict[str, Any]]:
+        """Counters of the CONDUCTOR plan memo that the plan stage reads through."""
+        plan_memo = getattr(self.conductor, "plan_memo", None)
+        return plan_memo.get_stats() if plan_memo else None
+    
+    def export_performance_metrics(self, format: str = "json") -> str:
+        """Dump stage metrics as ``json`` or ``openmetrics`` text."""
+        if format == "json":
+            return json.dumps(self.get_performance_metrics(), indent=2)
+        if format == "openmetrics":
+            return self.tracer.to_openmetrics()
+        raise ValueError(f"Unknown metrics format '{format}', expected 'json' or 'openmetrics'")
+    
     def _identify_concepts(self, request: str, memories: List[Dict[str, Any]]) -> List[str]:
         concepts = set()
         
-        # Extract from request
-        request_lower = request.lower()
-        
-        # System concepts
-        system_concepts = [
-            "deployment", "monitoring", "security", "optimization", "documentation",
-            "workflow", "node", "service", "database", "api", "frontend",
-            "authentication", "encryption", "visualization", "testing"
-        ]
-        
-        for concept in system_concepts:
-            if concept in request_lower:
-                concepts.add(concept)
+        # System concepts mentioned in the request
+        concepts.update(REQUEST_MATCHER.match_categories(request).get("system_concept", []))
         
         # Extract from memories
         for memory in memories[:10]:  # Top 10 memories
@@ -777,6 +1526,12 @@ class HeadyBrain:
         if self.registry:
             awareness["registry_summary"] = self.registry.get_summary()
         
+        if self.persistence:
+            awareness["persistence"] = self.persistence.get_stats()
+        
+        if self.prefetcher:
+            awareness["prefetch"] = self.prefetcher.get_stats()
+        
         # Don't call conductor.get_system_summary() to avoid circular recursion
         if self.conductor:
             awareness["execution_log_size"] = len(self.conductor.execution_log)
@@ -46,7 +46,9 @@ from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache, wraps
 import hashlib
-import pickle
+
+from HeadyTelemetry import StageTracer, traced_stage
+from HeadyCodec import RecordCodec, CodecError
 
 try:
     import psutil
@@ -57,7 +59,7 @@ except ImportError:
     print("⚠ HeadyBrain: psutil/requests not available, limited functionality")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingContext:
     """Context gathered before response generation."""
     request: str
@@ -87,6 +89,11 @@ class ProcessingContext:
     confidence_score: float = 0.0
 
 
+# Versioned binary codec for cached contexts; bump schema_version when fields change.
+# Entries share .heady_cache and the {"timestamp"} envelope with HeadyBrain.
+CONTEXT_CODEC = RecordCodec(ProcessingContext, schema_version=1)
+
+
 def performance_monitor(func):
     """Decorator to monitor function performance."""
     @wraps(func)
@@ -97,13 +104,24 @@ def performance_monitor(func):
             processing_time = time.time() - start_time
             
             # Log performance if available
-            if hasattr(self, 'logger'):
+            if hasattr(self, 'logger') and not getattr(self, 'quiet', False):
                 self.logger.info(f"{func.__name__} completed in {processing_time:.3f}s")
             
             # Add timing to result if it's a ProcessingContext
             if hasattr(result, 'processing_time'):
                 result.processing_time = processing_time
             
+            # Record the end-to-end span
+            if hasattr(self, 'tracer'):
+                self.tracer.record_span({
+                    "stage": func.__name__,
+                    "start": start_time,
+                    "end": start_time + processing_time,
+                    "duration_ms": processing_time * 1000.0,
+                    "cache_hit": bool(getattr(result, 'cache_hit', False)),
+                    "error": None
+                })
+            
             return result
         except Exception as e:
             processing_time = time.time() - start_time
@@ -121,12 +139,18 @@ class HeadyBrainOptimized:
     Features caching, parallel processing, and performance monitoring.
     """
     
-    def __init__(self, registry=None, lens=None, memory=None, conductor=None):
+    def __init__(self, registry=None, lens=None, memory=None, conductor=None, quiet: bool = False):
         self.registry = registry
         self.lens = lens
         self.memory = memory
         self.conductor = conductor
         
+        # Quiet mode keeps console output off the request hot path
+        self.quiet = quiet
+        
+        # Per-stage spans and latency histograms
+        self.tracer = StageTracer(namespace="heady_brain_optimized")
+        
         # Performance optimization components
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.cache_dir = Path(".heady_cache")
@@ -164,10 +188,11 @@ class HeadyBrainOptimized:
             "total_processing_time": 0.0
         }
         
-        print("∞ BRAIN OPTIMIZED: Initialized - Enhanced Central Intelligence is ready")
-        print(f"  ✓ Performance optimizations enabled")
-        print(f"  ✓ Cache directory: {self.cache_dir}")
-        print(f"  ✓ Parallel processing: {self.executor._max_workers} workers")
+        if not self.quiet:
+            print("∞ BRAIN OPTIMIZED: Initialized - Enhanced Central Intelligence is ready")
+            print(f"  ✓ Performance optimizations enabled")
+            print(f"  ✓ Cache directory: {self.cache_dir}")
+            print(f"  ✓ Parallel processing: {self.executor._max_workers} workers")
     
     @performance_monitor
     def process_request(self, request: str, user_config: Optional[Dict[str, Any]] = None) -> ProcessingContext:
@@ -191,22 +216,26 @@ class HeadyBrainOptimized:
         
         timestamp = datetime.now().isoformat()
         
-        print(f"\n{'='*80}")
-        print("∞ BRAIN OPTIMIZED - ENHANCED PROCESSING PIPELINE ∞")
-        print(f"{'='*80}")
-        print(f"Request: {request}")
-        print(f"Timestamp: {timestamp}")
-        print(f"Configuration: {json.dumps(config, indent=2)}")
+        if not self.quiet:
+            print(f"\n{'='*80}")
+            print("∞ BRAIN OPTIMIZED - ENHANCED PROCESSING PIPELINE ∞")
+            print(f"{'='*80}")
+            print(f"Request: {request}")
+            print(f"Timestamp: {timestamp}")
+            print(f"Configuration: {json.dumps(config, indent=2)}")
         
         # Check cache first if enabled
         cache_key = None
         if config["enable_caching"]:
             cache_key = self._get_cache_key(request, config)
-            cached_context = self._load_from_cache(cache_key, config["cache_ttl_minutes"])
+            with self.tracer.span("cache") as span:
+                cached_context = self._load_from_cache(cache_key, config["cache_ttl_minutes"])
+                span["cache_hit"] = cached_context is not None
             if cached_context:
                 self.metrics["cache_hits"] += 1
                 cached_context.cache_hit = True
-                print("  ✓ Cache hit - returning cached context")
+                if not self.quiet:
+                    print("  ✓ Cache hit - returning cached context")
                 return cached_context
         
         # Parallel processing of stages
@@ -222,9 +251,10 @@ class HeadyBrainOptimized:
         # Update metrics
         self._update_metrics(context.processing_time)
         
-        print(f"\n{'='*80}")
-        print("∞ BRAIN OPTIMIZED - PROCESSING COMPLETE ∞")
-        print(f"{'='*80}\n")
+        if not self.quiet:
+            print(f"\n{'='*80}")
+            print("∞ BRAIN OPTIMIZED - PROCESSING COMPLETE ∞")
+            print(f"{'='*80}\n")
         
         return context
     
@@ -294,6 +324,7 @@ class HeadyBrainOptimized:
             execution_plan, concepts_identified, tasks_assigned, comparative_analysis
         )
     
+    @traced_stage("lens")
     def _gather_system_awareness(self, config: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str], Dict[str, str]]:
         """Gather system awareness from LENS."""
         system_state = {}
@@ -301,16 +332,19 @@ class HeadyBrainOptimized:
         service_health = {}
         
         if config["use_lens"] and self.lens:
-            print("\n[Stage 1] Gathering system awareness from LENS...")
+            if not self.quiet:
+                print("\n[Stage 1] Gathering system awareness from LENS...")
             system_state = self.lens.get_current_state()
             active_nodes = system_state.get("nodes_active", [])
             service_health = system_state.get("services", {})
-            print(f"  ✓ System health: {system_state.get('system_health', 'unknown')}")
-            print(f"  ✓ Active nodes: {len(active_nodes)}")
-            print(f"  ✓ Services monitored: {len(service_health)}")
+            if not self.quiet:
+                print(f"  ✓ System health: {system_state.get('system_health', 'unknown')}")
+                print(f"  ✓ Active nodes: {len(active_nodes)}")
+                print(f"  ✓ Services monitored: {len(service_health)}")
         
         return system_state, active_nodes, service_health
     
+    @traced_stage("memory")
     def _recall_knowledge(self, request: str, config: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
         """Recall relevant knowledge from MEMORY."""
         relevant_memories = []
@@ -318,7 +352,8 @@ class HeadyBrainOptimized:
         external_sources = []
         
         if config["use_memory"] and self.memory:
-            print("\n[Stage 2] Recalling relevant knowledge from MEMORY...")
+            if not self.quiet:
+                print("\n[Stage 2] Recalling relevant knowledge from MEMORY...")
             
             # Query memories related to request
             request_keywords = self._extract_keywords(request)
@@ -342,46 +377,57 @@ class HeadyBrainOptimized:
             if config["enable_external_sources"]:
                 external_sources = self.memory.get_external_sources()
             
-            print(f"  ✓ Relevant memories: {len(relevant_memories)}")
-            print(f"  ✓ User preferences: {len(user_preferences)}")
-            print(f"  ✓ External sources: {len(external_sources)}")
+            if not self.quiet:
+                print(f"  ✓ Relevant memories: {len(relevant_memories)}")
+                print(f"  ✓ User preferences: {len(user_preferences)}")
+                print(f"  ✓ External sources: {len(external_sources)}")
         
         return relevant_memories, user_preferences, external_sources
     
+    @traced_stage("analysis")
     def _analyze_and_assign(self, request: str, memories: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
         """Identify concepts and assign tasks."""
-        print("\n[Stage 3] Identifying concepts and assigning tasks...")
+        if not self.quiet:
+            print("\n[Stage 3] Identifying concepts and assigning tasks...")
         concepts_identified = self._identify_concepts(request, memories)
         tasks_assigned = self._assign_tasks(request, concepts_identified)
         
-        print(f"  ✓ Concepts identified: {len(concepts_identified)}")
-        print(f"  ✓ Tasks assigned: {len(tasks_assigned)}")
+        if not self.quiet:
+            print(f"  ✓ Concepts identified: {len(concepts_identified)}")
+            print(f"  ✓ Tasks assigned: {len(tasks_assigned)}")
         
         return concepts_identified, tasks_assigned
     
+    @traced_stage("comparative")
     def _perform_comparative_analysis(self, request: str, external_sources: List[Dict[str, Any]], config: Dict[str, Any]) -> Optional[str]:
         """Perform comparative analysis with external sources."""
         comparative_analysis = None
         if config["enable_comparative_analysis"] and external_sources:
-            print("\n[Stage 4] Performing comparative analysis...")
+            if not self.quiet:
+                print("\n[Stage 4] Performing comparative analysis...")
             comparative_analysis = self._comparative_analysis(request, external_sources)
-            print(f"  ✓ Analysis complete")
+            if not self.quiet:
+                print(f"  ✓ Analysis complete")
         
         return comparative_analysis
     
+    @traced_stage("plan")
     def _generate_execution_plan(self, request: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Generate orchestration plan from CONDUCTOR."""
         execution_plan = {}
         
         if config["use_conductor"] and self.conductor:
-            print("\n[Stage 5] Generating orchestration plan from CONDUCTOR...")
+            if not self.quiet:
+                print("\n[Stage 5] Generating orchestration plan from CONDUCTOR...")
             execution_plan = self.conductor.analyze_request(request)
-            print(f"  ✓ Confidence: {execution_plan.get('confidence', 0):.0%}")
-            print(f"  ✓ Nodes to invoke: {len(execution_plan.get('nodes_to_invoke', []))}")
-            print(f"  ✓ Workflows to execute: {len(execution_plan.get('workflows_to_execute', []))}")
+            if not self.quiet:
+                print(f"  ✓ Confidence: {execution_plan.get('confidence', 0):.0%}")
+                print(f"  ✓ Nodes to invoke: {len(execution_plan.get('nodes_to_invoke', []))}")
+                print(f"  ✓ Workflows to execute: {len(execution_plan.get('workflows_to_execute', []))}")
         
         return execution_plan
     
+    @traced_stage("persist")
     def _store_processing_context(self, request: str, concepts: List[str], tasks: List[Dict[str, Any]], execution_plan: Dict[str, Any]):
         """Store processing context in MEMORY for future reference."""
         if self.memory:
@@ -434,20 +480,24 @@ class HeadyBrainOptimized:
     
     def _load_from_cache(self, cache_key: str, ttl_minutes: int) -> Optional[ProcessingContext]:
         """Load cached context if valid."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        cache_file = self.cache_dir / f"{cache_key}.hcx"
         
         if not cache_file.exists():
             return None
         
         try:
+            context, envelope = CONTEXT_CODEC.decode(cache_file.read_bytes())
+            
             # Check if cache is expired
-            file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if datetime.now() - file_time > timedelta(minutes=ttl_minutes):
+            cached_time = datetime.fromisoformat(envelope["timestamp"])
+            if datetime.now() - cached_time > timedelta(minutes=ttl_minutes):
                 cache_file.unlink()  # Remove expired cache
                 return None
-            
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
+            return context
+        except CodecError as e:
+            # Written under another schema version or truncated: treat as a miss
+            self.logger.debug(f"Cache entry {cache_key} ignored: {e}")
+            return None
         except Exception as e:
             self.logger.warning(f"Cache load failed: {e}")
             if cache_file.exists():
@@ -456,11 +506,10 @@ class HeadyBrainOptimized:
     
     def _save_to_cache(self, cache_key: str, context: ProcessingContext):
         """Save context to cache."""
-        cache_file = self.cache_dir / f"{cache_key}.pkl"
+        cache_file = self.cache_dir / f"{cache_key}.hcx"
         
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(context, f)
+            cache_file.write_bytes(CONTEXT_CODEC.encode(context, timestamp=datetime.now().isoformat()))
         except Exception as e:
             self.logger.warning(f"Cache save failed: {e}")
     
@@ -584,7 +633,7 @@ class HeadyBrainOptimized:
     
     def _get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        cache_files = list(self.cache_dir.glob("*.pkl"))
+        cache_files = list(self.cache_dir.glob("*.hcx"))
         total_size = sum(f.stat().st_size for f in cache_files)
         
         return {
@@ -608,7 +657,7 @@ class HeadyBrainOptimized:
     
     def clear_cache(self):
         """Clear all cached contexts."""
-        cache_files = list(self.cache_dir.glob("*.pkl"))
+        cache_files = list(self.cache_dir.glob("*.hcx"))
         for cache_file in cache_files:
             cache_file.unlink()
         print(f"∞ BRAIN OPTIMIZED: Cleared {len(cache_files)} cached files")
@@ -620,8 +669,23 @@ class HeadyBrainOptimized:
             "cache_hit_rate": (
                 self.metrics["cache_hits"] / max(self.metrics["requests_processed"], 1)
             ),
-            "cache_stats": self._get_cache_stats()
+            "cache_stats": self._get_cache_stats(),
+            "stages": self.tracer.get_stage_metrics(),
+            "plan_memo": self._plan_memo_stats()
         }
+    
+    def _plan_memo_stats(self) -> Optional[Dict[str, Any]]:
+        """Counters of the CONDUCTOR plan memo that the plan stage reads through."""
+        plan_memo = getattr(self.conductor, "plan_memo", None)
+        return plan_memo.get_stats() if plan_memo else None
+    
+    def export_performance_metrics(self, format: str = "json") -> str:
+        """Dump stage metrics as ``json`` or ``openmetrics`` text."""
+        if format == "json":
+            return json.dumps(self.get_performance_metrics(), indent=2)
+        if format == "openmetrics":
+            return self.tracer.to_openmetrics()
+        raise ValueError(f"Unknown metrics format '{format}', expected 'json' or 'openmetrics'")
 
 
 if __name__ == "__main__":
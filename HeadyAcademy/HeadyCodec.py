@@ -0,0 +1,176 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyCodec.py                                 ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      CODEC - COMPACT RECORD SERIALIZATION                                     ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                                    ║
+║     Schema-versioned binary encoding for dataclass records (cache) and        ║
+║     fast JSON for the API layer, without pickle                               ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import dataclasses
+from datetime import date, datetime
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+MAGIC = b"HCX"
+FORMAT_MSGPACK = 1
+FORMAT_ORJSON = 2
+FORMAT_JSON = 3
+
+
+class CodecError(ValueError):
+    """Raised for payloads that are corrupt or written under another schema version."""
+
+
+def json_default(obj: Any) -> Any:
+    """Fallback conversion for values JSON encoders do not handle natively."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=json_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON produced by dumps()."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class RecordView(Mapping):
+    """
+    Read-only mapping over a record's fields without copying them.
+    ``extras`` supplies additional keys that are not fields of the record.
+    """
+
+    __slots__ = ("_record", "_fields", "_extras")
+
+    def __init__(self, record: Any, fields: Dict[str, int], extras: Optional[Dict[str, Any]] = None):
+        self._record = record
+        self._fields = fields
+        self._extras = extras or {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self._record, key)
+        return self._extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        yield from (key for key in self._extras if key not in self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields) + sum(1 for key in self._extras if key not in self._fields)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class RecordCodec:
+    """
+    Positional binary codec for one dataclass type.
+
+    Layout: ``MAGIC | schema version (1 byte) | format (1 byte) | payload``,
+    where payload is ``[envelope, [field values in declaration order]]``
+    packed with msgpack when available, else orjson, else stdlib json.
+    Field names are not repeated per record. Decoding a payload written with
+    a different schema version or field count raises CodecError, so callers
+    treat it as a miss rather than building a wrong object.
+    """
+
+    def __init__(self, record_type: type, schema_version: int = 1, format: Optional[int] = None):
+        self.record_type = record_type
+        self.schema_version = schema_version
+        self.field_names = tuple(f.name for f in dataclasses.fields(record_type))
+        self.fields = {name: index for index, name in enumerate(self.field_names)}
+        if format is None:
+            format = FORMAT_MSGPACK if MSGPACK_AVAILABLE else FORMAT_ORJSON if ORJSON_AVAILABLE else FORMAT_JSON
+        self.format = format
+        self._header = MAGIC + bytes([schema_version, format])
+
+    def view(self, record: Any, extras: Optional[Dict[str, Any]] = None) -> RecordView:
+        """Zero-copy dict view of a record."""
+        return RecordView(record, self.fields, extras)
+
+    def encode(self, record: Any, **envelope) -> bytes:
+        """Encode a record plus optional envelope metadata (e.g. saved_at)."""
+        payload = [envelope, [getattr(record, name) for name in self.field_names]]
+        return self._header + self._pack(payload)
+
+    def decode(self, data: bytes) -> Tuple[Any, Dict[str, Any]]:
+        """Decode bytes from encode() into (record, envelope)."""
+        if len(data) < len(self._header) or data[:len(MAGIC)] != MAGIC:
+            raise CodecError("Not an encoded record")
+        version, format = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version != self.schema_version:
+            raise CodecError(f"Schema version {version} does not match {self.schema_version}")
+
+        try:
+            envelope, row = self._unpack(format, data[len(self._header):])
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt payload: {e}") from e
+        if len(row) != len(self.field_names):
+            raise CodecError(f"Expected {len(self.field_names)} fields, found {len(row)}")
+        return self.record_type(*row), envelope
+
+    def _pack(self, payload: Any) -> bytes:
+        if self.format == FORMAT_MSGPACK:
+            return msgpack.packb(payload, default=json_default, use_bin_type=True)
+        if self.format == FORMAT_ORJSON and ORJSON_AVAILABLE:
+            return orjson.dumps(payload, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, default=json_default, separators=(",", ":")).encode("utf-8")
+
+    def _unpack(self, format: int, body: bytes) -> Any:
+        if format == FORMAT_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise CodecError("Payload needs msgpack, which is not installed")
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        if format in (FORMAT_ORJSON, FORMAT_JSON):
+            return loads(body)
+        raise CodecError(f"Unknown payload format {format}")
@@ -35,18 +35,67 @@
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 """
 
-import os
-import sys
+if __name__ == "__main__":
+    # The CLI is a thin client of the conductor daemon (HeadyDaemon.main). Hand
+    # over before the imports below: only the daemon, or --in-process, needs them
+    from HeadyDaemon import main
+    main()
+    raise SystemExit(0)
+
 import json
-import asyncio
-import subprocess
+import time
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from HeadyRegistry import HeadyRegistry, Node, Workflow, Service, Tool
-from HeadyLens import HeadyLens
-from HeadyMemory import HeadyMemory
-from HeadyBrain import HeadyBrain
+from HeadyRouter import RouterIndex, PlanMemo, normalize_request, DEFAULT_TOP_K, DEFAULT_MIN_SCORE
+
+if TYPE_CHECKING:
+    # Imported on first use so registry-only commands skip asyncio, YAML,
+    # thread and process pools
+    from concurrent.futures import Future
+    from HeadyLens import HeadyLens
+    from HeadyMemory import HeadyMemory
+    from HeadyBrain import HeadyBrain
+    from HeadyExecutor import ExecutionEngine, PlanStep
+    from HeadyWorkQueue import QueueEngine
+    from HeadyToolRunner import ToolRunner
+    from HeadyScheduler import RequestScheduler
+    from HeadyHealth import HealthProber
+    from HeadyCostModel import CostModel
+    from HeadyExecutionLog import ExecutionLog
+
+# Serializes first-use construction; the Brain factory re-enters it for Lens and Memory
+_COMPONENT_LOCK = threading.RLock()
+
+
+class lazy_component:
+    """
+    Instance attribute built by the decorated method on first access.
+    Assigning the attribute replaces the component like a plain attribute.
+    """
+    
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        with _COMPONENT_LOCK:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+        return instance.__dict__[self.name]
+    
+    @staticmethod
+    def is_built(instance, name: str) -> bool:
+        return name in instance.__dict__
 
 
 class HeadyConductor:
@@ -58,18 +107,17 @@ class HeadyConductor:
     def __init__(self, root_path: str = None):
         self.root_path = Path(root_path) if root_path else Path(__file__).parent.parent
         
-        # Initialize core components (all indexed in registry)
+        # The registry answers most commands; Lens, Memory, Brain, resource
+        # policies and the execution pool are built on first use (see warmup())
         self.registry = HeadyRegistry(str(self.root_path))
-        self.lens = HeadyLens(registry=self.registry)
-        self.memory = HeadyMemory(str(self.root_path))
-        self.brain = HeadyBrain(
-            registry=self.registry,
-            lens=self.lens,
-            memory=self.memory,
-            conductor=self
-        )
-        
-        self.execution_log = []
+        self.plan_memo = PlanMemo()
+        self._router_index: Optional[RouterIndex] = None
+        self._tool_runner: Optional["ToolRunner"] = None
+        self._tool_runner_lock = threading.Lock()
+        self.route_top_k = DEFAULT_TOP_K
+        self.route_min_score = DEFAULT_MIN_SCORE
+        # submit() runs orchestrations concurrently; they all update these counters
+        self._stats_lock = threading.Lock()
         self.execution_stats = {
             "total_orchestrations": 0,
             "successful_executions": 0,
@@ -78,137 +126,209 @@ class HeadyConductor:
             "tools_used": 0
         }
         
-        # Start monitoring
-        self.lens.start_monitoring()
-        
         print(" HeadyConductor: SUPREME AUTHORITY INITIALIZED")
         print("  * Registry loaded and under conductor control")
-        print("  * Lens monitoring active and conductor directed")
-        print("  * Memory indexed and conductor managed")
-        print("  * Brain coordinating with conductor authority")
+        print("  * Lens, Memory and Brain stand by until first use")
         print("  * HeadyConductor is in charge and knows it")
         print("  * Optimal utilization protocols activated")
     
+    @lazy_component
+    def lens(self) -> "HeadyLens":
+        """LENS monitor; its background thread starts when health data is first read."""
+        from HeadyLens import HeadyLens
+        return HeadyLens(registry=self.registry)
+    
+    @lazy_component
+    def memory(self) -> "HeadyMemory":
+        from HeadyMemory import HeadyMemory
+        return HeadyMemory(str(self.root_path))
+    
+    @lazy_component
+    def brain(self) -> "HeadyBrain":
+        from HeadyBrain import HeadyBrain
+        return HeadyBrain(
+            registry=self.registry,
+            lens=self.lens,
+            memory=self.memory,
+            conductor=self
+        )
+    
+    @lazy_component
+    def resource_policies(self) -> Dict[str, Any]:
+        from HeadyExecutor import load_resource_policies
+        return load_resource_policies(self.root_path)
+    
+    @lazy_component
+    def executor(self) -> "ExecutionEngine | QueueEngine":
+        """Plan step engine: an in-process pool, or worker nodes when workQueue is enabled."""
+        if (self.resource_policies.get("workQueue") or {}).get("enabled"):
+            from HeadyWorkQueue import QueueEngine
+            return QueueEngine.from_policies(self.resource_policies, self.root_path)
+        from HeadyExecutor import ExecutionEngine
+        return ExecutionEngine.from_policies(self.resource_policies)
+    
+    @lazy_component
+    def scheduler(self) -> "RequestScheduler":
+        """Admission control for submit(): node pools and concurrency limits from resource policies."""
+        from HeadyScheduler import RequestScheduler
+        return RequestScheduler.from_policies(self.resource_policies)
+    
+    @lazy_component
+    def execution_log(self) -> "ExecutionLog":
+        """Last executions in a ring buffer; the full history in compressed segments under .heady."""
+        from HeadyExecutionLog import ExecutionLog
+        return ExecutionLog.from_policies(self.resource_policies, self.root_path)
+    
+    @lazy_component
+    def cost_model(self) -> "CostModel":
+        """Per-capability latency and success history, persisted in .heady, for plan costing."""
+        from HeadyCostModel import CostModel
+        return CostModel.from_policies(self.resource_policies, self.root_path)
+    
+    @lazy_component
+    def health_prober(self) -> "HealthProber":
+        """Concurrent service probes with a TTL cache; background revalidations update the registry."""
+        from HeadyHealth import HealthProber
+        return HealthProber.from_policies(
+            self.resource_policies,
+            on_revalidated=lambda results: self.registry.update_service_statuses(
+                {name: result.status for name, result in results.items()})
+        )
+    
+    def warmup(self, monitoring: bool = True) -> Dict[str, float]:
+        """
+        Build every lazy component now, for long-running processes such as
+        the conductor daemon. Returns milliseconds spent per component.
+        """
+        timings = {}
+        for name in ("resource_policies", "executor", "scheduler", "health_prober", "cost_model", "execution_log", "lens", "memory", "brain"):
+            started = time.perf_counter()
+            getattr(self, name)
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+        started = time.perf_counter()
+        self.get_router_index()
+        timings["router_index"] = round((time.perf_counter() - started) * 1000, 2)
+        if monitoring:
+            self.lens.start_monitoring()
+        tool_runner = self.get_tool_runner()
+        if tool_runner is not None:
+            started = time.perf_counter()
+            tool_runner.warm()
+            timings["tool_runner"] = round((time.perf_counter() - started) * 1000, 2)
+        print(f" HeadyConductor: warmed up in {sum(timings.values()):.0f}ms")
+        return timings
+    
     def analyze_request(self, request: str) -> Dict[str, Any]:
         """
         Analyze a user request and determine which capabilities to invoke.
         Returns a structured execution plan with enhanced confidence scoring.
         """
-        request_lower = request.lower()
-        
-        execution_plan = {
-            "request": request,
-            "timestamp": datetime.now().isoformat(),
-            "nodes_to_invoke": [],
-            "workflows_to_execute": [],
-            "tools_to_use": [],
-            "services_required": [],
-            "confidence": 0.0,
-            "conductor_directive": "HeadyConductor is in charge and will optimize execution"
-        }
-        
-        # Enhanced workflow matching with better confidence
-        for workflow_name, workflow in self.registry.workflows.items():
-            workflow_match = False
-            
-            # Check slash command
-            if workflow.slash_command and workflow.slash_command in request_lower:
-                workflow_match = True
-                execution_plan["confidence"] = max(execution_plan["confidence"], 0.95)
-            
-            # Check workflow name
-            elif workflow_name.lower() in request_lower:
-                workflow_match = True
-                execution_plan["confidence"] = max(execution_plan["confidence"], 0.85)
-            
-            # Check description keywords
-            elif workflow.description:
-                desc_words = workflow.description.lower().split()
-                request_words = request_lower.split()
-                overlap = len(set(desc_words) & set(request_words))
-                if overlap >= 2:  # At least 2 matching words
-                    workflow_match = True
-                    execution_plan["confidence"] = max(execution_plan["confidence"], 0.75)
-            
-            if workflow_match:
-                execution_plan["workflows_to_execute"].append({
-                    "name": workflow.name,
-                    "slash_command": workflow.slash_command,
-                    "file_path": workflow.file_path,
-                    "turbo_enabled": workflow.turbo_enabled,
-                    "conductor_optimized": True
-                })
-        
-        # Enhanced node matching
-        for node_name, node in self.registry.nodes.items():
-            node_match = False
-            
-            if node.trigger_on:
-                for trigger in node.trigger_on:
-                    if trigger.lower() in request_lower:
-                        node_match = True
-                        execution_plan["confidence"] = max(execution_plan["confidence"], 0.85)
-                        break
-            
-            # Check node role/description
-            elif node.role and node.role.lower() in request_lower:
-                node_match = True
-                execution_plan["confidence"] = max(execution_plan["confidence"], 0.80)
-            
-            # Check node name
-            elif node_name.lower() in request_lower:
-                node_match = True
-                execution_plan["confidence"] = max(execution_plan["confidence"], 0.75)
+        return self.analyze_requests([request])[0]
+    
+    def get_router_index(self) -> RouterIndex:
+        """Routing index for the current registry version, rebuilt when the registry changes."""
+        if self._router_index is None or not self._router_index.is_current(self.registry):
+            self._router_index = RouterIndex(self.registry)
+        return self._router_index
+    
+    def analyze_requests(self, requests: List[str], top_k: Optional[int] = None,
+                         min_score: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze many requests against the router index.
+        Capabilities are ranked by BM25F relevance and only the top_k scoring
+        at least min_score make it into the plan, so broad requests no longer
+        fan out to every loosely matching node and tool. Plan confidence is
+        the best calibrated score.
+        
+        Plans are memoized per normalized request and registry signature in
+        plan_memo, so repeating a request skips ranking entirely.
+        """
+        timestamp = datetime.now().isoformat()
+        router = self.get_router_index()
+        registry = self.registry
+        top_k = self.route_top_k if top_k is None else top_k
+        min_score = self.route_min_score if min_score is None else min_score
+        self.plan_memo.bind(router.signature)
+        
+        execution_plans = []
+        for request in requests:
+            key = (normalize_request(request), top_k, min_score)
+            memoized = self.plan_memo.get(key)
+            if memoized is not None:
+                execution_plans.append(self._copy_plan(memoized, request, timestamp, memo_hit=True))
+                continue
             
-            if node_match:
-                execution_plan["nodes_to_invoke"].append({
-                    "name": node.name,
-                    "role": node.role,
-                    "primary_tool": node.primary_tool,
-                    "conductor_directed": True,
-                    "optimization_priority": "high"
-                })
-        
-        # Enhanced tool matching
-        for tool_name, tool in self.registry.tools.items():
-            tool_name_words = tool_name.lower().replace('_', ' ')
+            execution_plan = {
+                "request": request,
+                "timestamp": timestamp,
+                "nodes_to_invoke": [],
+                "workflows_to_execute": [],
+                "tools_to_use": [],
+                "services_required": [],
+                "confidence": 0.0,
+                "routing": {"top_k": top_k, "min_score": min_score},
+                "conductor_directive": "HeadyConductor is in charge and will optimize execution"
+            }
+            matches = router.rank(request, top_k=top_k, min_score=min_score)
             
-            if tool_name_words in request_lower:
-                execution_plan["tools_to_use"].append({
-                    "name": tool.name,
-                    "file_path": tool.file_path,
-                    "category": tool.category,
-                    "conductor_optimized": True
-                })
-                execution_plan["confidence"] = max(execution_plan["confidence"], 0.75)
-        
-        # Service requirement detection
-        service_keywords = {
-            "api": ["api", "endpoint", "request", "server", "service"],
-            "database": ["database", "postgres", "db", "query", "data"],
-            "cache": ["cache", "redis", "memory", "store"],
-            "mcp": ["mcp", "protocol", "connect", "bridge"],
-            "frontend": ["ui", "interface", "web", "frontend", "app"]
-        }
-        
-        for service_name, service in self.registry.services.items():
-            for service_type, keywords in service_keywords.items():
-                if service.type == service_type and any(keyword in request_lower for keyword in keywords):
+            for match in matches:
+                if match.kind == "workflows":
+                    workflow = registry.workflows[match.name]
+                    execution_plan["workflows_to_execute"].append({
+                        "name": workflow.name,
+                        "slash_command": workflow.slash_command,
+                        "file_path": workflow.file_path,
+                        "turbo_enabled": workflow.turbo_enabled,
+                        "relevance": match.confidence,
+                        "conductor_optimized": True
+                    })
+                elif match.kind == "nodes":
+                    node = registry.nodes[match.name]
+                    execution_plan["nodes_to_invoke"].append({
+                        "name": node.name,
+                        "role": node.role,
+                        "primary_tool": node.primary_tool,
+                        "relevance": match.confidence,
+                        "conductor_directed": True,
+                        "optimization_priority": "high"
+                    })
+                elif match.kind == "tools":
+                    tool = registry.tools[match.name]
+                    execution_plan["tools_to_use"].append({
+                        "name": tool.name,
+                        "file_path": tool.file_path,
+                        "category": tool.category,
+                        "relevance": match.confidence,
+                        "conductor_optimized": True
+                    })
+                else:
+                    service = registry.services[match.name]
                     execution_plan["services_required"].append({
                         "name": service.name,
                         "type": service.type,
                         "endpoint": service.endpoint,
+                        "relevance": match.confidence,
                         "conductor_managed": True
                     })
-                    execution_plan["confidence"] = max(execution_plan["confidence"], 0.70)
-                    break
-        
-        # Apply conductor authority boost
-        if execution_plan["confidence"] > 0:
-            execution_plan["confidence"] = min(execution_plan["confidence"] * 1.1, 1.0)
-            execution_plan["conductor_authority"] = "OPTIMAL_EXECUTION_MODE"
+            
+            if matches:
+                execution_plan["confidence"] = matches[0].confidence
+                execution_plan["conductor_authority"] = "OPTIMAL_EXECUTION_MODE"
+            self.plan_memo.put(key, execution_plan)
+            execution_plans.append(self._copy_plan(execution_plan, request, timestamp, memo_hit=False))
         
-        return execution_plan
+        return execution_plans
+    
+    @staticmethod
+    def _copy_plan(plan: Dict[str, Any], request: str, timestamp: str, memo_hit: bool) -> Dict[str, Any]:
+        """Caller-owned copy of a memoized plan, stamped for this request."""
+        copied = dict(plan)
+        copied["request"] = request
+        copied["timestamp"] = timestamp
+        copied["routing"] = {**plan["routing"], "memo_hit": memo_hit}
+        for section in ("nodes_to_invoke", "workflows_to_execute", "tools_to_use", "services_required"):
+            copied[section] = [dict(entry) for entry in plan[section]]
+        return copied
     
     def execute_workflow(self, workflow_name: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute a workflow by name."""
@@ -273,8 +393,23 @@ class HeadyConductor:
         self._log_execution("node", node.name, result)
         return result
     
+    def get_tool_runner(self) -> Optional["ToolRunner"]:
+        """Warm tool worker pool, started on first use when toolRunner.enabled is set in resource policies."""
+        if not (self.resource_policies.get("toolRunner") or {}).get("enabled"):
+            return None
+        with self._tool_runner_lock:
+            if self._tool_runner is None:
+                from HeadyToolRunner import ToolRunner
+                tools_dir = self.root_path / "HeadyAcademy" / "Tools"
+                self._tool_runner = ToolRunner.from_policies(tools_dir, self.resource_policies)
+            return self._tool_runner
+    
     def _execute_tool(self, tool_name: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Execute a tool by name."""
+        """
+        Execute a tool by name.
+        With the tool runner enabled the tool's entry function is called in a
+        warm worker process; context may carry "args", "kwargs" and "entry".
+        """
         if tool_name not in self.registry.tools:
             return {
                 "success": False,
@@ -285,18 +420,40 @@ class HeadyConductor:
         
         print(f"  → Executing Tool: {tool.name}")
         
-        # For now, return a success indicator
-        # In production, this would actually execute the tool
-        return {
+        result = {
             "success": True,
             "tool": tool.name,
             "file_path": tool.file_path,
             "category": tool.category,
             "executed_at": datetime.now().isoformat()
         }
+        
+        runner = self.get_tool_runner()
+        if runner is None:
+            # Runner disabled: report the tool as dispatched without running it
+            return result
+        
+        context = context or {}
+        run = runner.run(
+            tool.name,
+            *context.get("args", ()),
+            entry=context.get("entry"),
+            **context.get("kwargs", {})
+        )
+        result["success"] = run.success
+        result["run"] = run.to_dict()
+        if run.error:
+            result["error"] = run.error
+        return result
     
-    def check_service_health(self, service_name: str = None) -> Dict[str, Any]:
-        """Check health of one or all services."""
+    def check_service_health(self, service_name: str = None, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Check health of one or all services.
+        Services are probed concurrently (HTTP GET for a health_check_url,
+        TCP connect for a port) within timeouts.healthCheckMs; recent results
+        come from the probe cache unless fresh is set. The sweep's statuses
+        are written to the registry in one save.
+        """
         if service_name:
             if service_name not in self.registry.services:
                 return {
@@ -313,27 +470,22 @@ class HeadyConductor:
             "services": {}
         }
         
+        probes = self.health_prober.check(services_to_check, fresh=fresh)
         for svc_name, service in services_to_check.items():
-            status = "unknown"
-            
-            # Simple health check logic
-            if service.health_check_url:
-                # In production, would make actual HTTP request
-                status = "healthy"
-            elif service.port:
-                # In production, would check if port is listening
-                status = "unknown"
-            
+            probe = probes[svc_name]
             health_report["services"][svc_name] = {
                 "name": service.name,
                 "type": service.type,
-                "status": status,
-                "endpoint": service.endpoint
+                "status": probe.status,
+                "endpoint": service.endpoint,
+                "probe": probe.method,
+                "latency_ms": probe.latency_ms,
+                "checked_at": probe.checked_at,
+                "cached": probe.cached,
+                "error": probe.error
             }
-            
-            # Update registry
-            self.registry.update_service_status(svc_name, status)
         
+        self.registry.update_service_statuses({name: probe.status for name, probe in probes.items()})
         return health_report
     
     def query_capabilities(self, query: str, category: str = None) -> Dict[str, Any]:
@@ -359,51 +511,146 @@ class HeadyConductor:
         return awareness
     
     def _log_execution(self, execution_type: str, name: str, result: Dict[str, Any]):
-        """Log execution for audit trail."""
+        """Log execution for audit trail (O(1); written to disk in the background)."""
         log_entry = {
             "type": execution_type,
             "name": name,
             "timestamp": datetime.now().isoformat(),
-            "result": result
+            # Callers keep adding keys to result; the background writer needs a stable copy
+            "result": dict(result)
         }
         self.execution_log.append(log_entry)
-        
-        # Keep log size manageable
-        if len(self.execution_log) > 1000:
-            self.execution_log = self.execution_log[-1000:]
     
     def _update_execution_stats(self, orchestration_result: Dict[str, Any]):
         """Update execution statistics with conductor authority."""
-        self.execution_stats["total_orchestrations"] += 1
-        
-        if orchestration_result.get("success"):
-            self.execution_stats["successful_executions"] += 1
-        
         results = orchestration_result.get("results", {})
-        self.execution_stats["nodes_invoked"] += len(results.get("nodes", []))
-        self.execution_stats["workflows_executed"] += len(results.get("workflows", []))
-        self.execution_stats["tools_used"] += len(results.get("tools", []))
+        with self._stats_lock:
+            self.execution_stats["total_orchestrations"] += 1
+            
+            if orchestration_result.get("success"):
+                self.execution_stats["successful_executions"] += 1
+            
+            self.execution_stats["nodes_invoked"] += len(results.get("nodes", []))
+            self.execution_stats["workflows_executed"] += len(results.get("workflows", []))
+            self.execution_stats["tools_used"] += len(results.get("tools", []))
+            stats = self.execution_stats.copy()
         
         # Store stats in memory
         self.memory.store(
             category="conductor_stats",
-            content=self.execution_stats,
+            content=stats,
             tags=["statistics", "conductor", "authority"],
             source="conductor"
         )
     
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get current execution statistics."""
+        with self._stats_lock:
+            stats = self.execution_stats.copy()
         return {
-            "stats": self.execution_stats.copy(),
+            "stats": stats,
             "success_rate": (
-                self.execution_stats["successful_executions"] / 
-                max(self.execution_stats["total_orchestrations"], 1)
+                stats["successful_executions"] / 
+                max(stats["total_orchestrations"], 1)
             ),
+            "cost_model": self.cost_model.summary(top=10),
             "conductor_authority": "SUPREME",
             "timestamp": datetime.now().isoformat()
         }
     
+    def shutdown(self):
+        """Stop background monitoring, the execution pool, tool workers and log writer that were started."""
+        if lazy_component.is_built(self, "lens"):
+            self.lens.stop_monitoring()
+        if lazy_component.is_built(self, "scheduler"):
+            self.scheduler.shutdown(wait=False)
+        if lazy_component.is_built(self, "executor"):
+            self.executor.shutdown(wait=False)
+        if lazy_component.is_built(self, "health_prober"):
+            self.health_prober.close()
+        if lazy_component.is_built(self, "execution_log"):
+            self.execution_log.close()
+        if self._tool_runner is not None:
+            self._tool_runner.close()
+        self.registry.flush()
+    
+    def _build_plan_steps(self, execution_plan: Dict[str, Any]) -> Tuple[List["PlanStep"], List[Tuple[str, Dict]]]:
+        """
+        Turn an execution plan into engine steps.
+        Returns the steps plus, per step, the results collection it reports
+        into and its plan entry. Step ids are "<kind>:<name>"; entries may
+        name other step ids in "depends_on".
+        """
+        from HeadyExecutor import PlanStep
+        health_timeout_ms = (self.resource_policies.get("timeouts") or {}).get("healthCheckMs")
+        sections = [
+            ("workflows_to_execute", "workflows", "workflow", "[EXEC] Executing Workflows (Conductor Optimized):"),
+            ("nodes_to_invoke", "nodes", "node", "[NODE] Invoking Nodes (Conductor Directed):"),
+            ("tools_to_use", "tools", "tool", "[TOOL] Executing Tools (Conductor Optimized):"),
+            ("services_required", "services", "service", "[SERVICE] Managing Services (Conductor Managed):")
+        ]
+        
+        steps, collectors = [], []
+        for plan_key, collection, kind, heading in sections:
+            entries = execution_plan.get(plan_key) or []
+            if entries:
+                print(f"\n{heading}")
+            for entry in entries:
+                label = f"{entry['name']} ({entry['role']})" if kind == "node" else \
+                    f"{entry['name']} ({entry['type']})" if kind == "service" else entry["name"]
+                print(f"  → {label}")
+                steps.append(PlanStep(
+                    id=f"{kind}:{entry['name']}",
+                    fn=lambda kind=kind, name=entry["name"]: self.run_plan_entry(kind, name),
+                    depends_on=list(entry.get("depends_on") or []),
+                    timeout=health_timeout_ms / 1000 if kind == "service" and health_timeout_ms else None,
+                    payload={"kind": kind, "name": entry["name"]}
+                ))
+                collectors.append((collection, entry))
+        return steps, collectors
+    
+    def run_plan_entry(self, kind: str, name: str) -> Dict[str, Any]:
+        """
+        Execute one plan step ("workflow", "node", "tool" or "service") on
+        this conductor; work-queue workers call this for steps enqueued by
+        other nodes.
+        """
+        if kind == "workflow":
+            return self._run_plan_workflow(name)
+        if kind == "node":
+            return self._run_plan_node(name)
+        if kind == "tool":
+            return self._run_plan_tool(name)
+        if kind == "service":
+            return self.check_service_health(name)
+        raise ValueError(f"Unknown plan step kind '{kind}'")
+    
+    def _run_plan_workflow(self, name: str) -> Dict[str, Any]:
+        result = self.execute_workflow(name)
+        result["conductor_optimized"] = True
+        return result
+    
+    def _run_plan_node(self, name: str) -> Dict[str, Any]:
+        result = self.invoke_node(name)
+        result["conductor_directed"] = True
+        return result
+    
+    def _run_plan_tool(self, name: str) -> Dict[str, Any]:
+        result = self._execute_tool(name)
+        result["conductor_optimized"] = True
+        return result
+    
+    def submit(self, request: str, user_config: Dict[str, Any] = None, pool: str = "hot",
+               user: str = None) -> "Future":
+        """
+        Queue an orchestration behind the request scheduler.
+        User-facing requests belong in the "hot" pool, background and batch
+        work in "warm" or "cold"; user is the fairness key. The Future
+        resolves with the orchestrate() result, or raises SchedulerOverloaded
+        from here when the queue overflows.
+        """
+        return self.scheduler.submit(self.orchestrate, request, user_config, pool=pool, user=user)
+    
     def orchestrate(self, request: str, user_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Main orchestration method with full ecosystem awareness and optimal execution.
@@ -421,11 +668,21 @@ class HeadyConductor:
         # Extract execution plan from brain's context
         execution_plan = processing_result.get("context", {}).get("execution_plan", {})
         
-        # If no plan from brain, use our enhanced analysis
-        if not execution_plan or execution_plan.get("confidence", 0) == 0:
+        # If no plan from brain, use our enhanced analysis. A routed plan with zero
+        # confidence already is that analysis; running it again cannot match more.
+        if not execution_plan or ("routing" not in execution_plan and execution_plan.get("confidence", 0) == 0):
             execution_plan = self.analyze_request(request)
             print("\n[TARGET] HeadyConductor: Using enhanced analysis for optimal execution")
         
+        # Prefer cheaper equivalents that execution history has proven out
+        if (self.resource_policies.get("costModel") or {}).get("optimizePlans", True):
+            execution_plan = self.cost_model.optimize_plan(execution_plan, self.registry.nodes)
+            for change in execution_plan["cost_model"]["substituted"]:
+                print(f"[COST] {change['step']} -> {change['with']} "
+                      f"(~{change['expected_ms']:.0f}ms vs ~{change['instead_of_ms']:.0f}ms)")
+            for change in execution_plan["cost_model"]["skipped"]:
+                print(f"[COST] Skipping {change['step']}: {change['reason']}")
+        
         print(f"\n[STATS] Execution Analysis:")
         print(f"  Confidence: {execution_plan['confidence']:.0%}")
         print(f"  Nodes to invoke: {len(execution_plan['nodes_to_invoke'])}")
@@ -452,44 +709,50 @@ class HeadyConductor:
             "optimization_applied": True
         }
         
-        # Execute workflows with conductor optimization
-        if execution_plan["workflows_to_execute"]:
-            print("\n[EXEC] Executing Workflows (Conductor Optimized):")
-            for workflow_info in execution_plan["workflows_to_execute"]:
-                print(f"  → {workflow_info['name']}")
-                result = self.execute_workflow(workflow_info["name"])
-                result["conductor_optimized"] = True
-                orchestration_result["results"]["workflows"].append(result)
-        
-        # Invoke nodes with conductor direction
-        if execution_plan["nodes_to_invoke"]:
-            print("\n[NODE] Invoking Nodes (Conductor Directed):")
-            for node_info in execution_plan["nodes_to_invoke"]:
-                print(f"  → {node_info['name']} ({node_info['role']})")
-                result = self.invoke_node(node_info["name"])
-                result["conductor_directed"] = True
-                orchestration_result["results"]["nodes"].append(result)
-        
-        # Execute tools with conductor optimization
-        if execution_plan["tools_to_use"]:
-            print("\n[TOOL] Executing Tools (Conductor Optimized):")
-            for tool_info in execution_plan["tools_to_use"]:
-                print(f"  → {tool_info['name']}")
-                result = self._execute_tool(tool_info["name"])
-                result["conductor_optimized"] = True
-                orchestration_result["results"]["tools"].append(result)
-        
-        # Check and manage services
-        if execution_plan["services_required"]:
-            print("\n[SERVICE] Managing Services (Conductor Managed):")
-            for service_info in execution_plan["services_required"]:
-                print(f"  → {service_info['name']} ({service_info['type']})")
-                health = self.check_service_health(service_info["name"])
-                orchestration_result["results"]["services"].append({
-                    "service": service_info,
-                    "health": health,
-                    "conductor_managed": True
-                })
+        # Run every plan step on the execution engine; steps are independent
+        # unless a plan entry lists the step ids it "depends_on". The cost
+        # model starts the longest dependency chains first. Node and service
+        # status changes reach the registry file in one write at the end.
+        steps, collectors = self._build_plan_steps(execution_plan)
+        estimate = self.cost_model.estimate(steps, self.executor.max_workers)
+        started = datetime.now()
+        with self.registry.batched():
+            ordered_results = self.executor.run([steps[i] for i in estimate.order])
+        wall_ms = (datetime.now() - started).total_seconds() * 1000
+        by_id = {result.id: result for result in ordered_results}
+        step_results = [by_id[step.id] for step in steps]
+        prediction = self.cost_model.record(step_results, estimate, wall_ms)
+        
+        for (collection, entry), step_result in zip(collectors, step_results):
+            if step_result.result is not None:
+                result = step_result.result
+            else:
+                result = {"success": False, "error": step_result.error}
+            result["execution"] = {
+                "status": step_result.status,
+                "attempts": step_result.attempts,
+                "duration_ms": round(step_result.duration_ms, 2)
+            }
+            if collection == "services":
+                result = {"service": entry, "health": result, "conductor_managed": True}
+            orchestration_result["results"][collection].append(result)
+        
+        failed = [r.id for r in step_results if not r.success]
+        orchestration_result["success"] = not failed
+        orchestration_result["execution"] = {
+            "steps": len(steps),
+            "failed": failed,
+            "wall_ms": round(wall_ms, 2),
+            "step_ms_total": round(sum(r.duration_ms for r in step_results), 2),
+            "max_workers": self.executor.max_workers,
+            "predicted_ms": round(estimate.predicted_ms, 2),
+            "critical_path_ms": round(estimate.critical_path_ms, 2),
+            "failure_risk": round(estimate.failure_risk, 4),
+            "prediction_error_ms": prediction.get("error_ms")
+        }
+        if steps:
+            print(f"\n[EXEC] {len(steps)} steps in {wall_ms:.0f}ms, predicted {estimate.predicted_ms:.0f}ms "
+                  f"({self.executor.max_workers} workers, {len(failed)} failed)")
         
         # Store orchestration result in memory
         self.memory.store(
@@ -515,49 +778,29 @@ class HeadyConductor:
         return orchestration_result
 
 
-def main():
-    """CLI interface for HeadyConductor."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Heady Conductor - Orchestration Layer")
-    parser.add_argument("--request", "-r", type=str, help="Request to orchestrate")
-    parser.add_argument("--query", "-q", type=str, help="Query capabilities")
-    parser.add_argument("--summary", "-s", action="store_true", help="Show system summary")
-    parser.add_argument("--health", action="store_true", help="Check service health")
-    parser.add_argument("--workflow", "-w", type=str, help="Execute specific workflow")
-    parser.add_argument("--node", "-n", type=str, help="Invoke specific node")
-    
-    args = parser.parse_args()
-    
-    conductor = HeadyConductor()
-    
-    if args.summary:
-        summary = conductor.get_system_summary()
-        print(json.dumps(summary, indent=2))
-    
-    elif args.health:
-        health = conductor.check_service_health()
-        print(json.dumps(health, indent=2))
-    
-    elif args.query:
-        results = conductor.query_capabilities(args.query)
-        print(json.dumps(results, indent=2))
-    
-    elif args.workflow:
-        result = conductor.execute_workflow(args.workflow)
-        print(json.dumps(result, indent=2))
-    
-    elif args.node:
-        result = conductor.invoke_node(args.node)
-        print(json.dumps(result, indent=2))
-    
-    elif args.request:
-        result = conductor.orchestrate(args.request)
-        print(json.dumps(result, indent=2))
-    
-    else:
-        parser.print_help()
+def run_command(conductor: HeadyConductor, command: str, arg: Any = None) -> Any:
+    """Run one CLI command; shared by main() and the conductor daemon."""
+    if command == "summary":
+        return conductor.get_system_summary()
+    if command == "health":
+        return conductor.check_service_health()
+    if command == "query":
+        return conductor.query_capabilities(arg)
+    if command == "workflow":
+        return conductor.execute_workflow(arg)
+    if command == "node":
+        return conductor.invoke_node(arg)
+    if command == "request":
+        # Requests queue behind the scheduler like every other orchestration
+        return conductor.submit(arg).result()
+    raise ValueError(f"Unknown command '{command}'")
 
 
-if __name__ == "__main__":
-    main()
+def main():
+    """
+    CLI for HeadyConductor: commands are answered by the warm conductor daemon,
+    started on first use; --in-process builds a conductor for this command only.
+    """
+    from HeadyDaemon import main as cli_main
+    cli_main()
+
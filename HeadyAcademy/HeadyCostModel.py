@@ -0,0 +1,429 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyCostModel.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      COST MODEL - PLAN SELECTION FROM EXECUTION HISTORY                       ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━           ║
+║     Per-capability latency histograms and success counts, persisted in       ║
+║     .heady; predicts a plan's wall time and failure risk, trims redundant     ║
+║     steps and orders the rest so the longest dependency chains start first    ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import json
+import heapq
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STATS_PATH = ".heady/capability-stats.json"
+STATS_VERSION = 1
+
+# Upper bounds (ms) of the latency histogram buckets; one more bucket takes the overflow
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+# Expected latency by step kind before a capability has history
+DEFAULT_PRIORS_MS = {"workflow": 2.0, "node": 10.0, "tool": 10.0, "service": 25.0}
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_EWMA_ALPHA = 0.2
+# Success rate assumed for new capabilities, weighted as this many runs
+PRIOR_SUCCESS_RATE = 0.95
+PRIOR_WEIGHT = 2
+# Predicted/actual pairs kept for validating the model
+RECENT_PLANS = 100
+
+
+@dataclass
+class CapabilityStats:
+    """Run history of one capability ("<kind>:<name>", the plan step id)."""
+    runs: int = 0
+    successes: int = 0
+    total_ms: float = 0.0
+    ewma_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    last_run: Optional[str] = None
+
+    def observe(self, duration_ms: float, success: bool, alpha: float = DEFAULT_EWMA_ALPHA):
+        self.ewma_ms = duration_ms if self.runs == 0 else alpha * duration_ms + (1 - alpha) * self.ewma_ms
+        self.runs += 1
+        self.successes += bool(success)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if duration_ms <= bound),
+                          len(LATENCY_BUCKETS_MS))] += 1
+        self.last_run = datetime.now().isoformat()
+
+    @property
+    def success_rate(self) -> float:
+        """Observed success rate, pulled toward PRIOR_SUCCESS_RATE while runs are few."""
+        return (self.successes + PRIOR_SUCCESS_RATE * PRIOR_WEIGHT) / (self.runs + PRIOR_WEIGHT)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the histogram bucket holding the q-th quantile (0 < q <= 1)."""
+        if self.runs == 0:
+            return 0.0
+        rank, seen = q * self.runs, 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CapabilityStats":
+        stats = cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        if len(stats.buckets) != len(LATENCY_BUCKETS_MS) + 1:
+            # Bucket bounds changed since this was written; the rest of the history still holds
+            stats.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        return stats
+
+
+@dataclass
+class PlanEstimate:
+    """Predicted cost of a plan; order lists step indices in the order they should be started."""
+    predicted_ms: float
+    critical_path_ms: float
+    serial_ms: float
+    failure_risk: float
+    max_workers: int
+    order: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "predicted_ms": round(self.predicted_ms, 2),
+            "critical_path_ms": round(self.critical_path_ms, 2),
+            "serial_ms": round(self.serial_ms, 2),
+            "failure_risk": round(self.failure_risk, 4),
+            "max_workers": self.max_workers
+        }
+
+
+class CostModel:
+    """
+    Learns what each capability costs and uses it to plan.
+
+    record() folds an orchestration's step durations and outcomes into the
+    per-capability stats and scores the prediction made for it; estimate()
+    simulates a plan on max_workers slots (longest remaining chain first,
+    the order run() should submit in) for its wall time, and multiplies
+    step success rates for its failure risk. optimize_plan() drops tools a
+    planned node already runs and swaps a node for a same-role one that
+    history shows to be cheaper. Without a path the stats live in memory.
+    """
+
+    def __init__(self, path: Optional[Path] = None, priors_ms: Dict[str, float] = None,
+                 min_samples: int = DEFAULT_MIN_SAMPLES, ewma_alpha: float = DEFAULT_EWMA_ALPHA):
+        self.path = Path(path) if path else None
+        self.priors_ms = {**DEFAULT_PRIORS_MS, **(priors_ms or {})}
+        self.min_samples = min_samples
+        self.ewma_alpha = ewma_alpha
+        self.capabilities: Dict[str, CapabilityStats] = {}
+        self.plans = {"count": 0, "abs_error_ms": 0.0, "abs_pct_error": 0.0, "recent": []}
+        self._lock = threading.Lock()
+        # Concurrent orchestrations each save; one writer at a time owns the temp file
+        self._save_lock = threading.Lock()
+        self.load()
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any], root_path: Path) -> "CostModel":
+        settings = policies.get("costModel") or {}
+        path = Path(settings.get("statsPath", DEFAULT_STATS_PATH))
+        return cls(
+            path=path if path.is_absolute() else Path(root_path) / path,
+            priors_ms=settings.get("priorsMs"),
+            min_samples=settings.get("minSamples", DEFAULT_MIN_SAMPLES),
+            ewma_alpha=settings.get("ewmaAlpha", DEFAULT_EWMA_ALPHA)
+        )
+
+    # ─── Persistence ──────────────────────────────────────────────────────
+
+    def load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") != STATS_VERSION:
+                raise ValueError(f"version {data.get('version')}")
+            self.capabilities = {step_id: CapabilityStats.from_dict(stats)
+                                 for step_id, stats in (data.get("capabilities") or {}).items()}
+            self.plans.update(data.get("plans") or {})
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"[WARN] HeadyCostModel: ignoring unreadable stats {self.path} ({e})")
+
+    def save(self):
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                data = {
+                    "version": STATS_VERSION,
+                    "updated_at": datetime.now().isoformat(),
+                    "capabilities": {step_id: stats.to_dict() for step_id, stats in self.capabilities.items()},
+                    "plans": dict(self.plans, recent=list(self.plans["recent"]))
+                }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_suffix(".tmp")
+                with open(temp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"[WARN] HeadyCostModel: could not save stats to {self.path} ({e})")
+
+    # ─── Estimates ────────────────────────────────────────────────────────
+
+    def expected_ms(self, step_id: str) -> float:
+        stats = self.capabilities.get(step_id)
+        if stats and stats.runs:
+            return stats.ewma_ms
+        return float(self.priors_ms.get(step_id.split(":", 1)[0], DEFAULT_PRIORS_MS["node"]))
+
+    def success_rate(self, step_id: str) -> float:
+        stats = self.capabilities.get(step_id)
+        return stats.success_rate if stats else PRIOR_SUCCESS_RATE
+
+    def expected_cost_ms(self, step_id: str) -> float:
+        """Expected time until the step succeeds, counting reruns of failures."""
+        return self.expected_ms(step_id) / max(self.success_rate(step_id), 0.01)
+
+    def estimate(self, steps: Sequence[Any], max_workers: int) -> PlanEstimate:
+        """
+        Predict wall time for PlanSteps (anything with id and depends_on) run
+        on max_workers slots, assuming the returned order is how they start.
+        """
+        max_workers = max(1, max_workers)
+        by_id = {step.id: step for step in steps}
+        durations = {step.id: self.expected_ms(step.id) for step in steps}
+        dependents: Dict[str, List[str]] = {step.id: [] for step in steps}
+        for step in steps:
+            for dep in step.depends_on:
+                if dep in dependents:
+                    dependents[dep].append(step.id)
+
+        # Upward rank: a step's duration plus the longest chain waiting on it
+        rank: Dict[str, float] = {}
+
+        def upward(step_id: str, path: frozenset) -> float:
+            if step_id not in rank:
+                rank[step_id] = durations[step_id] + max(
+                    (upward(child, path | {step_id}) for child in dependents[step_id] if child not in path),
+                    default=0.0)
+            return rank[step_id]
+
+        for step in steps:
+            upward(step.id, frozenset())
+        order = sorted(range(len(steps)), key=lambda i: -rank[steps[i].id])
+
+        # List scheduling in that order, as ExecutionEngine starts waiting steps
+        finished: Dict[str, float] = {}
+        running: List[tuple] = []
+        waiting = [steps[i] for i in order]
+        clock = 0.0
+        while waiting or running:
+            still_waiting = []
+            for step in waiting:
+                if len(running) < max_workers and all(dep in finished or dep not in by_id
+                                                      for dep in step.depends_on):
+                    heapq.heappush(running, (clock + durations[step.id], step.id))
+                else:
+                    still_waiting.append(step)
+            waiting = still_waiting
+            if not running:
+                break
+            clock, step_id = heapq.heappop(running)
+            finished[step_id] = clock
+
+        survival = 1.0
+        for step in steps:
+            survival *= self.success_rate(step.id)
+        return PlanEstimate(
+            predicted_ms=clock,
+            critical_path_ms=max(rank.values(), default=0.0),
+            serial_ms=sum(durations.values()),
+            failure_risk=1.0 - survival,
+            max_workers=max_workers,
+            order=order
+        )
+
+    # ─── Plan optimization ────────────────────────────────────────────────
+
+    def _cheapest_equivalent(self, name: str, nodes: Dict[str, Any]) -> str:
+        """The node with name's role that history shows to be cheapest; name itself without enough runs."""
+        node = nodes.get(name)
+        if node is None or not self._has_history(f"node:{name}"):
+            return name
+        best, best_cost = name, self.expected_cost_ms(f"node:{name}")
+        for candidate in nodes.values():
+            step_id = f"node:{candidate.name}"
+            if candidate.name == name or candidate.role != node.role or not self._has_history(step_id):
+                continue
+            cost = self.expected_cost_ms(step_id)
+            if cost < best_cost:
+                best, best_cost = candidate.name, cost
+        return best
+
+    def _has_history(self, step_id: str) -> bool:
+        stats = self.capabilities.get(step_id)
+        return stats is not None and stats.runs >= self.min_samples
+
+    def optimize_plan(self, plan: Dict[str, Any], nodes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy of plan with cheaper equivalents: nodes replaced by the fastest
+        registry node with the same role (both need min_samples runs), and
+        tools dropped that a planned node runs as its primary tool. Changes
+        are listed under plan["cost_model"]; depends_on follows them.
+        """
+        optimized = dict(plan)
+        renamed: Dict[str, str] = {}
+        substituted, skipped = [], []
+
+        planned_nodes, seen = [], set()
+        for entry in plan.get("nodes_to_invoke") or []:
+            name = entry["name"]
+            choice = self._cheapest_equivalent(name, nodes)
+            if choice != name:
+                alternative = nodes[choice]
+                substituted.append({
+                    "step": f"node:{name}",
+                    "with": f"node:{choice}",
+                    "role": alternative.role,
+                    "expected_ms": round(self.expected_cost_ms(f"node:{choice}"), 2),
+                    "instead_of_ms": round(self.expected_cost_ms(f"node:{name}"), 2)
+                })
+                renamed[f"node:{name}"] = f"node:{choice}"
+                entry = dict(entry, name=choice, role=alternative.role,
+                             primary_tool=alternative.primary_tool, substituted_for=name)
+            if entry["name"] in seen:
+                skipped.append({"step": f"node:{name}", "reason": f"node {entry['name']} is already planned"})
+                continue
+            seen.add(entry["name"])
+            planned_nodes.append(entry)
+
+        run_by_node = {entry["primary_tool"]: entry["name"] for entry in planned_nodes if entry.get("primary_tool")}
+        planned_tools, seen = [], set()
+        for entry in plan.get("tools_to_use") or []:
+            name = entry["name"]
+            if name in run_by_node:
+                skipped.append({"step": f"tool:{name}", "reason": f"primary tool of node {run_by_node[name]}"})
+                renamed[f"tool:{name}"] = f"node:{run_by_node[name]}"
+                continue
+            if name in seen:
+                continue
+            seen.add(name)
+            planned_tools.append(entry)
+
+        optimized["nodes_to_invoke"] = planned_nodes
+        optimized["tools_to_use"] = planned_tools
+        if renamed:
+            kinds = {"workflows_to_execute": "workflow", "nodes_to_invoke": "node",
+                     "tools_to_use": "tool", "services_required": "service"}
+            for section, kind in kinds.items():
+                entries = []
+                for entry in optimized.get(section) or []:
+                    if entry.get("depends_on"):
+                        own_id = f"{kind}:{entry['name']}"
+                        deps = []
+                        for dep in entry["depends_on"]:
+                            dep = renamed.get(dep, dep)
+                            if dep != own_id and dep not in deps:
+                                deps.append(dep)
+                        entry = dict(entry, depends_on=deps)
+                    entries.append(entry)
+                optimized[section] = entries
+        optimized["cost_model"] = {"substituted": substituted, "skipped": skipped}
+        return optimized
+
+    # ─── Recording ────────────────────────────────────────────────────────
+
+    def record(self, step_results: Sequence[Any], estimate: Optional[PlanEstimate],
+               actual_ms: float) -> Dict[str, Any]:
+        """
+        Fold StepResults (id, status, success, duration_ms) into the stats,
+        score the estimate against actual_ms and persist once. Skipped steps
+        never ran and teach nothing.
+        """
+        report = {"actual_ms": round(actual_ms, 2)}
+        with self._lock:
+            for result in step_results:
+                if result.status == "skipped":
+                    continue
+                stats = self.capabilities.setdefault(result.id, CapabilityStats())
+                stats.observe(result.duration_ms, result.success, self.ewma_alpha)
+            if estimate is not None and step_results:
+                error_ms = actual_ms - estimate.predicted_ms
+                self.plans["count"] += 1
+                self.plans["abs_error_ms"] += abs(error_ms)
+                if actual_ms > 0:
+                    self.plans["abs_pct_error"] += abs(error_ms) / actual_ms * 100
+                self.plans["recent"] = (self.plans["recent"] + [{
+                    "at": datetime.now().isoformat(),
+                    "steps": len(step_results),
+                    "predicted_ms": round(estimate.predicted_ms, 2),
+                    "actual_ms": round(actual_ms, 2)
+                }])[-RECENT_PLANS:]
+                report.update(predicted_ms=round(estimate.predicted_ms, 2), error_ms=round(error_ms, 2))
+        self.save()
+        return report
+
+    def summary(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """Prediction accuracy and per-capability latency/success, slowest first."""
+        with self._lock:
+            plans = self.plans["count"]
+            capabilities = sorted(self.capabilities.items(), key=lambda item: -item[1].ewma_ms)
+            return {
+                "plans_scored": plans,
+                "mean_abs_error_ms": round(self.plans["abs_error_ms"] / plans, 2) if plans else None,
+                "mean_abs_pct_error": round(self.plans["abs_pct_error"] / plans, 2) if plans else None,
+                "capabilities": {
+                    step_id: {
+                        "runs": stats.runs,
+                        "success_rate": round(stats.successes / stats.runs, 4) if stats.runs else None,
+                        "expected_ms": round(stats.ewma_ms, 2),
+                        "p50_ms": stats.percentile(0.5),
+                        "p95_ms": stats.percentile(0.95)
+                    }
+                    for step_id, stats in capabilities[:top]
+                }
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HeadyConductor per-capability execution stats")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Repository root")
+    parser.add_argument("--top", type=int, default=20, help="Show the N slowest capabilities")
+    args = parser.parse_args()
+
+    from HeadyExecutor import load_resource_policies
+    model = CostModel.from_policies(load_resource_policies(Path(args.root)), Path(args.root))
+    print(json.dumps(model.summary(top=args.top), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,626 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyDaemon.py                                ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      DAEMON - LONG-RUNNING CONDUCTOR WITH A THIN CLI CLIENT                   ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                      ║
+║     Keeps Registry, Lens, Memory and Brain warm in one process and serves     ║
+║     CLI commands as JSON lines over a local socket; the client starts the     ║
+║     daemon on first use and imports nothing heavier than the stdlib           ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import io
+import os
+import sys
+import hmac
+import json
+import time
+import socket
+import secrets
+import argparse
+import threading
+import contextvars
+import socketserver
+from pathlib import Path
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Auto-started daemons exit after this long without a command (0 = never)
+DEFAULT_IDLE_TIMEOUT = 900
+# How long the client waits for a freshly spawned daemon to accept connections
+DAEMON_START_TIMEOUT = 30
+# Unix socket paths are limited to ~108 bytes; longer ones move to the temp dir
+MAX_SOCKET_PATH = 100
+# Without inotify the warm registry re-checks its discovery sources this often
+DEFAULT_REFRESH_INTERVAL = 2.0
+
+# CLI option -> daemon command; the option value is the command argument
+COMMAND_OPTIONS = (
+    ("request", "request"),
+    ("query", "query"),
+    ("summary", "summary"),
+    ("health", "health"),
+    ("workflow", "workflow"),
+    ("node", "node"),
+)
+
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+# Buffer collecting what the current command prints (see _OutputRouter)
+_command_output: contextvars.ContextVar = contextvars.ContextVar("heady_command_output", default=None)
+_router_lock = threading.Lock()
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening for this root."""
+
+
+class DaemonAlreadyRunning(RuntimeError):
+    """Another daemon already serves this root."""
+
+
+def default_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+def socket_path(root_path: Path) -> Path:
+    """Unix socket for the daemon serving root_path."""
+    path = Path(root_path).resolve() / ".heady" / "conductor.sock"
+    if len(str(path)) >= MAX_SOCKET_PATH:
+        import hashlib
+        import tempfile
+        digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:12]
+        path = Path(tempfile.gettempdir()) / f"heady-conductor-{digest}.sock"
+    return path
+
+
+def _socket_answers(path: Path) -> bool:
+    """True when a process accepts connections on the Unix socket at path (a crashed daemon's does not)."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def address_file(root_path: Path) -> Path:
+    """Where a TCP daemon (no Unix sockets on this platform) records its loopback port."""
+    return Path(root_path).resolve() / ".heady" / "conductor.addr"
+
+
+def token_file(root_path: Path) -> Path:
+    """Secret a TCP daemon requires on every message: any local process can reach a loopback port."""
+    return Path(root_path).resolve() / ".heady" / "conductor.token"
+
+
+def add_command_arguments(parser: argparse.ArgumentParser):
+    """The conductor CLI commands, shared by HeadyConductor.main and the thin client."""
+    parser.add_argument("--request", "-r", type=str, help="Request to orchestrate")
+    parser.add_argument("--query", "-q", type=str, help="Query capabilities")
+    parser.add_argument("--summary", "-s", action="store_true", help="Show system summary")
+    parser.add_argument("--health", action="store_true", help="Check service health")
+    parser.add_argument("--workflow", "-w", type=str, help="Execute specific workflow")
+    parser.add_argument("--node", "-n", type=str, help="Invoke specific node")
+
+
+def parse_command(args: argparse.Namespace) -> Tuple[Optional[str], Any]:
+    """(command, argument) selected on the command line, or (None, None)."""
+    for option, command in COMMAND_OPTIONS:
+        value = getattr(args, option, None)
+        if value:
+            return command, (None if value is True else value)
+    return None, None
+
+
+class _OutputRouter(io.TextIOBase):
+    """
+    sys.stdout while the daemon serves: text goes to the buffer of the command
+    that printed it, so concurrent commands keep their output apart. The
+    scheduler, the execution engine and HeadyBrain's stages run work in the
+    submitter's context, so a command's worker threads print into its
+    buffer too.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return (_command_output.get() or self.stream).write(text)
+
+    def flush(self):
+        (_command_output.get() or self.stream).flush()
+
+
+def _route_stdout():
+    with _router_lock:
+        if not isinstance(sys.stdout, _OutputRouter):
+            sys.stdout = _OutputRouter(sys.stdout)
+
+
+class _CommandGate:
+    """
+    Commands share the conductor; registry refreshes need it to themselves.
+    shared() admits any number of commands at once. Entering the gate, or
+    acquire(), is exclusive: it waits for running commands to finish and
+    holds new ones back until release().
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._commands = 0
+        self._exclusive = False
+        self._waiting = 0
+
+    @contextmanager
+    def shared(self):
+        with self._condition:
+            # A waiting refresh goes first, so a steady stream of commands cannot starve it
+            while self._exclusive or self._waiting:
+                self._condition.wait()
+            self._commands += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._commands -= 1
+                self._condition.notify_all()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        with self._condition:
+            if not blocking and (self._exclusive or self._commands):
+                return False
+            self._waiting += 1
+            try:
+                while self._exclusive or self._commands:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._exclusive = True
+            return True
+
+    def release(self):
+        with self._condition:
+            self._exclusive = False
+            self._condition.notify_all()
+
+    def locked(self) -> bool:
+        with self._condition:
+            return self._exclusive or self._commands > 0
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        daemon = self.server.conductor_daemon
+        try:
+            message = json.loads(line)
+            if not daemon.authorized(message):
+                message, response = {}, {"ok": False, "error": "Unauthorized: missing or wrong daemon token"}
+            else:
+                response = daemon.handle(message.get("command"), message.get("arg"))
+        except (ValueError, AttributeError) as e:
+            message, response = {}, {"ok": False, "error": f"Malformed message: {e}"}
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+        self.wfile.flush()
+        # Only once the reply is out: the process exits as soon as serving stops
+        if message.get("command") == "stop":
+            daemon.stop()
+
+
+if HAS_UNIX_SOCKETS:
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class ConductorDaemon:
+    """
+    Serves conductor commands to DaemonClient connections.
+
+    One message per connection: {"command": ..., "arg": ...} in, one JSON
+    line {"ok", "result", "output", "elapsed_ms"} out, where output is what
+    the command printed. Connections are handled concurrently and commands
+    share the warm conductor, whose requests queue behind its scheduler;
+    registry refreshes wait for running commands and briefly hold new ones
+    back, so a delta never lands in the middle of an orchestration.
+    """
+
+    def __init__(self, root_path: Path = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 conductor_factory: Callable[[Path], Any] = None):
+        self.root_path = Path(root_path or default_root()).resolve()
+        self.idle_timeout = idle_timeout
+        self.conductor_factory = conductor_factory or _build_conductor
+        self.conductor = None
+        self.server = None
+        self.started_at = time.time()
+        self.last_activity = time.monotonic()
+        self.stats = {"commands": 0, "errors": 0}
+        self.registry_watcher = None
+        self.token: Optional[str] = None
+        self._command_lock = _CommandGate()
+        self._stats_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Build the conductor and bind the socket; serve_forever() then answers commands."""
+        with redirect_stdout(io.StringIO()):
+            self.conductor = self.conductor_factory(self.root_path)
+            # The conductor builds its components lazily; a daemon pays for them up front
+            if hasattr(self.conductor, "warmup"):
+                self.conductor.warmup()
+        if HAS_UNIX_SOCKETS:
+            path = socket_path(self.root_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Held from the liveness check through bind: of two daemons
+            # starting at once, the second finds the first listening
+            with open(path.with_suffix(".lock"), "a") as lock:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                if _socket_answers(path):
+                    if hasattr(self.conductor, "shutdown"):
+                        self.conductor.shutdown()
+                    raise DaemonAlreadyRunning(f"A conductor daemon already serves {self.root_path}")
+                # Nothing answers: a crashed daemon left the socket file behind
+                path.unlink(missing_ok=True)
+                self.server = _UnixServer(str(path), _Handler)
+                os.chmod(path, 0o600)
+        else:
+            self.server = _TCPServer(("127.0.0.1", 0), _Handler)
+            self.token = secrets.token_hex(32)
+            addr = address_file(self.root_path)
+            addr.parent.mkdir(parents=True, exist_ok=True)
+            # Token first: a client that finds the port can always read it
+            tokens = token_file(self.root_path)
+            tokens.write_text(self.token)
+            os.chmod(tokens, 0o600)
+            addr.write_text(str(self.server.server_address[1]))
+        self.server.conductor_daemon = self
+        return self
+
+    def serve_forever(self):
+        if self.idle_timeout:
+            threading.Thread(target=self._idle_watch, daemon=True, name="heady-daemon-idle").start()
+        self._start_registry_refresh()
+        try:
+            self.server.serve_forever(poll_interval=0.2)
+        finally:
+            self._cleanup()
+
+    def stop(self):
+        """Stop serving; safe to call from a handler thread."""
+        if not self._stopped.is_set():
+            self._stopped.set()
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+    def authorized(self, message: Dict[str, Any]) -> bool:
+        """Unix sockets are owner-only files; TCP messages must carry the token."""
+        if self.token is None:
+            return True
+        return hmac.compare_digest(str(message.get("token", "")), self.token)
+
+    def handle(self, command: Optional[str], arg: Any = None) -> Dict[str, Any]:
+        self.last_activity = time.monotonic()
+        if command == "ping":
+            return {"ok": True, "result": {"pid": os.getpid(), "root": str(self.root_path),
+                                           "started_at": self.started_at,
+                                           "registry_version": self._registry_version(), **self.stats}}
+        if command == "stop":
+            return {"ok": True, "result": {"stopping": True}}
+
+        from HeadyConductor import run_command
+        from HeadyCodec import json_default
+
+        started = time.perf_counter()
+        output = io.StringIO()
+        _route_stdout()
+        with self._command_lock.shared():
+            with self._stats_lock:
+                self.stats["commands"] += 1
+            capture = _command_output.set(output)
+            try:
+                result = run_command(self.conductor, command, arg)
+                # Round-trip here so the client receives exactly what the in-process CLI prints
+                response = {"ok": True, "result": json.loads(json.dumps(result, default=json_default))}
+            except Exception as e:
+                with self._stats_lock:
+                    self.stats["errors"] += 1
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            finally:
+                _command_output.reset(capture)
+        self.last_activity = time.monotonic()
+        response["output"] = output.getvalue()
+        response["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return response
+
+    def _idle_watch(self):
+        while not self._stopped.wait(min(self.idle_timeout, 5)):
+            if not self._command_lock.locked() and time.monotonic() - self.last_activity > self.idle_timeout:
+                print(f"[DAEMON] Idle for {self.idle_timeout}s, shutting down")
+                self.stop()
+
+    def _registry(self):
+        registry = getattr(self.conductor, "registry", None)
+        return registry if hasattr(registry, "refresh") else None
+
+    def _registry_version(self) -> Optional[int]:
+        registry = self._registry()
+        return registry.version if registry is not None else None
+
+    def _start_registry_refresh(self):
+        """Keep the warm registry in step with edited workflows, tools and nodes."""
+        registry = self._registry()
+        if registry is None:
+            return
+        discovery = (getattr(self.conductor, "resource_policies", None) or {}).get("registryDiscovery") or {}
+        if discovery.get("watch", True):
+            from HeadyRegistryWatch import RegistryWatcher, inotify_available
+            if inotify_available():
+                try:
+                    self.registry_watcher = RegistryWatcher(registry, lock=self._command_lock).start()
+                    return
+                except OSError as e:
+                    print(f"[DAEMON] Registry watcher unavailable ({e}), polling instead")
+        interval = discovery.get("refreshIntervalMs", DEFAULT_REFRESH_INTERVAL * 1000) / 1000
+        if interval > 0:
+            threading.Thread(target=self._refresh_registry, args=(registry, interval), daemon=True,
+                             name="heady-daemon-refresh").start()
+
+    def _refresh_registry(self, registry, interval: float):
+        while not self._stopped.wait(interval):
+            # A tick that finds a command running skips to the next one
+            if not self._command_lock.acquire(blocking=False):
+                continue
+            try:
+                registry.refresh()
+            except Exception as e:
+                print(f"[DAEMON] Registry refresh failed: {e}")
+            finally:
+                self._command_lock.release()
+
+    def _cleanup(self):
+        if self.registry_watcher is not None:
+            self.registry_watcher.stop()
+        self.server.server_close()
+        if HAS_UNIX_SOCKETS:
+            path = socket_path(self.root_path)
+            if path.exists():
+                path.unlink()
+        else:
+            address_file(self.root_path).unlink(missing_ok=True)
+            token_file(self.root_path).unlink(missing_ok=True)
+        if self.conductor is not None and hasattr(self.conductor, "shutdown"):
+            self.conductor.shutdown()
+
+
+def _build_conductor(root_path: Path):
+    from HeadyConductor import HeadyConductor
+    return HeadyConductor(str(root_path))
+
+
+class DaemonClient:
+    """Sends one command per connection to the daemon serving root_path."""
+
+    def __init__(self, root_path: Path = None, timeout: Optional[float] = None):
+        self.root_path = Path(root_path or default_root()).resolve()
+        self.timeout = timeout
+        self._token: Optional[str] = None
+
+    def _connect(self) -> socket.socket:
+        try:
+            if HAS_UNIX_SOCKETS:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(self.timeout)
+                try:
+                    sock.connect(str(socket_path(self.root_path)))
+                except OSError:
+                    sock.close()
+                    raise
+            else:
+                port = int(address_file(self.root_path).read_text())
+                self._token = token_file(self.root_path).read_text().strip()
+                sock = socket.create_connection(("127.0.0.1", port), timeout=self.timeout)
+        except (OSError, ValueError) as e:
+            raise DaemonUnavailable(f"No conductor daemon for {self.root_path}: {e}") from e
+        return sock
+
+    def call(self, command: str, arg: Any = None) -> Dict[str, Any]:
+        with self._connect() as sock:
+            message = {"command": command, "arg": arg}
+            if self._token is not None:
+                message["token"] = self._token
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise DaemonUnavailable("Conductor daemon closed the connection without a response")
+        return json.loads(line)
+
+    def ping(self) -> Optional[Dict[str, Any]]:
+        try:
+            return self.call("ping")["result"]
+        except DaemonUnavailable:
+            return None
+
+
+def start_daemon(root_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> "subprocess.Popen":
+    """Spawn a detached daemon for root_path, logging to .heady/conductor-daemon.log."""
+    # Imported here: every client run pays for module imports, only the first spawns
+    import subprocess
+
+    root_path = Path(root_path).resolve()
+    log_path = root_path / ".heady" / "conductor-daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), "--serve",
+               "--root", str(root_path), "--idle-timeout", str(idle_timeout)]
+    with open(log_path, "ab") as log:
+        kwargs = {"start_new_session": True} if os.name != "nt" else \
+            {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS}
+        return subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                                cwd=str(root_path), **kwargs)
+
+
+def ensure_daemon(root_path: Path = None, start_timeout: float = DAEMON_START_TIMEOUT,
+                  idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> DaemonClient:
+    """Client for a running daemon, starting one first if none answers."""
+    client = DaemonClient(root_path)
+    if client.ping() is not None:
+        return client
+    process = start_daemon(client.root_path, idle_timeout)
+    deadline = time.monotonic() + start_timeout
+    while time.monotonic() < deadline:
+        if client.ping() is not None:
+            return client
+        if process.poll() is not None:
+            # Lost a start race to another client, or failed; either way ask once more
+            if client.ping() is not None:
+                return client
+            raise DaemonUnavailable(f"Conductor daemon exited with code {process.returncode}, "
+                                    f"see {client.root_path / '.heady' / 'conductor-daemon.log'}")
+        time.sleep(0.05)
+    raise DaemonUnavailable(f"Conductor daemon did not start within {start_timeout}s")
+
+
+def serve(root_path: Path, idle_timeout: float):
+    """Run the daemon in the foreground unless one already serves root_path."""
+    if DaemonClient(root_path).ping() is not None:
+        print(f"[DAEMON] Already running for {root_path}")
+        return
+    try:
+        daemon = ConductorDaemon(root_path, idle_timeout=idle_timeout).start()
+    except DaemonAlreadyRunning:
+        # Another client's daemon won the start race
+        print(f"[DAEMON] Already running for {root_path}")
+        return
+    print(f"[DAEMON] Conductor daemon {os.getpid()} serving {daemon.root_path}")
+    sys.stdout.flush()
+    daemon.serve_forever()
+    print("[DAEMON] Stopped")
+
+
+def add_daemon_arguments(parser: argparse.ArgumentParser):
+    """Daemon control options, shared by HeadyConductor.main and HeadyDaemon.main."""
+    parser.add_argument("--root", type=str, help="Repository root served by the daemon")
+    parser.add_argument("--serve", action="store_true", help="Run the daemon in the foreground")
+    parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--status", action="store_true", help="Show daemon status")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds without commands before the daemon exits (0 = never)")
+
+
+def run_cli(parser: argparse.ArgumentParser, args: argparse.Namespace,
+            in_process: Callable[[Optional[Path], str, Any], None] = None):
+    """
+    Act on parsed CLI options: daemon control, or one command answered by the
+    daemon (started if none is running). When no daemon can be started and
+    in_process is given, in_process(root, command, arg) runs the command instead.
+    """
+    root_path = Path(args.root).resolve() if args.root else default_root()
+
+    if args.serve:
+        serve(root_path, args.idle_timeout)
+        return
+
+    if args.stop or args.status:
+        status = DaemonClient(root_path).ping()
+        if status is not None and args.stop:
+            DaemonClient(root_path).call("stop")
+        print(json.dumps(status or {"running": False}, indent=2))
+        return
+
+    command, arg = parse_command(args)
+    if command is None:
+        parser.print_help()
+        return
+
+    try:
+        client = ensure_daemon(root_path, idle_timeout=args.idle_timeout)
+    except DaemonUnavailable as e:
+        if in_process is None:
+            raise
+        # Only a daemon that never started: a command it received is not run twice
+        print(f"[WARN] Daemon: {e}; running in-process", file=sys.stderr)
+        in_process(root_path, command, arg)
+        return
+    response = client.call(command, arg)
+    sys.stdout.write(response.get("output", ""))
+    if not response["ok"]:
+        print(f"[ERROR] {response['error']}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(response["result"], indent=2))
+
+
+def run_in_process(root_path: Optional[Path], command: str, arg: Any):
+    """Build a conductor for one command and print its result."""
+    from HeadyConductor import HeadyConductor, run_command
+    from HeadyCodec import json_default
+    conductor = HeadyConductor(str(root_path) if root_path else None)
+    result = run_command(conductor, command, arg)
+    print(json.dumps(result, indent=2, default=json_default))
+
+
+def main():
+    """
+    Conductor CLI, for both HeadyConductor.py and HeadyDaemon.py: commands go to
+    the warm daemon unless --in-process is given or no daemon can be started.
+    """
+    parser = argparse.ArgumentParser(description="Heady Conductor - Orchestration Layer")
+    add_command_arguments(parser)
+    add_daemon_arguments(parser)
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run the command in this process instead of the conductor daemon")
+    args = parser.parse_args()
+
+    if args.in_process:
+        command, arg = parse_command(args)
+        if command is None:
+            parser.print_help()
+            return
+        run_in_process(Path(args.root).resolve() if args.root else None, command, arg)
+        return
+    run_cli(parser, args, in_process=run_in_process)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyExecutionLog.py                          ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      EXECUTION LOG - RING BUFFER OVER COMPRESSED SEGMENTS                     ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━              ║
+║     Recent conductor executions in a fixed-size ring; every execution         ║
+║     appended in the background to size-rotated gzip segments with a sparse    ║
+║     time index, so time-range queries decompress only the blocks they hit     ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import gzip
+import json
+import atexit
+import weakref
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIRECTORY = ".heady/execution-log"
+DEFAULT_CAPACITY = 1000
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 64
+# Records per compressed block, and so per sparse index entry
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 1.0
+# Entries waiting for the writer before the oldest are dropped from the on-disk log
+DEFAULT_MAX_PENDING = 50000
+
+SEGMENT_GLOB = "segment-*.log.gz"
+# flock()ed by every process writing the directory: exclusive to append, shared to read the indexes
+LOCK_FILE = "segments.lock"
+
+Timestamp = Union[str, datetime, None]
+
+
+def _stamp(value: Timestamp) -> Optional[str]:
+    """ISO string for comparing against entry timestamps (datetime.isoformat, local time)."""
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+# Logs still open at interpreter exit; weak, so the hook keeps none of them alive
+_open_logs: "weakref.WeakSet[ExecutionLog]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_logs():
+    for log in list(_open_logs):
+        log.close()
+
+
+class ExecutionLog:
+    """
+    Execution history for HeadyConductor.
+
+    append() is O(1) and never touches disk: the entry goes into a ring of
+    the last ``capacity`` executions and onto a pending queue. A background
+    writer drains the queue every ``flush_interval`` seconds, or sooner once
+    ``batch_size`` entries are waiting, compressing each batch into one gzip
+    member appended to the active segment. One line per member in the
+    segment's .idx file records its byte range and time span; that is the
+    sparse index between() uses to skip segments and blocks outside the
+    queried range. Segments rotate at ``segment_bytes``; only the newest
+    ``max_segments`` are kept. A segment is an ordinary multi-member gzip
+    file, so ``zcat`` reads it too.
+
+    Several processes may log to one directory (the daemon, the API and
+    queue workers each build a conductor on the same root). Writers hold an
+    exclusive flock on segments.lock and take the append offset from the
+    segment file itself, so no process relies on state another may have
+    changed; readers catch up on index lines others appended. Without fcntl
+    (Windows) only one process may write a directory.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, capacity: int = DEFAULT_CAPACITY,
+                 segment_bytes: int = DEFAULT_SEGMENT_BYTES, max_segments: Optional[int] = DEFAULT_MAX_SEGMENTS,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        self.directory = Path(directory) if directory else None
+        self.capacity = capacity
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._tail: deque = deque(maxlen=capacity)
+        self._pending: deque = deque()
+        self._condition = threading.Condition()
+        self._writing = 0
+        self._flush_requests = 0
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+        # Segment state, opened on first write or query
+        self._io_lock = threading.RLock()
+        self._indexes: Dict[int, List[Dict[str, Any]]] = {}
+        self._index_offsets: Dict[int, int] = {}
+        self._sequences: List[int] = []
+        self._lock_file = None
+
+        self.stats = {
+            "appended": 0,
+            "written": 0,
+            "blocks": 0,
+            "dropped": 0,
+            "rotations": 0,
+            "segments_deleted": 0,
+            "write_errors": 0,
+            "blocks_read": 0
+        }
+
+        if self.directory is not None:
+            _open_logs.add(self)
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any], root_path: Path) -> "ExecutionLog":
+        settings = policies.get("executionLog") or {}
+        directory = Path(settings.get("directory", DEFAULT_DIRECTORY))
+        return cls(
+            directory=(directory if directory.is_absolute() else Path(root_path) / directory)
+            if settings.get("persist", True) else None,
+            capacity=settings.get("memoryEntries", DEFAULT_CAPACITY),
+            segment_bytes=settings.get("segmentBytes", DEFAULT_SEGMENT_BYTES),
+            max_segments=settings.get("maxSegments", DEFAULT_MAX_SEGMENTS),
+            batch_size=settings.get("blockEntries", DEFAULT_BATCH_SIZE),
+            flush_interval=settings.get("flushIntervalMs", DEFAULT_FLUSH_INTERVAL * 1000) / 1000
+        )
+
+    # ─── In-memory tail ───────────────────────────────────────────────────
+
+    def append(self, entry: Dict[str, Any]):
+        """Record one execution; entries should carry an ISO "timestamp"."""
+        with self._condition:
+            self._tail.append(entry)
+            self.stats["appended"] += 1
+            if self.directory is None:
+                return
+            closed = self._closed
+            if not closed:
+                if len(self._pending) >= self.max_pending:
+                    self._pending.popleft()
+                    self.stats["dropped"] += 1
+                self._pending.append(entry)
+                self._ensure_writer()
+                if len(self._pending) >= self.batch_size:
+                    self._condition.notify_all()
+        if closed:
+            # Late executions after shutdown are written straight through
+            self._write_block([entry])
+
+    def recent(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """The last n executions in memory (all of the ring by default), oldest first."""
+        with self._condition:
+            entries = list(self._tail)
+        return entries if n is None else entries[-n:] if n > 0 else []
+
+    def __len__(self) -> int:
+        return len(self._tail)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.recent())
+
+    # ─── Background writer ────────────────────────────────────────────────
+
+    def _ensure_writer(self):
+        """Start the writer thread on first use (caller holds the condition)."""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="HeadyExecutionLog", daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self.batch_size or self._closed
+                    or (self._flush_requests and self._pending),
+                    timeout=self.flush_interval
+                )
+                batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                self._writing = len(batch)
+                closing = self._closed
+
+            if batch:
+                self._write_block(batch)
+
+            with self._condition:
+                self._writing = 0
+                self._condition.notify_all()
+                if closing and not self._pending:
+                    break
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every appended entry is on disk. Returns False on timeout."""
+        with self._condition:
+            if self._writer is None or not self._writer.is_alive():
+                return True
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout=timeout)
+            finally:
+                self._flush_requests -= 1
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Write out pending entries and stop the writer."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            writer = self._writer
+        _open_logs.discard(self)
+        if writer is not None:
+            writer.join(timeout=timeout)
+        with self._io_lock:
+            if self._lock_file is not None:
+                self._lock_file.close()
+                self._lock_file = None
+
+    # ─── Segments ─────────────────────────────────────────────────────────
+
+    def _segment_path(self, sequence: int) -> Path:
+        return self.directory / f"segment-{sequence:08d}.log.gz"
+
+    def _index_path(self, sequence: int) -> Path:
+        return self.directory / f"segment-{sequence:08d}.idx"
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """The io lock, plus an flock on the directory's lock file shared with other processes."""
+        with self._io_lock:
+            if self._lock_file is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                self._lock_file = open(self.directory / LOCK_FILE, "a+b")
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _sync_segments(self):
+        """Rescan the segments on disk; another process may have rotated or deleted some (lock held)."""
+        sequences = sorted(int(path.name[8:16]) for path in self.directory.glob(SEGMENT_GLOB))
+        for sequence in set(self._indexes) - set(sequences):
+            self._indexes.pop(sequence, None)
+            self._index_offsets.pop(sequence, None)
+        self._sequences = sequences or [1]
+
+    def _index(self, sequence: int) -> List[Dict[str, Any]]:
+        """Index entries of a segment, reading only lines appended since the last call (lock held)."""
+        blocks = self._indexes.setdefault(sequence, [])
+        offset = self._index_offsets.get(sequence, 0)
+        try:
+            with open(self._index_path(sequence), "rb") as f:
+                if os.fstat(f.fileno()).st_size < offset:
+                    # Rewritten by a recovery
+                    blocks.clear()
+                    offset = 0
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        blocks.append(json.loads(line))
+                    except ValueError:
+                        break
+                    offset += len(line)
+        except OSError:
+            pass
+        self._index_offsets[sequence] = offset
+        return blocks
+
+    def _indexed_end(self, sequence: int) -> int:
+        """
+        End of the last indexed block of a segment, first truncating a torn
+        tail a crashed writer left behind (exclusive lock held). Writers only
+        append under the lock, so anything past the index is unreachable.
+        """
+        path, index_path = self._segment_path(sequence), self._index_path(sequence)
+        size = path.stat().st_size if path.exists() else 0
+        blocks = self._index(sequence)
+        index_size = index_path.stat().st_size if index_path.exists() else 0
+        kept = [block for block in blocks if block["offset"] + block["length"] <= size]
+        indexed_end = kept[-1]["offset"] + kept[-1]["length"] if kept else 0
+        if size != indexed_end or index_size != self._index_offsets[sequence] or len(kept) != len(blocks):
+            print(f"[WARN] HeadyExecutionLog: recovering {path.name} "
+                  f"({size - indexed_end} unindexed bytes dropped)")
+            if size:
+                with open(path, "r+b") as f:
+                    f.truncate(indexed_end)
+            with open(index_path, "w") as f:
+                f.writelines(json.dumps(block) + "\n" for block in kept)
+            self._indexes[sequence] = kept
+            self._index_offsets[sequence] = index_path.stat().st_size
+        return indexed_end
+
+    def _write_block(self, batch: List[Dict[str, Any]]):
+        """Compress batch into one gzip member on the active segment and index it."""
+        try:
+            data = gzip.compress(
+                "".join(json.dumps(entry, default=str, separators=(",", ":")) + "\n" for entry in batch).encode(),
+                compresslevel=6, mtime=0
+            )
+            stamps = [str(entry.get("timestamp", "")) for entry in batch]
+            with self._locked(exclusive=True):
+                self._sync_segments()
+                end = self._indexed_end(self._sequences[-1])
+                if end and end + len(data) > self.segment_bytes:
+                    self._rotate()
+                active = self._sequences[-1]
+                with open(self._segment_path(active), "ab") as f:
+                    # The offset comes from the file, which every writer appends to under the lock
+                    offset = os.fstat(f.fileno()).st_size
+                    f.write(data)
+                block = {"first": min(stamps), "last": max(stamps), "offset": offset,
+                         "length": len(data), "count": len(batch)}
+                # The index line goes last: a block it does not name is dropped on recovery
+                with open(self._index_path(active), "a") as f:
+                    f.write(json.dumps(block) + "\n")
+                self._index(active)
+            self.stats["written"] += len(batch)
+            self.stats["blocks"] += 1
+        except Exception as e:
+            # One bad batch must not stop the writer thread
+            self.stats["write_errors"] += 1
+            print(f"[WARN] HeadyExecutionLog: could not write {len(batch)} entries ({e})")
+
+    def _rotate(self):
+        """Start a new segment and drop the oldest beyond max_segments (exclusive lock held)."""
+        sequence = self._sequences[-1] + 1
+        self._sequences.append(sequence)
+        self._indexes[sequence] = []
+        self._index_offsets[sequence] = 0
+        self.stats["rotations"] += 1
+        while self.max_segments and len(self._sequences) > self.max_segments:
+            oldest = self._sequences.pop(0)
+            self._indexes.pop(oldest, None)
+            self._index_offsets.pop(oldest, None)
+            for path in (self._segment_path(oldest), self._index_path(oldest)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self.stats["segments_deleted"] += 1
+
+    # ─── Queries ──────────────────────────────────────────────────────────
+
+    def between(self, start: Timestamp = None, end: Timestamp = None, execution_type: Optional[str] = None,
+                name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Executions with start <= timestamp <= end (either bound may be None),
+        oldest segment first, optionally filtered by type and name. Pending
+        entries are flushed first; only blocks overlapping the range are read.
+        """
+        low, high = _stamp(start), _stamp(end)
+        if self.directory is None:
+            for entry in self.recent():
+                if self._matches(entry, low, high, execution_type, name):
+                    yield entry
+            return
+        self.flush()
+        with self._locked(exclusive=False):
+            self._sync_segments()
+            plan = []
+            for sequence in self._sequences:
+                blocks = [block for block in self._index(sequence)
+                          if (low is None or block["last"] >= low) and (high is None or block["first"] <= high)]
+                if blocks:
+                    plan.append((self._segment_path(sequence), blocks))
+
+        for path, blocks in plan:
+            try:
+                with open(path, "rb") as f:
+                    for block in blocks:
+                        f.seek(block["offset"])
+                        lines = gzip.decompress(f.read(block["length"])).splitlines()
+                        self.stats["blocks_read"] += 1
+                        for line in lines:
+                            entry = json.loads(line)
+                            if self._matches(entry, low, high, execution_type, name):
+                                yield entry
+            except FileNotFoundError:
+                # Rotated away while we were reading
+                continue
+
+    @staticmethod
+    def _matches(entry: Dict[str, Any], low: Optional[str], high: Optional[str],
+                 execution_type: Optional[str], name: Optional[str]) -> bool:
+        stamp = str(entry.get("timestamp", ""))
+        return (low is None or stamp >= low) and (high is None or stamp <= high) \
+            and (execution_type is None or entry.get("type") == execution_type) \
+            and (name is None or entry.get("name") == name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            pending = len(self._pending) + self._writing
+        stats = {**self.stats, "in_memory": len(self._tail), "capacity": self.capacity, "pending": pending}
+        if self.directory is not None:
+            with self._locked(exclusive=False):
+                self._sync_segments()
+                stats["segments"] = len(self._sequences)
+            stats["bytes_on_disk"] = sum(path.stat().st_size for path in self.directory.glob(SEGMENT_GLOB))
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the HeadyConductor execution log")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Repository root")
+    parser.add_argument("--since", help="ISO timestamp, inclusive")
+    parser.add_argument("--until", help="ISO timestamp, inclusive")
+    parser.add_argument("--type", help="workflow or node")
+    parser.add_argument("--name", help="Workflow or node name")
+    parser.add_argument("--stats", action="store_true", help="Show segment statistics instead")
+    args = parser.parse_args()
+
+    from HeadyExecutor import load_resource_policies
+    log = ExecutionLog.from_policies(load_resource_policies(Path(args.root)), Path(args.root))
+    if log.directory is None:
+        print("[WARN] HeadyExecutionLog: executionLog.persist is off, nothing on disk to query")
+        return 1
+    if args.stats:
+        print(json.dumps(log.get_stats(), indent=2))
+        return 0
+    for entry in log.between(args.since, args.until, execution_type=args.type, name=args.name):
+        print(json.dumps(entry, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyExecutor.py                              ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      EXECUTOR - CONCURRENT PLAN EXECUTION                                     ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                                  ║
+║     Runs independent plan steps on a bounded worker pool with depends_on      ║
+║     ordering, per-step timeouts and retries from resource-policies.yaml       ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import time
+import random
+import contextvars
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+
+def load_resource_policies(root_path: Path) -> Dict[str, Any]:
+    """Read configs/resource-policies.yaml, or {} when it is missing or unreadable."""
+    policy_file = Path(root_path) / "configs" / "resource-policies.yaml"
+    try:
+        with open(policy_file, 'r') as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        print(f"[WARN] HeadyExecutor: resource policies unavailable ({e}), using defaults")
+        return {}
+
+
+@dataclass
+class RetryPolicy:
+    """Retry count and backoff schedule (the ``retry`` section of resource-policies.yaml)."""
+    max_retries: int = 3
+    strategy: str = "exponential"
+    base_delay_ms: float = 500
+    max_delay_ms: float = 30000
+    jitter_ms: float = 0
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any]) -> "RetryPolicy":
+        retry = policies.get("retry") or {}
+        return cls(
+            max_retries=retry.get("maxRetries", 3),
+            strategy=retry.get("backoffStrategy", "exponential"),
+            base_delay_ms=retry.get("baseDelayMs", 500),
+            max_delay_ms=retry.get("maxDelayMs", 30000),
+            jitter_ms=retry.get("jitterMaxMs", 1000) if retry.get("jitterEnabled") else 0
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (1-based)."""
+        if self.strategy == "fixed":
+            delay_ms = self.base_delay_ms
+        elif self.strategy == "linear":
+            delay_ms = self.base_delay_ms * attempt
+        else:
+            delay_ms = self.base_delay_ms * (2 ** (attempt - 1))
+        delay_ms = min(delay_ms, self.max_delay_ms)
+        if self.jitter_ms:
+            delay_ms += random.uniform(0, self.jitter_ms)
+        return delay_ms / 1000
+
+
+@dataclass
+class PlanStep:
+    """One unit of work in an execution plan."""
+    id: str
+    fn: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+    max_retries: Optional[int] = None
+    # JSON description of the step for engines that run it in another process
+    payload: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class StepResult:
+    """Outcome of a step: completed, failed, timeout or skipped (a dependency did not complete)."""
+    id: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.status == "completed"
+
+
+class ExecutionEngine:
+    """
+    Executes PlanSteps concurrently on a bounded thread pool.
+
+    A step starts once every step in its ``depends_on`` has completed; if a
+    dependency fails, times out or is skipped, the step is skipped. Steps
+    that raise or overrun their timeout are retried with the policy backoff.
+    A step whose result is a dict with ``success: False`` reported its own
+    failure and is not retried. Python threads cannot be interrupted, so a
+    timed-out attempt is abandoned: its result is discarded and it keeps a
+    worker slot until it returns. Timeouts count from when an attempt
+    actually starts on a worker, not from when it was queued.
+    """
+
+    def __init__(self, max_workers: int = 8, retry_policy: RetryPolicy = None,
+                 default_timeout: Optional[float] = None):
+        self.max_workers = max(1, max_workers)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.default_timeout = default_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="heady-exec")
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any]) -> "ExecutionEngine":
+        concurrency = policies.get("concurrency") or {}
+        timeouts = policies.get("timeouts") or {}
+        agent_timeout_ms = timeouts.get("agentExecutionMs")
+        return cls(
+            max_workers=concurrency.get("maxConcurrentTasks", 8),
+            retry_policy=RetryPolicy.from_policies(policies),
+            default_timeout=agent_timeout_ms / 1000 if agent_timeout_ms else None
+        )
+
+    def run(self, steps: List[PlanStep]) -> List[StepResult]:
+        """Run steps to completion and return their results in step order."""
+        by_id = {step.id: step for step in steps}
+        if len(by_id) != len(steps):
+            raise ValueError("Duplicate step ids in plan")
+        for step in steps:
+            missing = [dep for dep in step.depends_on if dep not in by_id]
+            if missing:
+                raise ValueError(f"Step '{step.id}' depends on unknown steps: {missing}")
+        self._check_acyclic(by_id)
+        return self._run(steps, by_id)
+
+    @staticmethod
+    def _attempt(fn: Callable[[], Any], started: Dict[tuple, float], key: tuple) -> Any:
+        started[key] = time.monotonic()
+        return fn()
+
+    def _run(self, steps: List[PlanStep], by_id: Dict[str, PlanStep]) -> List[StepResult]:
+        results: Dict[str, StepResult] = {}
+        attempts: Dict[str, int] = {step.id: 0 for step in steps}
+        first_start: Dict[str, float] = {}
+        ready_at: Dict[str, float] = {}
+        started: Dict[tuple, float] = {}
+        waiting = [step.id for step in steps]
+        running: Dict[Future, tuple] = {}
+        abandoned = set()
+
+        while len(results) < len(steps):
+            now = time.monotonic()
+
+            # Start steps whose dependencies are resolved, up to the free worker slots
+            still_waiting = []
+            for step_id in waiting:
+                step = by_id[step_id]
+                deps = [results.get(dep) for dep in step.depends_on]
+                if any(dep is not None and not dep.success for dep in deps):
+                    results[step_id] = StepResult(step_id, "skipped", error="dependency did not complete")
+                elif all(dep is not None for dep in deps) and ready_at.get(step_id, 0) <= now \
+                        and len(running) + len(abandoned) < self.max_workers:
+                    attempts[step_id] += 1
+                    first_start.setdefault(step_id, now)
+                    timeout = step.timeout if step.timeout is not None else self.default_timeout
+                    key = (step_id, attempts[step_id])
+                    # Steps see the caller's context variables (the daemon's per-command output)
+                    running[self._executor.submit(contextvars.copy_context().run, self._attempt,
+                                                  step.fn, started, key)] = (key, timeout)
+                else:
+                    still_waiting.append(step_id)
+            waiting = still_waiting
+            if len(results) == len(steps):
+                break
+
+            # Sleep until a step finishes, a deadline passes or a retry comes due
+            wake_times = []
+            for key, timeout in running.values():
+                if timeout:
+                    # Attempts still queued behind busy workers are polled until they start
+                    wake_times.append(started[key] + timeout if key in started else now + 0.05)
+            wake_times += [ready_at[step_id] for step_id in waiting if step_id in ready_at]
+            wait_for = max(0.0, min(wake_times) - now) if wake_times else None
+            pending = set(running) | abandoned
+            if pending:
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            else:
+                time.sleep(wait_for or 0)
+                done = set()
+            abandoned -= done
+
+            now = time.monotonic()
+            for future, (key, timeout) in list(running.items()):
+                step_id = key[0]
+                if future in done:
+                    del running[future]
+                    error = future.exception()
+                    if error is None:
+                        value = future.result()
+                        failed = isinstance(value, dict) and value.get("success") is False
+                        results[step_id] = StepResult(
+                            step_id, "failed" if failed else "completed", result=value,
+                            error=value.get("error") if failed else None, attempts=attempts[step_id],
+                            duration_ms=(now - first_start[step_id]) * 1000
+                        )
+                        continue
+                    status, message = "failed", f"{type(error).__name__}: {error}"
+                elif timeout and key in started and now >= started[key] + timeout:
+                    del running[future]
+                    abandoned.add(future)
+                    status, message = "timeout", f"timed out after {timeout:g}s"
+                else:
+                    continue
+
+                step = by_id[step_id]
+                max_retries = step.max_retries if step.max_retries is not None else self.retry_policy.max_retries
+                if attempts[step_id] <= max_retries:
+                    ready_at[step_id] = now + self.retry_policy.delay(attempts[step_id])
+                    waiting.append(step_id)
+                else:
+                    results[step_id] = StepResult(
+                        step_id, status, error=message, attempts=attempts[step_id],
+                        duration_ms=(now - first_start[step_id]) * 1000
+                    )
+
+        return [results[step.id] for step in steps]
+
+    @staticmethod
+    def _check_acyclic(by_id: Dict[str, PlanStep]):
+        state: Dict[str, int] = {}
+
+        def visit(step_id: str):
+            if state.get(step_id) == 2:
+                return
+            if state.get(step_id) == 1:
+                raise ValueError(f"Dependency cycle through step '{step_id}'")
+            state[step_id] = 1
+            for dep in by_id[step_id].depends_on:
+                visit(dep)
+            state[step_id] = 2
+
+        for step_id in by_id:
+            visit(step_id)
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,299 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyHealth.py                                ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      HEALTH - CONCURRENT SERVICE PROBES WITH A TTL CACHE                      ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━           ║
+║     HTTP GET over pooled keep-alive connections for services with a health    ║
+║     URL, asyncio TCP connects for services with a port, all of a sweep in     ║
+║     flight at once; results cached and revalidated in the background         ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import time
+import queue
+import asyncio
+import threading
+import http.client
+from datetime import datetime
+from urllib.parse import urlsplit
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_TTL = 10.0
+DEFAULT_STALE_TTL = 60.0
+# Threads for blocking HTTP probes; TCP probes need none
+MAX_HTTP_PROBES = 64
+# Idle keep-alive connections kept per host
+POOL_SIZE_PER_HOST = 4
+
+HEALTHY, UNHEALTHY, DOWN, UNKNOWN = "healthy", "unhealthy", "down", "unknown"
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one probe: healthy, unhealthy (answered badly), down (unreachable) or unknown (nothing to probe)."""
+    name: str
+    status: str
+    method: Optional[str] = None
+    target: Optional[str] = None
+    latency_ms: Optional[float] = None
+    http_status: Optional[int] = None
+    error: Optional[str] = None
+    checked_at: Optional[str] = None
+    cached: bool = False
+    stale: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def probe_target(service: Any) -> Tuple[Optional[str], Optional[str]]:
+    """("http", url), ("tcp", "host:port") or (None, None) for a registry Service."""
+    if getattr(service, "health_check_url", None):
+        return "http", service.health_check_url
+    port = getattr(service, "port", None)
+    if port:
+        endpoint = getattr(service, "endpoint", None) or ""
+        host = urlsplit(endpoint).hostname if "://" in endpoint else None
+        return "tcp", f"{host or 'localhost'}:{port}"
+    return None, None
+
+
+class HttpConnectionPool:
+    """Keep-alive http.client connections per (scheme, host, port), safe to share between threads."""
+
+    def __init__(self, timeout: float, size_per_host: int = POOL_SIZE_PER_HOST):
+        self.timeout = timeout
+        self.size_per_host = size_per_host
+        self._idle: Dict[Tuple[str, str, int], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _queue(self, key) -> queue.LifoQueue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(self.size_per_host)
+            return self._idle[key]
+
+    def get(self, url: str) -> Tuple[int, bytes]:
+        """GET url; returns (status, body). Raises OSError/HTTPException when the host is unreachable."""
+        parts = urlsplit(url)
+        https = parts.scheme == "https"
+        key = (parts.scheme, parts.hostname, parts.port or (443 if https else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        idle = self._queue(key)
+        try:
+            conn, reused = idle.get_nowait(), True
+        except queue.Empty:
+            conn_class = http.client.HTTPSConnection if https else http.client.HTTPConnection
+            conn, reused = conn_class(key[1], key[2], timeout=self.timeout), False
+            with self._lock:
+                self.connections_opened += 1
+        try:
+            conn.request("GET", path, headers={"Connection": "keep-alive", "User-Agent": "HeadyHealth"})
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection: retry once on a new one
+            return self.get(url)
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, body
+
+    def close(self):
+        with self._lock:
+            queues, self._idle = list(self._idle.values()), {}
+        for idle in queues:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+class HealthProber:
+    """
+    Probes services concurrently and caches the results.
+
+    check() answers from the cache while a result is younger than ttl. For
+    a further stale_ttl it still answers from the cache, flagged stale, and
+    re-probes in the background; on_revalidated receives those fresh
+    results. Anything older, or everything with fresh=True, is probed
+    before returning. Probes run on a private event loop thread, so a sweep
+    costs about one timeout however many services it covers.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, ttl: float = DEFAULT_TTL,
+                 stale_ttl: float = DEFAULT_STALE_TTL, clock: Callable[[], float] = time.monotonic,
+                 on_revalidated: Optional[Callable[[Dict[str, ProbeResult]], None]] = None):
+        self.timeout = timeout
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.clock = clock
+        self.on_revalidated = on_revalidated
+        self.http = HttpConnectionPool(timeout)
+        self._cache: Dict[str, Tuple[float, Tuple, ProbeResult]] = {}
+        self._revalidating: set = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_executor: Optional[ThreadPoolExecutor] = None
+        self.stats = {"probes": 0, "cache_hits": 0, "stale_hits": 0, "sweeps": 0}
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any], **kwargs) -> "HealthProber":
+        timeout_ms = (policies.get("timeouts") or {}).get("healthCheckMs")
+        cache = policies.get("healthChecks") or {}
+        return cls(
+            timeout=timeout_ms / 1000 if timeout_ms else DEFAULT_TIMEOUT,
+            ttl=cache.get("cacheTtlMs", DEFAULT_TTL * 1000) / 1000,
+            stale_ttl=cache.get("staleWhileRevalidateMs", DEFAULT_STALE_TTL * 1000) / 1000,
+            **kwargs
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._http_executor = ThreadPoolExecutor(max_workers=MAX_HTTP_PROBES,
+                                                         thread_name_prefix="heady-health-http")
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="heady-health", daemon=True).start()
+            return self._loop
+
+    # ─── Probes ───────────────────────────────────────────────────────────
+
+    async def _probe(self, name: str, method: Optional[str], target: Optional[str]) -> ProbeResult:
+        result = ProbeResult(name, UNKNOWN, method, target)
+        if method is None:
+            return result
+        started = time.perf_counter()
+        try:
+            if method == "http":
+                loop = asyncio.get_running_loop()
+                status, _ = await asyncio.wait_for(
+                    loop.run_in_executor(self._http_executor, self.http.get, target), self.timeout)
+                result.http_status = status
+                result.status = HEALTHY if 200 <= status < 400 else UNHEALTHY
+                if result.status == UNHEALTHY:
+                    result.error = f"HTTP {status}"
+            else:
+                host, port = target.rsplit(":", 1)
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), self.timeout)
+                writer.close()
+                result.status = HEALTHY
+        except asyncio.TimeoutError:
+            result.status, result.error = DOWN, f"timed out after {self.timeout:g}s"
+        except (OSError, http.client.HTTPException) as e:
+            result.status, result.error = DOWN, f"{type(e).__name__}: {e}"
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        result.checked_at = datetime.now().isoformat()
+        return result
+
+    async def _sweep(self, targets: Dict[str, Tuple]) -> List[ProbeResult]:
+        return await asyncio.gather(*(self._probe(name, *target) for name, target in targets.items()))
+
+    def _store(self, targets: Dict[str, Tuple], results: List[ProbeResult]) -> Dict[str, ProbeResult]:
+        now = self.clock()
+        with self._lock:
+            self.stats["sweeps"] += 1
+            self.stats["probes"] += sum(1 for r in results if r.method)
+            for result in results:
+                self._cache[result.name] = (now, targets[result.name], result)
+                self._revalidating.discard(result.name)
+        return {result.name: result for result in results}
+
+    def _probe_all(self, targets: Dict[str, Tuple]) -> Dict[str, ProbeResult]:
+        if not targets:
+            return {}
+        results = asyncio.run_coroutine_threadsafe(self._sweep(targets), self._ensure_loop()).result()
+        return self._store(targets, results)
+
+    def _revalidate(self, targets: Dict[str, Tuple]):
+        """Re-probe stale entries without blocking the caller."""
+        def finish(future):
+            if future.cancelled() or future.exception() is not None:
+                with self._lock:
+                    self._revalidating.difference_update(targets)
+                return
+            results = self._store(targets, future.result())
+            if self.on_revalidated:
+                self.on_revalidated(results)
+
+        asyncio.run_coroutine_threadsafe(self._sweep(targets), self._ensure_loop()).add_done_callback(finish)
+
+    # ─── Public API ───────────────────────────────────────────────────────
+
+    def check(self, services: Dict[str, Any], fresh: bool = False) -> Dict[str, ProbeResult]:
+        """Results for every service in the name -> Service mapping, in mapping order."""
+        now = self.clock()
+        answers: Dict[str, ProbeResult] = {}
+        to_probe, to_revalidate = {}, {}
+        with self._lock:
+            for name, service in services.items():
+                target = probe_target(service)
+                cached = None if fresh else self._cache.get(name)
+                if cached and cached[1] == target:
+                    checked, _, result = cached
+                    age = now - checked
+                    if age <= self.ttl:
+                        answers[name] = ProbeResult(**dict(asdict(result), cached=True))
+                        self.stats["cache_hits"] += 1
+                        continue
+                    if age <= self.ttl + self.stale_ttl:
+                        answers[name] = ProbeResult(**dict(asdict(result), cached=True, stale=True))
+                        self.stats["stale_hits"] += 1
+                        if name not in self._revalidating:
+                            self._revalidating.add(name)
+                            to_revalidate[name] = target
+                        continue
+                to_probe[name] = target
+        if to_revalidate:
+            self._revalidate(to_revalidate)
+        answers.update(self._probe_all(to_probe))
+        return {name: answers[name] for name in services}
+
+    def invalidate(self, name: str = None):
+        """Forget one cached result, or all of them."""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def close(self):
+        with self._lock:
+            loop, executor, self._loop = self._loop, self._http_executor, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.http.close()
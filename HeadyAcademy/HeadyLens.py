@@ -74,6 +74,8 @@ class HeadyLens:
         self.registry = registry
         self.monitoring_active = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
+        self._monitor_lock = threading.Lock()
         
         # Real-time data stores (indexed for performance)
         self.service_status_index: Dict[str, Dict[str, Any]] = {}
@@ -93,12 +95,14 @@ class HeadyLens:
     
     def start_monitoring(self):
         """Start real-time monitoring."""
-        if self.monitoring_active:
-            return {"status": "already_active"}
-        
-        self.monitoring_active = True
-        self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitor_thread.start()
+        with self._monitor_lock:
+            if self.monitoring_active:
+                return {"status": "already_active"}
+            
+            self.monitoring_active = True
+            self._stop_event.clear()
+            self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+            self.monitor_thread.start()
         
         self._log_event("info", "LENS started monitoring")
         return {"status": "started", "timestamp": datetime.now().isoformat()}
@@ -106,6 +110,7 @@ class HeadyLens:
     def stop_monitoring(self):
         """Stop monitoring."""
         self.monitoring_active = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         
@@ -117,10 +122,10 @@ class HeadyLens:
         while self.monitoring_active:
             try:
                 self._update_indexes()
-                time.sleep(self.check_interval)
             except Exception as e:
                 self._log_event("error", f"Monitoring error: {e}")
-                time.sleep(self.check_interval)
+            # Wakes immediately on stop_monitoring() instead of finishing the interval
+            self._stop_event.wait(self.check_interval)
     
     def _update_indexes(self):
         """Update all performance indexes."""
@@ -178,8 +183,14 @@ class HeadyLens:
             system_health=system_health
         )
     
+    def _ensure_monitoring(self):
+        """Health data was requested: keep the indexes fresh from now on."""
+        if not self.monitoring_active:
+            self.start_monitoring()
+    
     def get_current_state(self) -> Dict[str, Any]:
         """Get current system state (indexed for fast access)."""
+        self._ensure_monitoring()
         snapshot = self._create_snapshot()
         
         return {
@@ -197,6 +208,8 @@ class HeadyLens:
     def query_index(self, query_type: str, filters: Dict[str, Any] = None) -> Dict[str, Any]:
         """Query indexed data for fast retrieval."""
         filters = filters or {}
+        if query_type in ("services", "resources", "snapshots"):
+            self._ensure_monitoring()
         
         if query_type == "services":
             return self.service_status_index
@@ -259,6 +272,7 @@ class HeadyLens:
     
     def get_health_summary(self) -> Dict[str, Any]:
         """Get quick health summary."""
+        self._ensure_monitoring()
         snapshot = self._create_snapshot()
         
         return {
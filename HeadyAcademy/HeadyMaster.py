@@ -18,6 +18,8 @@ import os, time, yaml, subprocess, sys, logging
 from pathlib import Path
 from datetime import datetime
 
+from HeadyMatcher import PatternMatcher
+
 sys.path.append(str(Path("Tools").resolve()))
 
 LOG_DIR = Path("Logs")
@@ -59,6 +61,8 @@ class HeadyMaster:
         self.nodes = []
         self.secrets = {}
         self.processed_files = set()
+        self.council_matcher = PatternMatcher({})
+        self.registry_fingerprint = None
         self.ensure_infrastructure()
         self.unlock_vault()
         self.load_registry()
@@ -96,6 +100,34 @@ class HeadyMaster:
             log.error(f"Registry parse error: {e}")
             self.nodes = []
         self.ensure_dynamic_nodes()
+        self.build_council_matcher()
+        self.registry_fingerprint = self.get_registry_fingerprint()
+
+    def get_registry_fingerprint(self):
+        stamps = []
+        for path in (REGISTRY_FILE, ACADEMY_ROOT / "Students" / "Wrappers"):
+            try:
+                stamps.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def refresh_registry(self):
+        """Reload nodes and recompile the council matcher when the registry or wrappers change."""
+        if self.get_registry_fingerprint() != self.registry_fingerprint:
+            log.info("Registry changed. Reloading council.")
+            self.load_registry()
+
+    def build_council_matcher(self):
+        vocabulary = {}
+        for node in self.nodes:
+            node_name = node.get("name")
+            triggers = node.get("trigger_on") or []
+            if node_name and triggers:
+                vocabulary.setdefault(node_name, []).extend(str(trigger) for trigger in triggers)
+        word_boundary = bool((self.registry.get("council") or {}).get("word_boundary", False))
+        self.council_matcher = PatternMatcher(vocabulary, word_boundary=word_boundary)
+        log.info(f"Council matcher compiled: {len(self.council_matcher)} triggers across {len(vocabulary)} nodes.")
 
     def ensure_dynamic_nodes(self):
         known = {node.get("name", "").upper() for node in self.nodes if node.get("name")}
@@ -134,15 +166,9 @@ class HeadyMaster:
 
     def consult_council(self, file_path):
         signal = self.build_signal(file_path)
-        matches = []
-        for node in self.nodes:
-            node_name = node.get("name")
-            triggers = node.get("trigger_on") or []
-            if not node_name or not triggers:
-                continue
-            score = sum(1 for trigger in triggers if trigger.lower() in signal)
-            if score:
-                matches.append((score, node_name))
+        # One pass over the signal; score = distinct triggers hit per node
+        scores = self.council_matcher.count_by_category(signal)
+        matches = [(score, node_name) for node_name, score in scores.items()]
 
         if not matches:
             if file_path.suffix.lower() in CODE_EXTENSIONS:
@@ -216,6 +242,7 @@ class HeadyMaster:
         
         try:
             while True:
+                self.refresh_registry()
                 files = set(f for f in PLAYGROUND_DIR.glob('*') if f.is_file())
                 new = files - self.processed_files
                 for f in new:
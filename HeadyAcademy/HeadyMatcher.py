@@ -0,0 +1,153 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyMatcher.py                               ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      MATCHER - COMPILED MULTI-PATTERN MATCHING                                ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                          ║
+║     Aho-Corasick automaton over categorised vocabularies: every hit and       ║
+║     its category in a single pass, independent of vocabulary size             ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Iterable, Tuple
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One occurrence of a vocabulary pattern in the scanned text."""
+    pattern: str
+    category: str
+    start: int
+    end: int
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton built once from {category: [patterns]}.
+
+    Transitions are compiled into a deterministic table (failure links folded
+    in), so scanning costs one dict lookup per input character no matter how
+    many patterns are loaded. A pattern may belong to several categories.
+    Matching is case-insensitive unless ``case_sensitive`` is set; with
+    ``word_boundary`` a hit only counts when it is not embedded in a longer
+    word (letters, digits and underscore are word characters).
+    """
+
+    def __init__(self, vocabulary: Dict[str, Iterable[str]], word_boundary: bool = False,
+                 case_sensitive: bool = False):
+        self.word_boundary = word_boundary
+        self.case_sensitive = case_sensitive
+
+        # Each category keeps its patterns in vocabulary order for stable output
+        self.vocabulary: Dict[str, List[str]] = {}
+        self._entries: List[Tuple[str, str]] = []
+        for category, patterns in vocabulary.items():
+            ordered, seen = [], set()
+            for pattern in patterns:
+                key = pattern if case_sensitive else pattern.lower()
+                if key and key not in seen:
+                    seen.add(key)
+                    ordered.append(key)
+                    self._entries.append((key, category))
+            self.vocabulary[category] = ordered
+
+        self._build()
+
+    def _build(self):
+        """Build the trie, failure links and the compiled transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for entry_id, (pattern, _) in enumerate(self._entries):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(entry_id)
+
+        # Breadth-first: failure links, output merging and DFA completion
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            # Inherit the failure state's transitions, then overlay our own
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._outputs = [tuple(ids) for ids in outputs]
+
+    def find_all(self, text: str) -> List[PatternMatch]:
+        """Every (possibly overlapping) pattern occurrence in one pass over text."""
+        if not self.case_sensitive:
+            text = text.lower()
+
+        delta = self._delta
+        outputs = self._outputs
+        entries = self._entries
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for entry_id in outputs[state]:
+                    pattern, category = entries[entry_id]
+                    start = end - len(pattern)
+                    if self.word_boundary and not self._on_boundary(text, start, end):
+                        continue
+                    matches.append(PatternMatch(pattern, category, start, end))
+        return matches
+
+    def match_categories(self, text: str) -> Dict[str, List[str]]:
+        """Categories hit by text, each with its matched patterns in vocabulary order."""
+        hits: Dict[str, set] = {}
+        for match in self.find_all(text):
+            hits.setdefault(match.category, set()).add(match.pattern)
+        return {
+            category: [p for p in self.vocabulary[category] if p in hits[category]]
+            for category in self.vocabulary if category in hits
+        }
+
+    def count_by_category(self, text: str) -> Dict[str, int]:
+        """Number of distinct patterns matched per category."""
+        return {category: len(patterns) for category, patterns in self.match_categories(text).items()}
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        """True when the span is not embedded in a longer word."""
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+    def __len__(self) -> int:
+        return len(self._entries)
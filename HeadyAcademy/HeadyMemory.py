@@ -37,12 +37,17 @@ import sys
 import json
 import sqlite3
 import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
 
+class MemoryQueryCancelled(Exception):
+    """Raised when the caller cancels an in-flight memory query."""
+
+
 @dataclass
 class MemoryEntry:
     id: str
@@ -73,7 +78,9 @@ class HeadyMemory:
         # Initialize database
         self._init_database()
         
-        # In-memory indexes for fast access
+        # In-memory indexes for fast access; the lock covers them and the
+        # learning state, since concurrent orchestrations store at once
+        self._index_lock = threading.RLock()
         self.category_index: Dict[str, List[str]] = {}
         self.tag_index: Dict[str, List[str]] = {}
         self.source_index: Dict[str, List[str]] = {}
@@ -187,32 +194,71 @@ class HeadyMemory:
     def store(self, category: str, content: Dict[str, Any], tags: List[str] = None, 
               source: str = "system", relevance_score: float = 1.0) -> str:
         """Enhanced storage with learning and intelligent optimization."""
-        tags = tags or []
-        
-        # Generate ID
-        content_str = json.dumps(content, sort_keys=True)
-        mem_id = hashlib.sha256(f"{category}:{content_str}".encode()).hexdigest()[:16]
-        
+        return self.store_many([{
+            "category": category,
+            "content": content,
+            "tags": tags,
+            "source": source,
+            "relevance_score": relevance_score
+        }])[0]
+    
+    def store_many(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store many memories in a single transaction.
+        Each record holds the arguments of store(): category, content and
+        optionally tags, source and relevance_score. Returns the memory ids.
+        """
+        with self._index_lock:
+            return self._store_many(records)
+    
+    def _store_many(self, records: List[Dict[str, Any]]) -> List[str]:
         timestamp = datetime.now().isoformat()
+        rows = []
+        prepared = []
+        
+        for record in records:
+            category = record["category"]
+            content = record["content"]
+            tags = record.get("tags") or []
+            source = record.get("source", "system")
+            
+            # Generate ID
+            content_str = json.dumps(content, sort_keys=True)
+            mem_id = hashlib.sha256(f"{category}:{content_str}".encode()).hexdigest()[:16]
+            
+            # Learning: Identify connections to existing memories
+            connections = self._identify_knowledge_connections(category, tags, content)
+            
+            # Learning: Update relevance score based on patterns
+            enhanced_relevance_score = self._calculate_enhanced_relevance(
+                category, tags, record.get("relevance_score", 1.0)
+            )
+            
+            rows.append((mem_id, category, json.dumps(content), json.dumps(tags), timestamp, source, enhanced_relevance_score))
+            prepared.append((mem_id, category, tags, source, connections))
         
-        # Learning: Identify connections to existing memories
-        connections = self._identify_knowledge_connections(category, tags, content)
-        
-        # Learning: Update relevance score based on patterns
-        enhanced_relevance_score = self._calculate_enhanced_relevance(category, tags, relevance_score)
+        if not rows:
+            return []
         
         conn = sqlite3.connect(str(self.db_path))
         cursor = conn.cursor()
         
-        cursor.execute("""
+        cursor.executemany("""
             INSERT OR REPLACE INTO memories 
             (id, category, content, tags, timestamp, source, relevance_score, access_count, last_accessed)
             VALUES (?, ?, ?, ?, ?, ?, ?, 0, NULL)
-        """, (mem_id, category, json.dumps(content), json.dumps(tags), timestamp, source, enhanced_relevance_score))
+        """, rows)
         
         conn.commit()
         conn.close()
         
+        for mem_id, category, tags, source, connections in prepared:
+            self._index_memory(mem_id, category, tags, source, connections)
+        
+        return [mem_id for mem_id, _, _, _, _ in prepared]
+    
+    def _index_memory(self, mem_id: str, category: str, tags: List[str], source: str, connections: List[str]):
+        """Add a stored memory to the in-memory indexes and learning state."""
         # Update indexes
         if category not in self.category_index:
             self.category_index[category] = []
@@ -238,8 +284,6 @@ class HeadyMemory:
         # Update learning metrics
         self.learning_metrics["total_stored"] += 1
         self._update_learning_patterns(category, tags)
-        
-        return mem_id
     
     def _identify_knowledge_connections(self, category: str, tags: List[str], content: Dict[str, Any]) -> List[str]:
         """Identify connections to existing memories for learning."""
@@ -332,8 +376,41 @@ class HeadyMemory:
         return None
     
     def query(self, category: Optional[str] = None, tags: Optional[List[str]] = None,
-              source: Optional[str] = None, limit: int = 100) -> List[MemoryEntry]:
-        """Query memories using indexes for fast retrieval."""
+              source: Optional[str] = None, limit: int = 100,
+              cancel_event: Optional[threading.Event] = None) -> List[MemoryEntry]:
+        """
+        Query memories using indexes for fast retrieval.
+        If ``cancel_event`` is set while entries are being fetched, the query
+        stops and raises MemoryQueryCancelled.
+        """
+        with self._index_lock:
+            candidate_ids = self._candidate_ids(category, tags, source)
+        
+        # If no filters, get all
+        if not candidate_ids and not (category or tags or source):
+            conn = sqlite3.connect(str(self.db_path))
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM memories LIMIT ?", (limit,))
+            candidate_ids = {row[0] for row in cursor.fetchall()}
+            conn.close()
+        
+        # Fetch full entries
+        results = []
+        for mem_id in list(candidate_ids)[:limit]:
+            if cancel_event is not None and cancel_event.is_set():
+                raise MemoryQueryCancelled("Memory query cancelled by caller")
+            entry = self.recall(mem_id)
+            if entry:
+                results.append(entry)
+        
+        # Sort by relevance and recency
+        results.sort(key=lambda x: (x.relevance_score, x.timestamp), reverse=True)
+        
+        return results
+    
+    def _candidate_ids(self, category: Optional[str], tags: Optional[List[str]],
+                       source: Optional[str]) -> set:
+        """Ids matching every given filter, from the indexes. Caller holds _index_lock."""
         candidate_ids = set()
         
         # Use indexes for fast filtering
@@ -357,25 +434,116 @@ class HeadyMemory:
             else:
                 candidate_ids = source_ids
         
-        # If no filters, get all
-        if not candidate_ids and not (category or tags or source):
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM memories LIMIT ?", (limit,))
-            candidate_ids = {row[0] for row in cursor.fetchall()}
-            conn.close()
+        return candidate_ids
+    
+    def recall_many(self, mem_ids: List[str]) -> List[MemoryEntry]:
+        """Recall many memories with one connection and batched queries."""
+        if not mem_ids:
+            return []
         
-        # Fetch full entries
-        results = []
-        for mem_id in list(candidate_ids)[:limit]:
-            entry = self.recall(mem_id)
-            if entry:
-                results.append(entry)
+        accessed_at = datetime.now().isoformat()
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
         
-        # Sort by relevance and recency
-        results.sort(key=lambda x: (x.relevance_score, x.timestamp), reverse=True)
+        rows = []
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(mem_ids), 900):
+            chunk = mem_ids[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT * FROM memories WHERE id IN ({placeholders})", chunk)
+            rows.extend(cursor.fetchall())
+        
+        cursor.executemany("""
+            UPDATE memories 
+            SET access_count = access_count + 1, last_accessed = ?
+            WHERE id = ?
+        """, [(accessed_at, row[0]) for row in rows])
+        conn.commit()
+        conn.close()
         
-        return results
+        return [
+            MemoryEntry(
+                id=row[0],
+                category=row[1],
+                content=json.loads(row[2]),
+                tags=json.loads(row[3]),
+                timestamp=row[4],
+                source=row[5],
+                relevance_score=row[6],
+                access_count=row[7] + 1,
+                last_accessed=accessed_at
+            )
+            for row in rows
+        ]
+    
+    def _ranked_ids(self, mem_ids: List[str]) -> List[str]:
+        """Ids ordered by relevance then recency, read without loading content or counting an access."""
+        if not mem_ids:
+            return []
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
+        rows = []
+        for start in range(0, len(mem_ids), 900):
+            chunk = mem_ids[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT id, relevance_score, timestamp FROM memories WHERE id IN ({placeholders})", chunk)
+            rows.extend(cursor.fetchall())
+        conn.close()
+        rows.sort(key=lambda row: (row[1], row[2]), reverse=True)
+        return [row[0] for row in rows]
+    
+    @staticmethod
+    def _search_result(entry: MemoryEntry) -> Dict[str, Any]:
+        return {
+            "id": entry.id,
+            "category": entry.category,
+            "content": entry.content,
+            "tags": entry.tags,
+            "timestamp": entry.timestamp,
+            "source": entry.source
+        }
+    
+    def search_many(self, keyword_lists: List[List[str]], max_results: int = 10,
+                    cancel_event: Optional[threading.Event] = None) -> List[List[Dict[str, Any]]]:
+        """
+        search() for many keyword lists with one ranking query and one fetch.
+        Each list gets its own top max_results memories by relevance and
+        recency; only memories some list returns are loaded, each counted
+        as one access however many lists return it. If ``cancel_event`` is
+        set once ranking is done, raises MemoryQueryCancelled before loading.
+        """
+        with self._index_lock:
+            candidates = [
+                set().union(*(self.tag_index.get(keyword, []) for keyword in keywords))
+                for keywords in keyword_lists
+            ]
+        
+        ranked = self._ranked_ids(list(set().union(*candidates)))
+        chosen = []
+        for ids in candidates:
+            top = []
+            for mem_id in ranked:
+                if len(top) == max_results:
+                    break
+                if mem_id in ids:
+                    top.append(mem_id)
+            chosen.append(top)
+        
+        if cancel_event is not None and cancel_event.is_set():
+            raise MemoryQueryCancelled("Memory query cancelled by caller")
+        entries = {entry.id: entry for entry in self.recall_many(sorted(set().union(*chosen)))}
+        return [[self._search_result(entries[mem_id]) for mem_id in top if mem_id in entries] for top in chosen]
+    
+    def search(self, keywords: List[str], max_results: int = 10,
+               cancel_event: Optional[threading.Event] = None) -> List[Dict[str, Any]]:
+        """
+        The top max_results memories tagged with any of the keywords, by
+        relevance then recency, returned as plain dicts.
+        """
+        if not keywords:
+            return []
+        
+        return self.search_many([keywords], max_results, cancel_event=cancel_event)[0]
     
     def store_external_source(self, source_type: str, content: Dict[str, Any],
                              source_url: Optional[str] = None,
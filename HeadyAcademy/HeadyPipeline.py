@@ -0,0 +1,518 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyPipeline.py                              ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      PIPELINE - HCFULLPIPELINE STAGE GRAPH EXECUTOR                           ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━           ║
+║     Runs the stages of configs/hcfullpipeline.yaml with registered task       ║
+║     callables, bounded parallelism, retry backoff, stop rules checked         ║
+║     after every task and durable checkpoints to resume crashed runs           ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from HeadyCodec import json_default
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+PIPELINE_FILE = Path("configs") / "hcfullpipeline.yaml"
+CHECKPOINT_FILE = Path(".heady") / "pipeline-checkpoint.json"
+# Stage that enter_recovery jumps to
+RECOVERY_STAGE = "recover"
+# Jitter adds up to this fraction of each backoff delay
+JITTER_FRACTION = 0.2
+
+RUNNING, RECOVERY, PAUSED, HALTED, COMPLETED = "running", "recovery", "paused", "halted", "completed"
+# A checkpoint in one of these states belongs to a run that can be picked up again
+RESUMABLE = (RUNNING, RECOVERY, PAUSED)
+
+TaskFn = Callable[[Dict[str, Any]], Any]
+
+
+class PipelineTaskError(RuntimeError):
+    """
+    Raised by a task to classify its failure for the stop rules: severity
+    "critical" counts toward critical_alarm, error_type "data_integrity"
+    toward data_integrity_failure. Neither kind is retried.
+    """
+
+    def __init__(self, message: str, severity: str = "high", error_type: Optional[str] = None):
+        super().__init__(message)
+        self.severity = severity
+        self.error_type = error_type
+
+    @property
+    def retryable(self) -> bool:
+        return self.severity != "critical" and self.error_type != "data_integrity"
+
+
+def load_pipeline(root_path: Path = None) -> Dict[str, Any]:
+    """The parsed configs/hcfullpipeline.yaml under root_path."""
+    with open(Path(root_path or DEFAULT_ROOT) / PIPELINE_FILE, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def stage_order(stages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Stages in dependency order, ties kept in file order. Raises ValueError on bad graphs."""
+    by_id = {stage["id"]: stage for stage in stages}
+    if len(by_id) != len(stages):
+        raise ValueError("Duplicate stage ids in pipeline")
+    ordered, state = [], {}
+
+    def visit(stage_id: str):
+        if state.get(stage_id) == 2:
+            return
+        if state.get(stage_id) == 1:
+            raise ValueError(f"Circular dependency through stage '{stage_id}'")
+        state[stage_id] = 1
+        for dep in by_id[stage_id].get("dependsOn") or []:
+            if dep not in by_id:
+                raise ValueError(f"Stage '{stage_id}' depends on unknown stage '{dep}'")
+            visit(dep)
+        state[stage_id] = 2
+        ordered.append(by_id[stage_id])
+
+    for stage in stages:
+        visit(stage["id"])
+    return ordered
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return None
+
+
+class HCFullPipeline:
+    """
+    Executes the HCFullPipeline stage graph.
+
+    Stages run in dependency order. A parallel stage runs its tasks on up to
+    min(global.maxConcurrentTasks, supervisorConfig.maxParallelAgents)
+    threads; other stages run them one at a time. Each task is a registered
+    callable taking a context dict; raising, or returning a dict with
+    ``success: False``, fails the attempt, and failed attempts are retried
+    with the global retryBackoffMs schedule (deterministic jitter from the
+    pipeline seed). Unregistered tasks complete through a default handler,
+    as in the Node runner.
+
+    Metrics and stop rules are re-evaluated after every task, so a failing
+    stage stops scheduling work as soon as a condition trips:
+    enter_recovery abandons the rest of the stage and jumps to the recover
+    stage, pause_and_escalate and halt_immediately end the run. After each
+    checkpointed stage the run state is written to
+    .heady/pipeline-checkpoint.json; run() picks up a crashed or paused run
+    from its last checkpoint.
+    """
+
+    def __init__(self, root_path: Path = None, definition: Dict[str, Any] = None,
+                 tasks: Dict[str, TaskFn] = None, checkpoint_path: Path = None,
+                 sleep: Callable[[float], None] = time.sleep, quiet: bool = False):
+        self.root_path = Path(root_path or DEFAULT_ROOT)
+        self.definition = definition if definition is not None else load_pipeline(self.root_path)
+        self.pipeline = self.definition.get("pipeline") or {}
+        self.settings = self.pipeline.get("global") or {}
+        self.stages = stage_order(self.pipeline.get("stages") or [])
+        self.checkpoint_path = Path(checkpoint_path or self.root_path / CHECKPOINT_FILE)
+        self.tasks: Dict[str, TaskFn] = dict(tasks or {})
+        self.sleep = sleep
+        self.quiet = quiet
+        self.state: Optional[Dict[str, Any]] = None
+        self._last_checkpoint: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def register(self, name: str, fn: TaskFn = None):
+        """Register fn as the implementation of task name; usable as a decorator."""
+        if fn is None:
+            return lambda f: self.register(name, f)
+        self.tasks[name] = fn
+        return fn
+
+    def _log(self, level: str, message: str):
+        entry = {"ts": _now(), "level": level, "stage": self.state.get("currentStageId") or "system",
+                 "message": message}
+        self.state["log"].append(entry)
+        if not self.quiet:
+            print(f"[{level.upper()}] HCFullPipeline [{entry['stage']}] {message}")
+
+    # ─── Run state & checkpoints ──────────────────────────────────────────
+
+    def definition_hash(self) -> str:
+        return hashlib.sha256(json.dumps(self.definition, sort_keys=True, default=json_default)
+                              .encode()).hexdigest()[:16]
+
+    def _new_state(self) -> Dict[str, Any]:
+        return {
+            "runId": f"run_{int(time.time() * 1000)}_{os.urandom(3).hex()}",
+            "pipelineName": self.pipeline.get("name"),
+            "version": self.definition.get("version"),
+            "definitionHash": self.definition_hash(),
+            "status": RUNNING,
+            "startedAt": _now(),
+            "completedAt": None,
+            "currentStageId": None,
+            "completedStages": [],
+            "stages": {},
+            "checkpoints": [],
+            "errors": [],
+            "stopReason": None,
+            "resumedFrom": None,
+            "metrics": {
+                "totalTasks": 0,
+                "completedTasks": 0,
+                "failedTasks": 0,
+                "retriedTasks": 0,
+                "errorRate": 0.0,
+                "readinessScore": 100,
+                "elapsedMs": 0
+            },
+            "configHashes": {},
+            "log": []
+        }
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """The last persisted run state, or None if there is none or it is unreadable."""
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(state, f, indent=2, default=json_default)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _config_hashes(self) -> Dict[str, Optional[str]]:
+        protocol = self.pipeline.get("checkpointProtocol") or {}
+        return {source: _hash_file(self.root_path / source) for source in protocol.get("configHashSources") or []}
+
+    def _checkpoint(self, stage_id: str):
+        """Record a checkpoint for stage_id, check drift and escalation thresholds, and persist."""
+        hashes = self._config_hashes()
+        drifted = [source for source, digest in hashes.items()
+                   if source in self.state["configHashes"] and self.state["configHashes"][source] != digest]
+        metrics = self.state["metrics"]
+        checkpoint = {
+            "id": f"cp_{stage_id}_{int(time.time() * 1000)}",
+            "stageId": stage_id,
+            "ts": _now(),
+            "readinessScore": metrics["readinessScore"],
+            "errorRate": metrics["errorRate"],
+            "completedTasks": metrics["completedTasks"],
+            "failedTasks": metrics["failedTasks"],
+            "escalations": []
+        }
+        if drifted:
+            checkpoint["configDrift"] = drifted
+            self._log("warn", f"Config drift detected: {', '.join(drifted)}")
+
+        escalation = (self.pipeline.get("checkpointProtocol") or {}).get("escalationThreshold") or {}
+        if escalation.get("readinessBelow") is not None and metrics["readinessScore"] < escalation["readinessBelow"]:
+            checkpoint["escalations"].append({"type": "readiness", "value": metrics["readinessScore"],
+                                              "threshold": escalation["readinessBelow"]})
+        if escalation.get("errorRateAbove") is not None and metrics["errorRate"] > escalation["errorRateAbove"]:
+            checkpoint["escalations"].append({"type": "errorRate", "value": metrics["errorRate"],
+                                              "threshold": escalation["errorRateAbove"]})
+        for item in checkpoint["escalations"]:
+            self._log("warn", f"Escalation: {item['type']} {item['value']} past threshold {item['threshold']}")
+
+        self.state["configHashes"] = hashes
+        self.state["checkpoints"].append(checkpoint)
+        self._snapshot()
+        self._save_checkpoint(self._last_checkpoint)
+        self._log("info", f"Checkpoint {checkpoint['id']} saved")
+
+    def _snapshot(self):
+        self._last_checkpoint = json.loads(json.dumps(self.state, default=json_default))
+
+    def _resume_state(self) -> Optional[Dict[str, Any]]:
+        saved = self.load_checkpoint()
+        if not saved or saved.get("status") not in RESUMABLE:
+            return None
+        if saved.get("definitionHash") != self.definition_hash():
+            print(f"[WARN] HCFullPipeline: pipeline definition changed since run {saved.get('runId')}, starting over")
+            return None
+        return saved
+
+    # ─── Metrics & stop rules ─────────────────────────────────────────────
+
+    def _recalc_metrics(self, readiness: Optional[float] = None):
+        metrics = self.state["metrics"]
+        total = metrics["totalTasks"] or 1
+        metrics["errorRate"] = metrics["failedTasks"] / total
+        if readiness is not None:
+            metrics["readinessScore"] = readiness
+        else:
+            # Readiness degrades with errors unless a task reports a measured score
+            metrics["readinessScore"] = min(metrics["readinessScore"],
+                                            max(0, round(100 - metrics["errorRate"] * 200)))
+
+    def evaluate_stop_rules(self) -> Optional[Dict[str, Any]]:
+        """The first stopRule condition the current run state meets, or None."""
+        metrics, errors = self.state["metrics"], self.state["errors"]
+        for condition in (self.pipeline.get("stopRule") or {}).get("conditions") or []:
+            kind = condition.get("type")
+            if kind == "error_rate" and metrics["errorRate"] >= condition["threshold"]:
+                return condition
+            if kind == "readiness_score" and metrics["readinessScore"] <= condition["threshold"]:
+                return condition
+            if kind == "critical_alarm" and \
+                    sum(1 for e in errors if e.get("severity") == "critical") >= condition.get("count", 1):
+                return condition
+            if kind == "data_integrity_failure" and any(e.get("type") == "data_integrity" for e in errors):
+                return condition
+        return None
+
+    def _apply_stop_rules(self):
+        """Called with the lock held after every task; trips _stop when the run must change course."""
+        condition = self.evaluate_stop_rules()
+        if condition is None:
+            return
+        action = condition.get("action")
+        if action == "enter_recovery":
+            # Recovery under way or already done: keep going
+            if self.state["status"] != RUNNING or RECOVERY_STAGE in self.state["completedStages"] \
+                    or self.state["currentStageId"] == RECOVERY_STAGE:
+                return
+            self.state["status"] = RECOVERY
+        elif action == "halt_immediately":
+            self.state["status"] = HALTED
+        else:
+            self.state["status"] = PAUSED
+        self.state["stopReason"] = {"type": condition.get("type"), "action": action}
+        self._log("warn", f"Stop rule triggered: {condition.get('type')} -> {action}")
+        self._stop.set()
+
+    # ─── Task & stage execution ───────────────────────────────────────────
+
+    def _default_task(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": f"Task '{context['task']}' executed (default handler)"}
+
+    def _backoff(self, task: str, attempt: int) -> float:
+        schedule = self.settings.get("retryBackoffMs") or [500]
+        delay_ms = schedule[min(attempt, len(schedule)) - 1]
+        if self.settings.get("jitterEnabled"):
+            # Seeded per run, task and attempt so a replayed run backs off identically
+            rng = random.Random(f"{self.settings.get('seed')}:{self.state['runId']}:{task}:{attempt}")
+            delay_ms += rng.uniform(0, delay_ms * JITTER_FRACTION)
+        return delay_ms / 1000
+
+    def _run_task(self, stage: Dict[str, Any], task: str, results: Dict[str, Any]) -> Dict[str, Any]:
+        stage_state = self.state["stages"][stage["id"]]
+        if self._stop.is_set():
+            stage_state["tasks"][task] = {"status": "skipped"}
+            return stage_state["tasks"][task]
+
+        fn = self.tasks.get(task, self._default_task)
+        max_retries = self.settings.get("maxRetries", 0)
+        started = time.monotonic()
+        attempt, error = 0, None
+        while True:
+            attempt += 1
+            context = {"runId": self.state["runId"], "stageId": stage["id"], "task": task, "attempt": attempt,
+                       "results": results, "supervisorConfig": stage.get("supervisorConfig"),
+                       "settings": self.settings}
+            try:
+                value = fn(context)
+                if isinstance(value, dict) and value.get("success") is False:
+                    error = PipelineTaskError(value.get("error") or "task reported failure")
+                else:
+                    error = None
+            except Exception as e:
+                value, error = None, e
+            if error is None or attempt > max_retries or self._stop.is_set() or \
+                    not getattr(error, "retryable", True):
+                break
+            with self._lock:
+                self.state["metrics"]["retriedTasks"] += 1
+            self.sleep(self._backoff(task, attempt))
+
+        duration_ms = round((time.monotonic() - started) * 1000, 2)
+        with self._lock:
+            metrics = self.state["metrics"]
+            metrics["totalTasks"] += 1
+            readiness = None
+            if error is None:
+                metrics["completedTasks"] += 1
+                record = {"status": "completed", "result": value, "attempts": attempt, "durationMs": duration_ms}
+                if isinstance(value, dict) and isinstance(value.get("readinessScore"), (int, float)):
+                    readiness = value["readinessScore"]
+            else:
+                metrics["failedTasks"] += 1
+                message = f"{type(error).__name__}: {error}"
+                record = {"status": "failed", "error": message, "attempts": attempt, "durationMs": duration_ms}
+                self.state["errors"].append({
+                    "task": task, "stage": stage["id"], "message": message, "ts": _now(),
+                    "severity": getattr(error, "severity", "high"), "type": getattr(error, "error_type", None)
+                })
+                self._log("error", f"Task '{task}' failed after {attempt} attempt(s): {message}")
+            stage_state["tasks"][task] = record
+            self._recalc_metrics(readiness)
+            self._apply_stop_rules()
+        return record
+
+    def _stage_workers(self, stage: Dict[str, Any]) -> int:
+        if not stage.get("parallel"):
+            return 1
+        limit = self.settings.get("maxConcurrentTasks") or 8
+        agents = (stage.get("supervisorConfig") or {}).get("maxParallelAgents")
+        return max(1, min(limit, agents) if agents else limit)
+
+    def _completed_results(self) -> Dict[str, Any]:
+        return {task: record.get("result")
+                for stage_id in self.state["completedStages"]
+                for task, record in self.state["stages"][stage_id]["tasks"].items()
+                if record.get("status") == "completed"}
+
+    def run_stage(self, stage: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one stage's tasks and return its stage state."""
+        tasks = stage.get("tasks") or []
+        self.state["currentStageId"] = stage["id"]
+        stage_state = {"id": stage["id"], "name": stage.get("name"), "status": "running",
+                       "startedAt": _now(), "completedAt": None, "tasks": {}}
+        self.state["stages"][stage["id"]] = stage_state
+        workers = self._stage_workers(stage)
+        self._log("info", f"Stage '{stage.get('name')}' started ({len(tasks)} tasks, {workers} worker(s))")
+
+        results = self._completed_results()
+        if workers == 1:
+            for task in tasks:
+                self._run_task(stage, task, results)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"heady-pipeline-{stage['id']}") as pool:
+                for future in [pool.submit(self._run_task, stage, task, results) for task in tasks]:
+                    future.result()
+
+        statuses = [record["status"] for record in stage_state["tasks"].values()]
+        if "skipped" in statuses:
+            stage_state["status"] = "interrupted"
+        elif "failed" in statuses:
+            stage_state["status"] = "partial"
+        else:
+            stage_state["status"] = "completed"
+        stage_state["completedAt"] = _now()
+        self._log("info", f"Stage '{stage.get('name')}' {stage_state['status']}")
+        return stage_state
+
+    def run(self, resume: bool = True) -> Dict[str, Any]:
+        """Run the pipeline to completion or until a stop rule ends it; returns the run state."""
+        saved = self._resume_state() if resume else None
+        if saved:
+            self.state = saved
+            self.state["resumedFrom"] = self.state["checkpoints"][-1]["id"] if self.state["checkpoints"] else None
+            if self.state["status"] == PAUSED:
+                self.state["status"] = RUNNING
+            self.state["stopReason"] = None
+            self.state.pop("stopErrors", None)
+            self._log("info", f"Resuming run {self.state['runId']} after stages {self.state['completedStages']}")
+        else:
+            self.state = self._new_state()
+            self.state["configHashes"] = self._config_hashes()
+            self._log("info", f"Pipeline run {self.state['runId']} started")
+        self._snapshot()
+        self._stop.clear()
+        started = time.monotonic()
+
+        index = 0
+        while index < len(self.stages):
+            stage = self.stages[index]
+            index += 1
+            if stage["id"] in self.state["completedStages"]:
+                continue
+            stage_state = self.run_stage(stage)
+            if stage_state["status"] != "interrupted":
+                self.state["completedStages"].append(stage["id"])
+                if stage.get("checkpoint"):
+                    self._checkpoint(stage["id"])
+
+            if self.state["status"] in (PAUSED, HALTED):
+                break
+            if self._stop.is_set():
+                # enter_recovery: leave the rest of this stage and go repair
+                self._stop.clear()
+                recovery = next((i for i, s in enumerate(self.stages) if s["id"] == RECOVERY_STAGE), None)
+                if recovery is not None and self.stages[recovery]["id"] not in self.state["completedStages"]:
+                    self._log("warn", f"Entering recovery, skipping to stage '{RECOVERY_STAGE}'")
+                    index = recovery
+
+        if self.state["status"] in (RUNNING, RECOVERY):
+            self.state["status"] = COMPLETED
+        self.state["completedAt"] = _now()
+        self.state["metrics"]["elapsedMs"] += round((time.monotonic() - started) * 1000, 2)
+        if self.state["status"] in (PAUSED, HALTED):
+            # Resume from the last checkpoint, not from the half-run stage; the errors that
+            # stopped the run are kept apart so they do not trip the stop rules again
+            saved = dict(self._last_checkpoint, status=self.state["status"], stopReason=self.state["stopReason"],
+                         stopErrors=self.state["errors"][len(self._last_checkpoint["errors"]):])
+            self._save_checkpoint(saved)
+        else:
+            self._save_checkpoint(self.state)
+        metrics = self.state["metrics"]
+        self._log("info", f"Pipeline run {self.state['runId']} finished: {self.state['status']} "
+                          f"({metrics['completedTasks']} completed, {metrics['failedTasks']} failed)")
+        return self.state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run HCFullPipeline from configs/hcfullpipeline.yaml")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Repository root")
+    parser.add_argument("--fresh", action="store_true", help="Ignore any saved checkpoint and start a new run")
+    parser.add_argument("--status", action="store_true", help="Show the last saved run state and exit")
+    args = parser.parse_args()
+
+    pipeline = HCFullPipeline(args.root)
+    if args.status:
+        saved = pipeline.load_checkpoint()
+        if not saved:
+            print("No saved pipeline run")
+            return 0
+        print(json.dumps({key: saved[key] for key in ("runId", "status", "completedStages", "metrics", "stopReason")},
+                         indent=2))
+        return 0
+
+    state = pipeline.run(resume=not args.fresh)
+    return 0 if state["status"] == COMPLETED else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyPrefetch.py                              ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      PREFETCH - SPECULATIVE WARMING OF PREDICTED FOLLOW-UPS                   ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                  ║
+║     Low-priority background worker that precomputes predicted next            ║
+║     requests while the BRAIN is idle, within a CPU/IO budget                  ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+
+class SpeculativePrefetcher:
+    """
+    Runs ``warm(request, config)`` for predicted follow-up requests on a single
+    low-priority daemon thread.
+
+    Jobs only start while ``is_idle()`` reports no foreground work, at most
+    ``max_per_minute`` per minute, and the worker rests so that prefetching
+    uses at most ``duty_cycle`` of one core. Every warmed key is remembered;
+    record_access() turns a later foreground hit into a per-prediction hit
+    count, and adjusted_confidence() feeds that hit rate back to the predictor.
+    Also holds a short-lived cache of MEMORY search results.
+    """
+
+    def __init__(self, warm: Callable[[str, Dict[str, Any]], None], is_idle: Callable[[], bool],
+                 max_per_minute: int = 30, duty_cycle: float = 0.2, queue_size: int = 16,
+                 min_confidence: float = 0.5, min_samples: int = 5, entry_ttl_seconds: float = 1800,
+                 memory_ttl_seconds: float = 60, idle_poll_seconds: float = 0.05, nice: int = 10):
+        self.warm = warm
+        self.is_idle = is_idle
+        self.max_per_minute = max_per_minute
+        self.duty_cycle = duty_cycle
+        self.queue_size = queue_size
+        self.min_confidence = min_confidence
+        self.min_samples = min_samples
+        self.entry_ttl_seconds = entry_ttl_seconds
+        self.memory_ttl_seconds = memory_ttl_seconds
+        self.idle_poll_seconds = idle_poll_seconds
+        self.nice = nice
+
+        self.logger = logging.getLogger("HeadyPrefetch")
+
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._busy = False
+        self._recent_starts: deque = deque()
+
+        # cache_key -> (prediction, warmed_at); bounded, oldest first
+        self._warmed: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._memory_cache: Dict[Tuple[str, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "scheduled": 0,
+            "skipped": 0,
+            "warmed": 0,
+            "hits": 0,
+            "expired": 0,
+            "errors": 0,
+            "memory_cache_hits": 0
+        }
+        self.prediction_stats: Dict[str, Dict[str, int]] = {}
+
+    def schedule(self, prediction: str, request: str, config: Dict[str, Any],
+                 cache_key: str, confidence: float = 1.0) -> bool:
+        """Queue a follow-up request for warming. Returns False when it is not worth it."""
+        if confidence < self.min_confidence:
+            self.stats["skipped"] += 1
+            return False
+
+        with self._condition:
+            if self._closed:
+                return False
+            if cache_key in self._warmed or any(job[3] == cache_key for job in self._queue):
+                return False
+            if len(self._queue) >= self.queue_size:
+                # Newer predictions describe the current session better
+                self._queue.popleft()
+                self.stats["skipped"] += 1
+            self._queue.append((prediction, request, config, cache_key))
+            self.stats["scheduled"] += 1
+            self._ensure_worker()
+            self._condition.notify_all()
+        return True
+
+    def record_access(self, cache_key: str) -> bool:
+        """Note a foreground request; returns True if it was served by a prefetch."""
+        with self._lock:
+            entry = self._warmed.pop(cache_key, None)
+        if entry is None:
+            return False
+
+        prediction, warmed_at = entry
+        if time.time() - warmed_at > self.entry_ttl_seconds:
+            self.stats["expired"] += 1
+            return False
+        self.stats["hits"] += 1
+        self._prediction_stat(prediction)["hits"] += 1
+        return True
+
+    def adjusted_confidence(self, prediction: str, confidence: float) -> float:
+        """Scale a prediction's confidence by how often its prefetches were used."""
+        stats = self.prediction_stats.get(prediction)
+        if not stats or stats["warmed"] < self.min_samples:
+            return confidence
+        hit_rate = stats["hits"] / stats["warmed"]
+        return round(min(confidence * (0.5 + hit_rate), 1.0), 3)
+
+    def cached_memories(self, keywords: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """MEMORY search results warmed for these keywords, if still fresh."""
+        key = tuple(sorted(keywords))
+        with self._lock:
+            entry = self._memory_cache.get(key)
+        if entry is None or entry[0] < time.time():
+            return None
+        self.stats["memory_cache_hits"] += 1
+        return entry[1]
+
+    def cache_memories(self, keywords: List[str], memories: List[Dict[str, Any]]):
+        """Keep MEMORY search results for a short while."""
+        now = time.time()
+        with self._lock:
+            if len(self._memory_cache) >= self.queue_size * 8:
+                self._memory_cache = {k: v for k, v in self._memory_cache.items() if v[0] >= now}
+            self._memory_cache[tuple(sorted(keywords))] = (now + self.memory_ttl_seconds, memories)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Prefetch counters, overall hit rate and per-prediction hit rates."""
+        with self._condition:
+            queued = len(self._queue)
+        return {
+            **self.stats,
+            "queued": queued,
+            "hit_rate": self.stats["hits"] / max(self.stats["warmed"], 1),
+            "predictions": {
+                prediction: {**stats, "hit_rate": stats["hits"] / max(stats["warmed"], 1)}
+                for prediction, stats in self.prediction_stats.items()
+            }
+        }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until the queue is drained. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._busy, timeout=timeout)
+
+    def close(self):
+        """Drop pending jobs and stop the worker."""
+        with self._condition:
+            self._closed = True
+            self._queue.clear()
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout=5)
+
+    def _prediction_stat(self, prediction: str) -> Dict[str, int]:
+        return self.prediction_stats.setdefault(prediction, {"warmed": 0, "hits": 0})
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use (caller holds the condition)."""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, name="HeadyPrefetch", daemon=True)
+            self._worker.start()
+
+    def _lower_priority(self):
+        """Best effort: raise this thread's nice value (Linux schedules threads individually)."""
+        if not self.nice or not hasattr(os, "setpriority"):
+            return
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice)
+        except (OSError, AttributeError):
+            pass
+
+    def _wait_for_budget(self) -> bool:
+        """Sleep until foreground work is idle and the per-minute budget allows a job."""
+        while True:
+            with self._condition:
+                if self._closed:
+                    return False
+            now = time.time()
+            while self._recent_starts and now - self._recent_starts[0] > 60:
+                self._recent_starts.popleft()
+            if len(self._recent_starts) < self.max_per_minute and self.is_idle():
+                self._recent_starts.append(now)
+                return True
+            time.sleep(self.idle_poll_seconds)
+
+    def _worker_loop(self):
+        """Take jobs one at a time, honouring idleness, rate and duty-cycle budgets."""
+        self._lower_priority()
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if self._closed:
+                    return
+                self._busy = True
+
+            try:
+                if not self._wait_for_budget():
+                    return
+                with self._condition:
+                    if not self._queue:
+                        continue
+                    prediction, request, config, cache_key = self._queue.pop()
+
+                started = time.perf_counter()
+                try:
+                    self.warm(request, config)
+                    with self._lock:
+                        self._warmed[cache_key] = (prediction, time.time())
+                        while len(self._warmed) > self.queue_size * 8:
+                            self._warmed.popitem(last=False)
+                    self.stats["warmed"] += 1
+                    self._prediction_stat(prediction)["warmed"] += 1
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    self.logger.warning(f"Prefetch of '{request}' failed: {e}")
+
+                # Rest long enough to keep prefetch work under the duty cycle
+                elapsed = time.perf_counter() - started
+                if 0 < self.duty_cycle < 1:
+                    time.sleep(elapsed * (1 - self.duty_cycle) / self.duty_cycle)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
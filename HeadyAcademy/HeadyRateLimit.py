@@ -0,0 +1,366 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyRateLimit.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      RATE LIMIT - TOKEN BUCKETS & DAILY BUDGETS SHARED ACROSS PROCESSES       ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━           ║
+║     Enforces rateLimits and costBudgets from resource-policies.yaml with      ║
+║     bucket and counter state in one local SQLite file, so every worker,       ║
+║     tool and API process draws from the same allowance                        ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+# Overrides <root>/.heady/ratelimit.db, e.g. to share one file between checkouts
+DB_ENV = "HEADY_RATELIMIT_DB"
+# SQLite waits this long for another process's transaction before giving up
+LOCK_TIMEOUT = 5.0
+
+# Daily counters the policies define a limit for
+TOKEN_BUDGET = "llmProviders.tokens"
+CALL_BUDGET = "externalApis.calls"
+COST_TOTAL = "cost.total"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily_usage (
+    day TEXT NOT NULL,
+    name TEXT NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (day, name)
+);
+CREATE TABLE IF NOT EXISTS budget_alerts (
+    day TEXT NOT NULL,
+    name TEXT NOT NULL,
+    level TEXT NOT NULL,
+    percent REAL NOT NULL,
+    raised_at REAL NOT NULL,
+    PRIMARY KEY (day, name, level)
+);
+"""
+
+
+class RateLimitExceeded(RuntimeError):
+    """No token became available within the caller's timeout."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Rate limit '{name}' exhausted, retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class BudgetExceeded(RuntimeError):
+    """A daily or weekly budget has no room for the requested amount."""
+
+    def __init__(self, name: str, used: float, limit: float, period: str = "daily"):
+        super().__init__(f"{period.capitalize()} budget '{name}' exhausted ({used:g} of {limit:g} used)")
+        self.name = name
+        self.used = used
+        self.limit = limit
+        self.period = period
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    """requestsPerMinute refilled continuously; burst is the bucket size."""
+    rate_per_minute: float
+    burst: float = 1.0
+
+    @property
+    def rate_per_second(self) -> float:
+        return self.rate_per_minute / 60.0
+
+
+@dataclass(frozen=True)
+class BudgetPolicy:
+    daily: Optional[float] = None
+    weekly: Optional[float] = None
+
+
+def _today(now: float) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(now))
+
+
+def _days_back(now: float, days: int) -> List[str]:
+    return [_today(now - 86400 * offset) for offset in range(days)]
+
+
+def policies_from_config(policies: Dict) -> Tuple[Dict[str, BucketPolicy], Dict[str, BudgetPolicy], Dict[str, float]]:
+    """Buckets, budgets and alert thresholds (percent) from resource-policies.yaml."""
+    buckets, budgets = {}, {}
+    for name, limits in (policies.get("rateLimits") or {}).items():
+        if limits.get("requestsPerMinute"):
+            buckets[name] = BucketPolicy(float(limits["requestsPerMinute"]), float(limits.get("burstAllowance", 1)))
+        if limits.get("dailyTokenBudget"):
+            budgets[f"{name}.tokens"] = BudgetPolicy(daily=float(limits["dailyTokenBudget"]))
+        if limits.get("dailyCallBudget"):
+            budgets[f"{name}.calls"] = BudgetPolicy(daily=float(limits["dailyCallBudget"]))
+
+    costs = policies.get("costBudgets") or {}
+    if costs.get("dailyTotal") or costs.get("weeklyTotal"):
+        budgets[COST_TOTAL] = BudgetPolicy(daily=costs.get("dailyTotal"), weekly=costs.get("weeklyTotal"))
+    for subsystem, limit in (costs.get("perSubsystem") or {}).items():
+        budgets[f"cost.{subsystem}"] = BudgetPolicy(daily=float(limit))
+
+    thresholds = costs.get("alertThresholds") or {}
+    alerts = {
+        "warning": float(thresholds.get("warningPercent", 75)),
+        "critical": float(thresholds.get("criticalPercent", 90))
+    }
+    return buckets, budgets, alerts
+
+
+class RateLimiter:
+    """
+    Token buckets and daily budgets whose state lives in SQLite.
+
+    Every operation is one short IMMEDIATE transaction, so concurrent
+    processes see a single bucket per name and a single counter per day.
+    Bucket names may carry a suffix ("apiGateway:10.0.0.5") to get a
+    separate bucket under the base name's policy. Budget alerts fire once
+    per counter, level and day, in whichever process crosses the threshold,
+    printed and passed to any on_alert callbacks.
+    """
+
+    def __init__(self, db_path: Path, buckets: Dict[str, BucketPolicy] = None,
+                 budgets: Dict[str, BudgetPolicy] = None, alert_thresholds: Dict[str, float] = None,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        self.db_path = Path(db_path)
+        self.buckets = dict(buckets or {})
+        self.budgets = dict(budgets or {})
+        self.alert_thresholds = dict(alert_thresholds or {"warning": 75.0, "critical": 90.0})
+        self.clock = clock
+        self.sleep = sleep
+        self.on_alert: List[Callable[[Dict], None]] = []
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    @classmethod
+    def from_policies(cls, root_path: Path = None, db_path: Path = None, **kwargs) -> "RateLimiter":
+        """Limits from <root>/configs/resource-policies.yaml, state in <root>/.heady/ratelimit.db."""
+        from HeadyExecutor import load_resource_policies
+        root_path = Path(root_path or DEFAULT_ROOT)
+        buckets, budgets, alerts = policies_from_config(load_resource_policies(root_path))
+        db_path = db_path or os.getenv(DB_ENV) or root_path / ".heady" / "ratelimit.db"
+        return cls(db_path, buckets, budgets, alerts, **kwargs)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=LOCK_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction that takes the database lock up front (no upgrade deadlocks)."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _bucket_policy(self, name: str) -> BucketPolicy:
+        policy = self.buckets.get(name) or self.buckets.get(name.split(":", 1)[0])
+        if policy is None:
+            raise KeyError(f"No rate limit configured for '{name}'")
+        return policy
+
+    # ─── Token buckets ────────────────────────────────────────────────────
+
+    def try_acquire(self, name: str, cost: float = 1.0) -> float:
+        """Take cost tokens if available. Returns 0 when granted, else seconds until they will be."""
+        policy = self._bucket_policy(name)
+        now = self.clock()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (name,)).fetchone()
+            tokens = policy.burst if row is None else \
+                min(policy.burst, row[0] + max(now - row[1], 0) * policy.rate_per_second)
+            granted = tokens >= cost
+            if granted:
+                tokens -= cost
+            conn.execute("INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                         (name, tokens, now))
+        if granted:
+            return 0.0
+        return (cost - tokens) / policy.rate_per_second
+
+    def acquire(self, name: str, cost: float = 1.0, timeout: Optional[float] = None) -> float:
+        """Block until cost tokens are taken; returns seconds waited. Raises RateLimitExceeded past timeout."""
+        started = self.clock()
+        while True:
+            wait = self.try_acquire(name, cost)
+            if not wait:
+                return self.clock() - started
+            if timeout is not None and self.clock() - started + wait > timeout:
+                raise RateLimitExceeded(name, wait)
+            self.sleep(wait)
+
+    def penalize(self, name: str, retry_after: float):
+        """
+        A provider answered 429: empty the bucket so that no process calls
+        again for retry_after seconds.
+        """
+        policy = self._bucket_policy(name)
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                         (name, -retry_after * policy.rate_per_second, self.clock()))
+        print(f"[WARN] HeadyRateLimit: {name} throttled by provider, pausing all callers for {retry_after:.1f}s")
+
+    # ─── Daily budgets ────────────────────────────────────────────────────
+
+    def _used(self, conn: sqlite3.Connection, name: str, days: List[str]) -> float:
+        placeholders = ",".join("?" * len(days))
+        row = conn.execute(f"SELECT COALESCE(SUM(used), 0) FROM daily_usage WHERE name = ? AND day IN ({placeholders})",
+                           (name, *days)).fetchone()
+        return row[0]
+
+    def check_budget(self, name: str, amount: float = 0.0):
+        """Raise BudgetExceeded when name cannot absorb amount more today (or this week)."""
+        policy = self.budgets.get(name)
+        if policy is None:
+            return
+        now = self.clock()
+        conn = self._connection()
+        for period, limit, days in (("daily", policy.daily, 1), ("weekly", policy.weekly, 7)):
+            if limit is None:
+                continue
+            used = self._used(conn, name, _days_back(now, days))
+            if used + amount > limit or (amount == 0 and used >= limit):
+                raise BudgetExceeded(name, used, limit, period)
+
+    def record_usage(self, name: str, amount: float = 1.0) -> float:
+        """Add amount to today's counter for name; returns the new daily total."""
+        now = self.clock()
+        day = _today(now)
+        raised = []
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO daily_usage (day, name, used) VALUES (?, ?, ?) "
+                         "ON CONFLICT(day, name) DO UPDATE SET used = used + excluded.used", (day, name, amount))
+            used = self._used(conn, name, [day])
+            policy = self.budgets.get(name)
+            if policy is not None and policy.daily:
+                percent = used / policy.daily * 100
+                for level, threshold in sorted(self.alert_thresholds.items(), key=lambda item: item[1]):
+                    if percent >= threshold:
+                        inserted = conn.execute(
+                            "INSERT OR IGNORE INTO budget_alerts (day, name, level, percent, raised_at) "
+                            "VALUES (?, ?, ?, ?, ?)", (day, name, level, percent, now)).rowcount
+                        if inserted:
+                            raised.append({"name": name, "level": level, "percent": round(percent, 1),
+                                           "used": used, "limit": policy.daily, "day": day})
+        for alert in raised:
+            self._raise_alert(alert)
+        return used
+
+    def record_cost(self, subsystem: str, usd: float):
+        """Charge spend to cost.<subsystem> and cost.total."""
+        self.record_usage(f"cost.{subsystem}", usd)
+        self.record_usage(COST_TOTAL, usd)
+
+    def _raise_alert(self, alert: Dict):
+        print(f"[{alert['level'].upper()}] HeadyRateLimit: budget '{alert['name']}' at {alert['percent']}% "
+              f"of its daily limit ({alert['used']:g}/{alert['limit']:g})")
+        for callback in self.on_alert:
+            try:
+                callback(alert)
+            except Exception as e:
+                print(f"[ERROR] HeadyRateLimit: budget alert callback failed: {e}")
+
+    def usage(self, name: str) -> Dict:
+        """Today's (and this week's) use of a counter against its limits."""
+        now = self.clock()
+        conn = self._connection()
+        policy = self.budgets.get(name, BudgetPolicy())
+        used = self._used(conn, name, [_today(now)])
+        report = {"name": name, "used": used, "limit": policy.daily,
+                  "percent": round(used / policy.daily * 100, 1) if policy.daily else None}
+        if policy.weekly:
+            report["weekly_used"] = self._used(conn, name, _days_back(now, 7))
+            report["weekly_limit"] = policy.weekly
+        return report
+
+    def alerts(self, day: str = None) -> List[Dict]:
+        """Alerts raised on a day (default today), oldest first."""
+        rows = self._connection().execute(
+            "SELECT name, level, percent, raised_at FROM budget_alerts WHERE day = ? ORDER BY raised_at",
+            (day or _today(self.clock()),)).fetchall()
+        return [{"name": name, "level": level, "percent": percent, "raised_at": raised_at}
+                for name, level, percent, raised_at in rows]
+
+    def get_stats(self) -> Dict:
+        """
+        Bucket levels and today's usage of every configured budget. Buckets
+        in the shared database that this process has no policy for (renamed
+        or removed since another process wrote them) are listed under
+        "unconfigured" with their stored level.
+        """
+        now = self.clock()
+        rows = self._connection().execute("SELECT name, tokens, updated FROM buckets").fetchall()
+        buckets, unconfigured = {}, {}
+        for name, tokens, updated in rows:
+            try:
+                policy = self._bucket_policy(name)
+            except KeyError:
+                unconfigured[name] = round(tokens, 3)
+                continue
+            buckets[name] = round(min(policy.burst, tokens + max(now - updated, 0) * policy.rate_per_second), 3)
+        return {
+            "buckets": buckets,
+            "unconfigured": unconfigured,
+            "budgets": {name: self.usage(name) for name in self.budgets},
+            "alerts": self.alerts()
+        }
+
+
+_shared: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(root_path: Path = None) -> RateLimiter:
+    """Process-wide limiter for a repository root (policies are read once)."""
+    key = str(Path(root_path or DEFAULT_ROOT).resolve())
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = RateLimiter.from_policies(key)
+        return _shared[key]
+
+
+def estimate_tokens(*texts) -> int:
+    """Rough LLM token count (~4 characters per token) when a provider reports none."""
+    return sum(len(text if isinstance(text, str) else str(text)) for text in texts if text is not None) // 4 + 1
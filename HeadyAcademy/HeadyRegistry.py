@@ -38,12 +38,39 @@
 
 import os
 import json
-import yaml
+import time
+import atexit
+import hashlib
+import weakref
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import glob
+
+# Fields rewritten on every invocation or health sweep; changes go to the status journal
+HOT_FIELDS = ("status", "last_invoked")
+# Status changes outside a batched() block are written this long after the first one
+DEFAULT_SAVE_DELAY = 0.5
+# Journal entries folded into a fresh registry.json once this many accumulate
+DEFAULT_COMPACT_EVERY = 500
+# Discovery sources, relative to the root path
+NODE_REGISTRY = "HeadyAcademy/Node_Registry.yaml"
+WORKFLOWS_DIR = ".windsurf/workflows"
+TOOLS_DIR = "HeadyAcademy/Tools"
+
+# Registries with status changes possibly unwritten at exit; weak, so the hook keeps none of them alive
+_open_registries: "weakref.WeakSet[HeadyRegistry]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_registries():
+    for registry in list(_open_registries):
+        registry.flush()
+# Changed workflow files are parsed on up to this many threads
+DISCOVERY_WORKERS = 8
 
 
 @dataclass
@@ -101,6 +128,8 @@ class HeadyRegistry:
     Tracks nodes, workflows, skills, services, and tools.
     """
     
+    KINDS = ("nodes", "workflows", "skills", "services", "tools")
+    
     def __init__(self, root_path: str = None):
         self.root_path = Path(root_path) if root_path else Path(__file__).parent.parent
         self.registry_file = self.root_path / ".heady" / "registry.json"
@@ -111,8 +140,40 @@ class HeadyRegistry:
         self.services: Dict[str, Service] = {}
         self.tools: Dict[str, Tool] = {}
         
+        # Bumped whenever the capability set is reloaded; routing indexes key on it
+        self.version = 0
+        # Plan steps run concurrently and update statuses from several threads
+        self._save_lock = threading.RLock()
+        
+        # Status changes are coalesced per capability and appended to the
+        # journal together: when the outermost batched() block exits, or
+        # save_delay seconds after the first change outside one. Batches
+        # overlap across threads, so any batch exiting also writes changes
+        # that have waited save_delay
+        self.journal_file = self.registry_file.with_suffix(".journal")
+        self.save_delay = DEFAULT_SAVE_DELAY
+        self.compact_every = DEFAULT_COMPACT_EVERY
+        self._pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._batch_depth = 0
+        self._pending_since = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._journal_entries = 0
+        # The journal opens with {"snapshot": <hash of registry.json>}; set once
+        # the file on disk carries this snapshot's header
+        self._journal_started = False
+        self.write_stats = {"snapshots": 0, "journal_writes": 0, "journal_entries": 0, "compactions": 0}
+        
+        # Fingerprint (mtime, size, content hash) and produced capability ids
+        # per discovery source, so refresh() re-parses only what changed. Kept
+        # beside registry.json, valid only for the snapshot whose hash it records
+        self.sources_file = self.registry_file.parent / "registry-sources.json"
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_id: Optional[str] = None
+        self.refresh_stats = {"refreshes": 0, "hashed": 0, "parsed": 0, "deltas": 0}
+        
         self._ensure_registry_dir()
         self._load_or_discover()
+        _open_registries.add(self)
     
     def _ensure_registry_dir(self):
         """Ensure .heady directory exists."""
@@ -120,9 +181,10 @@ class HeadyRegistry:
         registry_dir.mkdir(parents=True, exist_ok=True)
     
     def _load_or_discover(self):
-        """Load existing registry or perform auto-discovery."""
+        """Load existing registry (re-parsing only changed sources) or perform auto-discovery."""
         if self.registry_file.exists():
             self.load()
+            self.refresh()
         else:
             self.discover_all()
             self.save()
@@ -130,75 +192,43 @@ class HeadyRegistry:
     def discover_all(self):
         """Auto-discover all system capabilities."""
         print(" HeadyRegistry: Discovering system capabilities...")
+        self.sources = {}
         self.discover_nodes()
         self.discover_workflows()
         self.discover_skills()
         self.discover_services()
         self.discover_tools()
+        self.bump_version()
         print(f" HeadyRegistry: Discovery complete. Found {self.get_total_count()} capabilities.")
     
     def discover_nodes(self):
         """Discover nodes from Node_Registry.yaml."""
-        node_registry_path = self.root_path / "HeadyAcademy" / "Node_Registry.yaml"
+        node_registry_path = self.root_path / NODE_REGISTRY
         
         if not node_registry_path.exists():
             print(f"[WARN] Node registry not found at {node_registry_path}")
             return
         
-        with open(node_registry_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        if 'nodes' in data:
-            for node_data in data['nodes']:
-                node = Node(
-                    name=node_data['name'],
-                    role=node_data['role'],
-                    primary_tool=node_data['primary_tool'],
-                    behavior_profile=node_data.get('behavior_profile'),
-                    trigger_on=node_data.get('trigger_on', [])
-                )
-                self.nodes[node.name] = node
+        nodes = self._parse_nodes(node_registry_path)
+        for node in nodes:
+            self.nodes[node.name] = node
+        self._record_source(NODE_REGISTRY, [f"nodes:{node.name}" for node in nodes])
         
         print(f"  * Discovered {len(self.nodes)} nodes")
     
     def discover_workflows(self):
         """Discover workflows from .windsurf/workflows/*.md."""
-        workflows_dir = self.root_path / ".windsurf" / "workflows"
+        workflows_dir = self.root_path / WORKFLOWS_DIR
         
         if not workflows_dir.exists():
             print(f"[WARN] Workflows directory not found at {workflows_dir}")
             return
         
-        for workflow_file in workflows_dir.glob("*.md"):
-            try:
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                description = "No description"
-                turbo_enabled = False
-                
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        frontmatter = yaml.safe_load(parts[1])
-                        description = frontmatter.get('description', 'No description')
-                
-                if '// turbo' in content:
-                    turbo_enabled = True
-                
-                slash_command = f"/{workflow_file.stem}"
-                
-                workflow = Workflow(
-                    name=workflow_file.stem,
-                    description=description,
-                    file_path=str(workflow_file),
-                    slash_command=slash_command,
-                    turbo_enabled=turbo_enabled
-                )
+        files = sorted(workflows_dir.glob("*.md"))
+        for workflow_file, workflow in zip(files, self._parse_workflows(files)):
+            if workflow is not None:
                 self.workflows[workflow.name] = workflow
-            
-            except Exception as e:
-                print(f"  [WARN] Error parsing workflow {workflow_file.name}: {e}")
+            self._record_source(self._relative(workflow_file), [f"workflows:{workflow.name}"] if workflow else [])
         
         print(f"  * Discovered {len(self.workflows)} workflows")
     
@@ -233,7 +263,7 @@ class HeadyRegistry:
     
     def discover_tools(self):
         """Discover tools from HeadyAcademy/Tools/."""
-        tools_dir = self.root_path / "HeadyAcademy" / "Tools"
+        tools_dir = self.root_path / TOOLS_DIR
         
         if not tools_dir.exists():
             print(f"[WARN] Tools directory not found at {tools_dir}")
@@ -242,21 +272,270 @@ class HeadyRegistry:
         for tool_file in tools_dir.rglob("*.py"):
             if tool_file.name.startswith('__'):
                 continue
-            
-            relative_path = tool_file.relative_to(tools_dir)
-            category = relative_path.parts[0] if len(relative_path.parts) > 1 else "general"
-            
-            tool = Tool(
-                name=tool_file.stem,
-                file_path=str(tool_file),
-                category=category
-            )
+            tool = self._parse_tool(tool_file)
             self.tools[tool.name] = tool
+            self._record_source(self._relative(tool_file), [f"tools:{tool.name}"])
         
         print(f"  * Discovered {len(self.tools)} tools")
     
+    # ─── Source parsing ───────────────────────────────────────────────────
+    
+    def _parse_nodes(self, path: Path) -> List[Node]:
+        data = _load_yaml(path.read_text(encoding='utf-8')) or {}
+        return [
+            Node(
+                name=node_data['name'],
+                role=node_data['role'],
+                primary_tool=node_data['primary_tool'],
+                behavior_profile=node_data.get('behavior_profile'),
+                trigger_on=node_data.get('trigger_on', [])
+            )
+            for node_data in data.get('nodes', [])
+        ]
+    
+    def _parse_workflow(self, workflow_file: Path) -> Optional[Workflow]:
+        try:
+            with open(workflow_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            description = "No description"
+            if content.startswith('---'):
+                parts = content.split('---', 2)
+                if len(parts) >= 3:
+                    frontmatter = _load_yaml(parts[1]) or {}
+                    description = frontmatter.get('description', 'No description')
+            
+            return Workflow(
+                name=workflow_file.stem,
+                description=description,
+                file_path=str(workflow_file),
+                slash_command=f"/{workflow_file.stem}",
+                turbo_enabled='// turbo' in content
+            )
+        except Exception as e:
+            print(f"  [WARN] Error parsing workflow {workflow_file.name}: {e}")
+            return None
+    
+    def _parse_workflows(self, files: List[Path]) -> List[Optional[Workflow]]:
+        """Parse workflow files, several at a time when there is more than one."""
+        if len(files) < 2:
+            return [self._parse_workflow(path) for path in files]
+        with ThreadPoolExecutor(max_workers=min(DISCOVERY_WORKERS, len(files)),
+                                thread_name_prefix="heady-discover") as pool:
+            return list(pool.map(self._parse_workflow, files))
+    
+    def _parse_tool(self, tool_file: Path) -> Tool:
+        relative_path = tool_file.relative_to(self.root_path / TOOLS_DIR)
+        category = relative_path.parts[0] if len(relative_path.parts) > 1 else "general"
+        return Tool(name=tool_file.stem, file_path=str(tool_file), category=category)
+    
+    # ─── Incremental refresh ──────────────────────────────────────────────
+    
+    def _relative(self, path: Path) -> str:
+        return Path(path).relative_to(self.root_path).as_posix()
+    
+    @staticmethod
+    def source_kind(relative_path: str) -> Optional[str]:
+        """Which capability kind a root-relative path is a discovery source for, if any."""
+        if relative_path == NODE_REGISTRY:
+            return "nodes"
+        name = relative_path.rsplit("/", 1)[-1]
+        if relative_path == f"{WORKFLOWS_DIR}/{name}" and name.endswith(".md"):
+            return "workflows"
+        if relative_path.startswith(TOOLS_DIR + "/") and name.endswith(".py") and not name.startswith("__"):
+            return "tools"
+        return None
+    
+    def _record_source(self, relative_path: str, capability_ids: List[str], stat: os.stat_result = None,
+                       digest: str = None):
+        path = self.root_path / relative_path
+        try:
+            stat = stat or path.stat()
+            digest = digest or _file_digest(path)
+        except OSError:
+            return
+        self.sources[relative_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                       "sha256": digest, "capabilities": capability_ids}
+    
+    def _scan_sources(self) -> Tuple[Dict[str, os.stat_result], set]:
+        """Stat every discovery source on disk; also returns the kinds whose source location exists."""
+        found, kinds = {}, set()
+        node_registry_path = self.root_path / NODE_REGISTRY
+        if node_registry_path.exists():
+            found[NODE_REGISTRY] = node_registry_path.stat()
+            kinds.add("nodes")
+        workflows_dir = self.root_path / WORKFLOWS_DIR
+        if workflows_dir.is_dir():
+            kinds.add("workflows")
+            for entry in os.scandir(workflows_dir):
+                if entry.name.endswith(".md") and entry.is_file():
+                    found[f"{WORKFLOWS_DIR}/{entry.name}"] = entry.stat()
+        tools_dir = self.root_path / TOOLS_DIR
+        if tools_dir.is_dir():
+            kinds.add("tools")
+            for tool_file in tools_dir.rglob("*.py"):
+                if not tool_file.name.startswith('__'):
+                    found[self._relative(tool_file)] = tool_file.stat()
+        return found, kinds
+    
+    def refresh(self, paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Bring the registry up to date with its discovery sources, re-parsing
+        only files whose content hash changed (the hash is only computed when
+        mtime or size moved, so an idle refresh is a handful of stat calls).
+        paths limits the check to those files, e.g. from a file watcher;
+        without it every source is scanned and capabilities no source
+        produces any more are dropped. Statuses and invocation times survive.
+        Any change bumps the version and writes a snapshot. Returns the
+        added, updated and removed capability ids ("kind:name").
+        """
+        with self._save_lock:
+            self.refresh_stats["refreshes"] += 1
+            if paths is None:
+                current, kinds = self._scan_sources()
+                candidates = set(current) | set(self.sources)
+            else:
+                current, kinds, candidates = {}, set(), set()
+                for path in paths:
+                    path = Path(path)
+                    try:
+                        relative_path = self._relative(path) if path.is_absolute() else path.as_posix()
+                    except ValueError:
+                        continue
+                    if self.source_kind(relative_path) is None:
+                        continue
+                    candidates.add(relative_path)
+                    try:
+                        current[relative_path] = (self.root_path / relative_path).stat()
+                    except FileNotFoundError:
+                        pass
+            
+            changed, digests, fingerprints_moved = [], {}, False
+            for relative_path in sorted(candidates):
+                stat, known = current.get(relative_path), self.sources.get(relative_path)
+                if stat is None:
+                    if known is not None:
+                        changed.append(relative_path)
+                    continue
+                if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+                    continue
+                try:
+                    digest = _file_digest(self.root_path / relative_path)
+                except OSError:
+                    continue
+                self.refresh_stats["hashed"] += 1
+                if known and known["sha256"] == digest:
+                    # Touched but not edited
+                    known.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                    fingerprints_moved = True
+                    continue
+                changed.append(relative_path)
+                digests[relative_path] = digest
+            
+            parsed = self._parse_sources([p for p in changed if p in digests])
+            delta = {"added": [], "updated": [], "removed": []}
+            for relative_path in changed:
+                previous = set((self.sources.get(relative_path) or {}).get("capabilities", []))
+                if relative_path in digests:
+                    kind = self.source_kind(relative_path)
+                    produced = [f"{kind}:{self._put(kind, capability, delta)}" for capability in parsed[relative_path]]
+                    self._record_source(relative_path, produced, current[relative_path], digests[relative_path])
+                    gone = previous - set(produced)
+                else:
+                    self.sources.pop(relative_path, None)
+                    gone = previous
+                still_produced = {cid for entry in self.sources.values() for cid in entry["capabilities"]}
+                for capability_id in gone - still_produced:
+                    self._drop(capability_id, delta)
+            
+            if paths is None:
+                # A snapshot written by an older discovery (or another machine) can
+                # list capabilities whose files are gone; nothing produces them now
+                produced = {cid for entry in self.sources.values() for cid in entry["capabilities"]}
+                for kind in sorted(kinds):
+                    for name in list(getattr(self, kind)):
+                        if f"{kind}:{name}" not in produced:
+                            self._drop(f"{kind}:{name}", delta)
+            
+            if any(delta.values()):
+                self.refresh_stats["deltas"] += 1
+                self.bump_version()
+                print(f" HeadyRegistry: Refreshed {len(changed)} source(s): " +
+                      ", ".join(f"{len(ids)} {label}" for label, ids in delta.items()))
+                self._save()
+            elif changed or fingerprints_moved:
+                self._save_sources()
+            return delta
+    
+    def _parse_sources(self, relative_paths: List[str]) -> Dict[str, List[Any]]:
+        parsed: Dict[str, List[Any]] = {}
+        workflow_paths = [p for p in relative_paths if self.source_kind(p) == "workflows"]
+        workflows = self._parse_workflows([self.root_path / p for p in workflow_paths])
+        for relative_path, workflow in zip(workflow_paths, workflows):
+            parsed[relative_path] = [workflow] if workflow else []
+        for relative_path in relative_paths:
+            kind = self.source_kind(relative_path)
+            if kind == "nodes":
+                try:
+                    parsed[relative_path] = self._parse_nodes(self.root_path / relative_path)
+                except Exception as e:
+                    # Keep the nodes we have rather than dropping them over a bad edit
+                    print(f"  [WARN] Error parsing {relative_path}: {e}")
+                    parsed[relative_path] = list(self.nodes.values())
+            elif kind == "tools":
+                parsed[relative_path] = [self._parse_tool(self.root_path / relative_path)]
+        self.refresh_stats["parsed"] += len(relative_paths)
+        return parsed
+    
+    def _put(self, kind: str, capability: Any, delta: Dict[str, List[str]]) -> str:
+        """Add or replace a parsed capability, keeping its hot fields; returns its name."""
+        capabilities = getattr(self, kind)
+        existing = capabilities.get(capability.name)
+        if existing is None:
+            capabilities[capability.name] = capability
+            delta["added"].append(f"{kind}:{capability.name}")
+            return capability.name
+        for field in HOT_FIELDS:
+            if hasattr(capability, field):
+                setattr(capability, field, getattr(existing, field))
+        if asdict(capability) != asdict(existing):
+            capabilities[capability.name] = capability
+            delta["updated"].append(f"{kind}:{capability.name}")
+        return capability.name
+    
+    def _drop(self, capability_id: str, delta: Dict[str, List[str]]):
+        kind, name = capability_id.split(":", 1)
+        if getattr(self, kind).pop(name, None) is not None:
+            self._pending.pop((kind, name), None)
+            delta["removed"].append(capability_id)
+    
+    def _save_sources(self):
+        if self._snapshot_id is None:
+            return
+        temp_file = self.sources_file.with_suffix(".tmp")
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({"snapshot": self._snapshot_id, "sources": self.sources}, f, indent=1, sort_keys=True)
+            os.replace(temp_file, self.sources_file)
+        except OSError as e:
+            # Only costs a re-hash of every source on the next start
+            print(f"[WARN] HeadyRegistry: could not write {self.sources_file.name} ({e})")
+    
+    def _load_sources(self):
+        try:
+            with open(self.sources_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        # Fingerprints taken against another snapshot say nothing about this one
+        self.sources = data.get("sources", {}) if data.get("snapshot") == self._snapshot_id else {}
+    
     def save(self):
-        """Save registry to JSON file."""
+        """Write the full registry to JSON (atomically) and clear the status journal."""
+        with self._save_lock:
+            self._save()
+    
+    def _save(self):
         data = {
             "metadata": {
                 "last_updated": datetime.now().isoformat(),
@@ -269,23 +548,170 @@ class HeadyRegistry:
             "tools": {k: asdict(v) for k, v in self.tools.items()}
         }
         
-        with open(self.registry_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        text = json.dumps(data, indent=2).encode('utf-8')
+        temp_file = self.registry_file.with_suffix(".tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.registry_file)
+        _fsync_dir(self.registry_file.parent)
+        self._snapshot_id = _digest(text)
+        
+        # The snapshot now holds every pending and journaled status change
+        self._cancel_flush()
+        self._pending = {}
+        try:
+            self.journal_file.unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_entries = 0
+        self._journal_started = False
+        self.write_stats["snapshots"] += 1
+        self._save_sources()
         
         print(f" HeadyRegistry: Saved to {self.registry_file}")
     
     def load(self):
-        """Load registry from JSON file."""
-        with open(self.registry_file, 'r') as f:
-            data = json.load(f)
+        """Load registry from JSON file, then replay the status journal over it."""
+        raw = self.registry_file.read_bytes()
+        data = json.loads(raw)
         
         self.nodes = {k: Node(**v) for k, v in data.get('nodes', {}).items()}
         self.workflows = {k: Workflow(**v) for k, v in data.get('workflows', {}).items()}
         self.skills = {k: Skill(**v) for k, v in data.get('skills', {}).items()}
         self.services = {k: Service(**v) for k, v in data.get('services', {}).items()}
         self.tools = {k: Tool(**v) for k, v in data.get('tools', {}).items()}
+        self._snapshot_id = _digest(raw)
+        self._load_sources()
+        replayed = self._replay_journal()
+        self.bump_version()
+        
+        journaled = f" (+{replayed} journaled status updates)" if replayed else ""
+        print(f"HeadyRegistry: Loaded {self.get_total_count()} capabilities from {self.registry_file}{journaled}")
+    
+    def _replay_journal(self) -> int:
+        """
+        Apply journaled status changes; a torn last line from a crash is cut off.
+        A journal whose header names another snapshot is dropped: a crash
+        between writing a compacted snapshot and unlinking the journal would
+        otherwise replay older statuses over the newer snapshot.
+        """
+        self._journal_started = False
+        self._journal_entries = 0
+        try:
+            with open(self.journal_file, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+        
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+        if not isinstance(header, dict) or header.get("snapshot") != self._snapshot_id:
+            if lines:
+                print(f"[WARN] HeadyRegistry: {self.journal_file.name} belongs to another snapshot, ignoring it")
+            self.journal_file.unlink()
+            return 0
+        self._journal_started = True
         
-        print(f"HeadyRegistry: Loaded {self.get_total_count()} capabilities from {self.registry_file}")
+        applied, good_bytes = 0, len(lines[0])
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+                capability = getattr(self, entry["kind"]).get(entry["name"]) if entry["kind"] in self.KINDS else None
+            except (ValueError, KeyError, TypeError):
+                break
+            good_bytes += len(line)
+            applied += 1
+            if capability is not None:
+                for field, value in entry["fields"].items():
+                    if field in HOT_FIELDS:
+                        setattr(capability, field, value)
+        
+        if good_bytes < sum(len(line) for line in lines):
+            print(f"[WARN] HeadyRegistry: dropping torn tail of {self.journal_file.name}")
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(good_bytes)
+        self._journal_entries = applied
+        return applied
+    
+    @contextmanager
+    def batched(self):
+        """
+        Hold status writes until the outermost batched() block exits, then
+        write them at once. Overlapping batches (concurrent orchestrations)
+        may keep some block open indefinitely, so any block that exits also
+        flushes once the oldest pending change is save_delay old.
+        """
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                due = self._batch_depth == 0 or (
+                    bool(self._pending) and time.monotonic() - self._pending_since >= self.save_delay
+                )
+            if due:
+                self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Write pending status changes now: one journal append, or a fresh
+        snapshot once the journal has compact_every entries. Returns True
+        if anything was written.
+        """
+        with self._save_lock:
+            self._cancel_flush()
+            if not self._pending:
+                return False
+            if self._journal_entries + len(self._pending) >= self.compact_every:
+                self.write_stats["compactions"] += 1
+                self._save()
+                return True
+            entries, self._pending = self._pending, {}
+            lines = "".join(json.dumps({"kind": kind, "name": name, "fields": fields}) + "\n"
+                            for (kind, name), fields in entries.items())
+            if not self._journal_started:
+                lines = json.dumps({"snapshot": self._snapshot_id}) + "\n" + lines
+            try:
+                with open(self.journal_file, 'a' if self._journal_started else 'w') as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"[WARN] HeadyRegistry: status journal write failed ({e}), will retry")
+                for key, fields in entries.items():
+                    self._pending[key] = {**fields, **self._pending.get(key, {})}
+                return False
+            self._journal_entries += len(entries)
+            self._journal_started = True
+            self.write_stats["journal_writes"] += 1
+            self.write_stats["journal_entries"] += len(entries)
+            return True
+    
+    def _mark(self, kind: str, name: str, fields: Dict[str, Any]):
+        """Queue hot-field changes for the next flush (save lock held)."""
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.setdefault((kind, name), {}).update(fields)
+        if self._batch_depth == 0 and self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.save_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _cancel_flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
+    def bump_version(self) -> int:
+        """Mark the capability set as changed (call after editing the dicts directly)."""
+        self.version += 1
+        return self.version
     
     def get_total_count(self) -> int:
         """Get total count of all capabilities."""
@@ -351,18 +777,63 @@ class HeadyRegistry:
         }
     
     def update_node_status(self, node_name: str, status: str, last_invoked: str = None):
-        """Update node status and last invoked time."""
-        if node_name in self.nodes:
-            self.nodes[node_name].status = status
-            if last_invoked:
-                self.nodes[node_name].last_invoked = last_invoked
-            self.save()
+        """Update node status and last invoked time; journaled with the next flush."""
+        with self._save_lock:
+            node = self.nodes.get(node_name)
+            if node is None:
+                return
+            fields = {}
+            if node.status != status:
+                node.status = fields["status"] = status
+            if last_invoked and node.last_invoked != last_invoked:
+                node.last_invoked = fields["last_invoked"] = last_invoked
+            if fields:
+                self._mark("nodes", node_name, fields)
     
     def update_service_status(self, service_name: str, status: str):
         """Update service status."""
-        if service_name in self.services:
-            self.services[service_name].status = status
-            self.save()
+        self.update_service_statuses({service_name: status})
+    
+    def update_service_statuses(self, statuses: Dict[str, str]) -> int:
+        """Apply many status updates with at most one registry write; returns how many changed."""
+        with self.batched():
+            with self._save_lock:
+                changed = 0
+                for service_name, status in statuses.items():
+                    service = self.services.get(service_name)
+                    if service is not None and service.status != status:
+                        service.status = status
+                        self._mark("services", service_name, {"status": status})
+                        changed += 1
+        return changed
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _file_digest(path: Path) -> str:
+    return _digest(path.read_bytes())
+
+
+def _load_yaml(text: str) -> Any:
+    # Only discovery parses YAML; loading registry.json does not
+    import yaml
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _fsync_dir(directory: Path):
+    """Make a rename in directory durable (not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,210 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyRegistryWatch.py                         ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      REGISTRY WATCH - INOTIFY DELTAS FOR THE CAPABILITY REGISTRY              ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                 ║
+║     Watches Node_Registry.yaml, .windsurf/workflows and HeadyAcademy/Tools    ║
+║     and hands each changed file to HeadyRegistry.refresh(), which re-parses   ║
+║     just that file and bumps the registry version. Linux only: elsewhere      ║
+║     inotify_available() is False and callers poll refresh() instead           ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import time
+import ctypes
+import select
+import struct
+import threading
+import ctypes.util
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+from HeadyRegistry import WORKFLOWS_DIR, TOOLS_DIR
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+# Editors save as a burst of events (write, rename, delete backup); one refresh covers the burst
+DEFAULT_DEBOUNCE = 0.05
+
+_libc_handle = None
+
+
+def _libc():
+    global _libc_handle
+    if _libc_handle is None:
+        if not sys.platform.startswith("linux"):
+            _libc_handle = False
+        else:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                libc.inotify_init1.argtypes = [ctypes.c_int]
+                libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                _libc_handle = libc
+            except (OSError, AttributeError):
+                _libc_handle = False
+    return _libc_handle or None
+
+
+def inotify_available() -> bool:
+    """True when this platform can run a RegistryWatcher."""
+    return _libc() is not None
+
+
+class RegistryWatcher:
+    """
+    Background thread applying discovery-source changes to a HeadyRegistry
+    as they happen. lock is held around each refresh; the daemon passes its
+    command lock so a delta never lands in the middle of an orchestration.
+    A queue overflow or a directory appearing or vanishing under Tools falls
+    back to one full refresh().
+    """
+
+    def __init__(self, registry, lock: Optional[threading.Lock] = None, debounce: float = DEFAULT_DEBOUNCE):
+        self.registry = registry
+        self.lock = lock or threading.Lock()
+        self.debounce = debounce
+        self.stats = {"events": 0, "refreshes": 0, "deltas": 0, "rescans": 0}
+        self._libc = _libc()
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, Path] = {}
+        self._tools_dir = Path(registry.root_path) / TOOLS_DIR
+        self._rescan = False
+        self._wake = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "RegistryWatcher":
+        if self._libc is None:
+            raise OSError("inotify is not available on this platform")
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        root = Path(self.registry.root_path)
+        # HeadyAcademy itself for Node_Registry.yaml; refresh() ignores its other files
+        self._add_watch(root / "HeadyAcademy")
+        self._add_watch(root / WORKFLOWS_DIR)
+        self._add_tree(self._tools_dir)
+        self._wake = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="heady-registry-watch")
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5):
+        if self._thread is None:
+            return
+        os.write(self._wake[1], b"x")
+        self._thread.join(timeout)
+        self._thread = None
+        for fd in (self._fd, *self._wake):
+            os.close(fd)
+        self._fd = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "watches": len(self._watches)}
+
+    def _add_watch(self, directory: Path):
+        if not directory.is_dir():
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            print(f"[WARN] RegistryWatcher: cannot watch {directory} ({os.strerror(ctypes.get_errno())})")
+            return
+        self._watches[wd] = directory
+
+    def _add_tree(self, directory: Path):
+        if directory.is_dir():
+            self._add_watch(directory)
+            for child in directory.rglob("*"):
+                if child.is_dir():
+                    self._add_watch(child)
+
+    def _run(self):
+        pending: Set[Path] = set()
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd, self._wake[0]], [], [], timeout)
+            if self._wake[0] in ready:
+                return
+            if self._fd in ready:
+                pending |= self._read_events()
+                if deadline is None:
+                    deadline = time.monotonic() + self.debounce
+            if deadline is not None and time.monotonic() >= deadline:
+                self._apply(pending)
+                pending, deadline = set(), None
+
+    def _read_events(self) -> Set[Path]:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed, offset = set(), 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0"))
+            offset += EVENT_HEADER.size + length
+            self.stats["events"] += 1
+            if mask & IN_Q_OVERFLOW:
+                self._rescan = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & IN_ISDIR:
+                if path == self._tools_dir or self._tools_dir in path.parents:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_tree(path)
+                    # Tools may have arrived or left with the directory
+                    self._rescan = True
+            elif not mask & IN_CREATE:
+                # A created file is followed by IN_CLOSE_WRITE once its content is there
+                changed.add(path)
+        return changed
+
+    def _apply(self, paths: Set[Path]):
+        rescan, self._rescan = self._rescan, False
+        if not paths and not rescan:
+            return
+        try:
+            with self.lock:
+                delta = self.registry.refresh(None if rescan else sorted(paths))
+        except Exception as e:
+            print(f"[WARN] RegistryWatcher: refresh failed: {e}")
+            return
+        self.stats["refreshes"] += 1
+        self.stats["rescans"] += rescan
+        if any(delta.values()):
+            self.stats["deltas"] += 1
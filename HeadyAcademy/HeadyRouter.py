@@ -0,0 +1,295 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyRouter.py                                ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      ROUTER - INVERTED INDEX OVER THE CAPABILITY REGISTRY                     ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                     ║
+║     Built once per registry version: BM25F term impacts over names,           ║
+║     triggers, roles, descriptions and keywords for top-k execution plans,     ║
+║     memoized per normalized request                                           ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import re
+import math
+import heapq
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Request keywords that pull in a service of the given type
+SERVICE_KEYWORDS = {
+    "api": ["api", "endpoint", "request", "server", "service"],
+    "database": ["database", "postgres", "db", "query", "data"],
+    "cache": ["cache", "redis", "memory", "store"],
+    "mcp": ["mcp", "protocol", "connect", "bridge"],
+    "frontend": ["ui", "interface", "web", "frontend", "app"]
+}
+
+KINDS = ("workflows", "nodes", "tools", "services")
+
+# BM25F: a term in a name or trigger says more than the same term in a description
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "triggers": 3.0,
+    "role": 2.0,
+    "type": 2.0,
+    "description": 1.0,
+    "category": 1.0,
+    "keywords": 1.0
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Plans execute at most DEFAULT_TOP_K capabilities scoring at least DEFAULT_MIN_SCORE
+DEFAULT_TOP_K = 5
+DEFAULT_MIN_SCORE = 0.2
+# An explicit slash command is unambiguous
+SLASH_COMMAND_SCORE = 1.0
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Function words carry no routing signal (roles read "The Connector")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or please the this to with".split()
+)
+SLASH_PATTERN = re.compile(r"/[\w.-]+")
+
+# Execution plans remembered per registry version
+PLAN_MEMO_SIZE = 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens without stopwords, plurals folded ("gaps" -> "gap")."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """A registry entry selected for a request."""
+    kind: str
+    name: str
+    confidence: float
+    rank: int
+
+
+def registry_signature(registry: Any) -> Tuple[int, ...]:
+    """Version plus entry counts, so direct dict edits without a bump still invalidate."""
+    return (getattr(registry, "version", 0),) + tuple(len(getattr(registry, kind)) for kind in KINDS)
+
+
+class RouterIndex:
+    """
+    Routing index for HeadyConductor.analyze_request.
+
+    rank() scores registry entries with BM25F over their names, triggers,
+    roles, descriptions and keywords. Per-posting impacts are precomputed at
+    build time, so ranking is a sparse sum over the request's terms,
+    independent of how many entries the registry holds.
+    """
+
+    def __init__(self, registry: Any, service_keywords: Dict[str, List[str]] = None):
+        started = time.perf_counter()
+        self.version = getattr(registry, "version", 0)
+        self.signature = registry_signature(registry)
+        service_keywords = SERVICE_KEYWORDS if service_keywords is None else service_keywords
+
+        self._documents: List[Tuple[str, str, int]] = []
+        self._slash_commands: Dict[str, int] = {}
+        document_fields: List[Dict[str, str]] = []
+
+        for rank, (name, workflow) in enumerate(registry.workflows.items()):
+            if workflow.slash_command:
+                self._slash_commands[workflow.slash_command.lower()] = len(self._documents)
+            self._documents.append(("workflows", name, rank))
+            # Discovery fills in "No description" for workflows without frontmatter
+            description = workflow.description if workflow.description != "No description" else ""
+            document_fields.append({"name": name, "description": description or ""})
+
+        for rank, (name, node) in enumerate(registry.nodes.items()):
+            self._documents.append(("nodes", name, rank))
+            document_fields.append({"name": name, "triggers": " ".join(node.trigger_on or []),
+                                    "role": node.role or "", "category": node.primary_tool or ""})
+
+        for rank, (name, tool) in enumerate(registry.tools.items()):
+            self._documents.append(("tools", name, rank))
+            document_fields.append({"name": name, "category": tool.category or ""})
+
+        for rank, (name, service) in enumerate(registry.services.items()):
+            keywords = service_keywords.get(service.type) or []
+            self._documents.append(("services", name, rank))
+            document_fields.append({"name": name, "type": service.type or "", "keywords": " ".join(keywords)})
+
+        self._build_relevance(document_fields)
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def _build_relevance(self, document_fields: List[Dict[str, str]]):
+        """Precompute BM25F idf and saturated per-document term impacts."""
+        tokenized = [
+            {field: tokenize(text) for field, text in fields.items() if text}
+            for fields in document_fields
+        ]
+        lengths: Dict[str, List[int]] = {}
+        for fields in tokenized:
+            for field, tokens in fields.items():
+                lengths.setdefault(field, []).append(len(tokens))
+        average_length = {field: (sum(values) / len(values)) or 1.0 for field, values in lengths.items()}
+
+        self._impacts: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_id, fields in enumerate(tokenized):
+            # Length-normalised, field-weighted term frequency
+            weighted: Dict[str, float] = {}
+            for field, tokens in fields.items():
+                norm = 1 - BM25_B + BM25_B * len(tokens) / average_length[field]
+                for token in tokens:
+                    weighted[token] = weighted.get(token, 0.0) + FIELD_WEIGHTS[field] / norm
+            for token, tf in weighted.items():
+                self._impacts.setdefault(token, []).append((doc_id, tf / (BM25_K1 + tf)))
+
+        total = len(tokenized)
+        self._idf = {
+            token: math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self._impacts.items()
+        }
+
+    def is_current(self, registry: Any) -> bool:
+        """True while the registry has not changed since the index was built."""
+        return registry_signature(registry) == self.signature
+
+    def rank(self, request: str, top_k: Optional[int] = DEFAULT_TOP_K,
+             min_score: float = DEFAULT_MIN_SCORE) -> List[RouteMatch]:
+        """
+        Capabilities by BM25F relevance, best first: at most top_k, each scoring
+        at least min_score. A score is the idf-weighted share of the request's
+        indexed terms the capability matches, so it falls in [0, 1] whatever
+        the request length; explicit slash commands score 1.0.
+        """
+        scores: Dict[int, float] = {}
+        total_idf = 0.0
+        for token in set(tokenize(request)):
+            postings = self._impacts.get(token)
+            if not postings:
+                continue
+            idf = self._idf[token]
+            total_idf += idf
+            for doc_id, impact in postings:
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * impact
+        if total_idf:
+            scores = {doc_id: score / total_idf for doc_id, score in scores.items()}
+
+        for command in SLASH_PATTERN.findall(request.lower()):
+            doc_id = self._slash_commands.get(command)
+            if doc_id is not None:
+                scores[doc_id] = SLASH_COMMAND_SCORE
+
+        candidates = [(score, doc_id) for doc_id, score in scores.items() if score >= min_score]
+        order = lambda item: (-item[0], item[1])
+        if top_k is None:
+            ranked = sorted(candidates, key=order)
+        else:
+            ranked = heapq.nsmallest(top_k, candidates, key=order)
+
+        matches = []
+        for score, doc_id in ranked:
+            kind, name, rank = self._documents[doc_id]
+            matches.append(RouteMatch(kind, name, round(score, 4), rank))
+        return matches
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and build cost."""
+        return {
+            "version": self.version,
+            "documents": len(self._documents),
+            "terms": len(self._impacts),
+            "build_ms": round(self.build_ms, 2)
+        }
+
+
+def normalize_request(request: str) -> str:
+    """Lowercased with whitespace collapsed; rank() cannot tell such requests apart."""
+    return " ".join(request.lower().split())
+
+
+class PlanMemo:
+    """
+    LRU of execution plans keyed on the normalized request and routing
+    parameters, valid for one registry signature.
+
+    HeadyConductor.analyze_requests consults it before ranking and HeadyBrain
+    reports its counters, so a repeated request costs a dict lookup. bind()
+    drops every plan once the registry changes.
+    """
+
+    def __init__(self, max_entries: int = PLAN_MEMO_SIZE):
+        self.max_entries = max_entries
+        self.signature: Optional[Tuple[int, ...]] = None
+        self._plans: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def bind(self, signature: Tuple[int, ...]):
+        """Forget all plans when the registry signature differs from the one they were built for."""
+        with self._lock:
+            if signature != self.signature:
+                if self._plans:
+                    self.stats["invalidations"] += 1
+                    self._plans.clear()
+                self.signature = signature
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.stats["misses"] += 1
+                return None
+            self._plans.move_to_end(key)
+            self.stats["hits"] += 1
+            return plan
+
+    def put(self, key: Tuple[Any, ...], plan: Dict[str, Any]):
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters, hit rate and current size."""
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "size": len(self._plans),
+                "max_entries": self.max_entries,
+                "hit_rate": self.stats["hits"] / max(lookups, 1)
+            }
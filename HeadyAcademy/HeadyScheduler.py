@@ -0,0 +1,323 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyScheduler.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      SCHEDULER - PRIORITY REQUEST QUEUES OVER NODE POOLS                      ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                       ║
+║     Admission control in front of HeadyConductor.orchestrate: hot/warm/       ║
+║     cold pools with reserved concurrency, per-user fairness, overflow         ║
+║     handling and queue-wait histograms from resource-policies.yaml            ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import time
+import itertools
+import threading
+import contextvars
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Optional
+
+from HeadyTelemetry import LatencyHistogram
+
+# nodePools priority names, most important first
+PRIORITY_ORDER = {"critical": 0, "high": 1, "normal": 2, "low": 3}
+OVERFLOW_ACTIONS = ("throttle", "reject", "buffer")
+# Idle reservations of these pools stay free for them; other pools lend theirs out
+HELD_PRIORITIES = ("critical",)
+
+# Used when resource-policies.yaml leaves them out
+DEFAULT_MAX_CONCURRENT = 8
+DEFAULT_MAX_PER_USER = 4
+DEFAULT_MAX_QUEUED = 64
+DEFAULT_POOLS = {
+    "hot": {"priority": "critical", "reservedConcurrency": 4, "maxLatencyMs": 2000},
+    "warm": {"priority": "high", "reservedConcurrency": 2, "maxLatencyMs": 10000},
+    "cold": {"priority": "low", "reservedConcurrency": 2, "maxLatencyMs": 60000},
+}
+ANONYMOUS_USER = "anonymous"
+
+
+class SchedulerOverloaded(RuntimeError):
+    """The queue is full and the overflow action rejected the request."""
+
+
+@dataclass
+class PoolPolicy:
+    """One nodePools entry."""
+    name: str
+    priority: str = "normal"
+    reserved: int = 0
+    max_latency_ms: float = 10000
+
+    @property
+    def rank(self) -> int:
+        return PRIORITY_ORDER.get(self.priority, PRIORITY_ORDER["normal"])
+
+    @classmethod
+    def from_policy(cls, name: str, policy: Dict[str, Any]) -> "PoolPolicy":
+        return cls(
+            name=name,
+            priority=policy.get("priority", "normal"),
+            reserved=int(policy.get("reservedConcurrency", 0)),
+            max_latency_ms=float(policy.get("maxLatencyMs", 10000))
+        )
+
+
+@dataclass
+class _Task:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: Dict[str, Any]
+    pool: str
+    user: str
+    future: Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # The submitter's context variables, visible to fn on the worker thread
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class RequestScheduler:
+    """
+    Runs callables on at most max_concurrent threads, chosen from per-pool
+    queues.
+
+    Pools are served in priority order. Idle reservations of critical pools
+    (reservedConcurrency minus running) are held free, so the hot pool
+    always finds its slots open while warm and cold work soaks up whatever
+    else is idle. Other reservations are lent out and honored under
+    contention: a pool below its reservation gets the next free slot before
+    pools that are borrowing. Within a pool, users take turns and none runs
+    more than max_per_user tasks at once.
+
+    Once max_queued tasks are waiting, overflow decides: "reject" raises
+    SchedulerOverloaded, "throttle" blocks the caller for up to the pool's
+    maxLatencyMs before rejecting, and "buffer" queues anyway.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_per_user: int = DEFAULT_MAX_PER_USER,
+                 pools: Dict[str, PoolPolicy] = None, overflow: str = "throttle",
+                 max_queued: int = DEFAULT_MAX_QUEUED):
+        if overflow not in OVERFLOW_ACTIONS:
+            raise ValueError(f"Unknown overflow action '{overflow}', expected one of {OVERFLOW_ACTIONS}")
+        self.max_concurrent = max_concurrent
+        self.max_per_user = max_per_user
+        self.overflow = overflow
+        self.max_queued = max_queued
+        if pools is None:
+            pools = {name: PoolPolicy.from_policy(name, policy) for name, policy in DEFAULT_POOLS.items()}
+        self.pools = dict(sorted(pools.items(), key=lambda item: item[1].rank))
+
+        self._condition = threading.Condition()
+        self._queues: Dict[str, "OrderedDict[str, Deque[_Task]]"] = {name: OrderedDict() for name in self.pools}
+        self._queued: Dict[str, int] = {name: 0 for name in self.pools}
+        self._running: Dict[str, int] = {name: 0 for name in self.pools}
+        self._running_by_user: Dict[str, int] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix="heady-sched")
+        self._closed = False
+
+        self.wait_histograms = {name: LatencyHistogram() for name in self.pools}
+        self.stats = {name: {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0,
+                             "buffered": 0, "throttled": 0, "slo_violations": 0} for name in self.pools}
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any]) -> "RequestScheduler":
+        """Concurrency limits and node pools from resource-policies.yaml."""
+        concurrency = policies.get("concurrency") or {}
+        pool_policies = policies.get("nodePools") or DEFAULT_POOLS
+        return cls(
+            max_concurrent=int(concurrency.get("maxConcurrentTasks", DEFAULT_MAX_CONCURRENT)),
+            max_per_user=int(concurrency.get("maxTasksPerUser", DEFAULT_MAX_PER_USER)),
+            pools={name: PoolPolicy.from_policy(name, policy) for name, policy in pool_policies.items()},
+            overflow=concurrency.get("queueOverflowAction", "throttle"),
+            max_queued=int(concurrency.get("maxQueuedTasks", DEFAULT_MAX_QUEUED))
+        )
+
+    def submit(self, fn: Callable[..., Any], *args, pool: str = "hot", user: str = None, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) in a pool; the Future resolves with its result."""
+        if pool not in self.pools:
+            raise ValueError(f"Unknown node pool '{pool}', expected one of {list(self.pools)}")
+        task = _Task(fn, args, kwargs, pool, user or ANONYMOUS_USER, Future())
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("RequestScheduler is shut down")
+            self.stats[pool]["submitted"] += 1
+            if sum(self._queued.values()) >= self.max_queued:
+                self._admit_overflow(pool)
+            self._queues[pool].setdefault(task.user, deque()).append(task)
+            self._queued[pool] += 1
+            self._dispatch()
+        return task.future
+
+    def run(self, fn: Callable[..., Any], *args, pool: str = "hot", user: str = None, **kwargs) -> Any:
+        """submit() and wait for the result."""
+        return self.submit(fn, *args, pool=pool, user=user, **kwargs).result()
+
+    def _admit_overflow(self, pool: str):
+        """Called with the queue full; returns when the task may be queued, else raises."""
+        if self.overflow == "buffer":
+            self.stats[pool]["buffered"] += 1
+            return
+        if self.overflow == "throttle":
+            self.stats[pool]["throttled"] += 1
+            deadline = time.monotonic() + self.pools[pool].max_latency_ms / 1000
+            while sum(self._queued.values()) >= self.max_queued and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if sum(self._queued.values()) < self.max_queued and not self._closed:
+                return
+        self.stats[pool]["rejected"] += 1
+        raise SchedulerOverloaded(f"Request queue full ({self.max_queued} waiting), '{pool}' request rejected")
+
+    def _headroom_above(self, pool: PoolPolicy) -> int:
+        """Free slots pool must leave for idle reservations of more important, held pools."""
+        return sum(max(other.reserved - self._running[name], 0)
+                   for name, other in self.pools.items()
+                   if other.rank < pool.rank and other.priority in HELD_PRIORITIES)
+
+    def _next_task(self, free: int) -> Optional[_Task]:
+        eligible = [
+            policy for name, policy in self.pools.items()
+            if self._queued[name] and free > self._headroom_above(policy)
+        ]
+        # Pools still short of their reservation first, then by priority
+        eligible.sort(key=lambda policy: (self._running[policy.name] >= policy.reserved, policy.rank))
+        for policy in eligible:
+            users = self._queues[policy.name]
+            for user in list(users):
+                if self._running_by_user.get(user, 0) >= self.max_per_user:
+                    continue
+                task = users[user].popleft()
+                if users[user]:
+                    users.move_to_end(user)
+                else:
+                    del users[user]
+                self._queued[policy.name] -= 1
+                return task
+        return None
+
+    def _dispatch(self):
+        """Start queued tasks while slots are free. Caller holds the condition."""
+        started = False
+        while True:
+            free = self.max_concurrent - sum(self._running.values())
+            task = self._next_task(free) if free > 0 else None
+            if task is None:
+                break
+            self._running[task.pool] += 1
+            self._running_by_user[task.user] = self._running_by_user.get(task.user, 0) + 1
+            wait_ms = (time.monotonic() - task.enqueued_at) * 1000
+            self.wait_histograms[task.pool].record(wait_ms)
+            if wait_ms > self.pools[task.pool].max_latency_ms:
+                self.stats[task.pool]["slo_violations"] += 1
+            self._executor.submit(self._run_task, task)
+            started = True
+        if started:
+            # Throttled submitters wait for queue room
+            self._condition.notify_all()
+
+    def _run_task(self, task: _Task):
+        if task.future.set_running_or_notify_cancel():
+            try:
+                task.future.set_result(task.context.run(task.fn, *task.args, **task.kwargs))
+                outcome = "completed"
+            except BaseException as e:
+                task.future.set_exception(e)
+                outcome = "failed"
+        else:
+            outcome = "completed"
+        with self._condition:
+            self._running[task.pool] -= 1
+            self._running_by_user[task.user] -= 1
+            if not self._running_by_user[task.user]:
+                del self._running_by_user[task.user]
+            self.stats[task.pool][outcome] += 1
+            self._dispatch()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-pool queue depth, running tasks, counters and queue-wait percentiles."""
+        with self._condition:
+            pools = {
+                name: {
+                    "priority": policy.priority,
+                    "reserved": policy.reserved,
+                    "max_latency_ms": policy.max_latency_ms,
+                    "queued": self._queued[name],
+                    "running": self._running[name],
+                    **self.stats[name],
+                    "queue_wait": self.wait_histograms[name].summary()
+                }
+                for name, policy in self.pools.items()
+            }
+            queued = sum(self._queued.values())
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_per_user": self.max_per_user,
+            "overflow": self.overflow,
+            "queued": queued,
+            "queue_utilization": queued / max(self.max_queued, 1),
+            "pools": pools
+        }
+
+    def to_openmetrics(self, namespace: str = "heady") -> str:
+        """Queue-wait summaries and queue depth per pool in OpenMetrics text format."""
+        metrics = self.get_metrics()["pools"]
+        name = f"{namespace}_scheduler_queue_wait_seconds"
+        lines = [f"# TYPE {name} summary", f"# UNIT {name} seconds", f"# HELP {name} Time requests wait for a slot."]
+        for pool, pool_metrics in metrics.items():
+            wait = pool_metrics["queue_wait"]
+            for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                lines.append(f'{name}{{pool="{pool}",quantile="{quantile}"}} {wait[key] / 1000.0}')
+            lines.append(f'{name}_count{{pool="{pool}"}} {wait["count"]}')
+            lines.append(f'{name}_sum{{pool="{pool}"}} {wait["mean_ms"] * wait["count"] / 1000.0}')
+        for family, key, kind, help_text in (
+            ("scheduler_queued", "queued", "gauge", "Requests waiting for a slot."),
+            ("scheduler_running", "running", "gauge", "Requests running."),
+            ("scheduler_rejected", "rejected", "counter", "Requests rejected on overflow."),
+            ("scheduler_slo_violations", "slo_violations", "counter", "Requests that waited past maxLatencyMs.")
+        ):
+            family_name = f"{namespace}_{family}"
+            suffix = "_total" if kind == "counter" else ""
+            lines.append(f"# TYPE {family_name} {kind}")
+            lines.append(f"# HELP {family_name} {help_text}")
+            for pool, pool_metrics in metrics.items():
+                lines.append(f'{family_name}{suffix}{{pool="{pool}"}} {pool_metrics[key]}')
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop accepting work. With wait, queued tasks still run and this
+        returns once all have finished; without, queued tasks are cancelled.
+        """
+        with self._condition:
+            self._closed = True
+            if not wait:
+                for name, users in self._queues.items():
+                    for task in itertools.chain.from_iterable(users.values()):
+                        task.future.cancel()
+                    users.clear()
+                    self._queued[name] = 0
+            self._condition.notify_all()
+            while any(self._queued.values()):
+                self._condition.wait(0.1)
+        self._executor.shutdown(wait=wait)
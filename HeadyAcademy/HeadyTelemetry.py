@@ -0,0 +1,226 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyTelemetry.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      TELEMETRY - STAGE TRACING & LATENCY HISTOGRAMS                           ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                          ║
+║     Per-stage spans and HDR-style latency histograms for the Heady            ║
+║     pipelines, exportable as JSON or OpenMetrics text                         ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import math
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional, Any, Callable
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram.
+    Values are recorded in microseconds into buckets whose width grows with
+    magnitude, keeping ``significant_digits`` of relative precision at any
+    scale with O(1) recording and memory bounded by the value range.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._lock = threading.Lock()
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def record(self, value_ms: float):
+        """Record one latency sample in milliseconds."""
+        value_us = max(int(value_ms * 1000), 0)
+        shift = max(value_us.bit_length() - self.sub_bucket_bits, 0)
+        bucket = (value_us >> shift) << shift
+
+        with self._lock:
+            self._counts[bucket] = self._counts.get(bucket, 0) + 1
+            self.count += 1
+            self.total_us += value_us
+            if self.min_us is None or value_us < self.min_us:
+                self.min_us = value_us
+            if self.max_us is None or value_us > self.max_us:
+                self.max_us = value_us
+
+    def percentile(self, percentile: float) -> float:
+        """Highest value (ms) equivalent to the given percentile."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = max(math.ceil(self.count * percentile / 100.0), 1)
+            seen = 0
+            for bucket in sorted(self._counts):
+                seen += self._counts[bucket]
+                if seen >= target:
+                    shift = max(bucket.bit_length() - self.sub_bucket_bits, 0)
+                    highest = bucket + (1 << shift) - 1
+                    return min(highest, self.max_us) / 1000.0
+            return self.max_us / 1000.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Count, mean, extremes and p50/p95/p99 in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": (self.total_us / self.count / 1000.0) if self.count else 0.0,
+            "min_ms": (self.min_us or 0) / 1000.0,
+            "max_ms": (self.max_us or 0) / 1000.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99)
+        }
+
+
+class StageTracer:
+    """
+    Collects one span per pipeline stage and aggregates per-stage histograms.
+    Spans record start/end, duration, cache-hit flag and error; the most
+    recent ones are kept for inspection and listeners receive every span.
+    """
+
+    def __init__(self, namespace: str = "heady", max_spans: int = 1000):
+        self.namespace = namespace
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.cache_hits: Dict[str, int] = {}
+        self.recent_spans: deque = deque(maxlen=max_spans)
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str, **attributes):
+        """
+        Time a stage. The yielded dict may be updated inside the block, e.g.
+        ``span["cache_hit"] = True``; exceptions are recorded and re-raised.
+        """
+        record = {"stage": stage, "start": time.time(), "cache_hit": False, "error": None, **attributes}
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record["duration_ms"] = (time.perf_counter() - started) * 1000.0
+            record["end"] = record["start"] + record["duration_ms"] / 1000.0
+            self.record_span(record)
+
+    def record_span(self, record: Dict[str, Any]):
+        """Aggregate a finished span and hand it to listeners."""
+        stage = record["stage"]
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            if record.get("error"):
+                self.errors[stage] = self.errors.get(stage, 0) + 1
+            if record.get("cache_hit"):
+                self.cache_hits[stage] = self.cache_hits.get(stage, 0) + 1
+            self.recent_spans.append(record)
+        histogram.record(record["duration_ms"])
+
+        for listener in self.listeners:
+            try:
+                listener(record)
+            except Exception:
+                pass
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """Register a callback invoked with every finished span."""
+        self.listeners.append(listener)
+
+    def get_stage_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage latency summary with error and cache-hit counts."""
+        with self._lock:
+            stages = dict(self.histograms)
+        return {
+            stage: {
+                **histogram.summary(),
+                "errors": self.errors.get(stage, 0),
+                "cache_hits": self.cache_hits.get(stage, 0)
+            }
+            for stage, histogram in sorted(stages.items())
+        }
+
+    def get_recent_spans(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Most recent finished spans, oldest first."""
+        with self._lock:
+            return list(self.recent_spans)[-limit:]
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Dump stage metrics as JSON."""
+        return json.dumps({"namespace": self.namespace, "stages": self.get_stage_metrics()}, indent=indent)
+
+    def to_openmetrics(self) -> str:
+        """Dump stage metrics in OpenMetrics text exposition format."""
+        name = f"{self.namespace}_stage_latency_seconds"
+        lines = [
+            f"# TYPE {name} summary",
+            f"# UNIT {name} seconds",
+            f"# HELP {name} Pipeline stage latency."
+        ]
+        stage_metrics = self.get_stage_metrics()
+        for stage, metrics in stage_metrics.items():
+            for quantile, key in (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms")):
+                lines.append(f'{name}{{stage="{stage}",quantile="{quantile}"}} {metrics[key] / 1000.0}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {metrics["count"]}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {metrics["mean_ms"] * metrics["count"] / 1000.0}')
+
+        for family, key, help_text in (
+            ("stage_errors", "errors", "Pipeline stage failures."),
+            ("stage_cache_hits", "cache_hits", "Pipeline stages served from cache.")
+        ):
+            counter = f"{self.namespace}_{family}"
+            lines.append(f"# TYPE {counter} counter")
+            lines.append(f"# HELP {counter} {help_text}")
+            for stage, metrics in stage_metrics.items():
+                lines.append(f'{counter}_total{{stage="{stage}"}} {metrics[key]}')
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clear all spans and histograms."""
+        with self._lock:
+            self.histograms.clear()
+            self.errors.clear()
+            self.cache_hits.clear()
+            self.recent_spans.clear()
+
+
+def traced_stage(stage: str):
+    """Decorator recording a span for a pipeline stage method via ``self.tracer``."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, "tracer", None)
+            if tracer is None:
+                return func(self, *args, **kwargs)
+            with tracer.span(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,371 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyToolRunner.py                            ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      TOOL RUNNER - WARM WORKER PROCESS POOL                                   ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                              ║
+║     Long-lived interpreters with HeadyAcademy/Tools pre-imported; entry       ║
+║     functions are called directly, with timeouts and worker recycling         ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import io
+import os
+import sys
+import time
+import queue
+import threading
+import traceback
+import importlib.util
+import multiprocessing
+from pathlib import Path
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+
+# Entry functions tried in order when a call does not name one
+ENTRY_POINTS = (
+    "scan", "audit", "optimize", "visualize", "generate_doc", "brainstorm", "clean_sweep",
+    "generate_content", "hydrate_project", "learn_tool", "scan_github", "obfuscate_file",
+    "run_inference", "main"
+)
+
+# Captured stdout/stderr is truncated to keep results small
+OUTPUT_LIMIT = 64 * 1024
+
+
+def discover_tools(tools_dir: Path) -> Dict[str, str]:
+    """Tool name (file stem) -> module path, matching HeadyRegistry.discover_tools."""
+    return {
+        path.stem: str(path)
+        for path in sorted(Path(tools_dir).rglob("*.py"))
+        if not path.name.startswith('__')
+    }
+
+
+def _current_rss_kb() -> int:
+    """Resident set size of this process in KiB (0 when it cannot be read)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return 0
+
+
+def _load_module(name: str, path: str, modules: Dict[str, Any]):
+    if name in modules:
+        return modules[name]
+    tool_dir = str(Path(path).parent)
+    if tool_dir not in sys.path:
+        sys.path.insert(0, tool_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    modules[name] = module
+    return module
+
+
+def _worker_main(conn, tools: Dict[str, str], preload: Optional[List[str]]):
+    """Worker process loop: pre-import tools, then serve (tool, entry, args, kwargs) calls."""
+    modules: Dict[str, Any] = {}
+    import_errors: Dict[str, str] = {}
+    for name in (preload if preload is not None else tools):
+        if name in tools:
+            try:
+                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                    _load_module(name, tools[name], modules)
+            except BaseException as e:
+                import_errors[name] = f"{type(e).__name__}: {e}"
+    conn.send({"ready": True, "pid": os.getpid(), "loaded": sorted(modules), "import_errors": import_errors})
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        tool, entry, args, kwargs = message
+        stdout, stderr = io.StringIO(), io.StringIO()
+        started = time.perf_counter()
+        response = {"success": False, "value": None, "error": None, "entry": entry}
+        try:
+            if tool not in tools:
+                raise LookupError(f"Unknown tool '{tool}'")
+            module = _load_module(tool, tools[tool], modules)
+            if entry is None:
+                entry = next((name for name in ENTRY_POINTS if callable(getattr(module, name, None))), None)
+                if entry is None:
+                    raise LookupError(f"Tool '{tool}' has no entry function")
+            response["entry"] = entry
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                value = getattr(module, entry)(*args, **kwargs)
+            response["success"] = True
+            response["value"] = value
+        except SystemExit as e:
+            response["success"] = e.code in (None, 0)
+            if not response["success"]:
+                response["error"] = f"SystemExit: {e.code}"
+        except BaseException as e:
+            response["error"] = f"{type(e).__name__}: {e}"
+            stderr.write(traceback.format_exc())
+
+        response["stdout"] = stdout.getvalue()[-OUTPUT_LIMIT:]
+        response["stderr"] = stderr.getvalue()[-OUTPUT_LIMIT:]
+        response["duration_ms"] = (time.perf_counter() - started) * 1000
+        response["rss_kb"] = _current_rss_kb()
+        try:
+            conn.send(response)
+        except Exception as e:
+            # Return values that cannot be pickled are reported as their repr
+            response["value"] = repr(response["value"])
+            response["error"] = response["error"] or f"Result not picklable: {e}"
+            conn.send(response)
+
+
+@dataclass
+class ToolResult:
+    """Structured outcome of one tool call."""
+    tool: str
+    entry: Optional[str]
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+    stdout: str = ""
+    stderr: str = ""
+    duration_ms: float = 0.0
+    overhead_ms: float = 0.0
+    worker_pid: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Any
+    pid: int
+    calls: int = 0
+    rss_kb: int = 0
+    import_errors: Dict[str, str] = field(default_factory=dict)
+
+
+class ToolRunner:
+    """
+    Pool of warm worker processes for HeadyAcademy tools.
+
+    Each worker is a spawned interpreter that imports the tool modules once
+    and then calls their entry functions directly, so a call costs a pipe
+    round trip instead of interpreter startup plus imports. A call that
+    overruns its timeout kills its worker (a replacement is spawned on
+    demand); workers are also recycled after ``max_calls_per_worker`` calls
+    or once their RSS exceeds ``max_rss_mb``. Safe to use from several
+    threads: each call holds one worker exclusively.
+    """
+
+    def __init__(self, tools_dir: Path, workers: int = 2, max_calls_per_worker: int = 200,
+                 max_rss_mb: float = 512, call_timeout: float = 30.0, preload: Optional[List[str]] = None,
+                 start_timeout: float = 60.0):
+        self.tools_dir = Path(tools_dir)
+        self.tools = discover_tools(self.tools_dir)
+        self.max_workers = max(1, workers)
+        self.max_calls_per_worker = max_calls_per_worker
+        self.max_rss_kb = max_rss_mb * 1024 if max_rss_mb else None
+        self.call_timeout = call_timeout
+        self.preload = preload
+        self.start_timeout = start_timeout
+
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._spawned = 0
+        self._closed = False
+        self.stats = {"calls": 0, "failures": 0, "timeouts": 0, "workers_started": 0, "workers_recycled": 0}
+
+    @classmethod
+    def from_policies(cls, tools_dir: Path, policies: Dict[str, Any]) -> "ToolRunner":
+        config = policies.get("toolRunner") or {}
+        return cls(
+            tools_dir,
+            workers=config.get("workers", 2),
+            max_calls_per_worker=config.get("maxCallsPerWorker", 200),
+            max_rss_mb=config.get("maxRssMb", 512),
+            call_timeout=config.get("callTimeoutMs", 30000) / 1000
+        )
+
+    def _count(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self.stats[key] += 1
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self.tools, self.preload),
+            name="heady-tool-worker", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        if not parent_conn.poll(self.start_timeout):
+            process.kill()
+            raise RuntimeError("Tool worker failed to start")
+        hello = parent_conn.recv()
+        self._count("workers_started")
+        return _Worker(process, parent_conn, hello["pid"], import_errors=hello["import_errors"])
+
+    def _acquire(self) -> _Worker:
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("ToolRunner is closed")
+                try:
+                    return self._idle.get_nowait()
+                except queue.Empty:
+                    spawn = self._spawned < self.max_workers
+                    if spawn:
+                        self._spawned += 1
+            if spawn:
+                try:
+                    return self._spawn()
+                except BaseException:
+                    with self._lock:
+                        self._spawned -= 1
+                    raise
+            # All workers busy; a retired worker frees a spawn slot rather than an idle one
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _release(self, worker: _Worker, retire: bool = False):
+        worn_out = worker.calls >= self.max_calls_per_worker or \
+            (self.max_rss_kb is not None and worker.rss_kb > self.max_rss_kb)
+        if not (retire or worn_out or self._closed or not worker.process.is_alive()):
+            self._idle.put(worker)
+            return
+        if worn_out and not retire:
+            self._count("workers_recycled")
+        # Stop the old worker and warm its replacement off the caller's path
+        threading.Thread(target=self._replace, args=(worker, retire), daemon=True).start()
+
+    def _replace(self, worker: _Worker, kill: bool):
+        self._stop(worker, kill=kill)
+        replacement = None
+        if not self._closed:
+            try:
+                replacement = self._spawn()
+            except Exception as e:
+                print(f"[WARN] ToolRunner: could not start a replacement worker: {e}")
+        with self._lock:
+            if replacement is not None and not self._closed:
+                self._idle.put(replacement)
+                return
+            self._spawned -= 1
+        if replacement is not None:
+            self._stop(replacement)
+
+    @staticmethod
+    def _stop(worker: _Worker, kill: bool = False):
+        try:
+            if kill:
+                worker.process.kill()
+            else:
+                worker.conn.send(None)
+            worker.process.join(timeout=5)
+        except (OSError, ValueError):
+            pass
+        finally:
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+
+    def run(self, tool: str, *args, entry: Optional[str] = None, timeout: Optional[float] = None,
+            **kwargs) -> ToolResult:
+        """Call a tool's entry function (first of ENTRY_POINTS it defines unless ``entry`` is given)."""
+        started = time.perf_counter()
+        self._count("calls")
+        if tool not in self.tools:
+            self._count("failures")
+            return ToolResult(tool, entry, False, error=f"Unknown tool '{tool}'")
+
+        timeout = self.call_timeout if timeout is None else timeout
+        worker = self._acquire()
+        worker.calls += 1
+        try:
+            worker.conn.send((tool, entry, args, kwargs))
+            if not worker.conn.poll(timeout):
+                self._count("timeouts", "failures")
+                self._release(worker, retire=True)
+                return ToolResult(tool, entry, False, error=f"Timed out after {timeout:g}s",
+                                  duration_ms=(time.perf_counter() - started) * 1000, worker_pid=worker.pid)
+            response = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            self._count("failures")
+            self._release(worker, retire=True)
+            return ToolResult(tool, entry, False, error=f"Worker died: {e}", worker_pid=worker.pid)
+
+        worker.rss_kb = response.get("rss_kb", 0)
+        self._release(worker)
+        if not response["success"]:
+            self._count("failures")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return ToolResult(
+            tool, response["entry"], response["success"], value=response["value"], error=response["error"],
+            stdout=response["stdout"], stderr=response["stderr"], duration_ms=elapsed_ms,
+            overhead_ms=max(0.0, elapsed_ms - response["duration_ms"]), worker_pid=worker.pid
+        )
+
+    def warm(self) -> int:
+        """Start every worker now instead of on first use; returns the number of idle workers."""
+        workers = []
+        while True:
+            with self._lock:
+                if self._spawned >= self.max_workers:
+                    break
+            workers.append(self._acquire())
+        for worker in workers:
+            self._release(worker)
+        return self._idle.qsize()
+
+    def list_tools(self) -> List[str]:
+        return sorted(self.tools)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "workers_alive": self._spawned, "workers_idle": self._idle.qsize()}
+
+    def close(self):
+        """Stop all idle workers; busy workers stop when their call returns."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._stop(worker)
+            with self._lock:
+                self._spawned -= 1
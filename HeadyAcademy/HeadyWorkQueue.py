@@ -0,0 +1,800 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyWorkQueue.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      WORK QUEUE - PLAN STEPS SHARED ACROSS CONDUCTOR NODES                    ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━           ║
+║     The conductor enqueues plan steps on a durable queue; worker nodes        ║
+║     lease, execute and ack them under a visibility timeout, and results       ║
+║     flow back to the orchestration that asked. Brokers: SQLite (processes     ║
+║     on one machine) and Redis (several machines)                              ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import argparse
+import threading
+from pathlib import Path
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from HeadyCodec import json_default
+from HeadyExecutor import ExecutionEngine, PlanStep, RetryPolicy, StepResult
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_QUEUE = "conductor"
+DEFAULT_VISIBILITY_TIMEOUT = 30.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RESULT_TIMEOUT = 120.0
+# A worker counts as active while its last heartbeat is this recent
+WORKER_TTL = 15.0
+# Longest an idle worker or a waiting SQLite caller sleeps between polls
+MAX_POLL_INTERVAL = 0.5
+
+QUEUED, LEASED, DONE, FAILED, CANCELLED = "queued", "leased", "done", "failed", "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+STATUSES = (QUEUED, LEASED, *FINISHED)
+# Redis keeps a finished job this long (seconds) unless its batch is forgotten first
+FINISHED_JOB_TTL = 86400
+
+
+@dataclass
+class Job:
+    id: str
+    queue: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    batch: Optional[str] = None
+    worker: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    enqueued_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class Broker(ABC):
+    """
+    Durable job queue interface.
+
+    lease() hands a job to one worker for visibility_timeout seconds; a
+    worker that dies without ack()/fail() loses it to the next lease once
+    that passes, and each lease counts an attempt. ack() and fail() only
+    take effect for the worker that currently holds the lease. stats()
+    counts a queue's jobs under every status in STATUSES, zeros included.
+    """
+
+    @abstractmethod
+    def enqueue(self, queue: str, payload: Dict[str, Any], batch: str = None,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> str:
+        ...
+
+    @abstractmethod
+    def lease(self, queue: str, worker: str, visibility_timeout: float) -> Optional[Job]:
+        ...
+
+    @abstractmethod
+    def extend(self, job_id: str, worker: str, visibility_timeout: float) -> bool:
+        ...
+
+    @abstractmethod
+    def ack(self, job_id: str, worker: str, result: Any) -> bool:
+        ...
+
+    @abstractmethod
+    def fail(self, job_id: str, worker: str, error: str, retry_delay: float = 0.0) -> bool:
+        """Requeue after retry_delay while attempts remain, else mark the job failed."""
+
+    @abstractmethod
+    def cancel(self, job_ids: List[str]):
+        ...
+
+    @abstractmethod
+    def wait(self, batch: str, job_ids: List[str], timeout: float) -> Dict[str, Job]:
+        """The jobs among job_ids that have finished, waiting up to timeout for at least one."""
+
+    @abstractmethod
+    def forget(self, batch: str):
+        """Drop a batch's jobs once its results have been collected."""
+
+    @abstractmethod
+    def heartbeat(self, queue: str, worker: str, info: Dict[str, Any]):
+        ...
+
+    @abstractmethod
+    def active_workers(self, queue: str) -> Dict[str, Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def stats(self, queue: str) -> Dict[str, int]:
+        ...
+
+    def close(self):
+        pass
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    batch TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires REAL,
+    worker TEXT,
+    result TEXT,
+    error TEXT,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (queue, status, available_at);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch);
+CREATE TABLE IF NOT EXISTS workers (
+    queue TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    info TEXT NOT NULL,
+    seen REAL NOT NULL,
+    PRIMARY KEY (queue, worker)
+);
+"""
+
+
+class SQLiteBroker(Broker):
+    """Queue in one SQLite file in WAL mode; any number of processes on the machine may share it."""
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.clock = clock
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(SQLITE_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _job(row) -> Job:
+        (job_id, queue, batch, payload, status, attempts, max_attempts,
+         worker, result, error, enqueued_at, finished_at) = row
+        return Job(str(job_id), queue, json.loads(payload), status, attempts, max_attempts, batch, worker,
+                   json.loads(result) if result is not None else None, error, enqueued_at, finished_at)
+
+    _COLUMNS = ("id, queue, batch, payload, status, attempts, max_attempts, "
+                "worker, result, error, enqueued_at, finished_at")
+
+    def enqueue(self, queue, payload, batch=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        now = self.clock()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (queue, batch, payload, status, max_attempts, available_at, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (queue, batch, json.dumps(payload, default=json_default), QUEUED, max_attempts, now, now))
+        return str(cursor.lastrowid)
+
+    def lease(self, queue, worker, visibility_timeout):
+        now = self.clock()
+        with self._transaction() as conn:
+            while True:
+                row = conn.execute(
+                    f"SELECT {self._COLUMNS} FROM jobs WHERE queue = ? AND "
+                    "((status = ? AND available_at <= ?) OR (status = ? AND lease_expires <= ?)) "
+                    "ORDER BY available_at, id LIMIT 1", (queue, QUEUED, now, LEASED, now)).fetchone()
+                if row is None:
+                    return None
+                job = self._job(row)
+                if job.status == LEASED and job.attempts >= job.max_attempts:
+                    # Its last worker vanished on the final attempt
+                    conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                                 (FAILED, f"lease expired after {job.attempts} attempt(s)", now, job.id))
+                    continue
+                conn.execute("UPDATE jobs SET status = ?, attempts = attempts + 1, lease_expires = ?, worker = ? "
+                             "WHERE id = ?", (LEASED, now + visibility_timeout, worker, job.id))
+                job.status, job.attempts, job.worker = LEASED, job.attempts + 1, worker
+                return job
+
+    def extend(self, job_id, worker, visibility_timeout):
+        with self._transaction() as conn:
+            return conn.execute("UPDATE jobs SET lease_expires = ? WHERE id = ? AND status = ? AND worker = ?",
+                                (self.clock() + visibility_timeout, job_id, LEASED, worker)).rowcount == 1
+
+    def ack(self, job_id, worker, result):
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, finished_at = ? WHERE id = ? AND status = ? AND worker = ?",
+                (DONE, json.dumps(result, default=json_default), self.clock(), job_id, LEASED, worker)).rowcount == 1
+
+    def fail(self, job_id, worker, error, retry_delay=0.0):
+        now = self.clock()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = ? AND worker = ?",
+                               (job_id, LEASED, worker)).fetchone()
+            if row is None:
+                return False
+            if row[0] < row[1]:
+                conn.execute("UPDATE jobs SET status = ?, error = ?, available_at = ?, worker = NULL WHERE id = ?",
+                             (QUEUED, error, now + retry_delay, job_id))
+            else:
+                conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                             (FAILED, error, now, job_id))
+            return True
+
+    def cancel(self, job_ids):
+        with self._transaction() as conn:
+            conn.executemany("UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status IN (?, ?)",
+                             [(CANCELLED, self.clock(), job_id, QUEUED, LEASED) for job_id in job_ids])
+
+    def wait(self, batch, job_ids, timeout):
+        deadline = time.monotonic() + timeout
+        interval = 0.01
+        placeholders = ",".join("?" * len(job_ids))
+        while True:
+            rows = self._connection().execute(
+                f"SELECT {self._COLUMNS} FROM jobs WHERE id IN ({placeholders}) AND status IN (?, ?, ?)",
+                (*job_ids, *FINISHED)).fetchall()
+            remaining = deadline - time.monotonic()
+            if rows or remaining <= 0:
+                return {str(row[0]): self._job(row) for row in rows}
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    def forget(self, batch):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM jobs WHERE batch = ?", (batch,))
+
+    def heartbeat(self, queue, worker, info):
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO workers (queue, worker, info, seen) VALUES (?, ?, ?, ?)",
+                         (queue, worker, json.dumps(info), self.clock()))
+
+    def active_workers(self, queue):
+        rows = self._connection().execute("SELECT worker, info FROM workers WHERE queue = ? AND seen >= ?",
+                                          (queue, self.clock() - WORKER_TTL)).fetchall()
+        return {worker: json.loads(info) for worker, info in rows}
+
+    def stats(self, queue):
+        rows = self._connection().execute("SELECT status, COUNT(*) FROM jobs WHERE queue = ? GROUP BY status",
+                                          (queue,)).fetchall()
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update(rows)
+        return counts
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# Redis layout under a key prefix P:
+#   P:seq                 job id counter
+#   P:job:<id>            hash with the job's fields
+#   P:ready:<queue>       zset of queued job ids scored by available_at
+#   P:leased:<queue>      zset of leased job ids scored by lease expiry
+#   P:batch:<batch>       set of a batch's job ids
+#   P:done:<batch>        list of finished job ids, for blocking waits
+#   P:finished:<queue>    zset of finished job ids scored by finish time, for stats
+#   P:workers:<queue>     hash of worker -> {"info":..., "seen":...}
+# Every state change is a Lua script on server time, so leases are atomic and
+# machines with skewed clocks agree on expiry.
+_REDIS_NOW = "local t = redis.call('TIME') local now = tonumber(t[1]) + tonumber(t[2]) / 1000000 "
+_REDIS_FINISH = (
+    "local function finish(key, id, status, field, value, now) "
+    "  redis.call('HSET', key, 'status', status, field, value, 'finished_at', now) "
+    f"  redis.call('EXPIRE', key, {FINISHED_JOB_TTL}) "
+    "  redis.call('ZADD', ARGV[1] .. 'finished:' .. redis.call('HGET', key, 'queue'), now, id) "
+    "  local batch = redis.call('HGET', key, 'batch') "
+    "  if batch and batch ~= '' then redis.call('RPUSH', ARGV[1] .. 'done:' .. batch, id) end "
+    "end "
+)
+REDIS_SCRIPTS = {
+    # KEYS: ready ; ARGV: prefix, queue, batch, payload, max_attempts
+    "enqueue": _REDIS_NOW + (
+        "local id = tostring(redis.call('INCR', ARGV[1] .. 'seq')) "
+        "redis.call('HSET', ARGV[1] .. 'job:' .. id, 'queue', ARGV[2], 'batch', ARGV[3], 'payload', ARGV[4], "
+        "  'status', 'queued', 'attempts', 0, 'max_attempts', ARGV[5], 'enqueued_at', now) "
+        "redis.call('ZADD', KEYS[1], now, id) "
+        "if ARGV[3] ~= '' then redis.call('SADD', ARGV[1] .. 'batch:' .. ARGV[3], id) end "
+        "return id"
+    ),
+    # KEYS: ready, leased ; ARGV: prefix, worker, visibility_timeout
+    "lease": _REDIS_NOW + _REDIS_FINISH + (
+        "for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)) do "
+        "  redis.call('ZREM', KEYS[2], id) "
+        "  local key = ARGV[1] .. 'job:' .. id "
+        "  local attempts = tonumber(redis.call('HGET', key, 'attempts')) "
+        "  if attempts >= tonumber(redis.call('HGET', key, 'max_attempts')) then "
+        "    finish(key, id, 'failed', 'error', 'lease expired after ' .. attempts .. ' attempt(s)', now) "
+        "  else "
+        "    redis.call('HSET', key, 'status', 'queued') "
+        "    redis.call('ZADD', KEYS[1], now, id) "
+        "  end "
+        "end "
+        "local ready = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'LIMIT', 0, 1) "
+        "if #ready == 0 then return false end "
+        "local id = ready[1] "
+        "local key = ARGV[1] .. 'job:' .. id "
+        "redis.call('ZREM', KEYS[1], id) "
+        "redis.call('HINCRBY', key, 'attempts', 1) "
+        "redis.call('HSET', key, 'status', 'leased', 'worker', ARGV[2]) "
+        "redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), id) "
+        "return id"
+    ),
+    # KEYS: leased ; ARGV: prefix, id, worker, visibility_timeout
+    "extend": _REDIS_NOW + (
+        "local key = ARGV[1] .. 'job:' .. ARGV[2] "
+        "if redis.call('HGET', key, 'status') ~= 'leased' or redis.call('HGET', key, 'worker') ~= ARGV[3] then "
+        "  return 0 end "
+        "redis.call('ZADD', KEYS[1], now + tonumber(ARGV[4]), ARGV[2]) "
+        "return 1"
+    ),
+    # KEYS: leased ; ARGV: prefix, id, worker, result
+    "ack": _REDIS_NOW + _REDIS_FINISH + (
+        "local key = ARGV[1] .. 'job:' .. ARGV[2] "
+        "if redis.call('HGET', key, 'status') ~= 'leased' or redis.call('HGET', key, 'worker') ~= ARGV[3] then "
+        "  return 0 end "
+        "redis.call('ZREM', KEYS[1], ARGV[2]) "
+        "finish(key, ARGV[2], 'done', 'result', ARGV[4], now) "
+        "return 1"
+    ),
+    # KEYS: ready, leased ; ARGV: prefix, id, worker, error, retry_delay
+    "fail": _REDIS_NOW + _REDIS_FINISH + (
+        "local key = ARGV[1] .. 'job:' .. ARGV[2] "
+        "if redis.call('HGET', key, 'status') ~= 'leased' or redis.call('HGET', key, 'worker') ~= ARGV[3] then "
+        "  return 0 end "
+        "redis.call('ZREM', KEYS[2], ARGV[2]) "
+        "if tonumber(redis.call('HGET', key, 'attempts')) < tonumber(redis.call('HGET', key, 'max_attempts')) then "
+        "  redis.call('HSET', key, 'status', 'queued', 'worker', '', 'error', ARGV[4]) "
+        "  redis.call('ZADD', KEYS[1], now + tonumber(ARGV[5]), ARGV[2]) "
+        "else "
+        "  finish(key, ARGV[2], 'failed', 'error', ARGV[4], now) "
+        "end "
+        "return 1"
+    ),
+    # KEYS: ready, leased ; ARGV: prefix, id...
+    "cancel": _REDIS_NOW + _REDIS_FINISH + (
+        "for i = 2, #ARGV do "
+        "  local key = ARGV[1] .. 'job:' .. ARGV[i] "
+        "  local status = redis.call('HGET', key, 'status') "
+        "  if status == 'queued' or status == 'leased' then "
+        "    redis.call('ZREM', KEYS[1], ARGV[i]) "
+        "    redis.call('ZREM', KEYS[2], ARGV[i]) "
+        "    finish(key, ARGV[i], 'cancelled', 'error', 'cancelled', now) "
+        "  end "
+        "end "
+        "return 1"
+    ),
+}
+
+
+class RedisBroker(Broker):
+    """
+    Queue in Redis (the registry's `redis` service), shared by conductor
+    nodes on any machine that can reach it. Requires the redis package.
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "heady:wq"):
+        import redis
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix + ":"
+        self.scripts = {name: self.client.register_script(source) for name, source in REDIS_SCRIPTS.items()}
+
+    def _keys(self, queue: str) -> List[str]:
+        return [f"{self.prefix}ready:{queue}", f"{self.prefix}leased:{queue}"]
+
+    def _queue_of(self, job_id: str) -> str:
+        return self.client.hget(f"{self.prefix}job:{job_id}", "queue") or DEFAULT_QUEUE
+
+    def _job(self, job_id: str, fields: Dict[str, str]) -> Job:
+        result = fields.get("result")
+        return Job(job_id, fields.get("queue"), json.loads(fields.get("payload") or "null"), fields.get("status"),
+                   int(fields.get("attempts") or 0), int(fields.get("max_attempts") or 0),
+                   fields.get("batch") or None, fields.get("worker") or None,
+                   json.loads(result) if result else None, fields.get("error") or None,
+                   float(fields["enqueued_at"]) if fields.get("enqueued_at") else None,
+                   float(fields["finished_at"]) if fields.get("finished_at") else None)
+
+    def enqueue(self, queue, payload, batch=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        return str(self.scripts["enqueue"](keys=self._keys(queue)[:1], args=[
+            self.prefix, queue, batch or "", json.dumps(payload, default=json_default), max_attempts]))
+
+    def lease(self, queue, worker, visibility_timeout):
+        job_id = self.scripts["lease"](keys=self._keys(queue), args=[self.prefix, worker, visibility_timeout])
+        if not job_id:
+            return None
+        return self._job(str(job_id), self.client.hgetall(f"{self.prefix}job:{job_id}"))
+
+    def extend(self, job_id, worker, visibility_timeout):
+        keys = self._keys(self._queue_of(job_id))[1:]
+        return self.scripts["extend"](keys=keys, args=[self.prefix, job_id, worker, visibility_timeout]) == 1
+
+    def ack(self, job_id, worker, result):
+        keys = self._keys(self._queue_of(job_id))[1:]
+        return self.scripts["ack"](keys=keys, args=[
+            self.prefix, job_id, worker, json.dumps(result, default=json_default)]) == 1
+
+    def fail(self, job_id, worker, error, retry_delay=0.0):
+        keys = self._keys(self._queue_of(job_id))
+        return self.scripts["fail"](keys=keys, args=[self.prefix, job_id, worker, error, retry_delay]) == 1
+
+    def cancel(self, job_ids):
+        by_queue: Dict[str, List[str]] = {}
+        for job_id in job_ids:
+            by_queue.setdefault(self._queue_of(job_id), []).append(job_id)
+        for queue, ids in by_queue.items():
+            self.scripts["cancel"](keys=self._keys(queue), args=[self.prefix, *ids])
+
+    def _finished(self, job_ids: List[str]) -> Dict[str, Job]:
+        pipe = self.client.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(f"{self.prefix}job:{job_id}")
+        return {job_id: self._job(job_id, fields) for job_id, fields in zip(job_ids, pipe.execute())
+                if fields.get("status") in FINISHED}
+
+    def wait(self, batch, job_ids, timeout):
+        finished = self._finished(job_ids)
+        if finished or timeout <= 0:
+            return finished
+        # Workers push finished ids onto the batch's list; block on it instead of polling
+        if self.client.blpop([f"{self.prefix}done:{batch}"], timeout=max(1, int(timeout + 0.999))):
+            finished = self._finished(job_ids)
+        return finished
+
+    def forget(self, batch):
+        batch_key = f"{self.prefix}batch:{batch}"
+        ids = list(self.client.smembers(batch_key))
+        queues = [self._queue_of(job_id) for job_id in ids]
+        pipe = self.client.pipeline(transaction=False)
+        for job_id, queue in zip(ids, queues):
+            pipe.zrem(f"{self.prefix}finished:{queue}", job_id)
+        pipe.delete(batch_key, f"{self.prefix}done:{batch}", *[f"{self.prefix}job:{job_id}" for job_id in ids])
+        pipe.execute()
+
+    def heartbeat(self, queue, worker, info):
+        self.client.hset(f"{self.prefix}workers:{queue}", worker,
+                         json.dumps({"info": info, "seen": self.client.time()[0]}))
+
+    def active_workers(self, queue):
+        now = self.client.time()[0]
+        workers = {}
+        for worker, value in self.client.hgetall(f"{self.prefix}workers:{queue}").items():
+            entry = json.loads(value)
+            if entry["seen"] >= now - WORKER_TTL:
+                workers[worker] = entry["info"]
+        return workers
+
+    def stats(self, queue):
+        ready, leased = self._keys(queue)
+        finished_key = f"{self.prefix}finished:{queue}"
+        # Drop ids whose job hash has expired, then count the rest by their status
+        self.client.zremrangebyscore(finished_key, "-inf", self.client.time()[0] - FINISHED_JOB_TTL)
+        pipe = self.client.pipeline(transaction=False)
+        for job_id in self.client.zrange(finished_key, 0, -1):
+            pipe.hget(f"{self.prefix}job:{job_id}", "status")
+        counts = dict.fromkeys(STATUSES, 0)
+        for status in pipe.execute():
+            if status in FINISHED:
+                counts[status] += 1
+        counts[QUEUED] = self.client.zcard(ready)
+        counts[LEASED] = self.client.zcard(leased)
+        return counts
+
+    def close(self):
+        self.client.close()
+
+
+def broker_from_policies(policies: Dict[str, Any], root_path: Path = None) -> Broker:
+    """The broker configured in the workQueue section of resource-policies.yaml."""
+    settings = policies.get("workQueue") or {}
+    if settings.get("broker", "sqlite") == "redis":
+        return RedisBroker(settings.get("redisUrl", "redis://localhost:6379/0"))
+    path = Path(settings.get("sqlitePath", ".heady/workqueue.db"))
+    return SQLiteBroker(path if path.is_absolute() else Path(root_path or DEFAULT_ROOT) / path)
+
+
+class QueueEngine:
+    """
+    Drop-in for ExecutionEngine that runs plan steps on worker nodes.
+
+    Steps are enqueued as their depends_on complete (a step whose
+    dependency fails is skipped, as in ExecutionEngine) and results are
+    collected from the broker. Retries happen on the workers, with
+    backoff; a step not finished within result_timeout is cancelled and
+    reported as a timeout. Each step needs a JSON payload describing it.
+    """
+
+    def __init__(self, broker: Broker, queue: str = DEFAULT_QUEUE, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 result_timeout: float = DEFAULT_RESULT_TIMEOUT):
+        self.broker = broker
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.result_timeout = result_timeout
+
+    @classmethod
+    def from_policies(cls, policies: Dict[str, Any], root_path: Path = None) -> "QueueEngine":
+        settings = policies.get("workQueue") or {}
+        return cls(
+            broker_from_policies(policies, root_path),
+            queue=settings.get("queue", DEFAULT_QUEUE),
+            max_attempts=settings.get("maxAttempts", DEFAULT_MAX_ATTEMPTS),
+            result_timeout=settings.get("resultTimeoutMs", DEFAULT_RESULT_TIMEOUT * 1000) / 1000
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """Worker slots currently serving the queue."""
+        return sum(info.get("concurrency", 1) for info in self.broker.active_workers(self.queue).values())
+
+    def run(self, steps: List[PlanStep]) -> List[StepResult]:
+        """Run steps on the queue and return their results in step order."""
+        by_id = {step.id: step for step in steps}
+        if len(by_id) != len(steps):
+            raise ValueError("Duplicate step ids in plan")
+        for step in steps:
+            if step.payload is None:
+                raise ValueError(f"Step '{step.id}' has no payload to send to workers")
+            missing = [dep for dep in step.depends_on if dep not in by_id]
+            if missing:
+                raise ValueError(f"Step '{step.id}' depends on unknown steps: {missing}")
+        ExecutionEngine._check_acyclic(by_id)
+
+        batch = uuid.uuid4().hex
+        results: Dict[str, StepResult] = {}
+        in_flight: Dict[str, str] = {}
+        deadlines: Dict[str, float] = {}
+        waiting = [step.id for step in steps]
+        try:
+            while len(results) < len(steps):
+                still_waiting = []
+                for step_id in waiting:
+                    deps = [results.get(dep) for dep in by_id[step_id].depends_on]
+                    if any(dep is not None and not dep.success for dep in deps):
+                        results[step_id] = StepResult(step_id, "skipped", error="dependency did not complete")
+                    elif all(dep is not None for dep in deps):
+                        step = by_id[step_id]
+                        attempts = step.max_retries + 1 if step.max_retries is not None else self.max_attempts
+                        job_id = self.broker.enqueue(self.queue, step.payload, batch=batch, max_attempts=attempts)
+                        in_flight[job_id] = step_id
+                        deadlines[job_id] = time.monotonic() + self.result_timeout
+                    else:
+                        still_waiting.append(step_id)
+                waiting = still_waiting
+                if not in_flight:
+                    continue
+
+                wait_for = max(0.0, min(deadlines[job_id] for job_id in in_flight) - time.monotonic())
+                for job_id, job in self.broker.wait(batch, list(in_flight), min(wait_for, 1.0)).items():
+                    step_id = in_flight.pop(job_id)
+                    results[step_id] = self._step_result(step_id, job)
+                expired = [job_id for job_id in in_flight if time.monotonic() >= deadlines[job_id]]
+                if expired:
+                    self.broker.cancel(expired)
+                    for job_id in expired:
+                        step_id = in_flight.pop(job_id)
+                        results[step_id] = StepResult(step_id, "timeout",
+                                                      error=f"no result within {self.result_timeout:g}s")
+        finally:
+            if in_flight:
+                self.broker.cancel(list(in_flight))
+            self.broker.forget(batch)
+        return [results[step.id] for step in steps]
+
+    @staticmethod
+    def _step_result(step_id: str, job: Job) -> StepResult:
+        duration_ms = (job.finished_at - job.enqueued_at) * 1000 if job.finished_at and job.enqueued_at else 0.0
+        if job.status == DONE:
+            value = job.result
+            failed = isinstance(value, dict) and value.get("success") is False
+            return StepResult(step_id, "failed" if failed else "completed", result=value,
+                              error=value.get("error") if failed else None, attempts=job.attempts,
+                              duration_ms=duration_ms)
+        return StepResult(step_id, "failed", error=job.error or job.status, attempts=job.attempts,
+                          duration_ms=duration_ms)
+
+    def shutdown(self, wait: bool = True):
+        self.broker.close()
+
+
+class QueueWorker:
+    """
+    Leases jobs from a queue and runs them through handler(payload).
+
+    Runs concurrency threads. While a job runs its lease is extended every
+    third of the visibility timeout, so only a dead worker loses its jobs.
+    A handler that raises is retried with the policy backoff until the
+    job's attempts are used up; a returned value is acked as the result.
+    """
+
+    def __init__(self, broker: Broker, handler: Callable[[Dict[str, Any]], Any], queue: str = DEFAULT_QUEUE,
+                 concurrency: int = 1, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+                 retry_policy: RetryPolicy = None, worker_id: str = None, profile: str = None):
+        self.broker = broker
+        self.handler = handler
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.profile = profile
+        self.stats = {"completed": 0, "failed": 0, "lost_leases": 0}
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> "QueueWorker":
+        self._stop.clear()
+        self.broker.heartbeat(self.queue, self.worker_id, self._info())
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._loop, name=f"heady-queue-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        threading.Thread(target=self._heartbeat_loop, name="heady-queue-heartbeat", daemon=True).start()
+        return self
+
+    def stop(self, wait: bool = True):
+        """Stop leasing; running jobs finish (and are acked) first when wait is set."""
+        self._stop.set()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+    def run_forever(self):
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            print(f"\n HeadyWorkQueue: worker {self.worker_id} draining")
+        self.stop()
+
+    def _info(self) -> Dict[str, Any]:
+        return {"concurrency": self.concurrency, "profile": self.profile, "host": socket.gethostname()}
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(WORKER_TTL / 3):
+            try:
+                self.broker.heartbeat(self.queue, self.worker_id, self._info())
+            except Exception as e:
+                print(f"[WARN] HeadyWorkQueue: heartbeat failed: {e}")
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _loop(self):
+        idle = 0.01
+        while not self._stop.is_set():
+            try:
+                job = self.broker.lease(self.queue, self.worker_id, self.visibility_timeout)
+            except Exception as e:
+                print(f"[WARN] HeadyWorkQueue: lease failed: {e}")
+                job = None
+            if job is None:
+                self._stop.wait(idle)
+                idle = min(idle * 2, MAX_POLL_INTERVAL)
+                continue
+            idle = 0.01
+            self._execute(job)
+
+    def _keep_lease(self, job: Job, done: threading.Event):
+        while not done.wait(self.visibility_timeout / 3):
+            if not self.broker.extend(job.id, self.worker_id, self.visibility_timeout):
+                return
+
+    def _execute(self, job: Job):
+        done = threading.Event()
+        keeper = threading.Thread(target=self._keep_lease, args=(job, done), daemon=True)
+        keeper.start()
+        try:
+            result = self.handler(job.payload)
+        except Exception as e:
+            done.set()
+            error = f"{type(e).__name__}: {e}"
+            if not self.broker.fail(job.id, self.worker_id, error, self.retry_policy.delay(job.attempts)):
+                self._count("lost_leases")
+            self._count("failed")
+            return
+        done.set()
+        if self.broker.ack(job.id, self.worker_id, result):
+            self._count("completed")
+        else:
+            # The lease expired and another worker owns the job now
+            self._count("lost_leases")
+
+
+def conductor_handler(conductor) -> Callable[[Dict[str, Any]], Any]:
+    """Handler that runs plan-step payloads ({"kind", "name"}) on a local conductor."""
+    return lambda payload: conductor.run_plan_entry(payload["kind"], payload["name"])
+
+
+def node_profile(root_path: Path = None) -> Dict[str, Any]:
+    """This machine's node_profile from PROJECT_STATE.json (written by scripts/ops/profile_node.py)."""
+    try:
+        with open(Path(root_path or DEFAULT_ROOT) / "PROJECT_STATE.json", 'r') as f:
+            return json.load(f).get("node_profile") or {}
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HeadyConductor work-queue worker node")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT), help="Repository root")
+    parser.add_argument("--concurrency", type=int, help="Jobs run at once (default: node profile's parallel_tasks)")
+    parser.add_argument("--stats", action="store_true", help="Show queue depth and active workers, then exit")
+    args = parser.parse_args()
+
+    from HeadyExecutor import load_resource_policies
+    policies = load_resource_policies(Path(args.root))
+    settings = policies.get("workQueue") or {}
+    broker = broker_from_policies(policies, Path(args.root))
+    queue = settings.get("queue", DEFAULT_QUEUE)
+    if args.stats:
+        print(json.dumps({"queue": queue, "jobs": broker.stats(queue), "workers": broker.active_workers(queue)},
+                         indent=2))
+        return 0
+
+    profile = node_profile(args.root)
+    concurrency = args.concurrency or (profile.get("recommendations") or {}).get("parallel_tasks") \
+        or settings.get("workerConcurrency", 2)
+
+    from HeadyConductor import HeadyConductor
+    conductor = HeadyConductor(args.root)
+    worker = QueueWorker(
+        broker, conductor_handler(conductor), queue=queue, concurrency=concurrency,
+        visibility_timeout=settings.get("visibilityTimeoutMs", DEFAULT_VISIBILITY_TIMEOUT * 1000) / 1000,
+        retry_policy=RetryPolicy.from_policies(policies), profile=profile.get("type")
+    )
+    print(f" HeadyWorkQueue: worker {worker.worker_id} ({profile.get('type', 'unprofiled')}) "
+          f"serving '{queue}' with {concurrency} slot(s)")
+    worker.run_forever()
+    conductor.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: HeadyAcademy/HeadyWriteBehind.py                           ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+╔═══════════════════════════════════════════════════════════════════════════════╗
+║                                                                               ║
+║      WRITE-BEHIND - DEFERRED MEMORY PERSISTENCE                               ║
+║     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━                                ║
+║     Bounded in-memory queue for MEMORY records, flushed in batches by a       ║
+║     background writer so request paths never wait on SQLite                   ║
+║                                                                               ║
+╚═══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import json
+import atexit
+import logging
+import weakref
+import threading
+from pathlib import Path
+from collections import deque
+from typing import Dict, List, Optional, Any
+
+
+OVERFLOW_POLICIES = ("drop_oldest", "block", "spill")
+# Failed writes of a spilled batch before its records go to the dead-letter file
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Queues still open at interpreter exit; weak, so the hook keeps none of them alive
+_open_queues: "weakref.WeakSet[WriteBehindQueue]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_queues():
+    for queue in list(_open_queues):
+        queue.close()
+
+
+class WriteBehindQueue:
+    """
+    Write-behind buffer in front of HeadyMemory.store_many.
+
+    Records are queued by put() and written by a background thread once
+    ``batch_size`` records are waiting or ``flush_interval`` seconds have
+    passed. When the queue is full the overflow policy applies:
+
+    - drop_oldest: discard the oldest queued record
+    - block: wait (up to ``block_timeout`` seconds) for the writer to make room
+    - spill: append the record to a JSON-lines spill file, replayed by the writer
+
+    Under the spill policy a batch that fails to write is spilled too and
+    retried; after ``max_attempts`` failures its records move to a
+    dead-letter file beside the spill file instead.
+
+    Remaining records are flushed on close(), which also runs at interpreter exit.
+    """
+
+    def __init__(self, memory, max_queue: int = 1000, batch_size: int = 50,
+                 flush_interval: float = 1.0, overflow_policy: str = "drop_oldest",
+                 spill_path: Optional[str] = None, block_timeout: Optional[float] = None,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}', expected one of {OVERFLOW_POLICIES}")
+
+        self.memory = memory
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.max_attempts = max_attempts
+        if spill_path:
+            self.spill_path = Path(spill_path)
+        elif hasattr(memory, "db_path"):
+            self.spill_path = Path(memory.db_path).parent / "memory_spill.jsonl"
+        else:
+            self.spill_path = Path(".heady") / "memory_spill.jsonl"
+        self.dead_letter_path = self.spill_path.with_suffix(".dead.jsonl")
+
+        self.logger = logging.getLogger("HeadyWriteBehind")
+
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._writing = 0
+        self._flush_requests = 0
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        self._spill_lock = threading.Lock()
+        # Records in the spill file and records read back from it but not yet
+        # written; replay passes count the writer's visits to the spill file
+        self._spilled = self._count_spilled()
+        self._replaying = 0
+        self._replay_passes = 0
+        self._replay_target = 0
+
+        self.stats = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "dead_lettered": 0,
+            "write_errors": 0
+        }
+
+        _open_queues.add(self)
+
+    def put(self, record: Dict[str, Any]) -> bool:
+        """Queue one memory record. Returns False if it was dropped."""
+        return self.put_many([record]) == 1
+
+    def put_many(self, records: List[Dict[str, Any]]) -> int:
+        """Queue memory records, applying the overflow policy. Returns how many were kept."""
+        kept = 0
+        spill = []
+
+        with self._condition:
+            closed = self._closed
+        if closed:
+            # Late writers after shutdown fall back to a direct write
+            self._write(records)
+            return len(records)
+
+        with self._condition:
+            self._ensure_writer()
+
+            for record in records:
+                if len(self._queue) >= self.max_queue:
+                    if self.overflow_policy == "drop_oldest":
+                        self._queue.popleft()
+                        self.stats["dropped"] += 1
+                    elif self.overflow_policy == "spill":
+                        spill.append(record)
+                        continue
+                    else:
+                        self._condition.notify_all()
+                        has_room = self._condition.wait_for(
+                            lambda: len(self._queue) < self.max_queue or self._closed,
+                            timeout=self.block_timeout
+                        )
+                        if not has_room or self._closed:
+                            self.stats["dropped"] += 1
+                            continue
+
+                self._queue.append(record)
+                self.stats["enqueued"] += 1
+                kept += 1
+
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify_all()
+
+        if spill:
+            self._spill(spill)
+            kept += len(spill)
+        return kept
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued record has been written and the spill file
+        has been replayed once. Returns False on timeout, or when records are
+        still spilled afterwards (failed writes waiting for their next retry).
+        """
+        with self._condition:
+            if self._writer is None:
+                if not self._spilled and not os.path.exists(self.spill_path):
+                    return True
+                self._ensure_writer()
+            self._flush_requests += 1
+            target = self._replay_passes + 1
+            self._replay_target = max(self._replay_target, target)
+            self._condition.notify_all()
+            try:
+                drained = self._condition.wait_for(
+                    lambda: not self._queue and not self._writing and self._replay_passes >= target,
+                    timeout=timeout
+                )
+                return drained and not self._spilled
+            finally:
+                self._flush_requests -= 1
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Flush remaining records and stop the background writer."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        _open_queues.discard(self)
+
+        if self._writer is not None:
+            self._writer.join(timeout=timeout)
+        else:
+            self._replay_spill()
+
+    def pending(self) -> int:
+        """Number of records not yet written, whether queued or spilled."""
+        with self._condition:
+            return len(self._queue) + self._writing + self._spilled + self._replaying
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer statistics plus current queue depth."""
+        return {
+            **self.stats,
+            "queued": self.pending(),
+            "spill_pending": self._spilled + self._replaying,
+            "max_queue": self.max_queue,
+            "overflow_policy": self.overflow_policy
+        }
+
+    def _ensure_writer(self):
+        """Start the writer thread on first use (caller holds the condition)."""
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="HeadyWriteBehind", daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self):
+        """Background loop: write a batch when full, on the interval, or on close."""
+        self._replay_spill()
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._queue) >= self.batch_size or self._closed or (self._flush_requests and (
+                        self._queue or self._replay_passes < self._replay_target)),
+                    timeout=self.flush_interval
+                )
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._writing = len(batch)
+                closing = self._closed
+                # Wake blocked producers now that there is room
+                self._condition.notify_all()
+
+            if batch:
+                self._write(batch)
+            elif os.path.exists(self.spill_path):
+                self._replay_spill()
+
+            with self._condition:
+                self._writing = 0
+                if not batch:
+                    self._replay_passes += 1
+                self._condition.notify_all()
+                if closing and not self._queue:
+                    break
+
+        self._replay_spill()
+
+    def _write(self, batch: List[Dict[str, Any]], attempts: int = 0) -> bool:
+        """Persist one batch through the memory layer. attempts counts earlier failed writes."""
+        try:
+            if hasattr(self.memory, "store_many"):
+                self.memory.store_many(batch)
+            else:
+                for record in batch:
+                    self.memory.store(**record)
+        except Exception as e:
+            self.stats["write_errors"] += 1
+            self.logger.warning(f"Write-behind batch of {len(batch)} failed: {e}")
+            if self.overflow_policy == "spill":
+                if attempts + 1 >= self.max_attempts:
+                    self._dead_letter(batch, attempts + 1, e)
+                else:
+                    self._spill(batch, attempts + 1)
+            return False
+        self.stats["written"] += len(batch)
+        self.stats["batches"] += 1
+        return True
+
+    def _spill(self, records: List[Dict[str, Any]], attempts: int = 0):
+        """Append records to the spill file for later replay."""
+        with self._spill_lock:
+            try:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    for record in records:
+                        # Overflow spills are plain records; failed writes carry their attempt count
+                        entry = {"attempts": attempts, "record": record} if attempts else record
+                        f.write(json.dumps(entry) + "\n")
+                self.stats["spilled"] += len(records)
+            except (OSError, TypeError) as e:
+                self.stats["dropped"] += len(records)
+                self.logger.warning(f"Write-behind spill failed, dropped {len(records)} records: {e}")
+                return
+        with self._condition:
+            self._spilled += len(records)
+
+    def _count_spilled(self) -> int:
+        """Records left in the spill file by an earlier run."""
+        try:
+            with open(self.spill_path, "r", encoding="utf-8") as f:
+                return sum(1 for line in f if line.strip())
+        except OSError:
+            return 0
+
+    def _dead_letter(self, records: List[Dict[str, Any]], attempts: int, error: Exception):
+        """Set aside records that keep failing, for inspection instead of endless replay."""
+        with self._spill_lock:
+            try:
+                self.dead_letter_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps({"attempts": attempts, "error": str(error), "record": record}) + "\n")
+                self.stats["dead_lettered"] += len(records)
+            except (OSError, TypeError) as e:
+                self.stats["dropped"] += len(records)
+                self.logger.warning(f"Write-behind dead-letter failed, dropped {len(records)} records: {e}")
+                return
+        self.logger.warning(f"Write-behind gave up on {len(records)} records after {attempts} attempts, "
+                            f"see {self.dead_letter_path}")
+
+    def _replay_spill(self):
+        """Write spilled records back through the memory layer and remove the spill file."""
+        with self._spill_lock:
+            if not os.path.exists(self.spill_path):
+                return
+            try:
+                with open(self.spill_path, "r", encoding="utf-8") as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+                os.remove(self.spill_path)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Write-behind spill replay failed: {e}")
+                return
+            with self._condition:
+                self._spilled = 0
+                self._replaying += len(entries)
+
+        by_attempts: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            if isinstance(entry, dict) and entry.keys() == {"attempts", "record"}:
+                by_attempts.setdefault(entry["attempts"], []).append(entry["record"])
+            else:
+                by_attempts.setdefault(0, []).append(entry)
+
+        for attempts, records in sorted(by_attempts.items()):
+            for start in range(0, len(records), self.batch_size):
+                batch = records[start:start + self.batch_size]
+                if self._write(batch, attempts):
+                    self.stats["replayed"] += len(batch)
+                with self._condition:
+                    self._replaying -= len(batch)
+                    self._condition.notify_all()
@@ -22,30 +22,80 @@ Requires GITHUB_TOKEN in environment for API access.
 import sys
 import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from HeadyRateLimit import get_rate_limiter, CALL_BUDGET, BudgetExceeded, RateLimitExceeded
+except ImportError:
+    get_rate_limiter = None
+    BudgetExceeded = RateLimitExceeded = RuntimeError
+
 OUTPUT_DIR = Path(__file__).parent.parent / "Research"
 API_BASE = "https://api.github.com"
+# Back-off when GitHub rate limits without saying for how long
+DEFAULT_RATE_LIMIT_WAIT = 60
 
-def search_repos(query, token=None):
-    """Search GitHub repositories."""
-    url = f"{API_BASE}/search/repositories?q={query}&sort=stars&order=desc&per_page=10"
-    
+def rate_limit_wait(error):
+    """
+    Seconds to hold off after an HTTPError that is a rate limit, else None.
+    GitHub also answers 403 for bad tokens and missing permissions; only a
+    Retry-After, an exhausted X-RateLimit-Remaining or a 429 is a rate limit.
+    """
+    headers = error.headers or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return max(1.0, int(reset) - time.time())
+        return DEFAULT_RATE_LIMIT_WAIT
+    if error.code == 429:
+        return DEFAULT_RATE_LIMIT_WAIT
+    return None
+
+def github_get(url, token=None):
+    """GET a GitHub API URL within rateLimits.externalApis and the daily call budget."""
     headers = {"Accept": "application/vnd.github.v3+json"}
     if token:
         headers["Authorization"] = f"token {token}"
-    
+
+    limiter = get_rate_limiter() if get_rate_limiter else None
+    if limiter:
+        limiter.check_budget(CALL_BUDGET, 1)
+        limiter.acquire("externalApis", timeout=30)
     try:
         req = Request(url, headers=headers)
         with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return data.get("items", [])
+            return json.loads(response.read().decode())
+    except HTTPError as e:
+        wait = rate_limit_wait(e) if e.code in (403, 429) else None
+        if limiter and wait is not None:
+            limiter.penalize("externalApis", wait)
+        raise
+    finally:
+        if limiter:
+            limiter.record_usage(CALL_BUDGET, 1)
+
+def search_repos(query, token=None):
+    """Search GitHub repositories."""
+    url = f"{API_BASE}/search/repositories?q={query}&sort=stars&order=desc&per_page=10"
+    
+    try:
+        return github_get(url, token).get("items", [])
     except HTTPError as e:
-        if e.code == 403:
+        if e.code in (403, 429) and rate_limit_wait(e) is not None:
             print("[SCOUT] Rate limited. Consider using GITHUB_TOKEN.")
+        else:
+            print(f"[SCOUT] GitHub refused the search (HTTP {e.code}); check GITHUB_TOKEN and its scopes.")
+        return []
+    except (BudgetExceeded, RateLimitExceeded) as e:
+        print(f"[SCOUT] {e}")
         return []
     except Exception as e:
         print(f"[SCOUT] Search error: {e}")
@@ -55,14 +105,8 @@ def get_repo_details(owner, repo, token=None):
     """Get detailed repository information."""
     url = f"{API_BASE}/repos/{owner}/{repo}"
     
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
-    
     try:
-        req = Request(url, headers=headers)
-        with urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode())
+        return github_get(url, token)
     except Exception:
         return None
 
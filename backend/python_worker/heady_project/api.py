@@ -15,12 +15,15 @@
 # HEADY_BRAND:END
 
 import os
+import sys
 import logging
 import secrets
 import asyncio
 import json
+from pathlib import Path
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException, WebSocket, Depends, Header, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, WebSocket, Depends, Header, WebSocketDisconnect, Request
+from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from .utils import get_logger
@@ -35,6 +38,7 @@ app = FastAPI(title="Heady Admin Console")
 # Security
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "default_insecure_token")
 SETTINGS_FILE = "admin_settings.json"
+HEADY_ACADEMY_DIR = Path(os.getenv("HEADY_ACADEMY_DIR", Path(__file__).resolve().parents[3] / "HeadyAcademy"))
 
 async def verify_token(x_admin_token: str = Header(None)):
     token = x_admin_token
@@ -111,6 +115,10 @@ class ChatRequest(BaseModel):
     messages: List[ChatMessage]
     context: Optional[str] = ""
 
+class OrchestrateRequest(BaseModel):
+    request: str
+    pool: str = "hot"
+
 class MCPToolRequest(BaseModel):
     server: str
     tool: str
@@ -134,6 +142,58 @@ def validate_path(path: str):
         raise HTTPException(status_code=403, detail="Access denied: Path outside project root")
     return requested_path
 
+_conductor = None
+_rate_limiter = None
+
+def _use_heady_academy():
+    if str(HEADY_ACADEMY_DIR) not in sys.path:
+        sys.path.insert(0, str(HEADY_ACADEMY_DIR))
+
+def get_conductor():
+    """Lazily start the HeadyAcademy conductor shared by every endpoint."""
+    global _conductor
+    if _conductor is None:
+        _use_heady_academy()
+        from HeadyConductor import HeadyConductor
+        _conductor = HeadyConductor()
+        _conductor.brain.quiet = True
+    return _conductor
+
+def get_brain():
+    """The conductor's BRAIN, for endpoints that stream pre-response context."""
+    return get_conductor().brain
+
+def get_rate_limiter():
+    """Shared limiter enforcing rateLimits.apiGateway from resource-policies.yaml."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _use_heady_academy()
+        from HeadyRateLimit import get_rate_limiter as shared_rate_limiter
+        _rate_limiter = shared_rate_limiter(HEADY_ACADEMY_DIR.parent)
+    return _rate_limiter
+
+def _try_acquire_api_token(client: str) -> float:
+    try:
+        return get_rate_limiter().try_acquire(f"apiGateway:{client}")
+    except KeyError:
+        return 0
+
+@app.middleware("http")
+async def enforce_rate_limit(request: Request, call_next):
+    # One bucket per client, shared by every worker process through the limiter's SQLite file
+    if request.url.path.startswith("/api/"):
+        client = request.client.host if request.client else "unknown"
+        # The bucket update is a blocking SQLite transaction; keep it off the event loop
+        wait = await asyncio.to_thread(_try_acquire_api_token, client)
+        if wait:
+            retry_after = max(1, int(wait + 0.999))
+            return JSONResponse(status_code=429, content={"detail": "Rate limit exceeded"},
+                                headers={"Retry-After": str(retry_after)})
+    return await call_next(request)
+
+def format_sse(event: str, payload: str) -> str:
+    return f"event: {event}\ndata: {payload}\n\n"
+
 def load_settings_data() -> Settings:
     if os.path.exists(SETTINGS_FILE):
         try:
@@ -238,6 +298,42 @@ async def update_settings(settings: Settings):
         logger.error(f"Failed to save settings: {e}")
         raise HTTPException(status_code=500, detail="Failed to save settings")
 
+@app.post("/api/orchestrate", dependencies=[Depends(verify_token)])
+async def orchestrate_request(body: OrchestrateRequest, request: Request):
+    """Orchestrate a request behind the conductor's scheduler; each client is a fairness key."""
+    conductor = get_conductor()
+    from HeadyScheduler import SchedulerOverloaded
+    from HeadyCodec import json_default
+    client = request.client.host if request.client else "unknown"
+    try:
+        # A full queue may throttle submit() itself, so keep it off the event loop
+        future = await asyncio.to_thread(conductor.submit, body.request, None, body.pool, client)
+    except SchedulerOverloaded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    result = await asyncio.wrap_future(future)
+    return JSONResponse(content=json.loads(json.dumps(result, default=json_default)))
+
+@app.get("/api/brain/stream", dependencies=[Depends(verify_token)])
+async def stream_brain_context(q: str):
+    """Server-Sent Events: one event per BRAIN stage as soon as it completes."""
+    brain = get_brain()
+
+    async def events():
+        try:
+            async for event in brain.process_request_stream_async(q):
+                yield format_sse(event.type, event.to_json())
+        except Exception as e:
+            logger.error(f"Brain stream failed: {e}")
+            yield format_sse("error", json.dumps({"detail": str(e)}))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.websocket("/api/logs")
 async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = None):
     if not token or not secrets.compare_digest(token, ADMIN_TOKEN):
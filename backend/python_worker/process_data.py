@@ -15,7 +15,9 @@
 # HEADY_BRAND:END
 
 import os
+import sys
 import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import requests
@@ -28,12 +30,28 @@ load_dotenv()
 HF_TOKEN = os.getenv("HF_TOKEN")
 DEFAULT_HF_TEXT_MODEL = os.getenv("HF_TEXT_MODEL", "gpt2")
 DEFAULT_HF_EMBED_MODEL = os.getenv("HF_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+HEADY_ACADEMY_DIR = Path(os.getenv("HEADY_ACADEMY_DIR", Path(__file__).resolve().parents[2] / "HeadyAcademy"))
 
 
 def _sleep_ms(ms: int) -> None:
     time.sleep(ms / 1000.0)
 
 
+def _rate_limiter():
+    """Limiter shared with every other Heady process (rateLimits.llmProviders)."""
+    if str(HEADY_ACADEMY_DIR) not in sys.path:
+        sys.path.insert(0, str(HEADY_ACADEMY_DIR))
+    import HeadyRateLimit
+    return HeadyRateLimit, HeadyRateLimit.get_rate_limiter(HEADY_ACADEMY_DIR.parent)
+
+
+def _retry_after_s(resp: Any, default: float) -> float:
+    try:
+        return max(float(resp.headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
 def hf_infer(
     *,
     model: str,
@@ -59,8 +77,18 @@ def hf_infer(
         "Accept": "application/json",
     }
 
+    rate_limit, limiter = _rate_limiter()
+    # The daily token budget counts prompt and completion; the prompt share is known up front
+    prompt_tokens = rate_limit.estimate_tokens(inputs)
+    limiter.check_budget(rate_limit.TOKEN_BUDGET, prompt_tokens)
+
     for attempt in range(max_retries + 1):
+        limiter.acquire("llmProviders", timeout=timeout_s)
         resp = requests.post(url, json=payload, headers=headers, timeout=timeout_s)
+        if resp.status_code == 429 and attempt < max_retries:
+            limiter.penalize("llmProviders", _retry_after_s(resp, 1.5))
+            continue
+
         if resp.status_code == 503 and attempt < max_retries:
             try:
                 data = resp.json()
@@ -82,7 +110,9 @@ def hf_infer(
                 message = data["error"].strip()
             raise RuntimeError(f"{message} (status={resp.status_code})")
 
-        return resp.json()
+        data = resp.json()
+        limiter.record_usage(rate_limit.TOKEN_BUDGET, prompt_tokens + rate_limit.estimate_tokens(data))
+        return data
 
     raise RuntimeError("Hugging Face inference failed")
 
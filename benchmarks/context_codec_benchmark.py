@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/context_codec_benchmark.py                      ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Compare ProcessingContext serialization: pickle vs stdlib JSON vs HeadyCodec.
+
+Usage: python benchmarks/context_codec_benchmark.py [iterations]
+"""
+
+import sys
+import json
+import time
+import pickle
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "HeadyAcademy"))
+
+from HeadyBrain import ProcessingContext, CONTEXT_CODEC
+from HeadyCodec import MSGPACK_AVAILABLE, ORJSON_AVAILABLE
+
+
+def sample_context() -> ProcessingContext:
+    memories = [
+        {"id": f"mem_{i}", "category": "processing_context",
+         "content": {"request": f"deploy service {i}", "concepts": ["deployment", "service"],
+                     "tasks": [{"task": "Deploy to production", "priority": "high"}]},
+         "tags": ["deployment", "service", f"svc{i}"], "timestamp": "2026-01-01T00:00:00", "source": "brain"}
+        for i in range(10)
+    ]
+    plan = {
+        "request": "deploy the application", "confidence": 0.85,
+        "nodes_to_invoke": [{"name": f"NODE{i}", "role": "Deployer", "reason": "Keyword match"} for i in range(6)],
+        "workflows_to_execute": [{"name": "hcautobuild", "description": "Build and deploy", "reason": "Workflow match"}],
+        "tools_to_use": [], "services_required": [{"name": "api", "endpoint": "http://localhost:3300"}]
+    }
+    return ProcessingContext(
+        request="deploy the application", timestamp="2026-01-01T00:00:00",
+        system_state={"system_health": "healthy", "nodes_active": ["LENS", "MEMORY"], "services": {"api": "healthy"}},
+        active_nodes=["LENS", "MEMORY"], service_health={"api": "healthy"},
+        relevant_memories=memories, user_preferences={"default_mode": "all_systems"}, external_sources=[],
+        execution_plan=plan, concepts_identified=["deployment", "service"],
+        tasks_assigned=[{"task": "Deploy to production", "priority": "high", "concept": "deployment"}],
+        comparative_analysis="No external sources available for comparison"
+    )
+
+
+def measure(name, encode, decode, iterations):
+    payload = encode()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encode()
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(payload)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"{name:<22} {len(payload):>8} B {encode_us:>10.1f} us {decode_us:>10.1f} us")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    context = sample_context()
+    backend = "msgpack" if MSGPACK_AVAILABLE else "orjson" if ORJSON_AVAILABLE else "json"
+
+    print(f"{'codec':<22} {'size':>10} {'encode':>13} {'decode':>13}")
+    measure("pickle", lambda: pickle.dumps(context), pickle.loads, iterations)
+    measure("json (asdict)", lambda: json.dumps(asdict(context)).encode(),
+            lambda data: ProcessingContext(**json.loads(data)), iterations)
+    measure(f"HeadyCodec ({backend})", lambda: CONTEXT_CODEC.encode(context, timestamp=context.timestamp),
+            CONTEXT_CODEC.decode, iterations)
+
+
+if __name__ == "__main__":
+    main()
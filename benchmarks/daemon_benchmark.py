@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/daemon_benchmark.py                             ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Per-command latency of the conductor CLI: a fresh HeadyConductor per command
+(python HeadyConductor.py --in-process) vs the same CLI as a thin client of
+a warm daemon (python HeadyConductor.py, or HeadyDaemon.py), plus the socket
+round trip alone.
+
+Usage: python benchmarks/daemon_benchmark.py [runs]
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ACADEMY = ROOT / "HeadyAcademy"
+sys.path.insert(0, str(ACADEMY))
+
+from HeadyDaemon import DaemonClient, ensure_daemon
+
+COMMANDS = [
+    ("--query", "security"),
+    ("--request", "scan for security gaps"),
+]
+
+
+def time_process(args, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, capture_output=True, cwd=str(ROOT))
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)[runs // 2]
+
+
+def time_cli(script, option, value, runs, *extra):
+    return time_process([str(ACADEMY / script), option, value, *extra], runs)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    was_running = DaemonClient(ROOT).ping() is not None
+
+    start = time.perf_counter()
+    client = ensure_daemon(ROOT)
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    print(f"median of {runs} runs per command")
+    print(f"  daemon start (one-time, {'already running' if was_running else 'cold'}): {startup_ms:8.2f} ms")
+    print(f"  bare interpreter (python -c pass)  : {time_process(['-c', 'pass'], runs):8.2f} ms")
+    try:
+        for option, value in COMMANDS:
+            command = option.lstrip("-")
+            cold_ms = time_cli("HeadyConductor.py", option, value, runs, "--in-process")
+            cli_ms = time_cli("HeadyConductor.py", option, value, runs)
+            thin_ms = time_cli("HeadyDaemon.py", option, value, runs)
+            samples = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                assert client.call(command, value)["ok"]
+                samples.append((time.perf_counter() - start) * 1000)
+            call_ms = sorted(samples)[runs // 2]
+
+            print(f"{option} {value!r}")
+            print(f"  HeadyConductor.py --in-process     : {cold_ms:8.2f} ms")
+            print(f"  HeadyConductor.py (daemon, warm)   : {cli_ms:8.2f} ms")
+            print(f"  HeadyDaemon.py (thin client, warm) : {thin_ms:8.2f} ms")
+            print(f"  DaemonClient.call (socket only)    : {call_ms:8.2f} ms")
+    finally:
+        if not was_running:
+            client.call("stop")
+
+
+if __name__ == "__main__":
+    main()
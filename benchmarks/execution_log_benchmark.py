@@ -0,0 +1,99 @@
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/execution_log_benchmark.py                      ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Execution log costs: per-append time of the old list that re-sliced itself
+past 1000 entries against the ring buffer, and a one-minute time-range
+query over a day of history on disk against decompressing all of it.
+
+Usage: python benchmarks/execution_log_benchmark.py [entries]
+"""
+
+import sys
+import gzip
+import time
+import tempfile
+from pathlib import Path
+from datetime import datetime, timedelta
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "HeadyAcademy"))
+
+from HeadyExecutionLog import ExecutionLog
+
+START = datetime(2026, 1, 1)
+
+
+def entries(count):
+    step = timedelta(days=1) / count
+    for i in range(count):
+        yield {"type": "node", "name": f"NODE{i % 20}", "timestamp": (START + step * i).isoformat(),
+               "result": {"success": True, "tool_used": "auto_doc", "i": i}}
+
+
+def list_append(records):
+    log = []
+    started = time.perf_counter()
+    for record in records:
+        log.append(record)
+        if len(log) > 1000:
+            log = log[-1000:]
+    return time.perf_counter() - started
+
+
+def ring_append(records, directory):
+    # Pending queue sized to hold the whole burst so nothing is dropped
+    log = ExecutionLog(directory, capacity=1000, max_pending=len(records))
+    started = time.perf_counter()
+    for record in records:
+        log.append(record)
+    elapsed = time.perf_counter() - started
+    log.close(timeout=None)
+    return elapsed, time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    records = list(entries(count))
+    with tempfile.TemporaryDirectory() as tmp:
+        old = list_append(records)
+        new, drained = ring_append(records, Path(tmp))
+        print(f"{count} appends")
+        print(f"  list + re-slice   {old / count * 1e6:8.2f} us/append")
+        print(f"  ring + segments   {new / count * 1e6:8.2f} us/append "
+              f"(background writer on disk after {drained:.2f}s)")
+
+        log = ExecutionLog(Path(tmp))
+        low, high = (START + timedelta(hours=12)).isoformat(), (START + timedelta(hours=12, minutes=1)).isoformat()
+        started = time.perf_counter()
+        window = list(log.between(low, high))
+        indexed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scanned = 0
+        for path in sorted(Path(tmp).glob("segment-*.log.gz")):
+            scanned += sum(1 for _ in gzip.decompress(path.read_bytes()).splitlines())
+        full = time.perf_counter() - started
+
+        size = sum(path.stat().st_size for path in Path(tmp).glob("segment-*.log.gz"))
+        print(f"\n{count} entries on disk: {size / 1024:.0f} KiB in {log.get_stats()['segments']} segment(s)")
+        print(f"  1-minute window   {indexed * 1000:8.2f} ms ({len(window)} entries, "
+              f"{log.stats['blocks_read']} block(s) decompressed)")
+        print(f"  full decompress   {full * 1000:8.2f} ms ({scanned} entries)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/router_index_benchmark.py                       ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Routing latency of HeadyConductor.analyze_request against synthetic registries:
+full registry scan (previous implementation) vs RouterIndex BM25F top-k
+ranking, plus the cost of building the index once per registry version.
+
+Usage: python benchmarks/router_index_benchmark.py [entries] [iterations]
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "HeadyAcademy"))
+
+from HeadyRegistry import Node, Workflow, Service, Tool
+from HeadyRouter import RouterIndex, SERVICE_KEYWORDS
+
+WORDS = ("deploy build scan audit monitor sync index cache queue stream render backup restore "
+         "migrate verify release lint format compile notify archive report ingest publish").split()
+NOUNS = ("service cluster bucket ledger asset secret schema model pipeline gateway token "
+         "vault mirror shard replica dashboard").split()
+
+REQUESTS = [
+    "deploy the application to production",
+    "/{workflow} now please",
+    "scan for security gaps in the gateway",
+    "monitor system health and notify on failures via {tool}",
+    "restore the replica from last night's backup",
+    "connect to mcp server and publish the report",
+]
+
+
+def synthetic_registry(entries: int, seed: int = 7) -> SimpleNamespace:
+    """
+    Registry-shaped object with ~entries split between workflows, nodes and
+    tools. Descriptions draw from a vocabulary that grows with the registry
+    and services stay a small fixed set, as in the real registry.
+    """
+    rng = random.Random(seed)
+    registry = SimpleNamespace(version=1, workflows={}, nodes={}, tools={}, services={})
+    per_kind = max(1, entries // 3)
+    vocabulary = WORDS + NOUNS + [f"term{i}" for i in range(per_kind)]
+
+    for i in range(per_kind):
+        verb, noun = rng.choice(WORDS), rng.choice(NOUNS)
+        name = f"{verb}-{noun}-{i}"
+        description = " ".join(rng.sample(vocabulary, 6))
+        registry.workflows[name] = Workflow(name=name, description=description, file_path=f"/wf/{name}.md",
+                                            slash_command=f"/{name}")
+    for i in range(per_kind):
+        name = f"NODE{i}"
+        triggers = [f"{rng.choice(WORDS)}_{rng.choice(NOUNS)}_{i}"] if i % 2 else []
+        registry.nodes[name] = Node(name=name, role=f"{rng.choice(NOUNS)} keeper {i}", primary_tool="tool",
+                                    trigger_on=triggers)
+    for i in range(per_kind):
+        name = f"{rng.choice(WORDS)}_{rng.choice(NOUNS)}_tool_{i}"
+        registry.tools[name] = Tool(name=name, file_path=f"/tools/{name}.py", category="general")
+    types = list(SERVICE_KEYWORDS) + ["worker", "web"]
+    for i in range(len(types) * 2):
+        name = f"svc-{i}"
+        registry.services[name] = Service(name=name, type=types[i % len(types)], endpoint=None)
+    return registry
+
+
+def scan(registry, request: str):
+    """The previous analyze_request matching loop (names only)."""
+    request_lower = request.lower()
+    request_words = set(request_lower.split())
+    routes = {"workflows": [], "nodes": [], "tools": [], "services": []}
+    for name, workflow in registry.workflows.items():
+        desc_words = set(workflow.description.lower().split()) if workflow.description else None
+        if (workflow.slash_command and workflow.slash_command in request_lower) or name.lower() in request_lower \
+                or (desc_words and len(desc_words & request_words) >= 2):
+            routes["workflows"].append(name)
+    for name, node in registry.nodes.items():
+        triggers = [trigger.lower() for trigger in node.trigger_on] if node.trigger_on else None
+        if triggers:
+            if any(trigger in request_lower for trigger in triggers):
+                routes["nodes"].append(name)
+        elif (node.role and node.role.lower() in request_lower) or name.lower() in request_lower:
+            routes["nodes"].append(name)
+    for name in registry.tools:
+        if name.lower().replace('_', ' ') in request_lower:
+            routes["tools"].append(name)
+    for name, service in registry.services.items():
+        keywords = SERVICE_KEYWORDS.get(service.type)
+        if keywords and any(keyword in request_lower for keyword in keywords):
+            routes["services"].append(name)
+    return routes
+
+
+def sample_requests(registry):
+    """REQUESTS with placeholders filled from entries in the middle of the registry."""
+    workflows, tools = list(registry.workflows), list(registry.tools)
+    workflow, tool = workflows[len(workflows) // 2], tools[len(tools) // 2]
+    return [request.format(workflow=workflow, tool=tool.replace('_', ' ')) for request in REQUESTS]
+
+
+def per_request_ms(fn, requests, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for request in requests:
+            fn(request)
+    return (time.perf_counter() - start) / (iterations * len(requests)) * 1000
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"{'entries':>8} {'build':>10} {'scan':>12} {'rank top-5':>12} {'speedup':>9}")
+    for entries in sorted({100, 1000, largest}):
+        registry = synthetic_registry(entries)
+        index = RouterIndex(registry)
+        requests = sample_requests(registry)
+
+        scan_ms = per_request_ms(lambda request: scan(registry, request), requests, iterations)
+        rank_ms = per_request_ms(index.rank, requests, iterations * 10)
+        print(f"{entries:>8} {index.build_ms:>8.1f}ms {scan_ms:>10.3f}ms {rank_ms:>10.3f}ms "
+              f"{scan_ms / rank_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
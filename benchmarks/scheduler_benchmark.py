@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/scheduler_benchmark.py                          ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Queue wait of user-facing requests while a batch backlog is running: one FIFO
+thread pool (how concurrent callers share the conductor today) vs the
+RequestScheduler with the node pools from configs/resource-policies.yaml.
+
+Usage: python benchmarks/scheduler_benchmark.py [batch_tasks] [hot_requests]
+"""
+
+import sys
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "HeadyAcademy"))
+
+from HeadyExecutor import load_resource_policies
+from HeadyScheduler import RequestScheduler
+
+BATCH_MS = 50
+HOT_MS = 5
+HOT_INTERVAL_MS = 20
+
+
+def work(ms, submitted, waits):
+    waits.append((time.monotonic() - submitted) * 1000)
+    time.sleep(ms / 1000)
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+def drive(submit, batch_tasks, hot_requests):
+    batch_waits, hot_waits = [], []
+    start = time.monotonic()
+    futures = [submit("cold", work, BATCH_MS, time.monotonic(), batch_waits) for _ in range(batch_tasks)]
+    for _ in range(hot_requests):
+        futures.append(submit("hot", work, HOT_MS, time.monotonic(), hot_waits))
+        time.sleep(HOT_INTERVAL_MS / 1000)
+    for future in futures:
+        future.result()
+    return hot_waits, batch_waits, (time.monotonic() - start) * 1000
+
+
+def main():
+    batch_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    hot_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    policies = load_resource_policies(ROOT)
+    slots = policies["concurrency"]["maxConcurrentTasks"]
+    slo_ms = policies["nodePools"]["hot"]["maxLatencyMs"]
+
+    fifo = ThreadPoolExecutor(max_workers=slots)
+    fifo_result = drive(lambda pool, fn, *args: fifo.submit(fn, *args), batch_tasks, hot_requests)
+    fifo.shutdown()
+
+    scheduler = RequestScheduler.from_policies(policies)
+    scheduler.max_queued = batch_tasks + hot_requests  # measure scheduling, not overflow
+    sched_result = drive(lambda pool, fn, *args: scheduler.submit(fn, *args, pool=pool, user=pool),
+                         batch_tasks, hot_requests)
+    scheduler.shutdown()
+
+    print(f"{batch_tasks} batch tasks x {BATCH_MS} ms + {hot_requests} user requests x {HOT_MS} ms "
+          f"every {HOT_INTERVAL_MS} ms, {slots} slots, hot SLO {slo_ms} ms")
+    for label, (hot, batch, wall) in (("FIFO pool", fifo_result), ("RequestScheduler", sched_result)):
+        print(f"  {label:17s}: user wait p50 {percentile(hot, 50):8.1f} ms  p99 {percentile(hot, 99):8.1f} ms  "
+              f"| batch wait p50 {percentile(batch, 50):8.1f} ms  | wall {wall:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/tool_runner_benchmark.py                        ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Per-call overhead of running a HeadyAcademy tool: fresh interpreter per call
+(how HeadyMaster and the dashboard run tools today) vs the warm ToolRunner pool.
+
+Usage: python benchmarks/tool_runner_benchmark.py [calls]
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = ROOT / "HeadyAcademy" / "Tools"
+sys.path.insert(0, str(ROOT / "HeadyAcademy"))
+
+from HeadyToolRunner import ToolRunner
+
+# Side-effect free entry point of a real tool
+TOOL, ENTRY, ARG = "Tool_Learner", "check_tool_available", "python"
+
+
+def cold_call():
+    code = f"import sys; sys.path.insert(0, {str(TOOLS_DIR)!r}); import {TOOL}; print({TOOL}.{ENTRY}({ARG!r}))"
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        cold_call()
+    cold_ms = (time.perf_counter() - start) / calls * 1000
+
+    runner = ToolRunner(TOOLS_DIR, workers=2)
+    start = time.perf_counter()
+    runner.warm()
+    warmup_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = [runner.run(TOOL, ARG, entry=ENTRY) for _ in range(calls)]
+    warm_ms = (time.perf_counter() - start) / calls * 1000
+    assert all(result.success for result in results), results[0].error
+    overhead_ms = sorted(result.overhead_ms for result in results)[calls // 2]
+    runner.close()
+
+    print(f"tool: {TOOL}.{ENTRY}({ARG!r}), {calls} calls")
+    print(f"  fresh interpreter per call : {cold_ms:8.2f} ms/call")
+    print(f"  warm pool                  : {warm_ms:8.2f} ms/call (median overhead {overhead_ms:.2f} ms)")
+    print(f"  pool warm-up (one-time)    : {warmup_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
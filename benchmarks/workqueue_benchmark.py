@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: benchmarks/workqueue_benchmark.py                          ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Plan-step throughput of the work queue as worker processes are added. Each
+worker is a separate process sharing one SQLite broker file, as conductor
+nodes on one machine would; every step sleeps STEP_MS to stand in for
+workflow, node or tool work.
+
+Usage: python benchmarks/workqueue_benchmark.py [steps] [max_workers]
+"""
+
+import sys
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "HeadyAcademy"))
+
+from HeadyExecutor import PlanStep
+from HeadyWorkQueue import SQLiteBroker, QueueEngine
+
+STEP_MS = 50
+
+WORKER = (
+    "import sys, time; sys.path.insert(0, sys.argv[1])\n"
+    "from HeadyWorkQueue import SQLiteBroker, QueueWorker\n"
+    "worker = QueueWorker(SQLiteBroker(sys.argv[2]), lambda p: time.sleep(p['ms'] / 1000) or {'ok': True})\n"
+    "worker.run_forever()\n"
+)
+
+
+def run(db, steps, workers):
+    procs = [subprocess.Popen([sys.executable, "-c", WORKER, str(ROOT / "HeadyAcademy"), str(db)])
+             for _ in range(workers)]
+    try:
+        engine = QueueEngine(SQLiteBroker(db), result_timeout=600)
+        # Let every worker come up and register before timing
+        while engine.max_workers < workers:
+            time.sleep(0.05)
+        plan = [PlanStep(f"s{i}", fn=None, payload={"ms": STEP_MS}) for i in range(steps)]
+        started = time.monotonic()
+        results = engine.run(plan)
+        elapsed = time.monotonic() - started
+        assert all(r.success for r in results)
+        return elapsed
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait()
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    print(f"{steps} steps of {STEP_MS}ms, SQLite broker\n")
+    print(f"{'workers':>8} {'seconds':>9} {'steps/s':>9} {'speedup':>8}")
+    baseline = None
+    workers = 1
+    with tempfile.TemporaryDirectory() as tmp:
+        while workers <= max_workers:
+            elapsed = run(Path(tmp) / f"queue-{workers}.db", steps, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {steps / elapsed:>9.1f} {baseline / elapsed:>7.1f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
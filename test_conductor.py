@@ -21,6 +21,7 @@ Test script for HeadyRegistry and HeadyConductor
 
 import sys
 import json
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
@@ -120,6 +121,32 @@ def test_orchestration():
     return True
 
 
+def test_components_start_on_first_use(tmp_path):
+    """Registry-only commands leave Lens, Memory, Brain and the pools unbuilt."""
+    conductor = HeadyConductor(str(tmp_path))
+    lazy = ("lens", "memory", "brain", "resource_policies", "executor")
+    
+    conductor.query_capabilities("deploy")
+    assert not any(name in vars(conductor) for name in lazy)
+    
+    # Health probes need only the prober and its timeout policy
+    conductor.check_service_health()
+    assert not any(name in vars(conductor) for name in ("lens", "memory", "brain", "executor"))
+    
+    # Reading health data starts the Lens monitor thread
+    assert not conductor.lens.monitoring_active
+    conductor.lens.get_health_summary()
+    assert conductor.lens.monitoring_active
+    
+    timings = conductor.warmup(monitoring=False)
+    assert set(lazy) <= set(timings) and conductor.brain.lens is conductor.lens
+    
+    started = time.monotonic()
+    conductor.shutdown()
+    assert not conductor.lens.monitor_thread.is_alive()
+    assert time.monotonic() - started < 1
+
+
 def main():
     """Run all tests."""
     print("\n" + "╔" + "="*78 + "╗")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_codec.py                                        ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the compact ProcessingContext codec, dict view and pickle-free cache.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain, ProcessingContext, CONTEXT_CODEC
+from HeadyCodec import RecordCodec, CodecError, json_default
+from test_headybrain_async import StubLens, StubMemory, StubConductor
+
+
+def make_context():
+    return ProcessingContext(
+        request="deploy", timestamp="2026-01-01T00:00:00",
+        system_state={"system_health": "healthy"}, active_nodes=["LENS"], service_health={"api": "healthy"},
+        relevant_memories=[{"id": "m1", "tags": ["deployment"]}], user_preferences={}, external_sources=[],
+        execution_plan={"confidence": 0.9, "nodes_to_invoke": []}, concepts_identified=["deployment"],
+        tasks_assigned=[], comparative_analysis=None, processing_time=0.25
+    )
+
+
+def test_roundtrip_and_schema_version_guard():
+    context = make_context()
+    data = CONTEXT_CODEC.encode(context, timestamp="2026-01-01T00:00:00")
+
+    decoded, envelope = CONTEXT_CODEC.decode(data)
+    assert decoded == context
+    assert envelope == {"timestamp": "2026-01-01T00:00:00"}
+    assert not hasattr(decoded, "__dict__")
+
+    newer = RecordCodec(ProcessingContext, schema_version=2)
+    with pytest.raises(CodecError):
+        newer.decode(data)
+    with pytest.raises(CodecError):
+        CONTEXT_CODEC.decode(b"\x80\x04not a record")
+
+
+def test_dict_view_shares_nested_objects():
+    context = make_context()
+    view = context.as_dict(extras={"predictions": []})
+
+    assert view["execution_plan"] is context.execution_plan
+    assert list(view)[:2] == ["request", "timestamp"]
+    assert view["predictions"] == [] and len(view) == 16
+    context.cache_hit = True
+    assert view["cache_hit"] is True
+    assert json.loads(json.dumps({"context": view}, default=json_default))["context"]["request"] == "deploy"
+
+
+def test_brain_cache_uses_codec_not_pickle(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor(), quiet=True)
+
+    brain.process_request("deploy the application")
+    files = list((tmp_path / ".heady_cache").iterdir())
+    assert [f.suffix for f in files] == [".hcx"]
+    assert files[0].read_bytes().startswith(b"HCX")
+
+    assert brain.process_request("deploy the application").cache_hit
+
+    # Entries from an older schema are ignored, not misread
+    files[0].write_bytes(b"HCX\x00\x02[]")
+    assert not brain.process_request("deploy the application").cache_hit
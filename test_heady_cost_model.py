@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_cost_model.py                                   ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for cost-based plan selection from per-capability execution history.
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyCostModel import CostModel, CapabilityStats
+from HeadyExecutor import ExecutionEngine, PlanStep, RetryPolicy, StepResult
+
+
+def step(step_id, *depends_on):
+    return PlanStep(id=step_id, fn=lambda: {"success": True}, depends_on=list(depends_on))
+
+
+def observed(model, step_id, duration_ms, runs=5, failures=0):
+    model.record([StepResult(step_id, "failed" if i < failures else "completed", duration_ms=duration_ms)
+                  for i in range(runs)], None, 0)
+
+
+def test_stats_histogram_and_persistence(tmp_path):
+    stats = CapabilityStats()
+    for duration in (3, 4, 40, 45, 900):
+        stats.observe(duration, success=duration < 900)
+    assert stats.buckets[2] == 2 and stats.percentile(0.5) == 50 and stats.percentile(0.95) == 1000
+    assert stats.successes == 4
+
+    path = tmp_path / "stats.json"
+    model = CostModel(path)
+    model.record([StepResult("node:ATLAS", "completed", duration_ms=12.0),
+                  StepResult("tool:Auto_Doc", "skipped")], None, 12.0)
+    reloaded = CostModel(path)
+    assert list(reloaded.capabilities) == ["node:ATLAS"]
+    assert reloaded.expected_ms("node:ATLAS") == 12.0
+    assert reloaded.expected_ms("workflow:new") == reloaded.priors_ms["workflow"]
+
+    path.write_text("{not json")
+    assert CostModel(path).capabilities == {}
+
+
+def test_estimate_simulates_workers_and_orders_longest_chain_first():
+    model = CostModel(priors_ms={"node": 10})
+    observed(model, "node:SLOW", 100)
+    observed(model, "node:AFTER", 50)
+    steps = [step("node:A"), step("node:B"), step("node:SLOW"), step("node:AFTER", "node:SLOW")]
+
+    wide = model.estimate(steps, max_workers=4)
+    assert wide.predicted_ms == 150 and wide.critical_path_ms == 150 and wide.serial_ms == 170
+    assert [steps[i].id for i in wide.order][:2] == ["node:SLOW", "node:AFTER"]
+
+    # One slot: the chain goes first either way, and the total is the serial time
+    assert model.estimate(steps, max_workers=1).predicted_ms == 170
+    assert 0 < wide.failure_risk < 1
+
+
+def test_optimize_plan_skips_redundant_tools_and_prefers_faster_same_role_node():
+    nodes = {
+        "ATLAS": SimpleNamespace(name="ATLAS", role="Archivist", primary_tool="Auto_Doc"),
+        "SCRIBE": SimpleNamespace(name="SCRIBE", role="Archivist", primary_tool="Doc_Writer"),
+        "MURPHY": SimpleNamespace(name="MURPHY", role="Inspector", primary_tool="Security_Audit"),
+    }
+    model = CostModel(min_samples=3)
+    plan = {
+        "nodes_to_invoke": [{"name": "ATLAS", "role": "Archivist", "primary_tool": "Auto_Doc"},
+                            {"name": "MURPHY", "role": "Inspector", "primary_tool": "Security_Audit"}],
+        "tools_to_use": [{"name": "Security_Audit"}, {"name": "Visualizer", "depends_on": ["tool:Security_Audit"]}],
+        "workflows_to_execute": [{"name": "report", "depends_on": ["node:ATLAS"]}],
+    }
+
+    # Without history only the redundant tool goes
+    optimized = model.optimize_plan(plan, nodes)
+    assert [n["name"] for n in optimized["nodes_to_invoke"]] == ["ATLAS", "MURPHY"]
+    assert [t["name"] for t in optimized["tools_to_use"]] == ["Visualizer"]
+    assert optimized["tools_to_use"][0]["depends_on"] == ["node:MURPHY"]
+    assert plan["tools_to_use"][1]["depends_on"] == ["tool:Security_Audit"]
+
+    observed(model, "node:ATLAS", 200)
+    observed(model, "node:SCRIBE", 80)
+    optimized = model.optimize_plan(plan, nodes)
+    assert optimized["nodes_to_invoke"][0]["name"] == "SCRIBE"
+    assert optimized["nodes_to_invoke"][0]["substituted_for"] == "ATLAS"
+    assert optimized["workflows_to_execute"][0]["depends_on"] == ["node:SCRIBE"]
+    assert optimized["cost_model"]["substituted"][0]["with"] == "node:SCRIBE"
+
+    # A fast but unreliable alternative costs its expected reruns
+    observed(model, "node:SCRIBE", 80, runs=20, failures=19)
+    assert model.optimize_plan(plan, nodes)["nodes_to_invoke"][0]["name"] == "ATLAS"
+
+
+def test_prediction_tracks_actual_wall_time():
+    model = CostModel()
+    engine = ExecutionEngine(max_workers=2, retry_policy=RetryPolicy(max_retries=0))
+    sleeps = {"node:A": 0.12, "node:B": 0.04, "node:C": 0.04, "node:D": 0.04}
+    steps = [PlanStep(id=step_id, fn=lambda s=seconds: time.sleep(s) or {"success": True})
+             for step_id, seconds in sleeps.items()]
+    try:
+        for _ in range(3):
+            estimate = model.estimate(steps, engine.max_workers)
+            started = time.monotonic()
+            results = engine.run([steps[i] for i in estimate.order])
+            report = model.record(results, estimate, (time.monotonic() - started) * 1000)
+    finally:
+        engine.shutdown()
+
+    # Learned durations: A on one worker while B, C and D share the other
+    assert [steps[i].id for i in estimate.order][0] == "node:A"
+    assert abs(report["error_ms"]) < 40
+    summary = model.summary()
+    assert summary["plans_scored"] == 3 and summary["capabilities"]["node:A"]["runs"] == 3
+    assert list(summary["capabilities"])[0] == "node:A"
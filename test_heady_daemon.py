@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_daemon.py                                       ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the conductor daemon and its thin CLI client.
+"""
+
+import sys
+import json
+import asyncio
+import socket
+import argparse
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+import HeadyDaemon
+from HeadyDaemon import (ConductorDaemon, DaemonAlreadyRunning, DaemonClient, DaemonUnavailable, ensure_daemon,
+                         socket_path, token_file)
+
+needs_unix_sockets = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+def fake_conductor(root_path):
+    def query_capabilities(query):
+        print(f"searching {query}")
+        return {"query": query, "root": root_path}
+    return SimpleNamespace(query_capabilities=query_capabilities, shutdown=lambda: None)
+
+
+@needs_unix_sockets
+def test_daemon_serves_commands_until_stopped(tmp_path):
+    daemon = ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=fake_conductor).start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(tmp_path, timeout=5)
+
+    response = client.call("query", "deploy")
+    assert response["ok"] and response["output"] == "searching deploy\n"
+    assert response["result"] == {"query": "deploy", "root": str(tmp_path.resolve())}
+    assert client.call("explode") == {"ok": False, "error": "ValueError: Unknown command 'explode'",
+                                      "output": "", "elapsed_ms": pytest.approx(0, abs=50)}
+    assert client.ping()["commands"] == 2 and client.ping()["errors"] == 1
+
+    client.call("stop")
+    thread.join(timeout=5)
+    assert not thread.is_alive() and not socket_path(tmp_path).exists()
+    with pytest.raises(DaemonUnavailable):
+        client.call("ping")
+
+
+@needs_unix_sockets
+def test_concurrent_commands_keep_their_output_apart(tmp_path):
+    both_running = threading.Barrier(2, timeout=5)
+
+    def interleaving_conductor(root_path):
+        def query_capabilities(query):
+            print(f"start {query}")
+            both_running.wait()
+            print(f"end {query}")
+            return {"query": query}
+        return SimpleNamespace(query_capabilities=query_capabilities, shutdown=lambda: None)
+
+    daemon = ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=interleaving_conductor).start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(tmp_path, timeout=5)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(lambda q: client.call("query", q), ["alpha", "beta"]))
+        assert [r["output"] for r in responses] == ["start alpha\nend alpha\n", "start beta\nend beta\n"]
+        assert client.ping()["commands"] == 2
+    finally:
+        client.call("stop")
+        thread.join(timeout=5)
+
+
+@needs_unix_sockets
+def test_brain_stage_output_reaches_the_client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from HeadyBrain import HeadyBrain
+
+    class PrintingLens:
+        def get_current_state(self):
+            print("lens snapshot")
+            return {"nodes_active": [], "services": {}}
+
+    def brain_conductor(root_path):
+        brain = HeadyBrain(lens=PrintingLens(), memory=None, conductor=None)
+        config = {"enable_caching": False}
+
+        def query_capabilities(query):
+            brain.process_request(query, config)
+            list(brain.process_request_stream(query, config))
+            asyncio.run(brain.process_request_async(query, config))
+            return {"query": query}
+        return SimpleNamespace(query_capabilities=query_capabilities, shutdown=lambda: None)
+
+    daemon = ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=brain_conductor).start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(tmp_path, timeout=5)
+    try:
+        assert client.call("query", "deploy")["output"].count("lens snapshot\n") == 3
+    finally:
+        client.call("stop")
+        thread.join(timeout=5)
+
+
+@needs_unix_sockets
+def test_client_autostarts_daemon_over_stale_socket(tmp_path):
+    (tmp_path / ".heady").mkdir()
+    socket_path(tmp_path).write_text("left behind by a crashed daemon")
+    assert DaemonClient(tmp_path).ping() is None
+
+    client = ensure_daemon(tmp_path, idle_timeout=60)
+    try:
+        pid = client.ping()["pid"]
+        response = client.call("query", "deploy")
+        assert response["ok"] and response["result"]["query"] == "deploy"
+        # A second client reuses the running daemon
+        assert ensure_daemon(tmp_path).ping()["pid"] == pid
+    finally:
+        client.call("stop")
+
+
+@needs_unix_sockets
+def test_simultaneous_starts_leave_one_daemon_reachable(tmp_path):
+    ready = threading.Barrier(2, timeout=5)
+
+    def start():
+        daemon = ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=fake_conductor)
+        ready.wait()
+        try:
+            return daemon.start()
+        except DaemonAlreadyRunning:
+            return None
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        started = [daemon for daemon in pool.map(lambda _: start(), range(2)) if daemon is not None]
+    assert len(started) == 1
+    thread = threading.Thread(target=started[0].serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(tmp_path, timeout=5)
+    try:
+        assert client.call("query", "deploy")["ok"]
+        # A later start does not take the socket over either
+        with pytest.raises(DaemonAlreadyRunning):
+            ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=fake_conductor).start()
+        assert client.ping()["commands"] == 1
+    finally:
+        client.call("stop")
+        thread.join(timeout=5)
+
+
+def test_tcp_daemon_requires_its_token(tmp_path, monkeypatch):
+    monkeypatch.setattr(HeadyDaemon, "HAS_UNIX_SOCKETS", False)
+    daemon = ConductorDaemon(tmp_path, idle_timeout=0, conductor_factory=fake_conductor).start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = DaemonClient(tmp_path, timeout=5)
+    try:
+        assert client.call("query", "deploy")["ok"]
+
+        port = int(HeadyDaemon.address_file(tmp_path).read_text())
+        for message in ({"command": "stop"}, {"command": "stop", "token": "guess"}):
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+                sock.sendall(json.dumps(message).encode() + b"\n")
+                reply = json.loads(sock.makefile("rb").readline())
+            assert not reply["ok"] and reply["error"].startswith("Unauthorized")
+        assert client.ping()["commands"] == 1
+    finally:
+        client.call("stop")
+        thread.join(timeout=5)
+    assert not token_file(tmp_path).exists()
+
+
+def test_cli_runs_in_process_when_no_daemon_starts(tmp_path, monkeypatch, capsys):
+    def no_daemon(root_path, **kwargs):
+        raise DaemonUnavailable("spawn failed")
+    monkeypatch.setattr(HeadyDaemon, "ensure_daemon", no_daemon)
+    parser = argparse.ArgumentParser()
+    HeadyDaemon.add_command_arguments(parser)
+    HeadyDaemon.add_daemon_arguments(parser)
+    ran = []
+
+    HeadyDaemon.run_cli(parser, parser.parse_args(["--query", "deploy", "--root", str(tmp_path)]),
+                        in_process=lambda root, command, arg: ran.append((root, command, arg)))
+    assert ran == [(tmp_path.resolve(), "query", "deploy")]
+    assert "running in-process" in capsys.readouterr().err
+    with pytest.raises(DaemonUnavailable):
+        HeadyDaemon.run_cli(parser, parser.parse_args(["--query", "deploy"]))
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_execution_log.py                                ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the conductor execution log: ring buffer, segments and time-range queries.
+"""
+
+import sys
+import gzip
+import json
+import time
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyExecutionLog import ExecutionLog
+from HeadyConductor import HeadyConductor
+
+
+def entry(i, execution_type="node"):
+    return {"type": execution_type, "name": f"N{i % 5}", "timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}",
+            "result": {"success": True, "i": i}}
+
+
+def test_ring_buffer_keeps_the_last_entries_in_memory():
+    log = ExecutionLog(capacity=3)
+    for i in range(10):
+        log.append(entry(i))
+    assert len(log) == 3
+    assert [e["result"]["i"] for e in log] == [7, 8, 9]
+    assert [e["result"]["i"] for e in log.recent(2)] == [8, 9]
+    assert [e["result"]["i"] for e in log.between("2026-01-01T00:00:08")] == [8, 9]
+
+
+def test_history_survives_restart_and_range_query_reads_only_overlapping_blocks(tmp_path):
+    log = ExecutionLog(tmp_path, capacity=10, batch_size=100, flush_interval=0.05)
+    for i in range(1000):
+        log.append(entry(i, "workflow" if i % 2 else "node"))
+    log.close()
+
+    reopened = ExecutionLog(tmp_path, batch_size=100)
+    assert len(reopened) == 0
+    window = list(reopened.between("2026-01-01T00:05:00", "2026-01-01T00:05:09"))
+    assert [e["result"]["i"] for e in window] == list(range(300, 310))
+    assert reopened.stats["blocks_read"] == 1
+
+    nodes = list(reopened.between("2026-01-01T00:05:00", "2026-01-01T00:05:09", execution_type="node", name="N0"))
+    assert [e["result"]["i"] for e in nodes] == [300]
+    assert sum(1 for _ in reopened.between()) == 1000
+
+
+def test_segments_rotate_compressed_and_old_ones_are_dropped(tmp_path):
+    log = ExecutionLog(tmp_path, batch_size=50, segment_bytes=1500, max_segments=3, flush_interval=0.05)
+    for i in range(1000):
+        log.append(entry(i))
+    log.close()
+
+    segments = sorted(tmp_path.glob("segment-*.log.gz"))
+    assert len(segments) == 3 and log.stats["rotations"] >= 3
+    assert all(path.stat().st_size <= 1500 for path in segments[:-1])
+    # Plain multi-member gzip: readable without the index
+    lines = gzip.decompress(segments[-1].read_bytes()).splitlines()
+    assert json.loads(lines[-1])["result"]["i"] == 999
+    kept = [e["result"]["i"] for e in ExecutionLog(tmp_path).between()]
+    assert kept == list(range(kept[0], 1000)) and kept[0] > 0
+
+
+def test_torn_tail_is_truncated_on_reopen(tmp_path):
+    log = ExecutionLog(tmp_path, batch_size=10, flush_interval=0.05)
+    for i in range(30):
+        log.append(entry(i))
+    log.close()
+    segment = next(tmp_path.glob("segment-*.log.gz"))
+    size = segment.stat().st_size
+    with open(segment, "ab") as f:
+        f.write(b"\x1f\x8b half a block")
+    with open(segment.with_suffix("").with_suffix(".idx"), "a") as f:
+        f.write('{"first": "2026')
+
+    reopened = ExecutionLog(tmp_path, batch_size=10, flush_interval=0.05)
+    reopened.append(entry(30))
+    reopened.close()
+    assert [e["result"]["i"] for e in reopened.between()] == list(range(31))
+    assert segment.stat().st_size > size
+
+
+def test_two_writers_share_a_directory(tmp_path):
+    # As the daemon and the API conductor do on one root
+    first = ExecutionLog(tmp_path, batch_size=1, flush_interval=0.01)
+    second = ExecutionLog(tmp_path, batch_size=1, flush_interval=0.01)
+    for i in range(3):
+        first.append(entry(2 * i))
+        first.flush(timeout=5)
+        second.append(entry(2 * i + 1))
+        second.flush(timeout=5)
+    assert [e["result"]["i"] for e in first.between()] == list(range(6))
+
+    # Concurrent writers across rotations: nothing lost, nothing repeated
+    logs = [ExecutionLog(tmp_path / "busy", batch_size=5, segment_bytes=2000, max_segments=None,
+                         flush_interval=0.01) for _ in range(2)]
+
+    def write(log, start):
+        for i in range(start, start + 200):
+            log.append(entry(i))
+
+    threads = [threading.Thread(target=write, args=(log, n * 200)) for n, log in enumerate(logs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for log in logs:
+        log.close()
+    assert sum(log.stats["rotations"] for log in logs) >= 2
+    kept = sorted(e["result"]["i"] for e in ExecutionLog(tmp_path / "busy").between())
+    assert kept == list(range(400))
+
+
+def test_append_does_not_wait_for_disk(tmp_path):
+    gate = threading.Event()
+    log = ExecutionLog(tmp_path, batch_size=10, flush_interval=0.01, max_pending=100)
+    write_block = log._write_block
+    log._write_block = lambda batch: (gate.wait(), write_block(batch))
+
+    started = time.perf_counter()
+    for i in range(500):
+        log.append(entry(i))
+    assert time.perf_counter() - started < 0.5
+    assert len(log) == 500 and log.stats["dropped"] >= 300
+
+    gate.set()
+    log.close()
+    assert log.stats["written"] + log.stats["dropped"] == 500
+
+
+def test_writer_survives_a_batch_it_cannot_encode(tmp_path):
+    class Unprintable:
+        def __str__(self):
+            raise RuntimeError("dictionary changed size during iteration")
+
+    log = ExecutionLog(tmp_path, batch_size=1, flush_interval=0.01)
+    log.append({**entry(0), "result": Unprintable()})
+    log.flush(timeout=5)
+    log.append(entry(1))
+    log.close()
+    assert log.stats["write_errors"] == 1
+    assert [e["result"]["i"] for e in ExecutionLog(tmp_path).between()] == [1]
+
+
+def test_conductor_logs_executions_to_disk(tmp_path):
+    conductor = HeadyConductor(str(tmp_path))
+    conductor.resource_policies = {"executionLog": {"flushIntervalMs": 10}}
+    result = {"success": True}
+    conductor._log_execution("node", "ATLAS", result)
+    # Keys added after logging (as _run_plan_node does) are not part of the entry
+    result["conductor_directed"] = True
+    conductor.shutdown()
+
+    assert len(conductor.execution_log) == 1
+    [logged] = ExecutionLog(tmp_path / ".heady" / "execution-log").between(execution_type="node")
+    assert logged["name"] == "ATLAS" and logged["result"] == {"success": True}
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_executor.py                                     ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the concurrent plan execution engine behind HeadyConductor.orchestrate.
+"""
+
+import sys
+import time
+import contextlib
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyExecutor import ExecutionEngine, PlanStep, RetryPolicy, load_resource_policies
+from HeadyConductor import HeadyConductor
+from HeadyCostModel import CostModel
+
+NO_DELAY = RetryPolicy(max_retries=2, base_delay_ms=1, jitter_ms=0)
+
+
+def sleeper(seconds, value=None, log=None, name=None):
+    def step():
+        time.sleep(seconds)
+        if log is not None:
+            log.append(name)
+        return value if value is not None else {"success": True}
+    return step
+
+
+def test_independent_steps_run_concurrently_and_dependencies_wait():
+    engine = ExecutionEngine(max_workers=4, retry_policy=NO_DELAY)
+    order = []
+    steps = [
+        PlanStep("a", sleeper(0.2, log=order, name="a")),
+        PlanStep("b", sleeper(0.2, log=order, name="b")),
+        PlanStep("c", sleeper(0.2, log=order, name="c")),
+        PlanStep("d", sleeper(0.01, log=order, name="d"), depends_on=["a", "b"]),
+    ]
+
+    start = time.monotonic()
+    results = engine.run(steps)
+    elapsed = time.monotonic() - start
+
+    assert [r.id for r in results] == ["a", "b", "c", "d"]
+    assert all(r.success for r in results)
+    assert order[-1] == "d"
+    assert elapsed < 0.4
+
+
+def test_retries_timeouts_and_skipped_dependents():
+    engine = ExecutionEngine(max_workers=4, retry_policy=NO_DELAY)
+    calls = {"flaky": 0, "reported": 0}
+    release = threading.Event()
+
+    def flaky():
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            raise ConnectionError("refused")
+        return {"success": True}
+
+    def reported():
+        calls["reported"] += 1
+        return {"success": False, "error": "not found"}
+
+    steps = [
+        PlanStep("flaky", flaky),
+        PlanStep("hung", lambda: release.wait(5), timeout=0.05, max_retries=1),
+        PlanStep("reported", reported),
+        PlanStep("after_hung", sleeper(0), depends_on=["hung"]),
+    ]
+    flaky_result, hung, reported_result, after = engine.run(steps)
+    release.set()
+
+    assert flaky_result.success and flaky_result.attempts == 3
+    assert hung.status == "timeout" and hung.attempts == 2
+    assert reported_result.status == "failed" and calls["reported"] == 1
+    assert after.status == "skipped"
+
+
+def test_policies_feed_engine_and_backoff():
+    policies = load_resource_policies(Path(__file__).parent)
+    engine = ExecutionEngine.from_policies(policies)
+
+    assert engine.max_workers == policies["concurrency"]["maxConcurrentTasks"]
+    assert engine.default_timeout == policies["timeouts"]["agentExecutionMs"] / 1000
+    policy = RetryPolicy(base_delay_ms=500, max_delay_ms=1500)
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 1.5, 1.5]
+
+
+def test_orchestrate_wall_clock_tracks_slowest_step():
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.resource_policies = {}
+    conductor.executor = ExecutionEngine(max_workers=8, retry_policy=NO_DELAY)
+    conductor.cost_model = CostModel()
+    conductor.registry = SimpleNamespace(nodes={}, batched=contextlib.nullcontext)
+    conductor._stats_lock = threading.Lock()
+    conductor.execution_stats = {"total_orchestrations": 0, "successful_executions": 0, "nodes_invoked": 0,
+                                 "workflows_executed": 0, "tools_used": 0}
+    nodes = [{"name": f"NODE{i}", "role": "Worker"} for i in range(5)]
+    plan = {"confidence": 0.9, "nodes_to_invoke": nodes, "workflows_to_execute": [],
+            "tools_to_use": [], "services_required": []}
+    conductor.brain = SimpleNamespace(execute_with_context=lambda request, config: {"context": {"execution_plan": plan}},
+                                      _extract_keywords=lambda request: [])
+    conductor.memory = SimpleNamespace(store=lambda **kwargs: None)
+    conductor.invoke_node = lambda name: sleeper(0.2, value={"success": True, "node": name})()
+
+    start = time.monotonic()
+    result = conductor.orchestrate("invoke every node")
+    elapsed = time.monotonic() - start
+
+    assert result["success"]
+    assert [r["node"] for r in result["results"]["nodes"]] == [n["name"] for n in nodes]
+    assert all(r["conductor_directed"] and r["execution"]["status"] == "completed" for r in result["results"]["nodes"])
+    assert result["execution"]["steps"] == 5
+    assert result["execution"]["predicted_ms"] == CostModel().priors_ms["node"]
+    assert elapsed < 0.5
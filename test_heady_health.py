@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_health.py                                       ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for concurrent service health probing and the probe cache.
+"""
+
+import sys
+import time
+import socket
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyHealth import HealthProber
+from HeadyRegistry import Service
+from HeadyConductor import HeadyConductor
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        code = 500 if self.path.startswith("/broken") else 200
+        body = b"ok"
+        self.send_response(code)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    Handler.delay = 0.0
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_probe_statuses(server):
+    port = server.server_address[1]
+    services = {
+        "api": Service("api", "api", health_check_url=f"http://127.0.0.1:{port}/health"),
+        "broken": Service("broken", "api", health_check_url=f"http://127.0.0.1:{port}/broken"),
+        "worker": Service("worker", "worker", endpoint=f"http://127.0.0.1:{port}", port=port),
+        "db": Service("db", "database", endpoint="http://127.0.0.1", port=closed_port()),
+        "mcp": Service("mcp", "mcp", endpoint="stdio")
+    }
+    prober = HealthProber(timeout=2)
+    try:
+        results = prober.check(services)
+    finally:
+        prober.close()
+
+    assert {name: r.status for name, r in results.items()} == {
+        "api": "healthy", "broken": "unhealthy", "worker": "healthy", "db": "down", "mcp": "unknown"
+    }
+    assert results["broken"].http_status == 500
+    assert results["worker"].method == "tcp" and results["api"].method == "http"
+
+
+def test_sweep_of_fifty_slow_services_takes_about_one_probe(server):
+    Handler.delay = 0.3
+    port = server.server_address[1]
+    services = {f"svc{i}": Service(f"svc{i}", "api", health_check_url=f"http://127.0.0.1:{port}/h{i}")
+                for i in range(50)}
+    prober = HealthProber(timeout=2)
+    try:
+        started = time.monotonic()
+        results = prober.check(services)
+        elapsed = time.monotonic() - started
+    finally:
+        prober.close()
+
+    assert all(r.status == "healthy" for r in results.values())
+    assert elapsed < 1.5
+
+
+def test_cache_ttl_and_stale_while_revalidate(server):
+    port = server.server_address[1]
+    services = {"api": Service("api", "api", health_check_url=f"http://127.0.0.1:{port}/health")}
+    clock = Clock()
+    revalidated = threading.Event()
+    prober = HealthProber(timeout=2, ttl=10, stale_ttl=60, clock=clock,
+                          on_revalidated=lambda results: revalidated.set())
+    try:
+        assert not prober.check(services)["api"].cached
+        assert prober.check(services)["api"].cached
+        assert prober.stats["probes"] == 1
+
+        clock.now += 30
+        stale = prober.check(services)["api"]
+        assert stale.cached and stale.stale
+        assert revalidated.wait(2)
+        assert prober.stats["probes"] == 2
+        assert not prober.check(services)["api"].stale
+
+        clock.now += 500
+        assert not prober.check(services)["api"].cached
+        assert not prober.check(services, fresh=True)["api"].cached
+        # Sequential probes of one host reuse a keep-alive connection
+        assert prober.http.connections_opened == 1
+    finally:
+        prober.close()
+
+
+def test_conductor_sweep_writes_registry_once(tmp_path, server):
+    port = server.server_address[1]
+    conductor = HeadyConductor(str(tmp_path))
+    conductor.resource_policies = {"timeouts": {"healthCheckMs": 2000}}
+    conductor.registry.services = {
+        "api": Service("api", "api", health_check_url=f"http://127.0.0.1:{port}/health"),
+        "db": Service("db", "database", port=closed_port()),
+        "mcp": Service("mcp", "mcp", endpoint="stdio")
+    }
+    writes = conductor.registry.write_stats
+    written = lambda: writes["journal_writes"] + writes["snapshots"]
+    before = written()
+    try:
+        report = conductor.check_service_health()
+        assert written() == before + 1
+        assert report["services"]["api"]["status"] == "healthy"
+        assert report["services"]["db"]["status"] == "down"
+        assert conductor.registry.services["api"].status == "healthy"
+
+        # Cached and unchanged: nothing to write
+        assert conductor.check_service_health()["services"]["api"]["cached"]
+        assert written() == before + 1
+    finally:
+        conductor.shutdown()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_matcher.py                                      ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the compiled multi-pattern matcher and its Brain / council users.
+"""
+
+import sys
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyMatcher import PatternMatcher
+
+
+def test_matches_agree_with_naive_substring_search():
+    vocabulary = {"a": ["he", "she", "his", "hers"], "b": ["h", "ers", "s"]}
+    matcher = PatternMatcher(vocabulary)
+    rng = random.Random(7)
+
+    for _ in range(500):
+        text = "".join(rng.choice("hers i") for _ in range(40))
+        found = sorted((m.pattern, m.category, m.start) for m in matcher.find_all(text))
+        expected = sorted(
+            (pattern, category, i)
+            for category, patterns in vocabulary.items()
+            for pattern in patterns
+            for i in range(len(text)) if text.startswith(pattern, i)
+        )
+        assert found == expected
+
+
+def test_categories_word_boundary_and_case():
+    matcher = PatternMatcher({"ops": ["Monitor", "deploy"], "docs": ["api"]})
+    assert matcher.match_categories("Please MONITOR the rapid deploy") == {
+        "ops": ["monitor", "deploy"], "docs": ["api"]
+    }
+
+    bounded = PatternMatcher({"ops": ["monitor"], "docs": ["api"]}, word_boundary=True)
+    assert bounded.match_categories("monitoring the rapid rollout") == {}
+    assert bounded.count_by_category("monitor the api, then monitor again") == {"ops": 1, "docs": 1}
+
+
+def test_brain_pattern_recognition_uses_shared_vocabulary(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from HeadyBrain import HeadyBrain
+
+    brain = HeadyBrain(quiet=True)
+    patterns = brain._recognize_patterns("Deploy and publish the release, then check health", [])
+
+    by_type = {p["type"]: p["indicators"] for p in patterns}
+    assert by_type == {
+        "deployment_request": ["deploy", "release", "publish"],
+        "monitoring_request": ["check", "health"]
+    }
+    assert set(brain._identify_concepts("secure the api database", [])) == {"api", "database"}
+
+
+def test_council_matcher_rebuilds_when_registry_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "Node_Registry.yaml").write_text(
+        'nodes:\n  - name: "BRIDGE"\n    trigger_on: ["mcp", "warp"]\n'
+        '  - name: "MUSE"\n    trigger_on: ["whitepaper"]\n'
+    )
+    import HeadyMaster
+
+    master = HeadyMaster.HeadyMaster()
+    incoming = tmp_path / "warp_mcp_notes.txt"
+    incoming.write_text("draft whitepaper")
+    assert master.consult_council(incoming) == ["BRIDGE", "MUSE"]
+
+    (tmp_path / "Node_Registry.yaml").write_text(
+        'nodes:\n  - name: "MUSE"\n    trigger_on: ["whitepaper", "draft", "notes"]\n'
+    )
+    master.registry_fingerprint = None
+    master.refresh_registry()
+    assert master.consult_council(incoming) == ["MUSE"]
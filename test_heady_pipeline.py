@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_pipeline.py                                     ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the HCFullPipeline stage graph executor.
+"""
+
+import sys
+import copy
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyPipeline import HCFullPipeline, PipelineTaskError, load_pipeline, stage_order
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-stage."""
+
+
+def definition(**overrides):
+    pipeline = copy.deepcopy(load_pipeline(Path(__file__).parent))
+    pipeline["pipeline"]["global"].update(overrides)
+    return pipeline
+
+
+def make_pipeline(tmp_path, tasks=None, sleeps=None, **overrides):
+    return HCFullPipeline(Path(__file__).parent, definition=definition(**overrides), tasks=tasks,
+                          checkpoint_path=tmp_path / "checkpoint.json",
+                          sleep=(sleeps.append if sleeps is not None else lambda s: None), quiet=True)
+
+
+def test_stage_order_follows_depends_on():
+    stages = [{"id": "b", "dependsOn": ["a"]}, {"id": "a"}, {"id": "c", "dependsOn": ["b"]}]
+    assert [s["id"] for s in stage_order(stages)] == ["a", "b", "c"]
+    with pytest.raises(ValueError):
+        stage_order([{"id": "a", "dependsOn": ["b"]}, {"id": "b", "dependsOn": ["a"]}])
+
+
+def test_parallel_stages_are_bounded_by_max_parallel_agents(tmp_path):
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def agent(context):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return {"agent": context["task"]}
+
+    pipeline = make_pipeline(tmp_path, maxConcurrentTasks=2)
+    for task in ("route_to_agents", "monitor_agent_execution", "collect_agent_results"):
+        pipeline.register(task, agent)
+
+    started = time.monotonic()
+    state = pipeline.run()
+
+    assert state["status"] == "completed"
+    assert peak[0] == 2
+    assert time.monotonic() - started < 0.5
+    assert state["stages"]["execute-major-phase"]["tasks"]["route_to_agents"]["result"] == {"agent": "route_to_agents"}
+
+
+def test_failed_attempts_retry_on_the_backoff_schedule(tmp_path):
+    attempts = []
+
+    def flaky(context):
+        attempts.append(context["attempt"])
+        if context["attempt"] < 3:
+            raise ConnectionError("feed unavailable")
+        return {"items": 3}
+
+    sleeps = []
+    pipeline = make_pipeline(tmp_path, tasks={"ingest_news_feeds": flaky}, sleeps=sleeps, jitterEnabled=False)
+    state = pipeline.run()
+
+    assert attempts == [1, 2, 3]
+    assert sleeps == [0.5, 2.0]
+    assert state["metrics"]["retriedTasks"] == 2
+    assert state["metrics"]["failedTasks"] == 0
+    assert state["status"] == "completed"
+
+
+def test_crashed_run_resumes_from_last_checkpoint(tmp_path):
+    calls = []
+
+    def record(context):
+        calls.append(context["task"])
+        return {"task": context["task"]}
+
+    def crash(context):
+        raise Crash()
+
+    tasks = {name: record for name in ("ingest_news_feeds", "generate_task_graph", "route_to_agents")}
+    with pytest.raises(Crash):
+        make_pipeline(tmp_path, tasks=dict(tasks, route_to_agents=crash)).run()
+    assert sorted(calls) == ["generate_task_graph", "ingest_news_feeds"]
+
+    calls.clear()
+    resumed = make_pipeline(tmp_path, tasks=tasks)
+    state = resumed.run()
+
+    assert calls == ["route_to_agents"]
+    assert state["resumedFrom"].startswith("cp_plan_")
+    assert state["completedStages"] == ["ingest", "plan", "execute-major-phase", "recover", "finalize"]
+    # Earlier stages' results are still visible to later tasks
+    assert state["stages"]["ingest"]["tasks"]["ingest_news_feeds"]["result"] == {"task": "ingest_news_feeds"}
+
+    # A finished run is not resumed again
+    assert make_pipeline(tmp_path, tasks=tasks).run()["runId"] != state["runId"]
+
+
+def test_error_rate_enters_recovery_and_skips_rest_of_stage(tmp_path):
+    def broken(context):
+        raise RuntimeError("agent down")
+
+    tasks = {name: broken for name in ("generate_task_graph", "assign_priorities", "estimate_costs")}
+    state = make_pipeline(tmp_path, tasks=tasks, maxRetries=0).run()
+
+    plan = state["stages"]["plan"]
+    assert plan["status"] == "interrupted"
+    assert plan["tasks"]["validate_governance"] == {"status": "skipped"}
+    assert "execute-major-phase" not in state["stages"]
+    assert state["stopReason"] == {"type": "error_rate", "action": "enter_recovery"}
+    assert state["completedStages"][-2:] == ["recover", "finalize"]
+    assert state["status"] == "completed"
+
+
+def test_critical_alarm_pauses_and_data_integrity_halts(tmp_path):
+    def alarm(context):
+        raise PipelineTaskError("governance violation", severity="critical")
+
+    pipeline = make_pipeline(tmp_path, tasks={"assign_priorities": alarm})
+    state = pipeline.run()
+    assert state["status"] == "paused"
+    assert pipeline.load_checkpoint()["completedStages"] == ["ingest"]
+    assert state["stages"]["plan"]["tasks"]["assign_priorities"]["attempts"] == 1
+    assert state["stages"]["plan"]["tasks"]["estimate_costs"] == {"status": "skipped"}
+
+    # Resuming after escalation re-runs the paused stage only
+    state = make_pipeline(tmp_path).run()
+    assert state["status"] == "completed"
+    assert state["metrics"]["totalTasks"] == 20
+
+    def corrupt(context):
+        raise PipelineTaskError("checksum mismatch", error_type="data_integrity")
+
+    state = make_pipeline(tmp_path, tasks={"persist_results": corrupt}).run()
+    assert state["status"] == "halted"
+    assert state["stages"]["finalize"]["tasks"]["update_concept_index"] == {"status": "skipped"}
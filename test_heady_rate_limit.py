@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_rate_limit.py                                   ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the shared token-bucket rate limiter and daily budgets.
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+from email.message import Message
+from urllib.error import HTTPError
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy" / "Tools"))
+
+from HeadyRateLimit import (RateLimiter, BucketPolicy, BudgetPolicy, BudgetExceeded, RateLimitExceeded,
+                            policies_from_config, TOKEN_BUDGET, CALL_BUDGET, COST_TOTAL)
+from HeadyExecutor import load_resource_policies
+from Github_Scanner import rate_limit_wait, DEFAULT_RATE_LIMIT_WAIT
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_limiter(tmp_path, clock, **budgets):
+    return RateLimiter(tmp_path / "ratelimit.db",
+                       buckets={"api": BucketPolicy(rate_per_minute=60, burst=3)},
+                       budgets={name: BudgetPolicy(daily=limit) for name, limit in budgets.items()},
+                       clock=clock, sleep=clock.sleep)
+
+
+def test_policies_follow_resource_policies_yaml():
+    buckets, budgets, alerts = policies_from_config(load_resource_policies(Path(__file__).parent))
+
+    assert buckets["apiGateway"] == BucketPolicy(120, 20)
+    assert buckets["llmProviders"].rate_per_minute == 60
+    assert budgets[TOKEN_BUDGET].daily == 500000
+    assert budgets[CALL_BUDGET].daily == 5000
+    assert budgets[COST_TOTAL] == BudgetPolicy(daily=50, weekly=300)
+    assert budgets["cost.llm"].daily == 30
+    assert alerts == {"warning": 75, "critical": 90}
+
+
+def test_bucket_allows_burst_then_refills(tmp_path):
+    clock = FakeClock()
+    limiter = make_limiter(tmp_path, clock)
+
+    assert [limiter.try_acquire("api") for _ in range(3)] == [0, 0, 0]
+    assert limiter.try_acquire("api") == pytest.approx(1.0)
+
+    clock.now += 2
+    assert limiter.try_acquire("api") == 0
+    assert limiter.try_acquire("api") == 0
+    assert limiter.try_acquire("api") > 0
+
+    # Suffixed names share the policy but not the tokens
+    assert limiter.try_acquire("api:10.0.0.5") == 0
+
+
+def test_acquire_waits_penalize_pauses_and_timeout_raises(tmp_path):
+    clock = FakeClock()
+    limiter = make_limiter(tmp_path, clock)
+    for _ in range(3):
+        limiter.acquire("api")
+
+    assert limiter.acquire("api") == pytest.approx(1.0)
+
+    limiter.penalize("api", retry_after=30)
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        limiter.acquire("api", timeout=5)
+    assert excinfo.value.retry_after == pytest.approx(31.0)
+    assert limiter.acquire("api") == pytest.approx(31.0)
+
+
+def test_budget_alerts_fire_once_and_limits_are_enforced(tmp_path):
+    clock = FakeClock()
+    limiter = make_limiter(tmp_path, clock, calls=100)
+    seen = []
+    limiter.on_alert.append(seen.append)
+
+    limiter.record_usage("calls", 70)
+    assert seen == []
+    limiter.record_usage("calls", 10)
+    limiter.record_usage("calls", 1)
+    assert [alert["level"] for alert in seen] == ["warning"]
+    limiter.record_usage("calls", 15)
+    assert [alert["level"] for alert in seen] == ["warning", "critical"]
+
+    limiter.check_budget("calls", 4)
+    with pytest.raises(BudgetExceeded):
+        limiter.check_budget("calls", 5)
+
+    # A new UTC day starts from zero
+    clock.now += 86400
+    assert limiter.usage("calls")["used"] == 0
+    limiter.check_budget("calls", 100)
+
+
+def test_state_is_shared_across_processes(tmp_path):
+    clock = FakeClock()
+    limiter = make_limiter(tmp_path, clock, calls=100)
+    limiter.record_usage("calls", 5)
+
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1])\n"
+        "from HeadyRateLimit import RateLimiter, BudgetPolicy\n"
+        "limiter = RateLimiter(sys.argv[2], budgets={'calls': BudgetPolicy(daily=100)}, clock=lambda: float(sys.argv[3]))\n"
+        "limiter.record_usage('calls', 7)\n"
+    )
+    subprocess.run([sys.executable, "-c", script, str(Path(__file__).parent / "HeadyAcademy"),
+                    str(tmp_path / "ratelimit.db"), str(clock.now)], check=True)
+
+    assert limiter.usage("calls")["used"] == 12
+    reopened = make_limiter(tmp_path, clock, calls=100)
+    assert reopened.usage("calls")["percent"] == 12.0
+
+
+
+def test_stats_survive_buckets_without_a_policy(tmp_path):
+    clock = FakeClock()
+    make_limiter(tmp_path, clock).try_acquire("api")
+    # Another process, or a later config, dropped the "api" policy
+    renamed = RateLimiter(tmp_path / "ratelimit.db", buckets={"web": BucketPolicy(rate_per_minute=60, burst=3)},
+                          clock=clock, sleep=clock.sleep)
+    renamed.try_acquire("web")
+
+    stats = renamed.get_stats()
+    assert stats["buckets"] == {"web": 2.0}
+    assert stats["unconfigured"] == {"api": 2.0}
+
+
+def http_error(code, **headers):
+    message = Message()
+    for name, value in headers.items():
+        message[name.replace("_", "-")] = value
+    return HTTPError("https://api.github.com/search/repositories", code, "error", message, None)
+
+
+def test_only_rate_limit_responses_back_off():
+    assert rate_limit_wait(http_error(403)) is None
+    assert rate_limit_wait(http_error(403, X_RateLimit_Remaining="12")) is None
+    assert rate_limit_wait(http_error(403, Retry_After="7")) == 7
+    reset = str(int(time.time()) + 120)
+    assert 100 < rate_limit_wait(http_error(403, X_RateLimit_Remaining="0", X_RateLimit_Reset=reset)) <= 120
+    assert rate_limit_wait(http_error(429)) == DEFAULT_RATE_LIMIT_WAIT
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_registry.py                                     ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyRegistry persistence (journaled status updates, coalesced writes and
+compaction) and incremental discovery.
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyRegistry import HeadyRegistry, Node, Service
+from HeadyRegistryWatch import RegistryWatcher, inotify_available
+from HeadyConductor import HeadyConductor
+
+
+def registry_with_nodes(root, count=20):
+    registry = HeadyRegistry(str(root))
+    registry.nodes = {f"N{i}": Node(f"N{i}", f"Role {i}", "missing_tool") for i in range(count)}
+    registry.services = {"api": Service("api", "api")}
+    registry.save()
+    return registry
+
+
+def writes(registry):
+    return registry.write_stats["journal_writes"] + registry.write_stats["snapshots"]
+
+
+def test_batched_status_updates_are_one_journal_write(tmp_path):
+    registry = registry_with_nodes(tmp_path)
+    snapshot = registry.registry_file.read_bytes()
+    before = writes(registry)
+
+    with registry.batched():
+        for name in registry.nodes:
+            registry.update_node_status(name, "active", "2026-01-01T00:00:00")
+            registry.update_node_status(name, "available")
+        registry.update_service_statuses({"api": "healthy"})
+        assert writes(registry) == before
+
+    assert writes(registry) == before + 1
+    assert registry.write_stats["journal_entries"] == 21
+    assert registry.registry_file.read_bytes() == snapshot
+
+    reloaded = HeadyRegistry(str(tmp_path))
+    assert reloaded.nodes["N3"].status == "available"
+    assert reloaded.nodes["N3"].last_invoked == "2026-01-01T00:00:00"
+    assert reloaded.services["api"].status == "healthy"
+
+
+def test_updates_outside_a_batch_are_coalesced(tmp_path):
+    registry = registry_with_nodes(tmp_path, count=5)
+    registry.save_delay = 0.05
+    before = writes(registry)
+    for name in registry.nodes:
+        registry.update_node_status(name, "busy")
+    assert writes(registry) == before
+
+    time.sleep(0.2)
+    assert writes(registry) == before + 1
+
+    # Unchanged values queue nothing
+    registry.update_node_status("N0", "busy")
+    assert not registry.flush()
+
+
+def test_journal_is_compacted_into_the_snapshot(tmp_path):
+    registry = registry_with_nodes(tmp_path, count=4)
+    registry.compact_every = 6
+    for round_number in range(3):
+        with registry.batched():
+            for name in registry.nodes:
+                registry.update_node_status(name, f"state-{round_number}")
+
+    # Round two would have taken the journal to 8 entries: it went into registry.json instead
+    assert registry.write_stats["compactions"] == 1 and registry.write_stats["journal_writes"] == 2
+    # Snapshot header plus the last round
+    assert len(registry.journal_file.read_text().splitlines()) == 5
+    assert all(node.status == "state-2" for node in HeadyRegistry(str(tmp_path)).nodes.values())
+
+
+def test_journal_from_an_older_snapshot_is_not_replayed(tmp_path):
+    registry = registry_with_nodes(tmp_path, count=2)
+    with registry.batched():
+        registry.update_node_status("N0", "busy")
+    stale_journal = registry.journal_file.read_bytes()
+    registry.update_node_status("N0", "active")
+    registry.save()
+    # Crash between replacing registry.json and unlinking the journal
+    registry.journal_file.write_bytes(stale_journal)
+
+    reloaded = HeadyRegistry(str(tmp_path))
+    assert reloaded.nodes["N0"].status == "active"
+    assert not reloaded.journal_file.exists()
+    with reloaded.batched():
+        reloaded.update_node_status("N1", "busy")
+    assert HeadyRegistry(str(tmp_path)).nodes["N1"].status == "busy"
+
+
+def test_overlapping_batches_still_write_old_changes(tmp_path):
+    registry = registry_with_nodes(tmp_path, count=2)
+    registry.save_delay = 0.05
+    before = writes(registry)
+    # One orchestration always running while others come and go
+    with registry.batched():
+        with registry.batched():
+            registry.update_node_status("N0", "busy")
+        assert writes(registry) == before
+
+        time.sleep(0.1)
+        with registry.batched():
+            registry.update_node_status("N1", "busy")
+        assert writes(registry) == before + 1
+        assert HeadyRegistry(str(tmp_path)).nodes["N1"].status == "busy"
+
+
+def test_torn_journal_tail_is_dropped(tmp_path):
+    registry = registry_with_nodes(tmp_path, count=2)
+    with registry.batched():
+        registry.update_node_status("N0", "active")
+    with open(registry.journal_file, "a") as f:
+        f.write('{"kind": "nodes", "name": "N1", "fie')
+
+    reloaded = HeadyRegistry(str(tmp_path))
+    assert reloaded.nodes["N0"].status == "active" and reloaded.nodes["N1"].status == "available"
+    with reloaded.batched():
+        reloaded.update_node_status("N1", "active")
+    assert HeadyRegistry(str(tmp_path)).nodes["N1"].status == "active"
+
+
+def test_orchestrating_twenty_nodes_writes_the_registry_once(tmp_path):
+    conductor = HeadyConductor(str(tmp_path))
+    conductor.registry = registry_with_nodes(tmp_path)
+    conductor.resource_policies = {"executionLog": {"persist": False}}
+    plan = {"confidence": 0.9, "workflows_to_execute": [], "tools_to_use": [], "services_required": [],
+            "nodes_to_invoke": [{"name": name, "role": node.role, "primary_tool": node.primary_tool}
+                                for name, node in conductor.registry.nodes.items()]}
+    conductor.brain = SimpleNamespace(execute_with_context=lambda request, config: {"context": {"execution_plan": plan}},
+                                      _extract_keywords=lambda request: [])
+    conductor.memory = SimpleNamespace(store=lambda **kwargs: None)
+    before = writes(conductor.registry)
+    try:
+        result = conductor.orchestrate("invoke every node")
+    finally:
+        conductor.shutdown()
+
+    assert len(result["results"]["nodes"]) == 20
+    assert writes(conductor.registry) == before + 1
+    assert all(node.last_invoked for node in HeadyRegistry(str(tmp_path)).nodes.values())
+
+
+def write_sources(root, workflows=("build", "deploy", "review"), tools=("auto_doc", "research/scraper")):
+    (root / "HeadyAcademy" / "Tools").mkdir(parents=True, exist_ok=True)
+    (root / "HeadyAcademy" / "Node_Registry.yaml").write_text(
+        "nodes:\n  - name: ATLAS\n    role: Documentation\n    primary_tool: auto_doc\n")
+    (root / ".windsurf" / "workflows").mkdir(parents=True, exist_ok=True)
+    for name in workflows:
+        (root / ".windsurf" / "workflows" / f"{name}.md").write_text(f"---\ndescription: {name} things\n---\n")
+    for name in tools:
+        path = root / "HeadyAcademy" / "Tools" / f"{name}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("def main(): pass\n")
+
+
+def test_refresh_reparses_only_changed_sources(tmp_path):
+    write_sources(tmp_path)
+    HeadyRegistry(str(tmp_path))
+
+    registry = HeadyRegistry(str(tmp_path))
+    assert registry.refresh_stats == {"refreshes": 1, "hashed": 0, "parsed": 0, "deltas": 0}
+    assert registry.tools["scraper"].category == "research"
+    version, untouched = registry.version, registry.workflows["build"]
+    with registry.batched():
+        registry.update_node_status("ATLAS", "busy")
+
+    (tmp_path / ".windsurf" / "workflows" / "deploy.md").write_text("---\ndescription: ship it\n---\n// turbo\n")
+    os.utime(tmp_path / ".windsurf" / "workflows" / "review.md")
+    delta = registry.refresh()
+    assert delta == {"added": [], "updated": ["workflows:deploy"], "removed": []}
+    assert registry.refresh_stats["hashed"] == 2 and registry.refresh_stats["parsed"] == 1
+    assert registry.workflows["deploy"].turbo_enabled and registry.workflows["build"] is untouched
+    assert registry.version == version + 1
+
+    assert registry.refresh() == {"added": [], "updated": [], "removed": []}
+    assert registry.refresh_stats["hashed"] == 2 and registry.version == version + 1
+    reloaded = HeadyRegistry(str(tmp_path))
+    assert reloaded.refresh_stats["parsed"] == 0 and reloaded.workflows["deploy"].description == "ship it"
+    assert reloaded.nodes["ATLAS"].status == "busy"
+
+
+def test_refresh_adds_and_removes_sources_keeping_statuses(tmp_path):
+    write_sources(tmp_path)
+    registry = HeadyRegistry(str(tmp_path))
+    registry.update_node_status("ATLAS", "busy", "2026-01-01T00:00:00")
+
+    (tmp_path / ".windsurf" / "workflows" / "build.md").unlink()
+    (tmp_path / "HeadyAcademy" / "Tools" / "lint.py").write_text("def main(): pass\n")
+    node_registry = tmp_path / "HeadyAcademy" / "Node_Registry.yaml"
+    node_registry.write_text(node_registry.read_text().replace("Documentation", "Docs") +
+                             "  - name: MUSE\n    role: Content\n    primary_tool: lint\n")
+    delta = registry.refresh()
+
+    assert delta == {"added": ["nodes:MUSE", "tools:lint"], "updated": ["nodes:ATLAS"],
+                     "removed": ["workflows:build"]}
+    assert registry.nodes["ATLAS"].role == "Docs" and registry.nodes["ATLAS"].status == "busy"
+    assert registry.nodes["ATLAS"].last_invoked == "2026-01-01T00:00:00"
+    assert set(HeadyRegistry(str(tmp_path)).workflows) == {"deploy", "review"}
+
+
+def test_stale_snapshot_is_reconciled_with_sources(tmp_path):
+    write_sources(tmp_path)
+    registry = HeadyRegistry(str(tmp_path))
+    data = json.loads(registry.registry_file.read_text())
+    data["workflows"]["ghost"] = {**data["workflows"]["build"], "name": "ghost"}
+    data["workflows"]["build"]["file_path"] = "C:\\Users\\someone\\build.md"
+    data["nodes"]["ATLAS"]["status"] = "busy"
+    registry.registry_file.write_text(json.dumps(data))
+
+    # registry-sources.json belongs to the overwritten snapshot, so every source is checked
+    reloaded = HeadyRegistry(str(tmp_path))
+    assert reloaded.refresh_stats["parsed"] == 6
+    assert set(reloaded.workflows) == {"build", "deploy", "review"}
+    assert reloaded.workflows["build"].file_path == str(tmp_path / ".windsurf" / "workflows" / "build.md")
+    assert reloaded.nodes["ATLAS"].status == "busy"
+
+
+@pytest.mark.skipif(not inotify_available(), reason="needs inotify")
+def test_watcher_applies_single_file_deltas(tmp_path):
+    write_sources(tmp_path)
+    registry = HeadyRegistry(str(tmp_path))
+    version = registry.version
+    watcher = RegistryWatcher(registry, debounce=0.01).start()
+    try:
+        (tmp_path / ".windsurf" / "workflows" / "release.md").write_text("---\ndescription: cut a release\n---\n")
+        (tmp_path / "HeadyAcademy" / "notes.txt").write_text("not a source")
+        deadline = time.monotonic() + 5
+        while "release" not in registry.workflows and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert registry.workflows["release"].description == "cut a release"
+        assert registry.version == version + 1
+        # Only the new file was looked at
+        assert registry.refresh_stats["hashed"] == 1 and registry.refresh_stats["parsed"] == 1
+
+        (tmp_path / "HeadyAcademy" / "Tools" / "research" / "scraper.py").unlink()
+        deadline = time.monotonic() + 5
+        while "scraper" in registry.tools and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "scraper" not in registry.tools and registry.version == version + 2
+    finally:
+        watcher.stop()
+    assert watcher.stats["deltas"] == 2
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_router.py                                       ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the RouterIndex behind HeadyConductor.analyze_request.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyRegistry import Node, Workflow, Service, Tool
+from HeadyRouter import RouterIndex, PlanMemo
+from HeadyConductor import HeadyConductor
+
+
+def make_registry():
+    return SimpleNamespace(
+        version=1,
+        workflows={
+            "hcautobuild": Workflow(name="hcautobuild", description="Build test and deploy the whole stack",
+                                    file_path="/wf/hcautobuild.md", slash_command="/hcautobuild"),
+            "Release": Workflow(name="Release", description="Publish a tagged release",
+                                file_path="/wf/Release.md", slash_command="/Release"),
+        },
+        nodes={
+            "SENTINEL": Node(name="SENTINEL", role="Security", primary_tool="scan", trigger_on=["audit"]),
+            "MUSE": Node(name="MUSE", role="Writer", primary_tool="write", trigger_on=[]),
+        },
+        tools={"Gap_Scanner": Tool(name="Gap_Scanner", file_path="/tools/gap.py", category="scan")},
+        services={"api": Service(name="api", type="api", endpoint="http://localhost:3300"),
+                  "worker": Service(name="worker", type="worker", endpoint=None)},
+    )
+
+
+def test_rank_returns_calibrated_top_k():
+    index = RouterIndex(make_registry())
+
+    ranked = index.rank("audit the gap scanner and the api", top_k=None, min_score=0.0)
+    assert [m.name for m in ranked][:3] == ["Gap_Scanner", "api", "SENTINEL"]
+    assert all(0.0 < m.confidence <= 1.0 for m in ranked)
+    assert ranked == sorted(ranked, key=lambda m: -m.confidence)
+
+    assert [m.name for m in index.rank("audit the gap scanner and the api", top_k=2, min_score=0.0)] == \
+        ["Gap_Scanner", "api"]
+    assert index.rank("deploy things", min_score=0.9) == []
+    # Slash commands are explicit and rank first with full confidence
+    assert index.rank("publish /release")[0].name == "Release"
+    assert index.rank("publish /release")[0].confidence == 1.0
+    assert index.rank("unknown words only") == []
+
+
+def test_conductor_rebuilds_index_when_registry_changes():
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.registry = make_registry()
+    conductor._router_index = None
+    conductor.plan_memo = PlanMemo()
+    conductor.route_top_k, conductor.route_min_score = 3, 0.2
+
+    plan = conductor.analyze_request("run hcautobuild")
+    first_index = conductor.get_router_index()
+    assert [w["name"] for w in plan["workflows_to_execute"]] == ["hcautobuild"]
+    assert 0.2 <= plan["confidence"] < 1.0
+    assert plan["workflows_to_execute"][0]["relevance"] == plan["confidence"]
+    assert conductor.get_router_index() is first_index
+
+    conductor.registry.tools["hcdeploy"] = Tool(name="hcdeploy", file_path="/tools/hcdeploy.py", category="ops")
+    plan = conductor.analyze_request("run hcdeploy")
+    assert conductor.get_router_index() is not first_index
+    assert [t["name"] for t in plan["tools_to_use"]] == ["hcdeploy"]
+
+    conductor.registry.version += 1
+    assert conductor.analyze_request("nothing relevant")["confidence"] == 0.0
+
+
+def test_plan_memo_serves_repeats_and_forgets_on_registry_change():
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.registry = make_registry()
+    conductor._router_index = None
+    conductor.plan_memo = PlanMemo(max_entries=2)
+    conductor.route_top_k, conductor.route_min_score = 3, 0.2
+
+    first = conductor.analyze_request("run hcautobuild")
+    first["workflows_to_execute"][0]["name"] = "mutated by caller"
+    repeat = conductor.analyze_request("  Run   HCAUTOBUILD ")
+    assert repeat["routing"]["memo_hit"] and not first["routing"]["memo_hit"]
+    assert repeat["request"] == "  Run   HCAUTOBUILD "
+    assert [w["name"] for w in repeat["workflows_to_execute"]] == ["hcautobuild"]
+
+    conductor.analyze_request("check security")
+    conductor.analyze_request("deploy api")
+    stats = conductor.plan_memo.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (1, 3, 1, 2)
+
+    conductor.registry.version += 1
+    assert not conductor.analyze_request("deploy api")["routing"]["memo_hit"]
+    assert conductor.plan_memo.get_stats()["invalidations"] == 1
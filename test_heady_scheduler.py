@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_scheduler.py                                    ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the priority request scheduler in front of HeadyConductor.orchestrate.
+"""
+
+import sys
+import time
+import threading
+import contextvars
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyExecutor import load_resource_policies
+from HeadyScheduler import PoolPolicy, RequestScheduler, SchedulerOverloaded
+from HeadyConductor import HeadyConductor, run_command
+
+
+def pools(**reserved):
+    ranks = {"hot": "critical", "warm": "high", "cold": "low"}
+    return {name: PoolPolicy(name, ranks[name], count, max_latency_ms=200) for name, count in reserved.items()}
+
+
+def test_hot_reservation_survives_cold_flood_and_cold_soaks_spare_slots():
+    release = threading.Event()
+    scheduler = RequestScheduler(max_concurrent=4, max_per_user=10, pools=pools(hot=2, warm=1, cold=1))
+    try:
+        batch = [scheduler.submit(release.wait, pool="cold", user="batch") for _ in range(6)]
+        metrics = scheduler.get_metrics()["pools"]
+        # Cold borrows every slot except the hot reservation, including the idle warm one
+        assert (metrics["cold"]["running"], metrics["cold"]["queued"]) == (2, 4)
+
+        started = time.monotonic()
+        assert scheduler.run(lambda: "answer", pool="hot", user="alice") == "answer"
+        assert time.monotonic() - started < 0.1
+        assert scheduler.get_metrics()["pools"]["hot"]["queue_wait"]["max_ms"] < 100
+    finally:
+        release.set()
+        scheduler.shutdown()
+    assert all(future.done() for future in batch)
+    assert scheduler.get_metrics()["pools"]["cold"]["completed"] == 6
+
+
+def test_users_take_turns_within_a_pool():
+    gate = threading.Event()
+    order = []
+    scheduler = RequestScheduler(max_concurrent=1, max_per_user=1, pools=pools(hot=1))
+    scheduler.submit(gate.wait, user="blocker")
+    for user, n in (("a", 1), ("a", 2), ("a", 3), ("b", 1)):
+        scheduler.submit(order.append, f"{user}{n}", user=user)
+    gate.set()
+    scheduler.shutdown()
+    assert order == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.parametrize("overflow", ["reject", "throttle", "buffer"])
+def test_overflow_actions(overflow):
+    gate = threading.Event()
+    scheduler = RequestScheduler(max_concurrent=1, pools=pools(hot=1), overflow=overflow, max_queued=1)
+    scheduler.submit(gate.wait)
+    scheduler.submit(lambda: None)
+
+    if overflow == "buffer":
+        scheduler.submit(lambda: None)
+        assert scheduler.get_metrics()["queued"] == 2
+    elif overflow == "reject":
+        with pytest.raises(SchedulerOverloaded):
+            scheduler.submit(lambda: None)
+    else:
+        # Room frees up while the caller is held back
+        threading.Timer(0.05, gate.set).start()
+        assert scheduler.submit(lambda: "late").result(timeout=1) == "late"
+        assert scheduler.get_metrics()["pools"]["hot"]["throttled"] == 1
+    gate.set()
+    scheduler.shutdown()
+
+
+def test_policies_and_conductor_submit():
+    policies = load_resource_policies(Path(__file__).parent)
+    scheduler = RequestScheduler.from_policies(policies)
+    assert scheduler.max_concurrent == policies["concurrency"]["maxConcurrentTasks"]
+    assert list(scheduler.pools) == ["hot", "warm", "cold"]
+    assert scheduler.pools["hot"].reserved == policies["nodePools"]["hot"]["reservedConcurrency"]
+
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.scheduler = scheduler
+    conductor.orchestrate = lambda request, user_config: {"request": request, "config": user_config}
+    result = conductor.submit("nightly report", {"depth": 1}, pool="cold", user="cron").result(timeout=5)
+    assert result == {"request": "nightly report", "config": {"depth": 1}}
+    assert 'heady_scheduler_queue_wait_seconds_count{pool="cold"} 1' in scheduler.to_openmetrics()
+    scheduler.shutdown()
+
+
+def test_cli_requests_run_behind_the_scheduler_in_the_callers_context():
+    caller = contextvars.ContextVar("caller", default=None)
+    scheduler = RequestScheduler(max_concurrent=2)
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.scheduler = scheduler
+    conductor.orchestrate = lambda request, user_config: {"request": request, "caller": caller.get(),
+                                                           "thread": threading.current_thread().name}
+
+    caller.set("cli")
+    result = run_command(conductor, "request", "deploy the application")
+    assert result["request"] == "deploy the application" and result["caller"] == "cli"
+    assert result["thread"] != threading.current_thread().name
+    assert scheduler.get_metrics()["pools"]["hot"]["submitted"] == 1
+    scheduler.shutdown()
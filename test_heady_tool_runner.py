@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_tool_runner.py                                  ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the warm process-pool ToolRunner and HeadyConductor._execute_tool.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyRegistry import Tool
+from HeadyToolRunner import ToolRunner
+from HeadyConductor import HeadyConductor
+
+ECHO_TOOL = '''
+import os, time
+
+def scan(target, delay=0):
+    time.sleep(delay)
+    print(f"scanning {target}")
+    return {"target": target, "pid": os.getpid()}
+
+def explode():
+    raise ValueError("bad input")
+'''
+
+
+@pytest.fixture
+def tools_dir(tmp_path):
+    tools = tmp_path / "HeadyAcademy" / "Tools"
+    (tools / "Nested").mkdir(parents=True)
+    (tools / "Echo.py").write_text(ECHO_TOOL)
+    (tools / "Nested" / "Quit.py").write_text("import sys\ndef main():\n    sys.exit(2)\n")
+    return tools
+
+
+def test_warm_calls_are_cheap_and_structured(tools_dir):
+    runner = ToolRunner(tools_dir, workers=1)
+    try:
+        runner.warm()
+        result = runner.run("Echo", "repo")
+        assert result.success and result.entry == "scan"
+        assert result.value["target"] == "repo" and result.stdout == "scanning repo\n"
+        assert result.overhead_ms < 50
+
+        failed = runner.run("Echo", entry="explode")
+        assert not failed.success and failed.error == "ValueError: bad input"
+        assert "Traceback" in failed.stderr
+        assert runner.run("Quit").error == "SystemExit: 2"
+        assert runner.run("Missing").error == "Unknown tool 'Missing'"
+        # Failures do not cost the worker
+        assert runner.run("Echo", "again").worker_pid == result.worker_pid
+    finally:
+        runner.close()
+
+
+def test_timeouts_kill_and_recycling_replaces_workers(tools_dir):
+    runner = ToolRunner(tools_dir, workers=1, max_calls_per_worker=2)
+    try:
+        first = runner.run("Echo", "a").value["pid"]
+        assert runner.run("Echo", "b").value["pid"] == first
+        assert runner.run("Echo", "c").value["pid"] != first
+
+        slow = runner.run("Echo", "slow", delay=5, timeout=0.2)
+        assert not slow.success and slow.error.startswith("Timed out")
+        assert runner.run("Echo", "d").success
+        stats = runner.get_stats()
+        assert stats["timeouts"] == 1 and stats["workers_recycled"] == 1
+    finally:
+        runner.close()
+
+
+def test_conductor_executes_tools_only_when_enabled(tools_dir):
+    conductor = HeadyConductor.__new__(HeadyConductor)
+    conductor.root_path = tools_dir.parent.parent
+    conductor.registry = SimpleNamespace(tools={"Echo": Tool(name="Echo", file_path=str(tools_dir / "Echo.py"),
+                                                             category="general")})
+    conductor._tool_runner = None
+    conductor._tool_runner_lock = threading.Lock()
+
+    conductor.resource_policies = {}
+    assert "run" not in conductor._execute_tool("Echo")
+
+    conductor.resource_policies = {"toolRunner": {"enabled": True, "workers": 1}}
+    try:
+        result = conductor._execute_tool("Echo", {"args": ["docs"]})
+        assert result["success"] and result["run"]["value"]["target"] == "docs"
+        assert conductor.get_tool_runner() is conductor._tool_runner
+    finally:
+        conductor._tool_runner.close()
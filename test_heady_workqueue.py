@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_heady_workqueue.py                                    ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the work-queue conductor: SQLite broker, workers and the queue engine.
+"""
+
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyExecutor import PlanStep, RetryPolicy
+from HeadyWorkQueue import Broker, SQLiteBroker, QueueEngine, QueueWorker, conductor_handler
+from HeadyConductor import HeadyConductor
+
+NO_BACKOFF = RetryPolicy(base_delay_ms=0, jitter_ms=0)
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def step(step_id, depends_on=(), **payload):
+    return PlanStep(step_id, fn=None, depends_on=list(depends_on), payload=dict(payload, id=step_id))
+
+
+def test_visibility_timeout_hands_job_to_next_worker(tmp_path):
+    clock = Clock()
+    broker = SQLiteBroker(tmp_path / "queue.db", clock=clock)
+    job_id = broker.enqueue("q", {"n": 1}, max_attempts=2)
+
+    job = broker.lease("q", "w1", visibility_timeout=10)
+    assert (job.id, job.attempts, job.payload) == (job_id, 1, {"n": 1})
+    assert broker.lease("q", "w2", 10) is None
+
+    clock.now += 11
+    job = broker.lease("q", "w2", 10)
+    assert (job.worker, job.attempts) == ("w2", 2)
+    assert not broker.ack(job_id, "w1", "late")
+    assert broker.ack(job_id, "w2", {"ok": True})
+    assert broker.wait("b", [job_id], 0)[job_id].result == {"ok": True}
+
+    # A worker dying on the final attempt fails the job
+    job_id = broker.enqueue("q", {"n": 2}, batch="b", max_attempts=1)
+    broker.lease("q", "w1", 10)
+    clock.now += 11
+    assert broker.lease("q", "w2", 10) is None
+    assert broker.wait("b", [job_id], 0)[job_id].status == "failed"
+
+
+def test_incomplete_broker_fails_at_construction():
+    class LeaseOnlyBroker(Broker):
+        def lease(self, queue, worker, visibility_timeout):
+            return None
+
+    with pytest.raises(TypeError):
+        LeaseOnlyBroker()
+
+
+def test_failed_attempts_are_retried_after_delay(tmp_path):
+    clock = Clock()
+    broker = SQLiteBroker(tmp_path / "queue.db", clock=clock)
+    job_id = broker.enqueue("q", {}, max_attempts=2)
+
+    broker.lease("q", "w1", 10)
+    assert broker.fail(job_id, "w1", "boom", retry_delay=5)
+    assert broker.lease("q", "w1", 10) is None
+    clock.now += 5
+    assert broker.lease("q", "w1", 10).attempts == 2
+    broker.fail(job_id, "w1", "boom again")
+    job = broker.wait("b", [job_id], 0)[job_id]
+    assert (job.status, job.error) == ("failed", "boom again")
+
+
+def test_engine_aggregates_results_in_dependency_order(tmp_path):
+    broker = SQLiteBroker(tmp_path / "queue.db")
+    seen, flaky_calls = [], []
+
+    def handler(payload):
+        seen.append(payload["id"])
+        if payload["id"] == "flaky" and len(flaky_calls) < 1:
+            flaky_calls.append(1)
+            raise ConnectionError("transient")
+        if payload["id"] == "bad":
+            return {"success": False, "error": "refused"}
+        return {"success": True, "echo": payload["id"]}
+
+    worker = QueueWorker(broker, handler, concurrency=2, retry_policy=NO_BACKOFF).start()
+    try:
+        engine = QueueEngine(broker, result_timeout=5)
+        results = engine.run([
+            step("first"), step("second", depends_on=["first"]), step("flaky"),
+            step("bad"), step("after_bad", depends_on=["bad"])
+        ])
+    finally:
+        worker.stop()
+
+    by_id = {r.id: r for r in results}
+    assert [r.id for r in results] == ["first", "second", "flaky", "bad", "after_bad"]
+    assert by_id["second"].result == {"success": True, "echo": "second"}
+    assert seen.index("first") < seen.index("second")
+    assert (by_id["flaky"].status, by_id["flaky"].attempts) == ("completed", 2)
+    assert (by_id["bad"].status, by_id["bad"].error) == ("failed", "refused")
+    assert by_id["after_bad"].status == "skipped"
+    # Collected batches are forgotten; every status is still reported
+    assert broker.stats("conductor") == {"queued": 0, "leased": 0, "done": 0, "failed": 0, "cancelled": 0}
+    assert engine.max_workers == 2
+
+
+def test_throughput_scales_with_workers(tmp_path):
+    broker = SQLiteBroker(tmp_path / "queue.db")
+    steps = [step(f"s{i}") for i in range(8)]
+
+    def timed(workers):
+        pool = [QueueWorker(broker, lambda payload: time.sleep(0.1) or {"ok": True}) for _ in range(workers)]
+        for worker in pool:
+            worker.start()
+        try:
+            started = time.monotonic()
+            assert all(r.success for r in QueueEngine(broker, result_timeout=10).run(steps))
+            return time.monotonic() - started
+        finally:
+            for worker in pool:
+                worker.stop()
+
+    one, four = timed(1), timed(4)
+    assert one >= 0.8
+    assert four < one / 2
+
+
+def test_worker_in_another_process(tmp_path):
+    db = tmp_path / "queue.db"
+    script = (
+        "import sys; sys.path.insert(0, sys.argv[1])\n"
+        "from HeadyWorkQueue import SQLiteBroker, QueueWorker\n"
+        "broker = SQLiteBroker(sys.argv[2])\n"
+        "worker = QueueWorker(broker, lambda p: {'pid_square': p['n'] ** 2}).start()\n"
+        "import time; time.sleep(float(sys.argv[3])); worker.stop()\n"
+    )
+    proc = subprocess.Popen([sys.executable, "-c", script, str(Path(__file__).parent / "HeadyAcademy"),
+                             str(db), "5"])
+    try:
+        results = QueueEngine(SQLiteBroker(db), result_timeout=4).run(
+            [PlanStep(f"n{n}", fn=None, payload={"n": n}) for n in range(3)])
+    finally:
+        proc.kill()
+        proc.wait()
+    assert [r.result for r in results] == [{"pid_square": 0}, {"pid_square": 1}, {"pid_square": 4}]
+
+
+def test_conductor_plan_steps_run_on_queue_workers(tmp_path):
+    conductor = HeadyConductor(str(tmp_path))
+    conductor.resource_policies = {"workQueue": {"enabled": True, "sqlitePath": str(tmp_path / "queue.db"),
+                                                 "resultTimeoutMs": 10000}}
+    worker_node = HeadyConductor(str(tmp_path))
+    worker = QueueWorker(conductor.executor.broker, conductor_handler(worker_node)).start()
+    try:
+        steps, _ = conductor._build_plan_steps({"services_required": [{"name": "mcp-server", "type": "mcp"}]})
+        [result] = conductor.executor.run(steps)
+    finally:
+        worker.stop()
+        conductor.shutdown()
+        worker_node.shutdown()
+
+    assert type(conductor.executor).__name__ == "QueueEngine"
+    assert result.success
+    assert result.result["services"]["mcp-server"]["status"] == "unknown"
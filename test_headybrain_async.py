@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_headybrain_async.py                                   ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyBrain.process_request_async using lightweight stub components.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain
+
+
+class StubLens:
+    def get_current_state(self):
+        return {"system_health": "healthy", "nodes_active": ["LENS"], "services": {"api": "healthy"}}
+
+
+class StubMemory:
+    def __init__(self, block_until_cancelled=False):
+        self.block_until_cancelled = block_until_cancelled
+        self.cancelled = threading.Event()
+        self.stored = []
+
+    def search(self, keywords, max_results=10, cancel_event=None):
+        if self.block_until_cancelled:
+            while not cancel_event.is_set():
+                time.sleep(0.01)
+            self.cancelled.set()
+            raise RuntimeError("cancelled")
+        return [{"id": "m1", "category": "processing_context", "tags": ["deployment"]}]
+
+    def get_all_preferences(self, category=None):
+        return {"default_mode": "all_systems"}
+
+    def store(self, category, content, tags=None, source="system"):
+        self.stored.append((category, content))
+
+
+class StubConductor:
+    execution_log = []
+
+    def analyze_request(self, request):
+        return {"confidence": 0.9, "nodes_to_invoke": [], "workflows_to_execute": [],
+                "tools_to_use": [], "services_required": []}
+
+
+def test_async_pipeline_runs_many_requests_on_one_loop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor())
+    threads_before = threading.active_count()
+
+    async def run_all():
+        return await asyncio.gather(*[
+            brain.process_request_async(f"deploy service {i}", {"enable_caching": False})
+            for i in range(200)
+        ])
+
+    contexts = asyncio.run(run_all())
+
+    assert len(contexts) == 200
+    assert all(c.execution_plan["confidence"] == 0.9 for c in contexts)
+    assert "deployment" in contexts[0].concepts_identified
+    # Executor workers plus the write-behind thread, regardless of request count
+    assert threading.active_count() <= threads_before + brain.executor._max_workers + 1
+    assert brain.metrics["requests_processed"] == 200
+
+
+def test_async_stage_timeout_cancels_memory_query(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    memory = StubMemory(block_until_cancelled=True)
+    brain = HeadyBrain(lens=StubLens(), memory=memory, conductor=StubConductor())
+
+    context = asyncio.run(brain.process_request_async(
+        "deploy the application", {"enable_caching": False, "stage_timeout_seconds": 0.2}
+    ))
+
+    assert context.relevant_memories == []
+    assert context.system_state["system_health"] == "healthy"
+    assert memory.cancelled.wait(timeout=2)
+
+
+def test_async_stage_timeout_excludes_time_queued_for_a_worker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor())
+    brain.executor = ThreadPoolExecutor(max_workers=1)
+    # Another request's stage holds the only worker for longer than the stage timeout
+    brain.executor.submit(time.sleep, 0.3)
+
+    context = asyncio.run(brain.process_request_async(
+        "deploy the application", {"enable_caching": False, "stage_timeout_seconds": 0.2}
+    ))
+
+    assert [m["id"] for m in context.relevant_memories] == ["m1"]
+    assert context.execution_plan["confidence"] == 0.9
+
+
+def test_async_spill_persistence_runs_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor(),
+                       write_behind={"overflow_policy": "spill", "spill_path": str(tmp_path / "spill.jsonl")})
+    put_threads = []
+    put_many = brain.persistence.put_many
+    brain.persistence.put_many = lambda records: (put_threads.append(threading.current_thread()), put_many(records))[1]
+
+    async def run():
+        await brain.process_request_async("deploy the application", {"enable_caching": False})
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    brain.persistence.close()
+
+    assert len(put_threads) == 1 and put_threads[0] is not loop_thread
+
+
+def test_async_and_sync_share_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor())
+
+    first = asyncio.run(brain.process_request_async("monitor system health"))
+    second = brain.process_request("monitor system health")
+
+    assert not first.cache_hit
+    assert second.cache_hit
+
+
+class SlowConductor(StubConductor):
+    def __init__(self, delay=0.2, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    def analyze_request(self, request):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return super().analyze_request(request)
+
+
+def test_identical_sync_requests_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor()
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=conductor)
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        contexts = list(pool.map(
+            lambda _: brain.process_request("deploy the application", {"enable_caching": False}), range(5)
+        ))
+
+    assert conductor.calls == 1
+    assert brain.metrics["coalesced_requests"] == 4
+    # Each caller gets its own context, so per-call timing cannot leak between them
+    assert len({id(c) for c in contexts}) == 5
+    assert {c.execution_plan["confidence"] for c in contexts} == {0.9}
+    assert brain.coalescer.in_flight() == 0
+
+
+def test_coalesced_sync_requests_share_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor(error=ValueError("registry unavailable"))
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=conductor)
+
+    def call(_):
+        try:
+            brain.process_request("deploy the application", {"enable_caching": False})
+        except ValueError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        errors = list(pool.map(call, range(3)))
+
+    assert conductor.calls == 1
+    assert errors == ["registry unavailable"] * 3
+    assert brain.coalescer.in_flight() == 0
+
+
+def test_identical_async_requests_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor()
+    memory = StubMemory()
+    brain = HeadyBrain(lens=StubLens(), memory=memory, conductor=conductor)
+
+    async def run_all():
+        return await asyncio.gather(*[
+            brain.process_request_async("deploy the application", {"enable_caching": False})
+            for _ in range(10)
+        ])
+
+    contexts = asyncio.run(run_all())
+    brain.flush_persistence()
+
+    assert conductor.calls == 1
+    assert len(memory.stored) == 1
+    assert brain.metrics["coalesced_requests"] == 9
+    assert len({id(c) for c in contexts}) == 10
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_headybrain_batch.py                                   ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyBrain.process_batch and the bulk HeadyMemory helpers it relies on.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain
+from HeadyMemory import HeadyMemory
+
+
+class CountingLens:
+    def __init__(self):
+        self.snapshots = 0
+
+    def get_current_state(self):
+        self.snapshots += 1
+        return {"system_health": "healthy", "nodes_active": [], "services": {}}
+
+
+class CountingConductor:
+    execution_log = []
+
+    def __init__(self):
+        self.batches = []
+
+    def analyze_requests(self, requests):
+        self.batches.append(list(requests))
+        return [{"request": r, "confidence": 0.8, "nodes_to_invoke": [], "workflows_to_execute": [],
+                 "tools_to_use": [], "services_required": []} for r in requests]
+
+
+def test_store_many_and_search_many(tmp_path):
+    memory = HeadyMemory(str(tmp_path))
+    ids = memory.store_many([
+        {"category": "concept", "content": {"n": 1}, "tags": ["deploy"]},
+        {"category": "concept", "content": {"n": 2}, "tags": ["monitor"]},
+        {"category": "task", "content": {"n": 3}, "tags": ["audit"]},
+    ])
+
+    assert len(ids) == 3
+    assert memory.get_statistics()["total_memories"] == 3
+    [found] = memory.search_many([["deploy", "monitor"]])
+    assert sorted(m["content"]["n"] for m in found) == [1, 2]
+
+
+def test_search_many_limits_each_list_and_counts_only_returned(tmp_path):
+    memory = HeadyMemory(str(tmp_path))
+    memory.store_many([{"category": "concept", "content": {"n": n}, "tags": ["deploy"], "relevance_score": n / 10}
+                       for n in range(5)])
+    memory.store("concept", {"n": "audit"}, tags=["audit"])
+
+    deploys, audits, nothing = memory.search_many([["deploy"], ["audit", "deploy"], ["unknown"]], max_results=2)
+
+    assert [m["content"]["n"] for m in deploys] == [4, 3]
+    assert [m["content"]["n"] for m in audits] == ["audit", 4]
+    assert nothing == []
+    counts = {entry.content["n"]: entry.access_count - 1 for entry in memory.query(category="concept")}
+    assert counts == {0: 0, 1: 0, 2: 0, 3: 1, 4: 1, "audit": 1}
+
+
+def test_batch_and_single_recall_agree_past_the_limit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    memory = HeadyMemory(str(tmp_path))
+    memory.store_many([{"category": "concept", "content": {"n": n}, "tags": ["deploy"], "relevance_score": n / 40}
+                       for n in range(30)])
+    brain = HeadyBrain(memory=memory)
+    config = {**brain.default_config, "use_lens": False, "use_conductor": False}
+
+    [batch], _, _ = brain._recall_knowledge_batch(["deploy the application"], config)
+    single, _, _ = brain._recall_knowledge("deploy the application", config)
+
+    assert [m["content"]["n"] for m in single] == list(range(29, 19, -1))
+    assert batch == single
+
+
+def test_process_batch_dedupes_and_shares_one_pass(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    memory = HeadyMemory(str(tmp_path))
+    memory.store("concept", {"topic": "deploys"}, tags=["deploy"], source="test")
+    lens = CountingLens()
+    conductor = CountingConductor()
+    brain = HeadyBrain(lens=lens, memory=memory, conductor=conductor)
+
+    requests = ["deploy the application", "Deploy  the   application", "monitor system health"]
+    contexts = brain.process_batch(requests)
+    brain.flush_persistence()
+
+    assert len(contexts) == 3
+    assert contexts[0] is contexts[1]
+    assert lens.snapshots == 1
+    assert conductor.batches == [["deploy the application", "monitor system health"]]
+    assert contexts[0].relevant_memories[0]["content"] == {"topic": "deploys"}
+    assert contexts[2].relevant_memories == []
+    assert memory.get_statistics()["by_category"]["processing_context"] == 2
+
+    # Every spelling is now warm in the shared cache
+    assert brain.process_request("Deploy  the   application").cache_hit
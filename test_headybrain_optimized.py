@@ -15,8 +15,14 @@
 # ╚══════════════════════════════════════════════════════════════════╝
 # HEADY_BRAND:END
 
-from HeadyAcademy.HeadyBrain_optimized import HeadyBrainOptimized
+import sys
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain
+from HeadyBrain_optimized import HeadyBrainOptimized
 
 def test_headybrain_optimized():
     """Comprehensive test of HeadyBrain optimizations."""
@@ -117,6 +123,19 @@ def test_headybrain_optimized():
     
     return passed == total
 
+
+def test_optimized_cache_entries_are_readable_by_headybrain(tmp_path, monkeypatch):
+    """Both brains share .heady_cache, so entries carry the same timestamp envelope."""
+    monkeypatch.chdir(tmp_path)
+    optimized = HeadyBrainOptimized(quiet=True)
+    context = optimized.process_request("monitor system health")
+    cache_key = optimized._get_cache_key("monitor system health", optimized.default_config)
+
+    cached = HeadyBrain(quiet=True)._load_from_cache(cache_key, 30)
+    assert cached is not None and cached.request == context.request
+    assert optimized._load_from_cache(cache_key, 30).request == context.request
+
+
 if __name__ == "__main__":
     success = test_headybrain_optimized()
     exit(0 if success else 1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_headybrain_prefetch.py                                ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyBrain speculative prefetch of predicted follow-up requests.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain
+from HeadyPrefetch import SpeculativePrefetcher
+from test_headybrain_async import StubLens, StubMemory, SlowConductor
+
+
+def test_deploy_verify_monitor_session_is_served_from_prefetch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    memory = StubMemory()
+    conductor = SlowConductor(delay=0.05)
+    brain = HeadyBrain(lens=StubLens(), memory=memory, conductor=conductor, quiet=True,
+                       prefetch={"enabled": True, "duty_cycle": 0.9})
+
+    first = brain.process_request("deploy the application")
+    assert brain.prefetcher.wait_idle(timeout=5)
+
+    verify = brain.process_request("verify the deployment")
+    assert brain.prefetcher.wait_idle(timeout=5)
+    monitor = brain.process_request("monitor system health")
+    brain.flush_persistence()
+
+    assert not first.cache_hit
+    assert verify.cache_hit and monitor.cache_hit
+    assert conductor.calls == 3
+
+    stats = brain.prefetcher.get_stats()
+    assert stats["warmed"] == 2 and stats["hits"] == 2
+    assert stats["predictions"]["post_deployment_verification_needed"]["hit_rate"] == 1.0
+    # Speculative contexts are not written to MEMORY
+    assert [content["request"] for _, content in memory.stored] == ["deploy the application"]
+    brain.shutdown()
+
+
+def test_prefetch_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=SlowConductor(delay=0), quiet=True)
+
+    brain.process_request("deploy the application")
+
+    assert brain.prefetcher is None
+    assert not brain.process_request("verify the deployment").cache_hit
+
+
+def test_unused_predictions_lose_confidence():
+    prefetcher = SpeculativePrefetcher(lambda request, config: None, is_idle=lambda: True, min_samples=2)
+    prefetcher.prediction_stats["security_findings_likely"] = {"warmed": 4, "hits": 0}
+    prefetcher.prediction_stats["post_deployment_verification_needed"] = {"warmed": 4, "hits": 4}
+
+    assert prefetcher.adjusted_confidence("security_findings_likely", 0.7) == 0.35
+    assert prefetcher.adjusted_confidence("post_deployment_verification_needed", 0.8) == 1.0
+    assert not prefetcher.schedule("security_findings_likely", "fix security", {}, "key", confidence=0.35)
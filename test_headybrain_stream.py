@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_headybrain_stream.py                                  ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyBrain.process_request_stream (sync and async generators).
+"""
+
+import sys
+import json
+import time
+import asyncio
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain, ProcessingContext
+from test_headybrain_async import StubLens, StubMemory, SlowConductor
+
+
+def test_stream_yields_fast_stages_before_slow_plan(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=SlowConductor(delay=0.3), quiet=True)
+
+    events = list(brain.process_request_stream("deploy the application"))
+    types = [e.type for e in events]
+
+    assert types[-1] == "context"
+    assert set(types[:-1]) == {"system_state", "memories", "concepts", "analysis", "plan"}
+    assert types.index("plan") == len(types) - 2
+    assert events[0].elapsed_ms < 150
+    assert isinstance(events[-1].data, ProcessingContext)
+    assert events[-1].data.execution_plan["confidence"] == 0.9
+    json.dumps(events[-1].to_dict(), default=str)
+
+
+def test_stream_replays_cached_context(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor(delay=0)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=conductor, quiet=True)
+
+    list(brain.process_request_stream("monitor system health"))
+    replay = list(brain.process_request_stream("monitor system health"))
+
+    assert conductor.calls == 1
+    assert all(e.cache_hit for e in replay)
+    assert [e.type for e in replay][-1] == "context"
+
+
+def test_async_stream_and_early_close(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=SlowConductor(delay=0.3), quiet=True)
+
+    async def first_event():
+        stream = brain.process_request_stream_async("audit security", {"enable_caching": False})
+        event = await stream.__anext__()
+        await stream.aclose()
+        return event
+
+    async def all_events():
+        return [e async for e in brain.process_request_stream_async("deploy the application")]
+
+    first = asyncio.run(first_event())
+    events = asyncio.run(all_events())
+
+    assert first.type in ("system_state", "memories")
+    assert first.elapsed_ms < 150
+    assert brain.metrics["requests_processed"] == 1
+    assert [e.type for e in events][-2:] == ["plan", "context"]
+
+
+def test_identical_streams_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor()
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=conductor, quiet=True)
+
+    def stream(_):
+        return list(brain.process_request_stream("deploy the application", {"enable_caching": False}))
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        runs = list(pool.map(stream, range(3)))
+
+    assert conductor.calls == 1
+    assert brain.metrics["coalesced_requests"] == 2
+    assert all([e.type for e in run][-1] == "context" for run in runs)
+    assert len({id(run[-1].data) for run in runs}) == 3
+    assert brain.coalescer.in_flight() == 0
+
+
+def test_abandoned_stream_hands_the_request_to_its_waiters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    conductor = SlowConductor(delay=0.3)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=conductor, quiet=True)
+    config = {"enable_caching": False}
+
+    stream = brain.process_request_stream("deploy the application", config)
+    next(stream)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        waiter = pool.submit(brain.process_request, "deploy the application", config)
+        time.sleep(0.05)
+        stream.close()
+        context = waiter.result(timeout=5)
+
+    assert context.execution_plan["confidence"] == 0.9
+    assert conductor.calls == 2
+    assert brain.coalescer.in_flight() == 0
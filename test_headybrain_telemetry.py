@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_headybrain_telemetry.py                               ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for HeadyBrain stage tracing, latency histograms and quiet mode.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyBrain import HeadyBrain
+from HeadyTelemetry import LatencyHistogram, StageTracer
+from test_headybrain_async import StubLens, StubMemory, StubConductor
+
+
+def test_histogram_percentiles_within_precision():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+
+    summary = histogram.summary()
+    assert summary["count"] == 1000
+    assert abs(summary["p50_ms"] - 500) / 500 < 0.01
+    assert abs(summary["p95_ms"] - 950) / 950 < 0.01
+    assert abs(summary["p99_ms"] - 990) / 990 < 0.01
+    assert summary["max_ms"] == 1000
+
+
+def test_tracer_records_errors_and_openmetrics():
+    tracer = StageTracer(namespace="test")
+    with tracer.span("lens"):
+        pass
+    try:
+        with tracer.span("memory"):
+            raise RuntimeError("db locked")
+    except RuntimeError:
+        pass
+
+    metrics = tracer.get_stage_metrics()
+    assert metrics["memory"]["errors"] == 1
+    assert tracer.get_recent_spans()[-1]["error"] == "RuntimeError: db locked"
+
+    text = tracer.to_openmetrics()
+    assert 'test_stage_latency_seconds{stage="lens",quantile="0.99"}' in text
+    assert 'test_stage_errors_total{stage="memory"} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_quiet_brain_traces_stages_without_printing(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    brain = HeadyBrain(lens=StubLens(), memory=StubMemory(), conductor=StubConductor(), quiet=True)
+
+    brain.process_request("deploy the application")
+    cached = brain.process_request("deploy the application")
+    brain.flush_persistence()
+
+    assert cached.cache_hit
+    assert capsys.readouterr().out == ""
+
+    stages = brain.get_performance_metrics()["stages"]
+    for stage in ("cache", "lens", "memory", "analysis", "plan", "persist", "process_request"):
+        assert stages[stage]["count"] >= 1
+    assert stages["cache"]["cache_hits"] == 1
+    assert stages["process_request"]["count"] == 2
+    assert stages["process_request"]["p99_ms"] >= stages["process_request"]["p50_ms"]
+
+    dumped = json.loads(brain.export_performance_metrics("json"))
+    assert dumped["stages"]["plan"]["count"] == 1
+    assert "heady_brain_stage_latency_seconds_count" in brain.export_performance_metrics("openmetrics")
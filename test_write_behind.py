@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# HEADY_BRAND:BEGIN
+# ╔══════════════════════════════════════════════════════════════════╗
+# ║  █╗  █╗███████╗ █████╗ ██████╗ █╗   █╗                     ║
+# ║  █║  █║█╔════╝█╔══█╗█╔══█╗╚█╗ █╔╝                     ║
+# ║  ███████║█████╗  ███████║█║  █║ ╚████╔╝                      ║
+# ║  █╔══█║█╔══╝  █╔══█║█║  █║  ╚█╔╝                       ║
+# ║  █║  █║███████╗█║  █║██████╔╝   █║                        ║
+# ║  ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═════╝    ╚═╝                        ║
+# ║                                                                  ║
+# ║  ∞ SACRED GEOMETRY ∞  Organic Systems · Breathing Interfaces    ║
+# ║  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━  ║
+# ║  FILE: test_write_behind.py                                       ║
+# ║  LAYER: root                                                      ║
+# ╚══════════════════════════════════════════════════════════════════╝
+# HEADY_BRAND:END
+
+"""
+Tests for the write-behind queue that defers HeadyBrain memory writes.
+"""
+
+import gc
+import sys
+import json
+import weakref
+import time
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "HeadyAcademy"))
+
+from HeadyWriteBehind import WriteBehindQueue
+from HeadyMemory import HeadyMemory
+
+
+class GatedMemory:
+    """Memory stub whose writes wait until the test opens the gate."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.batches = []
+
+    def store_many(self, records):
+        self.gate.wait(timeout=5)
+        self.batches.append(list(records))
+
+
+def record(n):
+    return {"category": "processing_context", "content": {"n": n}, "tags": ["test"], "source": "test"}
+
+
+def test_batches_are_written_and_flushed_on_close(tmp_path):
+    memory = HeadyMemory(str(tmp_path))
+    queue = WriteBehindQueue(memory, batch_size=10, flush_interval=60)
+
+    queue.put_many([record(n) for n in range(25)])
+    queue.close()
+
+    assert memory.get_statistics()["total_memories"] == 25
+    assert queue.get_stats()["batches"] == 3
+    assert queue.pending() == 0
+
+
+def test_drop_oldest_policy_discards_oldest_records():
+    memory = GatedMemory()
+    queue = WriteBehindQueue(memory, max_queue=3, batch_size=1, flush_interval=60, overflow_policy="drop_oldest")
+
+    queue.put(record(0))
+    time.sleep(0.1)  # writer takes record 0 and waits on the gate
+    for n in range(1, 6):
+        queue.put(record(n))
+    memory.gate.set()
+    queue.close()
+
+    written = [r["content"]["n"] for batch in memory.batches for r in batch]
+    assert written == [0, 3, 4, 5]
+    assert queue.get_stats()["dropped"] == 2
+
+
+def test_spill_policy_writes_overflow_to_disk_and_replays(tmp_path):
+    memory = GatedMemory()
+    spill_path = tmp_path / "spill.jsonl"
+    queue = WriteBehindQueue(memory, max_queue=2, batch_size=1, flush_interval=60,
+                             overflow_policy="spill", spill_path=str(spill_path))
+
+    queue.put(record(0))
+    time.sleep(0.1)
+    for n in range(1, 5):
+        queue.put(record(n))
+
+    spilled = [json.loads(line)["content"]["n"] for line in spill_path.read_text().splitlines()]
+    assert spilled == [3, 4]
+
+    memory.gate.set()
+    queue.close()
+
+    written = sorted(r["content"]["n"] for batch in memory.batches for r in batch)
+    assert written == [0, 1, 2, 3, 4]
+    assert not spill_path.exists()
+
+
+def test_block_policy_waits_for_room():
+    memory = GatedMemory()
+    queue = WriteBehindQueue(memory, max_queue=1, batch_size=1, flush_interval=60,
+                             overflow_policy="block", block_timeout=0.2)
+
+    queue.put(record(0))
+    time.sleep(0.1)
+    queue.put(record(1))
+    started = time.time()
+    kept = queue.put(record(2))
+
+    assert not kept
+    assert time.time() - started >= 0.2
+    memory.gate.set()
+    assert queue.put(record(3))
+    queue.close()
+
+    written = [r["content"]["n"] for batch in memory.batches for r in batch]
+    assert written == [0, 1, 3]
+
+
+def test_flush_waits_for_spilled_records(tmp_path):
+    memory = GatedMemory()
+    spill_path = tmp_path / "spill.jsonl"
+    queue = WriteBehindQueue(memory, max_queue=1, batch_size=1, flush_interval=60,
+                             overflow_policy="spill", spill_path=str(spill_path))
+
+    queue.put(record(0))
+    time.sleep(0.1)
+    for n in range(1, 4):
+        queue.put(record(n))
+    assert queue.pending() == 4 and queue.get_stats()["spill_pending"] == 2
+
+    memory.gate.set()
+    assert queue.flush(timeout=5)
+    written = sorted(r["content"]["n"] for batch in memory.batches for r in batch)
+    assert written == [0, 1, 2, 3]
+    assert queue.pending() == 0 and not spill_path.exists()
+    queue.close()
+
+    # A spill file left by an earlier run is replayed by the next flush
+    spill_path.write_text(json.dumps(record(4)) + "\n")
+    queue = WriteBehindQueue(memory, flush_interval=60, overflow_policy="spill", spill_path=str(spill_path))
+    assert queue.pending() == 1
+    assert queue.flush(timeout=5)
+    assert memory.batches[-1] == [record(4)]
+    queue.close()
+
+
+class FailingMemory:
+    def __init__(self):
+        self.calls = 0
+
+    def store_many(self, records):
+        self.calls += 1
+        raise OSError("disk full")
+
+
+def test_failing_batch_is_dead_lettered_after_max_attempts(tmp_path):
+    memory = FailingMemory()
+    spill_path = tmp_path / "spill.jsonl"
+    queue = WriteBehindQueue(memory, batch_size=1, flush_interval=0.02, overflow_policy="spill",
+                             spill_path=str(spill_path), max_attempts=3)
+
+    queue.put(record(0))
+    deadline = time.time() + 5
+    while queue.stats["dead_lettered"] == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    queue.close()
+
+    assert memory.calls == 3 and queue.stats["write_errors"] == 3
+    assert queue.stats["replayed"] == 0 and queue.stats["dead_lettered"] == 1
+    assert not spill_path.exists()
+    [dead] = [json.loads(line) for line in queue.dead_letter_path.read_text().splitlines()]
+    assert dead["attempts"] == 3 and dead["record"]["content"] == {"n": 0}
+
+
+def test_open_queues_are_not_kept_alive_by_the_exit_hook():
+    queue = WriteBehindQueue(GatedMemory())
+    ref = weakref.ref(queue)
+    del queue
+    gc.collect()
+    assert ref() is None